@@ -5,6 +5,7 @@ This package contains higher-order functions for carrying out analysis.
 from .compare import ComparisonResults as ComparisonResults
 from .compare import compare_vehicles as compare_vehicles
 from .coupling import coupling as coupling
+from .executor import AnalysisExecutor as AnalysisExecutor
 from .sensitivity import points_sensitivity as points_sensitivity
 from .sweep import sweep_vehicles as sweep_vehicles
 from .sweep_1d import SweepSettings as SweepSettings
@@ -2,12 +2,14 @@
 This module contains code for comparing two or more distinct vehicles.
 """
 
-from typing import Generator
+from typing import Generator, Optional
 
 from usmlap.competition import Competition, CompetitionPoints
 from usmlap.simulation import SimulationSettings
 from usmlap.vehicle import Vehicle
 
+from .executor import AnalysisExecutor
+
 
 class ComparisonResults(object):
     """
@@ -69,6 +71,7 @@ def compare_vehicles(
     vehicles: list[Vehicle],
     simulation_settings: SimulationSettings,
     competition: Competition,
+    executor: Optional[AnalysisExecutor] = None,
 ) -> ComparisonResults:
     """
     Run simulations for a list of vehicles and return the results.
@@ -76,8 +79,14 @@ def compare_vehicles(
 
     results = ComparisonResults()
 
-    for vehicle in vehicles:
-        points, _ = competition.simulate(vehicle, simulation_settings)
-        results.add_result(vehicle, points)
+    executor = executor or AnalysisExecutor()
+    competition_results = executor.simulate(
+        competition,
+        vehicles,
+        simulation_settings,
+        description="Comparing vehicles...",
+    )
+    for vehicle, competition_result in zip(vehicles, competition_results):
+        results.add_result(vehicle, competition_result.points)
 
     return results
@@ -3,15 +3,21 @@ This module contains code for analysing the coupling between two parameters.
 """
 
 from dataclasses import dataclass, field
+from itertools import batched
+from typing import Optional
 
 import matplotlib.pyplot as plt
-from rich import progress
 
 from usmlap.competition import Competition
 from usmlap.simulation import SimulationSettings
 from usmlap.vehicle import Parameter, Vehicle
 
-from .sensitivity import points_sensitivity
+from .executor import AnalysisExecutor
+from .sensitivity import (
+    calculate_sensitivity,
+    get_sensitivity_delta,
+    get_sensitivity_vehicles,
+)
 from .sweep_1d import SweepSettings
 
 
@@ -51,6 +57,7 @@ def coupling(
     competition: Competition,
     sweep_settings: SweepSettings,
     coupled_parameter: type[Parameter[float]],
+    executor: Optional[AnalysisExecutor] = None,
 ) -> CouplingResults:
     """
     Carry out a coupling analysis between two parameters.
@@ -66,6 +73,8 @@ def coupling(
             Settings for sweeping the first parameter.
         coupled_parameter (type[Parameter[float]]):
             The parameter to evaluate the sensitivity of.
+        executor (AnalysisExecutor, optional):
+            Executor for the simulations. Defaults to a process pool.
 
     Returns:
         coupling_results (CouplingResults):
@@ -75,18 +84,24 @@ def coupling(
         sweep_parameter=sweep_settings.parameter,
         coupled_parameter=coupled_parameter,
     )
-    for value, vehicle in progress.track(
-        sweep_settings.get_vehicles(baseline_vehicle),
+    delta = get_sensitivity_delta(coupled_parameter)
+    values = sweep_settings.values
+    vehicles = (
+        sensitivity_vehicle
+        for _, vehicle in sweep_settings.get_vehicles(baseline_vehicle)
+        for sensitivity_vehicle in get_sensitivity_vehicles(
+            vehicle, coupled_parameter, delta
+        )
+    )
+    executor = executor or AnalysisExecutor()
+    competition_results = executor.map(
+        competition,
+        vehicles,
+        simulation_settings,
         description=f"Sweeping {sweep_settings.parameter.name}...",
-        transient=True,
-        total=sweep_settings.number_of_steps,
-    ):
-        sensitivity, _ = points_sensitivity(
-            vehicle=vehicle,
-            settings=simulation_settings,
-            competition=competition,
-            parameter=coupled_parameter,
-            normalise=True,
+    )
+    for value, results in zip(values, batched(competition_results, 2)):
+        coupling_results.data[value] = calculate_sensitivity(
+            list(results), delta, normalise=True
         )
-        coupling_results.data[value] = sensitivity
     return coupling_results
@@ -0,0 +1,244 @@
+"""
+This module contains an executor for simulating many vehicles
+at a competition in parallel.
+"""
+
+import os
+from collections.abc import Iterable, Iterator, Sized
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from functools import partial
+from itertools import batched
+from math import ceil
+from typing import Callable, Literal, Optional
+
+import rich
+from rich.console import Console
+from rich.progress import Progress
+
+from usmlap.competition import Competition
+from usmlap.competition.competition import CompetitionResults
+from usmlap.simulation import SimulationSettings
+from usmlap.vehicle import Vehicle
+
+type ExecutorBackend = Literal["process", "thread", "serial"]
+type Batch = tuple[Vehicle, ...]
+type BatchTask = Callable[[Batch], list[CompetitionResults]]
+
+IN_FLIGHT_TASKS_PER_WORKER = 2
+MAXIMUM_BATCH_SIZE = 16
+
+_worker_competition: Optional[Competition] = None
+_worker_settings: Optional[SimulationSettings] = None
+
+
+@dataclass
+class AnalysisExecutor(object):
+    """
+    Executor for simulating many vehicles at a competition.
+
+    Vehicles are simulated in tasks of `batch_size` vehicles,
+    so that batched solvers can share work within each task.
+    Tasks are submitted as vehicles are generated, with at most
+    `max_in_flight` tasks submitted but not yet returned,
+    so that only a bounded number of vehicles and results are held
+    in memory at once. Results are always returned in input order.
+
+    The progress displays of individual simulations are suppressed
+    while the executor is running, and a single aggregated progress
+    display is shown instead.
+
+    Attributes:
+        backend (ExecutorBackend): Whether tasks are executed
+            in a pool of processes, a pool of threads or in turn.
+        workers (int, optional): Number of workers in the pool.
+            Defaults to the number of CPUs.
+        batch_size (int, optional): Number of vehicles simulated
+            in each task. Defaults to an even share of the vehicles
+            for each worker, up to `MAXIMUM_BATCH_SIZE` vehicles,
+            so that every task is simulated by a batched solver.
+        max_in_flight (int, optional): Maximum number of tasks
+            submitted but not yet returned.
+            Defaults to `IN_FLIGHT_TASKS_PER_WORKER` per worker.
+    """
+
+    backend: ExecutorBackend = "process"
+    workers: Optional[int] = None
+    batch_size: Optional[int] = None
+    max_in_flight: Optional[int] = None
+
+    def map(
+        self,
+        competition: Competition,
+        vehicles: Iterable[Vehicle],
+        settings: SimulationSettings,
+        description: str = "Simulating vehicles...",
+    ) -> Iterator[CompetitionResults]:
+        """
+        Simulate a competition for each vehicle.
+
+        Args:
+            competition (Competition): The competition to simulate.
+            vehicles (Iterable[Vehicle]): The vehicles to simulate.
+                These may be generated lazily.
+            settings (SimulationSettings): Settings for the simulation.
+            description (str): Description of the progress display.
+
+        Yields:
+            competition_results (CompetitionResults):
+                The results of each vehicle, in the order of `vehicles`.
+        """
+        total = len(vehicles) if isinstance(vehicles, Sized) else None
+        workers = self._get_worker_count(total)
+        batch_size = self._get_batch_size(total, workers)
+        max_in_flight = max(
+            1, self.max_in_flight or IN_FLIGHT_TASKS_PER_WORKER * workers
+        )
+        batches = batched(vehicles, batch_size)
+
+        console = rich.get_console()
+        quiet = console.quiet
+        if self.backend != "process":
+            console.quiet = True
+        executor, run_batch = self._create_executor(
+            competition, settings, workers
+        )
+        pending: dict[Future[list[CompetitionResults]], int] = {}
+        returned: dict[int, list[CompetitionResults]] = {}
+        submitted = 0
+        next_index = 0
+        exhausted = False
+
+        try:
+            with Progress(console=Console(), transient=True) as progress:
+                task = progress.add_task(description, total=total)
+                while True:
+                    while (
+                        not exhausted
+                        and len(pending) + len(returned) < max_in_flight
+                    ):
+                        batch = next(batches, None)
+                        if batch is None:
+                            exhausted = True
+                            break
+                        pending[executor.submit(run_batch, batch)] = submitted
+                        submitted += 1
+
+                    while next_index in returned:
+                        yield from returned.pop(next_index)
+                        next_index += 1
+
+                    if exhausted and not pending and not returned:
+                        break
+                    if not pending:
+                        continue
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results = future.result()
+                        returned[pending.pop(future)] = results
+                        progress.advance(task, len(results))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            console.quiet = quiet
+
+    def simulate(
+        self,
+        competition: Competition,
+        vehicles: Iterable[Vehicle],
+        settings: SimulationSettings,
+        description: str = "Simulating vehicles...",
+    ) -> list[CompetitionResults]:
+        """
+        Simulate a competition for each vehicle.
+
+        Args:
+            competition (Competition): The competition to simulate.
+            vehicles (Iterable[Vehicle]): The vehicles to simulate.
+            settings (SimulationSettings): Settings for the simulation.
+            description (str): Description of the progress display.
+
+        Returns:
+            competition_results (list[CompetitionResults]):
+                The results of each vehicle, in the order of `vehicles`.
+        """
+        return list(self.map(competition, vehicles, settings, description))
+
+    def _get_worker_count(self, total: Optional[int]) -> int:
+        if self.backend == "serial":
+            return 1
+        workers = self.workers or os.cpu_count() or 1
+        if total is not None:
+            workers = min(workers, ceil(total / (self.batch_size or 1)))
+        return max(workers, 1)
+
+    def _get_batch_size(self, total: Optional[int], workers: int) -> int:
+        if self.batch_size is not None:
+            return self.batch_size
+        if total is None:
+            return MAXIMUM_BATCH_SIZE
+        return max(1, min(ceil(total / workers), MAXIMUM_BATCH_SIZE))
+
+    def _create_executor(
+        self,
+        competition: Competition,
+        settings: SimulationSettings,
+        workers: int,
+    ) -> tuple[Executor, BatchTask]:
+        """
+        Create the executor, and the task which simulates a batch on it.
+        Process workers receive the competition once, when they start,
+        so that only the vehicles are sent with each task.
+        """
+        match self.backend:
+            case "process":
+                executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_initialise_worker,
+                    initargs=(competition, settings),
+                )
+                return executor, _simulate_batch_in_worker
+            case "thread":
+                executor = ThreadPoolExecutor(max_workers=workers)
+            case "serial":
+                executor = _SerialExecutor()
+        return executor, partial(_simulate_batch, competition, settings)
+
+
+class _SerialExecutor(Executor):
+    """Executor which runs each task immediately when it is submitted."""
+
+    def submit[T](self, fn: Callable[..., T], /, *args, **kwargs) -> Future[T]:
+        future: Future[T] = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
+
+def _simulate_batch(
+    competition: Competition, settings: SimulationSettings, batch: Batch
+) -> list[CompetitionResults]:
+    return competition.simulate_batch(list(batch), settings)
+
+
+def _initialise_worker(
+    competition: Competition, settings: SimulationSettings
+) -> None:
+    global _worker_competition, _worker_settings
+    _worker_competition = competition
+    _worker_settings = settings
+    rich.get_console().quiet = True
+
+
+def _simulate_batch_in_worker(batch: Batch) -> list[CompetitionResults]:
+    assert _worker_competition is not None and _worker_settings is not None
+    return _simulate_batch(_worker_competition, _worker_settings, batch)
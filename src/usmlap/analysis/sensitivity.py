@@ -4,14 +4,14 @@ This module contains code for points sensitivity analysis.
 
 from typing import Optional
 
-from rich.progress import Progress
-
 from usmlap.competition import Competition
+from usmlap.competition.competition import CompetitionResults
 from usmlap.simulation import SimulationSettings
 from usmlap.vehicle import Parameter, Vehicle, get_new_vehicle
 
+from .executor import AnalysisExecutor
+
 PARAMETER_DELTA_SCALAR = 0.0001
-TASK_DESCRIPTION = "Evaluating sensitivity..."
 
 
 def points_sensitivity(
@@ -21,6 +21,7 @@ def points_sensitivity(
     parameter: type[Parameter],
     delta: Optional[tuple[float, float]] = None,
     normalise: bool = False,
+    executor: Optional[AnalysisExecutor] = None,
 ) -> tuple[float, tuple[float, float]]:
     """
     Evaluate the points sensitivity of a vehicle parameter.
@@ -35,35 +36,94 @@ def points_sensitivity(
             If not provided, the parameter uncertainty is used.
         normalise (bool): Whether to normalise the sensitivity.
             If `True`, the sensitivity is divided by the parameter delta.
+        executor (AnalysisExecutor, optional): Executor for the simulations.
+            Defaults to a process pool.
 
     Returns:
         sensitivity (float): The points sensitivity of the parameter.
         delta (tuple[float, float]):
             The range over which the sensitivity was evaluated.
     """
+    delta = get_sensitivity_delta(parameter, delta)
+    vehicles = get_sensitivity_vehicles(vehicle, parameter, delta)
+    executor = executor or AnalysisExecutor()
+    competition_results = executor.simulate(
+        competition,
+        vehicles,
+        settings,
+        description=f"Evaluating {parameter.name} sensitivity...",
+    )
+    sensitivity = calculate_sensitivity(competition_results, delta, normalise)
+    return sensitivity, delta
 
+
+def get_sensitivity_delta(
+    parameter: type[Parameter], delta: Optional[tuple[float, float]] = None
+) -> tuple[float, float]:
+    """
+    Get the range of values to evaluate a sensitivity across.
+
+    Args:
+        parameter (Parameter): The parameter to analyse the sensitivity of.
+        delta (Optional[tuple[float, float]]):
+            The range of values to evaluate across.
+            If not provided, the parameter uncertainty is used.
+
+    Returns:
+        delta (tuple[float, float]): The range of values.
+    """
     if not delta:
         if not parameter.uncertainty:
             raise ValueError(
                 "Parameter has no uncertainty, unable to analyse sensitivity."
             )
         delta = (-parameter.uncertainty, parameter.uncertainty)
+    return delta
+
+
+def get_sensitivity_vehicles(
+    vehicle: Vehicle, parameter: type[Parameter], delta: tuple[float, float]
+) -> list[Vehicle]:
+    """
+    Get the decreased and increased vehicles for a sensitivity analysis.
 
+    Args:
+        vehicle (Vehicle): The baseline vehicle.
+        parameter (Parameter): The parameter to analyse the sensitivity of.
+        delta (tuple[float, float]): The range of values to evaluate across.
+
+    Returns:
+        vehicles (list[Vehicle]): The decreased and increased vehicles.
+    """
     baseline_value = parameter.get_value(vehicle)
+    return [
+        get_new_vehicle(vehicle, parameter, baseline_value + value)
+        for value in delta
+    ]
 
-    deltas: dict[str, float] = {"decreased": delta[0], "increased": delta[1]}
-    results: dict[str, float] = {}
-    with Progress(transient=True) as progress:
-        task = progress.add_task(TASK_DESCRIPTION, total=2)
-        for i, (label, value) in enumerate(deltas.items()):
-            progress.update(task, description=f"{TASK_DESCRIPTION} ({i + 1}/2)")
-            new_value = baseline_value + value
-            modified_vehicle = get_new_vehicle(vehicle, parameter, new_value)
-            points, _ = competition.simulate(modified_vehicle, settings)
-            results[label] = sum(points.values())
-
-    sensitivity = results["increased"] - results["decreased"]
-    if normalise:
-        sensitivity /= deltas["increased"] - deltas["decreased"]
 
-    return sensitivity, delta
+def calculate_sensitivity(
+    competition_results: list[CompetitionResults],
+    delta: tuple[float, float],
+    normalise: bool = False,
+) -> float:
+    """
+    Calculate a points sensitivity from the results
+    of the decreased and increased vehicles.
+
+    Args:
+        competition_results (list[CompetitionResults]):
+            The results of the decreased and increased vehicles.
+        delta (tuple[float, float]): The range of values evaluated across.
+        normalise (bool): Whether to normalise the sensitivity.
+
+    Returns:
+        sensitivity (float): The points sensitivity.
+    """
+    decreased, increased = (
+        sum(result.points.values()) for result in competition_results
+    )
+    sensitivity = increased - decreased
+    if normalise:
+        sensitivity /= delta[1] - delta[0]
+    return sensitivity
@@ -4,15 +4,16 @@ This module contains code for carrying out a 1D sweep of a parameter.
 
 import logging
 from dataclasses import dataclass
-from typing import Generator
+from typing import Generator, Optional
 
 import numpy as np
-from rich import progress
 
 from usmlap.competition import Competition, CompetitionPoints
 from usmlap.simulation import SimulationSettings
 from usmlap.vehicle import Parameter, Vehicle, get_new_vehicle
 
+from .executor import AnalysisExecutor
+
 
 @dataclass
 class SweepSettings(object):
@@ -92,6 +93,7 @@ def sweep_1d(
     simulation_settings: SimulationSettings,
     competition: Competition,
     sweep_settings: SweepSettings,
+    executor: Optional[AnalysisExecutor] = None,
 ) -> SweepResults:
     """
     Carry out a 1D sweep of a parameter.
@@ -101,22 +103,27 @@ def sweep_1d(
         simulation_settings (SimulationSettings): Settings for the simulation.
         competition (Competition): The competition to simulate.
         sweep_settings (SweepSettings): Settings for the sweep.
+        executor (AnalysisExecutor, optional): Executor for the simulations.
+            Defaults to a process pool.
 
     Returns:
         sweep_results (SweepResults): The results of the sweep.
     """
-    sweep_results: SweepResults = {}
-
-    for value, vehicle in progress.track(
-        sweep_settings.get_vehicles(baseline_vehicle),
-        description=f"Sweeping {sweep_settings.parameter.name}...",
-        transient=True,
-        total=sweep_settings.number_of_steps,
-    ):
-        logging.info(
-            f"Simulating vehicle with {sweep_settings.parameter.name} = {value}"
-        )
-        points, _ = competition.simulate(vehicle, simulation_settings)
-        sweep_results[value] = points
-
-    return sweep_results
+    name = sweep_settings.parameter.name
+    values: list[float] = []
+    vehicles: list[Vehicle] = []
+    for value, vehicle in sweep_settings.get_vehicles(baseline_vehicle):
+        logging.info(f"Simulating vehicle with {name} = {value}")
+        values.append(value)
+        vehicles.append(vehicle)
+    if not vehicles:
+        return {}
+
+    executor = executor or AnalysisExecutor()
+    results = executor.simulate(
+        competition,
+        vehicles,
+        simulation_settings,
+        description=f"Sweeping {name}...",
+    )
+    return {value: result.points for value, result in zip(values, results)}
@@ -0,0 +1,7 @@
+"""
+This package contains on-disk caches of simulation inputs and results.
+"""
+
+from .fingerprint import fingerprint as fingerprint
+from .result_cache import CacheStatistics as CacheStatistics
+from .result_cache import ResultCache as ResultCache
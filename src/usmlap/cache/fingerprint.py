@@ -0,0 +1,131 @@
+"""
+This module contains code for computing canonical fingerprints of
+simulation inputs, so that results can be cached by their inputs.
+"""
+
+import hashlib
+import json
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import cache, cached_property
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from pydantic import BaseModel
+
+PACKAGE_ROOT = Path(__file__).parent.parent
+
+
+def fingerprint(*values: Any) -> str:
+    """
+    Compute a fingerprint of a set of values and the code version.
+
+    Equal values always have the same fingerprint,
+    independent of object identity and dictionary ordering.
+    Changing any field of any value, or the source code of the package,
+    changes the fingerprint.
+
+    Args:
+        *values (Any): The values to fingerprint.
+
+    Returns:
+        fingerprint (str): A hexadecimal SHA-256 digest.
+
+    Raises:
+        TypeError: If a value cannot be represented canonically.
+    """
+    canonical = [canonicalise(value) for value in values]
+    canonical.append(get_code_version())
+    data = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def canonicalise(value: Any) -> Any:
+    """
+    Convert a value to a canonical representation built from
+    JSON-compatible types, including the type of each object.
+    Functions and other callable objects are rejected,
+    since their behaviour is not captured by their attributes.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        canonical (Any): The canonical representation of the value.
+
+    Raises:
+        TypeError: If the value cannot be represented canonically.
+    """
+    if value is None or type(value) in (bool, int, str):
+        return value
+    if type(value) is float:
+        return repr(value)
+    if isinstance(value, type):
+        return {"__class__": _qualified_name(value)}
+    if isinstance(value, Enum):
+        return {"__enum__": _qualified_name(type(value)), "name": value.name}
+    if isinstance(value, float):
+        return {"__float__": _qualified_name(type(value)), "repr": repr(value)}
+    if isinstance(value, np.ndarray):
+        return {
+            "__array__": str(value.dtype),
+            "shape": list(value.shape),
+            "sha256": hashlib.sha256(value.tobytes()).hexdigest(),
+        }
+    if isinstance(value, np.generic):
+        return canonicalise(value.item())
+    if isinstance(value, (list, tuple)):
+        return [canonicalise(item) for item in value]
+    if isinstance(value, dict):
+        return {
+            json.dumps(canonicalise(key), sort_keys=True): canonicalise(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, BaseModel):
+        return _canonicalise_object(value, dict(value))
+    if is_dataclass(value):
+        attributes = {
+            field.name: getattr(value, field.name) for field in fields(value)
+        }
+        return _canonicalise_object(value, attributes)
+    if callable(value):
+        raise TypeError(f"Cannot fingerprint callable {value!r}")
+    if hasattr(value, "__dict__"):
+        return _canonicalise_object(value, vars(value))
+    raise TypeError(f"Cannot fingerprint value of type {type(value)}")
+
+
+@cache
+def get_code_version() -> str:
+    """
+    Get a fingerprint of the source code of the package,
+    so that cached results are invalidated when the code changes.
+
+    Returns:
+        code_version (str): A hexadecimal SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(PACKAGE_ROOT.rglob("*.py")):
+        digest.update(path.relative_to(PACKAGE_ROOT).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _canonicalise_object(value: Any, attributes: dict[str, Any]) -> Any:
+    """
+    Canonicalise the attributes of an object,
+    excluding cached properties, which are derived from the other attributes
+    and only present once they have been used.
+    """
+    canonical = {
+        name: canonicalise(item)
+        for name, item in attributes.items()
+        if not isinstance(getattr(type(value), name, None), cached_property)
+    }
+    canonical["__class__"] = _qualified_name(type(value))
+    return canonical
+
+
+def _qualified_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
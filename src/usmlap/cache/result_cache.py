@@ -0,0 +1,274 @@
+"""
+This module contains an on-disk cache of simulation results,
+keyed by a fingerprint of the simulation inputs.
+"""
+
+import logging
+import os
+import pickle
+import tempfile
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from usmlap.competition import Competition
+from usmlap.competition.competition import CompetitionResults
+from usmlap.filepath import CACHE_ROOT
+from usmlap.model import TransientVariables
+from usmlap.simulation import SimulationSettings, simulate
+from usmlap.telemetry import TelemetrySolution
+from usmlap.track import Mesh
+from usmlap.vehicle import Vehicle
+
+from .fingerprint import fingerprint
+
+DEFAULT_RESULT_DIRECTORY = CACHE_ROOT / "results"
+DEFAULT_MAXIMUM_SIZE = 2**30
+ENTRY_SUFFIX = ".pkl"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStatistics(object):
+    """
+    Statistics of the use of a cache.
+
+    Attributes:
+        hits (int): Number of lookups which found a result.
+        misses (int): Number of lookups which did not find a result.
+        writes (int): Number of results stored.
+        evictions (int): Number of results removed to limit the cache size.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        if self.lookups == 0:
+            return 0
+        return self.hits / self.lookups
+
+
+@dataclass
+class ResultCache(object):
+    """
+    On-disk cache of simulation results.
+
+    Results are pickled to one file per key in `directory`.
+    The cache is shared between processes, so entries are written
+    atomically. Reading an entry marks it as recently used,
+    and the least recently used entries are evicted
+    whenever the total size of the cache exceeds `maximum_size`.
+
+    Attributes:
+        directory (Path): The directory to store results in.
+        maximum_size (int): The maximum total size of results, in bytes.
+        statistics (CacheStatistics): Statistics of the use of the cache.
+    """
+
+    directory: Path = DEFAULT_RESULT_DIRECTORY
+    maximum_size: int = DEFAULT_MAXIMUM_SIZE
+    statistics: CacheStatistics = field(default_factory=CacheStatistics)
+
+    def __post_init__(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a result from the cache.
+
+        Args:
+            key (str): The key of the result.
+
+        Returns:
+            result (Any, optional): The result,
+                or `None` if it is not in the cache.
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as file:
+                result = pickle.load(file)
+            _touch(path)
+        except FileNotFoundError:
+            self.statistics.misses += 1
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError) as error:
+            logger.warning(f"Removing unreadable cache entry {key}: {error}")
+            path.unlink(missing_ok=True)
+            self.statistics.misses += 1
+            return None
+        self.statistics.hits += 1
+        return result
+
+    def put(self, key: str, result: Any) -> None:
+        """
+        Store a result in the cache, evicting old results if necessary.
+        A result larger than the maximum size of the cache is not stored.
+
+        Args:
+            key (str): The key of the result.
+            result (Any): The result to store. Must be picklable.
+        """
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+                size = file.tell()
+            if size > self.maximum_size:
+                logger.warning(
+                    f"Not caching result {key} of {size} bytes, "
+                    "which exceeds the maximum size of the cache."
+                )
+                Path(temporary_path).unlink()
+                return
+            os.replace(temporary_path, self._get_path(key))
+            _touch(self._get_path(key))
+        except BaseException:
+            Path(temporary_path).unlink(missing_ok=True)
+            raise
+        self.statistics.writes += 1
+        self._evict()
+
+    def get_or_compute[T](self, key: str, compute: Callable[[], T]) -> T:
+        """
+        Get a result from the cache, computing and storing it if missing.
+
+        Args:
+            key (str): The key of the result.
+            compute (Callable[[], T]): Function which computes the result.
+
+        Returns:
+            result (T): The cached or computed result.
+        """
+        result = self.get(key)
+        if result is None:
+            result = compute()
+            self.put(key, result)
+        return result
+
+    def simulate(
+        self,
+        vehicle: Vehicle,
+        track_mesh: Mesh,
+        settings: SimulationSettings,
+        initial_state: Optional[TransientVariables] = None,
+    ) -> TelemetrySolution:
+        """
+        Simulate a vehicle driving around a track,
+        reusing the cached solution if the inputs have been simulated before.
+
+        Args:
+            vehicle (Vehicle): The vehicle to simulate.
+            track_mesh (Mesh): The track mesh.
+            settings (SimulationSettings): Settings for the simulation.
+            initial_state (TransientVariables, optional):
+                The initial state of the vehicle.
+
+        Returns:
+            solution (TelemetrySolution): The solution of the simulation.
+        """
+        key = fingerprint(
+            "simulate", vehicle, track_mesh, settings, initial_state
+        )
+        return self.get_or_compute(
+            key, lambda: simulate(vehicle, track_mesh, settings, initial_state)
+        )
+
+    def simulate_competition(
+        self,
+        competition: Competition,
+        vehicle: Vehicle,
+        settings: SimulationSettings,
+        keep_solutions: bool = True,
+        workers: int = 1,
+    ) -> CompetitionResults:
+        """
+        Simulate a Formula Student competition,
+        reusing the cached results if the inputs have been simulated before.
+
+        Args:
+            competition (Competition): The competition to simulate.
+            vehicle (Vehicle): The vehicle to simulate.
+            settings (SimulationSettings): Settings for the simulation.
+            keep_solutions (bool): Whether to store the solution of each event.
+                If `False`, only the points and timings are stored,
+                which keeps cache entries small.
+            workers (int): Number of processes used to simulate events.
+
+        Returns:
+            competition_results (CompetitionResults):
+                The results of the competition.
+        """
+        key = fingerprint(
+            "competition", competition, vehicle, settings, keep_solutions
+        )
+
+        def compute() -> CompetitionResults:
+            results = competition.simulate(vehicle, settings, workers)
+            if keep_solutions:
+                return results
+            return replace(results, solutions={})
+
+        return self.get_or_compute(key, compute)
+
+    def clear(self) -> None:
+        """Remove all results from the cache."""
+        for path in self._get_entries():
+            path.unlink(missing_ok=True)
+
+    @property
+    def size(self) -> int:
+        """The total size of the results in the cache, in bytes."""
+        return sum(_get_size(path) for path in self._get_entries())
+
+    def _get_path(self, key: str) -> Path:
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
+
+    def _get_entries(self) -> list[Path]:
+        return list(self.directory.glob(f"*{ENTRY_SUFFIX}"))
+
+    def _evict(self) -> None:
+        """
+        Remove the least recently used results
+        until the cache is no larger than the maximum size.
+        """
+        entries: list[tuple[int, int, Path]] = []
+        for path in self._get_entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.maximum_size:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+            self.statistics.evictions += 1
+
+
+def _touch(path: Path) -> None:
+    """
+    Mark an entry as used now.
+    The time is set explicitly, since the file system may only update
+    modification times at a coarse resolution.
+    """
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
+
+
+def _get_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
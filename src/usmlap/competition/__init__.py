@@ -4,6 +4,7 @@ This package contains code for simulating Formula Student competitions.
 
 from .competition import Competition as Competition
 from .competition import CompetitionSolutions as CompetitionSolutions
+from .errors import EventSimulationError as EventSimulationError
 from .points import CompetitionData as CompetitionData
 from .points import CompetitionPoints as CompetitionPoints
 from .points import points_delta as points_delta
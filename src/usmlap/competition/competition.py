@@ -2,6 +2,9 @@
 This module contains code for simulating a Formula Student competition.
 """
 
+import logging
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from dataclasses import InitVar, dataclass, field
 
 from rich.progress import Progress
@@ -10,6 +13,7 @@ from usmlap.simulation import SimulationSettings
 from usmlap.telemetry import TelemetrySolution
 from usmlap.vehicle import Vehicle
 
+from .errors import EventSimulationError
 from .events.acceleration import Acceleration
 from .events.autocross import Autocross
 from .events.endurance import Endurance
@@ -17,19 +21,31 @@ from .events.event import EventInterface
 from .events.skidpad import Skidpad
 from .points import CompetitionData, CompetitionPoints
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_AUTOCROSS_TRACK = "FS AutoX Germany 2012"
 DEFAULT_COMPETITION_DATASET = "FSG 2025 Hybrid"
 
 
 type CompetitionSolutions = dict[str, TelemetrySolution]
+type EventTimings = dict[str, float]
+type EventResult = tuple[TelemetrySolution, CompetitionPoints, float]
 
 
 @dataclass
 class CompetitionResults(object):
-    """Results of simulating a Formula Student competition."""
+    """
+    Results of simulating a Formula Student competition.
+
+    Attributes:
+        points (CompetitionPoints): Points scored in each event.
+        solutions (CompetitionSolutions): The solution of each event.
+        timings (EventTimings): Wall time taken to simulate each event.
+    """
 
     points: CompetitionPoints
     solutions: CompetitionSolutions
+    timings: EventTimings = field(default_factory=dict)
 
 
 @dataclass
@@ -98,7 +114,7 @@ class Competition(object):
                 self._add_event(endurance)
 
     def simulate(
-        self, vehicle: Vehicle, settings: SimulationSettings
+        self, vehicle: Vehicle, settings: SimulationSettings, workers: int = 1
     ) -> CompetitionResults:
         """
         Simulate a Formula Student competition.
@@ -106,14 +122,30 @@ class Competition(object):
         Args:
             vehicle (Vehicle): The vehicle to simulate.
             settings (SimulationSettings): Settings for the simulation.
+            workers (int): Number of processes used to simulate events.
+                Events are simulated in turn if this is 1.
 
         Returns:
-            competition_points (CompetitionPoints):
-                Dictionary of points scored in all simulated events.
+            competition_results (CompetitionResults):
+                Points scored and solutions for all simulated events.
+
+        Raises:
+            EventSimulationError: If an event fails in a worker process.
         """
 
-        competition_results: CompetitionSolutions = {}
-        competition_points: CompetitionPoints = {}
+        if workers > 1 and len(self.events) > 1:
+            results = self._simulate_parallel(vehicle, settings, workers)
+        else:
+            results = self._simulate_serial(vehicle, settings)
+
+        for label, wall_time in results.timings.items():
+            logger.info(f"Simulated {label} in {wall_time:.3f} s")
+        return results
+
+    def _simulate_serial(
+        self, vehicle: Vehicle, settings: SimulationSettings
+    ) -> CompetitionResults:
+        results = CompetitionResults({}, {})
         data = self.competition_data
 
         with Progress(transient=True) as progress:
@@ -126,12 +158,130 @@ class Competition(object):
                     task, description=f"Simulating {event.label}..."
                 )
 
-                event_solution = event.simulate_event(vehicle, settings)
-                competition_results[event.label] = event_solution
+                solution, points, wall_time = _simulate_event(
+                    event, vehicle, settings, data
+                )
+                results.solutions[event.label] = solution
+                results.points.update(points)
+                results.timings[event.label] = wall_time
+
+                progress.advance(task)
+
+        return results
+
+    def _simulate_parallel(
+        self, vehicle: Vehicle, settings: SimulationSettings, workers: int
+    ) -> CompetitionResults:
+        """
+        Simulate the competition events in a pool of worker processes.
+        Results are gathered in the order of `events`,
+        regardless of the order in which the events finish.
+        If an event fails, the pool is shut down without waiting
+        for the running events, and pending events are cancelled.
+        """
+        results = CompetitionResults({}, {})
+        data = self.competition_data
+        workers = min(workers, len(self.events))
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            with Progress(transient=True) as progress:
+                task = progress.add_task(
+                    "Simulating competition...", total=len(self.events)
+                )
+                futures: dict[Future[EventResult], EventInterface] = {
+                    executor.submit(
+                        _simulate_event, event, vehicle, settings, data
+                    ): event
+                    for event in self.events
+                }
+
+                for future in as_completed(futures):
+                    event = futures[future]
+                    error = future.exception()
+                    if error is not None:
+                        raise EventSimulationError(
+                            event.label, repr(error)
+                        ) from error
+                    progress.update(
+                        task, description=f"Finished {event.label}"
+                    )
+                    progress.advance(task)
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+        for future, event in futures.items():
+            solution, points, wall_time = future.result()
+            results.solutions[event.label] = solution
+            results.points.update(points)
+            results.timings[event.label] = wall_time
+
+        return results
+
+    def simulate_batch(
+        self, vehicles: list[Vehicle], settings: SimulationSettings
+    ) -> list[CompetitionResults]:
+        """
+        Simulate a Formula Student competition for many vehicles.
 
-                event_points = event.calculate_points(event_solution, data)
-                competition_points.update(event_points)
+        Each event simulates all of the vehicles together,
+        so that work can be shared between them.
+
+        Args:
+            vehicles (list[Vehicle]): The vehicles to simulate.
+            settings (SimulationSettings): Settings for the simulation.
+
+        Returns:
+            competition_results (list[CompetitionResults]):
+                The results of each vehicle.
+        """
+        results = [CompetitionResults({}, {}) for _ in vehicles]
+        data = self.competition_data
+
+        with Progress(transient=True) as progress:
+            task = progress.add_task(
+                "Simulating competition...", total=len(self.events)
+            )
+
+            for event in self.events:
+                progress.update(
+                    task, description=f"Simulating {event.label}..."
+                )
+
+                event_solutions = event.simulate_batch(vehicles, settings)
+                for result, event_solution in zip(results, event_solutions):
+                    result.solutions[event.label] = event_solution
+                    result.points.update(
+                        event.calculate_points(event_solution, data)
+                    )
 
                 progress.advance(task)
 
-        return CompetitionResults(competition_points, competition_results)
+        return results
+
+
+def _simulate_event(
+    event: EventInterface,
+    vehicle: Vehicle,
+    settings: SimulationSettings,
+    data: CompetitionData,
+) -> EventResult:
+    """
+    Simulate a single event and calculate the points scored.
+
+    Args:
+        event (EventInterface): The event to simulate.
+        vehicle (Vehicle): The vehicle to simulate.
+        settings (SimulationSettings): Settings for the simulation.
+        data (CompetitionData): Data used for the points calculation.
+
+    Returns:
+        event_result (EventResult): The solution, the points scored
+            and the wall time taken to simulate the event.
+    """
+    start_time = time.perf_counter()
+    solution = event.simulate_event(vehicle, settings)
+    points = event.calculate_points(solution, data)
+    return solution, points, time.perf_counter() - start_time
@@ -0,0 +1,22 @@
+"""
+This module defines custom error types for competition simulations.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class EventSimulationError(Exception):
+    """
+    Error raised when simulating a competition event fails.
+
+    Attributes:
+        label (str): The label of the event that failed.
+        message (str): A description of the original error.
+    """
+
+    label: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"Failed to simulate {self.label}: {self.message}"
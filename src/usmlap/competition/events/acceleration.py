@@ -4,9 +4,9 @@ This module defines the acceleration event at Formula Student.
 
 from dataclasses import dataclass
 
-from usmlap.simulation import SimulationSettings, simulate
+from usmlap.simulation import SimulationSettings, simulate, simulate_batch
 from usmlap.telemetry import TelemetrySolution
-from usmlap.track import Mesh, TrackData, generate_mesh
+from usmlap.track import Mesh, TrackData, load_mesh
 from usmlap.vehicle import Vehicle
 
 from ..points import (
@@ -31,10 +31,16 @@ class Acceleration(EventInterface, label="acceleration"):
     def simulate_event(
         self, vehicle: Vehicle, settings: SimulationSettings
     ) -> TelemetrySolution:
-        mesh = self.get_mesh(settings.mesh_resolution)
+        mesh = self.get_mesh(settings.mesh_resolution, settings.cache_meshes)
         solution = simulate(vehicle, mesh, settings)
         return solution
 
+    def simulate_batch(
+        self, vehicles: list[Vehicle], settings: SimulationSettings
+    ) -> list[TelemetrySolution]:
+        mesh = self.get_mesh(settings.mesh_resolution, settings.cache_meshes)
+        return simulate_batch(vehicles, mesh, settings)
+
     def calculate_points(
         self, solution: TelemetrySolution, data: CompetitionData
     ) -> CompetitionPoints:
@@ -43,14 +49,15 @@ class Acceleration(EventInterface, label="acceleration"):
         points = calculate_points(t_team, t_min, ACCELERATION_COEFFICIENTS)[1]
         return {"acceleration": points}
 
-    def _generate_mesh(self, resolution: float) -> Mesh:
+    def _generate_mesh(self, resolution: float, cache: bool) -> Mesh:
         """
         Generate a track mesh for the acceleration event.
 
         Args:
             resolution (float): The resolution of the mesh.
+            cache (bool): Whether to use the on-disk mesh cache.
 
         Returns:
             mesh (Mesh): A mesh of the track.
         """
-        return generate_mesh(self.track_data, resolution)
+        return load_mesh(self.track_data, resolution, cache=cache)
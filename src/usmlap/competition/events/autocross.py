@@ -4,9 +4,9 @@ This module defines the autocross event at Formula Student.
 
 from dataclasses import InitVar, dataclass, field
 
-from usmlap.simulation import SimulationSettings, simulate
+from usmlap.simulation import SimulationSettings, simulate, simulate_batch
 from usmlap.telemetry import TelemetrySolution
-from usmlap.track import Mesh, TrackData, generate_mesh
+from usmlap.track import Mesh, TrackData, load_mesh
 from usmlap.vehicle import Vehicle
 
 from ..points import (
@@ -33,10 +33,16 @@ class Autocross(EventInterface, label="autocross"):
     def simulate_event(
         self, vehicle: Vehicle, settings: SimulationSettings
     ) -> TelemetrySolution:
-        mesh = self.get_mesh(settings.mesh_resolution)
+        mesh = self.get_mesh(settings.mesh_resolution, settings.cache_meshes)
         solution = simulate(vehicle, mesh, settings)
         return solution
 
+    def simulate_batch(
+        self, vehicles: list[Vehicle], settings: SimulationSettings
+    ) -> list[TelemetrySolution]:
+        mesh = self.get_mesh(settings.mesh_resolution, settings.cache_meshes)
+        return simulate_batch(vehicles, mesh, settings)
+
     def calculate_points(
         self, solution: TelemetrySolution, data: CompetitionData
     ) -> CompetitionPoints:
@@ -45,14 +51,15 @@ class Autocross(EventInterface, label="autocross"):
         points = calculate_points(t_team, t_min, AUTOCROSS_COEFFICIENTS)[1]
         return {"autocross": points}
 
-    def _generate_mesh(self, resolution: float) -> Mesh:
+    def _generate_mesh(self, resolution: float, cache: bool) -> Mesh:
         """
         Generate a track mesh for the autocross event.
 
         Args:
             resolution (float): The resolution of the mesh.
+            cache (bool): Whether to use the on-disk mesh cache.
 
         Returns:
             mesh (Mesh): A mesh of the track.
         """
-        return generate_mesh(self.track_data, resolution)
+        return load_mesh(self.track_data, resolution, cache=cache)
@@ -7,7 +7,7 @@ from math import ceil
 
 from usmlap.simulation import SimulationSettings, simulate
 from usmlap.telemetry import TelemetrySolution
-from usmlap.track import Mesh, TrackData, generate_mesh
+from usmlap.track import Mesh, TrackData, load_mesh
 from usmlap.vehicle import Vehicle, get_new_vehicle
 from usmlap.vehicle.parameters import DischargeCurrentLimit
 
@@ -40,7 +40,7 @@ class Endurance(EventInterface, label="endurance"):
     def simulate_event(
         self, vehicle: Vehicle, settings: SimulationSettings
     ) -> TelemetrySolution:
-        mesh = self.get_mesh(settings.mesh_resolution)
+        mesh = self.get_mesh(settings.mesh_resolution, settings.cache_meshes)
         vehicle = _modify_vehicle_for_event(vehicle)
         solution = simulate(vehicle, mesh, settings)
         return solution
@@ -67,17 +67,18 @@ class Endurance(EventInterface, label="endurance"):
 
         return points
 
-    def _generate_mesh(self, resolution: float) -> Mesh:
+    def _generate_mesh(self, resolution: float, cache: bool) -> Mesh:
         """
         Generate a track mesh for the endurance event.
 
         Args:
             resolution (float): The resolution of the mesh.
+            cache (bool): Whether to use the on-disk mesh cache.
 
         Returns:
             mesh (Mesh): A mesh of the track.
         """
-        base_mesh = generate_mesh(self.track_data, resolution)
+        base_mesh = load_mesh(self.track_data, resolution, cache=cache)
 
         number_of_laps = ceil(ENDURANCE_TRACK_LENGTH / base_mesh.track_length)
 
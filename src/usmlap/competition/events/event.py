@@ -36,19 +36,35 @@ class EventInterface(ABC):
         cls._meshes: dict[float, Mesh] = {}
         cls.label = label
 
-    def get_mesh(self, resolution: float) -> Mesh:
+    def get_mesh(self, resolution: float, cache: bool = False) -> Mesh:
+        """
+        Get the track mesh of the event, generating it on first use.
+
+        Args:
+            resolution (float): The resolution of the mesh.
+            cache (bool): Whether to use the on-disk mesh cache.
+        """
         if resolution not in self._meshes:
-            self._meshes[resolution] = self._generate_mesh(resolution)
+            self._meshes[resolution] = self._generate_mesh(resolution, cache)
         return self._meshes[resolution]
 
     @abstractmethod
-    def _generate_mesh(self, resolution: float) -> Mesh: ...
+    def _generate_mesh(self, resolution: float, cache: bool) -> Mesh: ...
 
     @abstractmethod
     def simulate_event(
         self, vehicle: Vehicle, settings: SimulationSettings
     ) -> TelemetrySolution: ...
 
+    def simulate_batch(
+        self, vehicles: list[Vehicle], settings: SimulationSettings
+    ) -> list[TelemetrySolution]:
+        """
+        Simulate the event for many vehicles.
+        By default, each vehicle is simulated in turn.
+        """
+        return [self.simulate_event(vehicle, settings) for vehicle in vehicles]
+
     @abstractmethod
     def calculate_points(
         self, solution: TelemetrySolution, data: CompetitionData
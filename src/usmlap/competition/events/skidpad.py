@@ -4,9 +4,9 @@ This module defines the skidpad event at Formula Student.
 
 from dataclasses import dataclass
 
-from usmlap.simulation import SimulationSettings, simulate
+from usmlap.simulation import SimulationSettings, simulate, simulate_batch
 from usmlap.telemetry import TelemetrySolution
-from usmlap.track import Mesh, TrackData, generate_mesh
+from usmlap.track import Mesh, TrackData, load_mesh
 from usmlap.vehicle import Vehicle
 
 from ..points import (
@@ -33,10 +33,16 @@ class Skidpad(EventInterface, label="skidpad"):
     def simulate_event(
         self, vehicle: Vehicle, settings: SimulationSettings
     ) -> TelemetrySolution:
-        mesh = self.get_mesh(settings.mesh_resolution)
+        mesh = self.get_mesh(settings.mesh_resolution, settings.cache_meshes)
         solution = simulate(vehicle, mesh, settings)
         return solution
 
+    def simulate_batch(
+        self, vehicles: list[Vehicle], settings: SimulationSettings
+    ) -> list[TelemetrySolution]:
+        mesh = self.get_mesh(settings.mesh_resolution, settings.cache_meshes)
+        return simulate_batch(vehicles, mesh, settings)
+
     def event_time(self, solution: TelemetrySolution) -> float:
         right_time = solution.solution.get_sector_time(
             RIGHT_CIRCLE_TIMED_SECTOR
@@ -52,7 +58,7 @@ class Skidpad(EventInterface, label="skidpad"):
         points = calculate_points(t_team, t_min, SKIDPAD_COEFFICIENTS)[1]
         return {"skidpad": points}
 
-    def _generate_mesh(self, resolution: float) -> Mesh:
+    def _generate_mesh(self, resolution: float, cache: bool) -> Mesh:
         """
         Generate a track mesh for the skidpad event.
 
@@ -65,9 +71,12 @@ class Skidpad(EventInterface, label="skidpad"):
 
         Args:
             resolution (float): The resolution of the mesh.
+            cache (bool): Whether to use the on-disk mesh cache.
 
         Returns:
             mesh (Mesh): A mesh of the skidpad track.
         """
 
-        return generate_mesh(self.track_data, resolution, smooth=False)
+        return load_mesh(
+            self.track_data, resolution, cache=cache, smooth=False
+        )
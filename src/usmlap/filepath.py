@@ -7,3 +7,4 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 LIBRARY_ROOT = PROJECT_ROOT / "data"
 TEMPORARY_ROOT = PROJECT_ROOT / "tmp"
+CACHE_ROOT = TEMPORARY_ROOT / "cache"
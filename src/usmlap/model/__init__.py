@@ -9,4 +9,6 @@ from .lambda_coefficients import LambdaCoefficients as LambdaCoefficients
 from .powertrain import PowertrainModelInterface as PowertrainModelInterface
 from .traction import TractionModel as TractionModel
 from .vehicle_state import CalculatedVehicleState as CalculatedVehicleState
+from .vehicle_state import PowertrainState as PowertrainState
 from .vehicle_state import TransientVariables as TransientVariables
+from .vehicle_state import VehicleStateTable as VehicleStateTable
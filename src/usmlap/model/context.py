@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from usmlap.track import TrackNode
+from usmlap.track import NodeArrays, TrackNode
 from usmlap.vehicle import Vehicle
 
 from .environment import Environment
@@ -41,6 +41,28 @@ class GlobalContext(object):
             lambdas=self.lambdas,
         )
 
+    def get_array_context(
+        self, nodes: NodeArrays, state: TransientVariables
+    ) -> NodeContext:
+        """
+        Create a context which evaluates a set of nodes simultaneously.
+        The transient variables may hold one value per node.
+
+        Args:
+            nodes (NodeArrays): The track nodes to evaluate.
+            state (TransientVariables): The transient variables.
+
+        Returns:
+            ctx (NodeContext): A context for the vectorised vehicle models.
+        """
+        return NodeContext(
+            environment=self.environment,
+            vehicle=self.vehicle,
+            state=state,
+            node=nodes,  # type: ignore[arg-type]
+            lambdas=self.lambdas,
+        )
+
 
 @dataclass
 class NodeContext(GlobalContext):
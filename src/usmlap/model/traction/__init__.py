@@ -5,4 +5,7 @@ This subpackage contains defintions of traction models.
 from .bicycle import Bicycle as Bicycle
 from .four_corner import FourCornerModel as FourCornerModel
 from .point_mass import PointMass as PointMass
+from .status import TractionArrays as TractionArrays
+from .status import TractionResult as TractionResult
+from .status import TractionStatus as TractionStatus
 from .traction_model import TractionModel as TractionModel
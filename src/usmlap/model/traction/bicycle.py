@@ -6,7 +6,7 @@ from usmlap.model.vehicle_state import Trajectory
 from usmlap.utils.datatypes import FourCorner, FrontRear
 
 from ..context import NodeContext
-from ..errors import InsufficientTractionError
+from .status import TractionArrays, TractionResult
 from .traction_model import TractionModel
 
 PRECISION = 1e-3
@@ -21,7 +21,21 @@ class Bicycle(TractionModel):
     def lateral_traction(
         self, ctx: NodeContext, trajectory: Trajectory
     ) -> FourCorner[float]:
+        return self.lateral_traction_status(ctx, trajectory).unwrap()
 
+    def longitudinal_traction(
+        self, ctx: NodeContext, trajectory: Trajectory
+    ) -> FourCorner[float]:
+        return self.longitudinal_traction_status(ctx, trajectory).unwrap()
+
+    def braking_traction(
+        self, ctx: NodeContext, trajectory: Trajectory
+    ) -> FourCorner[float]:
+        return self.braking_traction_status(ctx, trajectory).unwrap()
+
+    def lateral_traction_status(
+        self, ctx: NodeContext, trajectory: Trajectory
+    ) -> TractionResult:
         resistive_fx = sum(self.resistive_forces(ctx, trajectory.velocity))
         normal_loads = self.normal_loads(ctx, trajectory)
         attitudes = self.get_tyre_attitudes(normal_loads)
@@ -30,13 +44,25 @@ class Bicycle(TractionModel):
         fx_max = self.fx_max(tyres, attitudes)
         fy_max = self.fy_max(tyres, attitudes)
         fx = FourCorner(0, 0, resistive_fx / 2, resistive_fx / 2)
-        fy = self.fy_available(fx, fx_max, fy_max)
+        return self.fy_available_status(fx, fx_max, fy_max)
 
-        return fy
+    def lateral_traction_array(
+        self, ctx: NodeContext, trajectory: Trajectory
+    ) -> TractionArrays:
+        resistive_fx = sum(self.resistive_forces(ctx, trajectory.velocity))
+        normal_loads = self.normal_loads(ctx, trajectory)
+        attitudes = self.get_tyre_attitudes(normal_loads)
+        tyres = self.get_tyres(ctx.vehicle)
 
-    def longitudinal_traction(
+        fx_max = self.fx_max(tyres, attitudes)
+        fy_max = self.fy_max(tyres, attitudes)
+        fx = FourCorner(0, 0, resistive_fx / 2, resistive_fx / 2)
+        result = TractionArrays.from_loads(normal_loads)
+        return self.fy_available_array(fx, fx_max, fy_max, result)
+
+    def longitudinal_traction_status(
         self, ctx: NodeContext, trajectory: Trajectory
-    ) -> FourCorner[float]:
+    ) -> TractionResult:
         required_fy = abs(self.required_fy(ctx, trajectory.velocity))
         normal_loads = self.normal_loads(ctx, trajectory)
         attitudes = self.get_tyre_attitudes(normal_loads)
@@ -44,14 +70,19 @@ class Bicycle(TractionModel):
 
         fx_max = self.fx_max(tyres, attitudes)
         fy_max = self.fy_max(tyres, attitudes)
-        fy = self._split_traction(fy_max, required_fy)
-        fx = self.fx_available(fy, fx_max, fy_max)
-
-        return FourCorner(0, 0, fx.rear_left, fx.rear_right)
+        fy = self.split_traction_status(fy_max, required_fy)
+        if not fy.ok:
+            return fy
+        fx = self.fx_available_status(fy.forces, fx_max, fy_max)
+        if not fx.ok:
+            return fx
+        return TractionResult(
+            FourCorner(0, 0, fx.forces.rear_left, fx.forces.rear_right)
+        )
 
-    def braking_traction(
+    def braking_traction_status(
         self, ctx: NodeContext, trajectory: Trajectory
-    ) -> FourCorner[float]:
+    ) -> TractionResult:
         required_fy = abs(self.required_fy(ctx, trajectory.velocity))
         normal_loads = self.normal_loads(ctx, trajectory)
         attitudes = self.get_tyre_attitudes(normal_loads)
@@ -59,10 +90,10 @@ class Bicycle(TractionModel):
 
         fx_max = self.fx_max(tyres, attitudes)
         fy_max = self.fy_max(tyres, attitudes)
-        fy = self._split_traction(fy_max, required_fy)
-        fx = self.fx_available(fy, fx_max, fy_max)
-
-        return fx
+        fy = self.split_traction_status(fy_max, required_fy)
+        if not fy.ok:
+            return fy
+        return self.fx_available_status(fy.forces, fx_max, fy_max)
 
     def normal_loads(
         self, ctx: NodeContext, trajectory: Trajectory
@@ -106,12 +137,3 @@ class Bicycle(TractionModel):
         wheelbase = ctx.vehicle.suspension.wheelbase
         lt = aero_fx * (cop_height / wheelbase)
         return FrontRear(-lt, lt)
-
-    def _split_traction(
-        self, maximum: FourCorner[float], required: float
-    ) -> FourCorner[float]:
-        available = sum(maximum)
-        if required > available:
-            raise InsufficientTractionError(required, available)
-        saturation = required / available  # Between 0 and 1
-        return maximum * saturation
@@ -2,11 +2,13 @@
 This module defines the four corner vehicle model.
 """
 
+import numpy as np
+
 from usmlap.model.context import NodeContext
-from usmlap.model.errors import InsufficientTractionError, WheelLiftError
 from usmlap.model.vehicle_state import Trajectory
 from usmlap.utils.datatypes import FourCorner, FrontRear
 
+from .status import TractionArrays, TractionResult
 from .traction_model import TractionModel
 
 PRECISION = 1e-3
@@ -21,33 +23,69 @@ class FourCornerModel(TractionModel):
     def lateral_traction(
         self, ctx: NodeContext, trajectory: Trajectory
     ) -> FourCorner[float]:
+        return self.lateral_traction_status(ctx, trajectory).unwrap()
+
+    def longitudinal_traction(
+        self, ctx: NodeContext, trajectory: Trajectory
+    ) -> FourCorner[float]:
+        return self.longitudinal_traction_status(ctx, trajectory).unwrap()
 
+    def braking_traction(
+        self, ctx: NodeContext, trajectory: Trajectory
+    ) -> FourCorner[float]:
+        return self.braking_traction_status(ctx, trajectory).unwrap()
+
+    def lateral_traction_status(
+        self, ctx: NodeContext, trajectory: Trajectory
+    ) -> TractionResult:
         resistive_fx = sum(self.resistive_forces(ctx, trajectory.velocity))
         normal_loads = self.normal_loads(ctx, trajectory)
         if min(normal_loads) < 0:
-            raise WheelLiftError(normal_loads, trajectory.ax, trajectory.ay)
+            return TractionResult.wheel_lift(
+                normal_loads, trajectory.ax, trajectory.ay
+            )
 
         attitudes = self.get_tyre_attitudes(normal_loads)
         tyres = self.get_tyres(ctx.vehicle)
 
         fx_max = self.fx_max(tyres, attitudes)
         fy_max = self.fy_max(tyres, attitudes)
-        fx = self._split_traction(
+        fx = self.split_traction_status(
             FourCorner(0, 0, fx_max.rear_left, fx_max.rear_right), resistive_fx
         )
-        fy = self.fy_available(fx, fx_max, fy_max)
+        if not fx.ok:
+            return fx
+        return self.fy_available_status(fx.forces, fx_max, fy_max)
 
-        return fy
+    def lateral_traction_array(
+        self, ctx: NodeContext, trajectory: Trajectory
+    ) -> TractionArrays:
+        resistive_fx = sum(self.resistive_forces(ctx, trajectory.velocity))
+        normal_loads = self.normal_loads(ctx, trajectory)
+        wheel_lift = np.minimum.reduce(list(normal_loads)) < 0
+        result = TractionArrays.from_loads(normal_loads, wheel_lift)
 
-    def longitudinal_traction(
+        attitudes = self.get_tyre_attitudes(normal_loads)
+        tyres = self.get_tyres(ctx.vehicle)
+
+        fx_max = self.fx_max(tyres, attitudes)
+        fy_max = self.fy_max(tyres, attitudes)
+        fx = self.split_traction_array(
+            FourCorner(0, 0, fx_max.rear_left, fx_max.rear_right),
+            resistive_fx,
+            result,
+        )
+        return self.fy_available_array(fx, fx_max, fy_max, result)
+
+    def longitudinal_traction_status(
         self, ctx: NodeContext, trajectory: Trajectory
-    ) -> FourCorner[float]:
+    ) -> TractionResult:
         required_fy = abs(self.required_fy(ctx, trajectory.velocity))
 
         normal_loads = self.normal_loads(ctx, trajectory)
         if min(normal_loads) < 0:
-            raise WheelLiftError(
-                normal_loads, ax=trajectory.ax, ay=trajectory.ay
+            return TractionResult.wheel_lift(
+                normal_loads, trajectory.ax, trajectory.ay
             )
 
         attitudes = self.get_tyre_attitudes(normal_loads)
@@ -55,14 +93,19 @@ class FourCornerModel(TractionModel):
 
         fx_max = self.fx_max(tyres, attitudes)
         fy_max = self.fy_max(tyres, attitudes)
-        fy = self._split_traction(fy_max, required_fy)
-        fx = self.fx_available(fy, fx_max, fy_max)
-
-        return FourCorner(0, 0, fx.rear_left, fx.rear_right)
+        fy = self.split_traction_status(fy_max, required_fy)
+        if not fy.ok:
+            return fy
+        fx = self.fx_available_status(fy.forces, fx_max, fy_max)
+        if not fx.ok:
+            return fx
+        return TractionResult(
+            FourCorner(0, 0, fx.forces.rear_left, fx.forces.rear_right)
+        )
 
-    def braking_traction(
+    def braking_traction_status(
         self, ctx: NodeContext, trajectory: Trajectory
-    ) -> FourCorner[float]:
+    ) -> TractionResult:
         required_fy = abs(self.required_fy(ctx, trajectory.velocity))
         normal_loads = self.normal_loads(ctx, trajectory)
         attitudes = self.get_tyre_attitudes(normal_loads)
@@ -70,10 +113,10 @@ class FourCornerModel(TractionModel):
 
         fx_max = self.fx_max(tyres, attitudes)
         fy_max = self.fy_max(tyres, attitudes)
-        fy = self._split_traction(fy_max, required_fy)
-        fx = self.fx_available(fy, fx_max, fy_max)
-
-        return fx
+        fy = self.split_traction_status(fy_max, required_fy)
+        if not fy.ok:
+            return fy
+        return self.fx_available_status(fy.forces, fx_max, fy_max)
 
     def normal_loads(
         self, ctx: NodeContext, trajectory: Trajectory
@@ -140,12 +183,3 @@ class FourCornerModel(TractionModel):
         lt = lltd * total_load_transfer
 
         return FourCorner(-lt.front, lt.front, -lt.rear, lt.rear)
-
-    def _split_traction(
-        self, maximum: FourCorner[float], required: float
-    ) -> FourCorner[float]:
-        available = sum(maximum)
-        if required > available:
-            raise InsufficientTractionError(required, available)
-        saturation = required / available  # Between 0 and 1
-        return maximum * saturation
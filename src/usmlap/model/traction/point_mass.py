@@ -3,17 +3,28 @@ This module defines the point mass vehicle model.
 """
 
 import logging
+import math
+from collections.abc import Callable
+from typing import Optional
 
+from usmlap.model.tyre import FrictionEllipse, TyreAttitude
 from usmlap.model.vehicle_state import Trajectory
 from usmlap.utils.datatypes import FourCorner
+from usmlap.utils.maths import smallest_positive_root
+from usmlap.vehicle.aero import ConstantAero
 
 from ..context import NodeContext
+from ..errors import InsufficientTractionError
+from .status import TractionArrays
 from .traction_model import TractionModel
 
 logger = logging.getLogger(__name__)
 
 PRECISION = 1e-2
 MAXIMUM_ITERATIONS = 100
+ELLIPSE_PRECISION = 1e-9
+
+type Quadratic = tuple[float, float, float]
 
 
 class PointMass(TractionModel):
@@ -39,6 +50,20 @@ class PointMass(TractionModel):
 
         return FourCorner(front_fy, front_fy, rear_fy, rear_fy)
 
+    def lateral_traction_array(
+        self, ctx: NodeContext, trajectory: Trajectory
+    ) -> TractionArrays:
+        resistive_fx = sum(self.resistive_forces(ctx, trajectory.velocity))
+        normal_loads = self.normal_loads(ctx, trajectory)
+        attitudes = self.get_tyre_attitudes(normal_loads)
+        tyres = self.get_tyres(ctx.vehicle)
+
+        fx_max = self.fx_max(tyres, attitudes)
+        fy_max = self.fy_max(tyres, attitudes)
+        fx = FourCorner(0, 0, resistive_fx / 2, resistive_fx / 2)
+        result = TractionArrays.from_loads(normal_loads)
+        return self.fy_available_array(fx, fx_max, fy_max, result)
+
     def longitudinal_traction(
         self, ctx: NodeContext, trajectory: Trajectory
     ) -> FourCorner[float]:
@@ -67,8 +92,12 @@ class PointMass(TractionModel):
         attitudes = self.get_tyre_attitudes(normal_loads)
         tyres = ctx.vehicle.tyres
 
-        front_fx_max = self.tyre_model.fx_max(tyres.front, attitudes.front_left)
-        front_fy_max = self.tyre_model.fy_max(tyres.front, attitudes.front_left)
+        front_fx_max = self.tyre_model.fx_max(
+            tyres.front, attitudes.front_left
+        )
+        front_fy_max = self.tyre_model.fy_max(
+            tyres.front, attitudes.front_left
+        )
         front_traction = self.tyre_model.fx(
             fy=required_fy / 4, fx_max=front_fx_max, fy_max=front_fy_max
         )
@@ -93,3 +122,175 @@ class PointMass(TractionModel):
             0.25 * normal_force,
             0.25 * normal_force,
         )
+
+    def analytic_maximum_ax(
+        self, ctx: NodeContext, velocity: float
+    ) -> Optional[float]:
+        # The normal loads are independent of the longitudinal acceleration,
+        # so the traction limit only needs to be evaluated once.
+        trajectory = Trajectory(
+            curvature=ctx.node.curvature, velocity=velocity, ax=0
+        )
+        try:
+            traction_force = sum(self.longitudinal_traction(ctx, trajectory))
+        except InsufficientTractionError:
+            return 0
+
+        drive_force = self.powertrain.drive_force(ctx, velocity)
+        resistive_fx = sum(self.resistive_forces(ctx, velocity))
+        net_force = min(traction_force, drive_force) - resistive_fx
+        return net_force / ctx.vehicle.equivalent_mass
+
+    def analytic_minimum_ax(
+        self, ctx: NodeContext, velocity: float
+    ) -> Optional[float]:
+        # The normal loads are independent of the longitudinal acceleration,
+        # so the braking limit only needs to be evaluated once.
+        trajectory = Trajectory(
+            curvature=ctx.node.curvature, velocity=velocity, ax=0
+        )
+        try:
+            braking_force = sum(self.braking_traction(ctx, trajectory))
+        except InsufficientTractionError:
+            return 0
+
+        resistive_fx = sum(self.resistive_forces(ctx, velocity))
+        net_force = -(braking_force + resistive_fx)
+        return net_force / ctx.vehicle.equivalent_mass
+
+    def analytic_apex_velocity(self, ctx: NodeContext) -> Optional[float]:
+        """
+        Calculate the apex velocity at a node in closed form.
+
+        This is available when the pure tyre models are quadratic in load,
+        the combined tyre model is a friction ellipse
+        and the aero coefficients are constant.
+        The normal load on each tyre and the resistive force
+        are then linear in the square of the velocity,
+        so the lateral limit is a quadratic in the square of the velocity.
+
+        The rear tyres also carry the resistive force,
+        which reduces their lateral force by the friction ellipse factor.
+        The quadratic is solved for a fixed ellipse factor,
+        which is then updated until it converges,
+        typically within two or three evaluations.
+
+        Args:
+            ctx (NodeContext): The simulation context.
+
+        Returns:
+            apex_velocity (Optional[float]): The apex velocity at the node,
+                or `None` if the configuration has no analytic solution.
+        """
+        if not self._has_analytic_lateral_limit(ctx):
+            return None
+
+        weight = self.weight(ctx)
+        unit_velocity = self.aero_attitude(ctx, 1)
+
+        # Tyre load and rear tyre force, linear in the square of the velocity
+        tyre_load = (
+            0.25
+            * (
+                ctx.node.y_to_z(ctx.vehicle.total_mass * ctx.node.curvature)
+                + ctx.vehicle.aero.get_downforce(unit_velocity)
+            ),
+            0.25 * ctx.node.z_to_z(weight),
+        )
+        rear_fx = (
+            0.5 * ctx.vehicle.aero.get_drag(unit_velocity),
+            0.5 * ctx.node.z_to_x(weight),
+        )
+
+        tyres = ctx.vehicle.tyres
+        front_fy_max = _quadratic_in_velocity(
+            lambda load: self.tyre_model.fy_max(
+                tyres.front, TyreAttitude(normal_load=load)
+            ),
+            tyre_load,
+        )
+        rear_fy_max = _quadratic_in_velocity(
+            lambda load: self.tyre_model.fy_max(
+                tyres.rear, TyreAttitude(normal_load=load)
+            ),
+            tyre_load,
+        )
+        rear_fx_max = _quadratic_in_velocity(
+            lambda load: self.tyre_model.fx_max(
+                tyres.rear, TyreAttitude(normal_load=load)
+            ),
+            tyre_load,
+        )
+        centripetal = ctx.vehicle.total_mass * abs(ctx.node.curvature)
+
+        ellipse_factor = 1.0
+        velocity_squared = math.inf
+        for _ in range(MAXIMUM_ITERATIONS):
+            a, b, c = (
+                2 * front + 2 * ellipse_factor * rear
+                for front, rear in zip(front_fy_max, rear_fy_max)
+            )
+            velocity_squared = smallest_positive_root(a, b - centripetal, c)
+            if velocity_squared == math.inf:
+                return math.inf
+
+            fx = _evaluate(rear_fx, velocity_squared)
+            fx_max = _evaluate(rear_fx_max, velocity_squared)
+            usage = fx / fx_max if fx_max != 0 else 0
+            new_ellipse_factor = math.sqrt(max(1 - usage**2, 0))
+
+            if abs(new_ellipse_factor - ellipse_factor) < ELLIPSE_PRECISION:
+                break
+            ellipse_factor = new_ellipse_factor
+
+        return math.sqrt(velocity_squared)
+
+    def _has_analytic_lateral_limit(self, ctx: NodeContext) -> bool:
+        """Check whether the lateral limit can be solved analytically."""
+        return (
+            self.tyre_model.longitudinal.quadratic_in_load
+            and self.tyre_model.lateral.quadratic_in_load
+            and isinstance(self.tyre_model.combined, FrictionEllipse)
+            and isinstance(ctx.vehicle.aero.aero_model, ConstantAero)
+        )
+
+
+def _quadratic_in_velocity(
+    function: Callable[[float], float], load: tuple[float, float]
+) -> Quadratic:
+    """
+    Express a tyre force, which is quadratic in normal load,
+    as a quadratic in the square of the velocity.
+
+    The quadratic coefficients are recovered exactly
+    by evaluating the tyre force at three normal loads.
+
+    Args:
+        function (Callable[[float], float]): Tyre force as a function of load.
+        load (tuple[float, float]): Coefficients of the normal load,
+            which is linear in the square of the velocity,
+            from the highest order.
+
+    Returns:
+        coefficients (Quadratic): Coefficients of the tyre force,
+            from the highest order.
+    """
+    f_0, f_1, f_2 = function(0), function(1), function(2)
+    a = 0.5 * (f_2 - 2 * f_1 + f_0)
+    b = f_1 - f_0 - a
+    c = f_0
+
+    load_1, load_0 = load
+    return (
+        a * load_1**2,
+        2 * a * load_0 * load_1 + b * load_1,
+        a * load_0**2 + b * load_0 + c,
+    )
+
+
+def _evaluate(coefficients: tuple[float, ...], x: float) -> float:
+    """Evaluate a polynomial, with coefficients from the highest order."""
+    result = 0.0
+    for coefficient in coefficients:
+        result = result * x + coefficient
+    return result
@@ -0,0 +1,217 @@
+"""
+This module defines the results of traction calculations,
+which report traction limits by status rather than by raising exceptions.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Optional
+
+import numpy as np
+
+from usmlap.utils.datatypes import FourCorner
+
+from ..errors import InsufficientTractionError, WheelLiftError
+
+type Array = np.ndarray[tuple[Any, ...], np.dtype[np.float64]]
+type BoolArray = np.ndarray[tuple[Any, ...], np.dtype[np.bool_]]
+
+
+class TractionStatus(Enum):
+    """The outcome of a traction calculation."""
+
+    OK = "ok"
+    INSUFFICIENT_TRACTION = "insufficient traction"
+    WHEEL_LIFT = "wheel lift"
+
+
+@dataclass
+class TractionResult(object):
+    """
+    The result of a traction calculation.
+
+    This carries the same information as `InsufficientTractionError`
+    and `WheelLiftError`, without the cost of raising an exception.
+
+    Attributes:
+        forces (FourCorner[float]):
+            The available force at each tyre, if the status is OK.
+        status (TractionStatus): The outcome of the calculation.
+        required (float): The traction required, if insufficient.
+        available (float): The traction available, if insufficient.
+        loads (FourCorner[float], optional):
+            The normal loads, if a wheel has lifted.
+        ax (float): The longitudinal acceleration, if a wheel has lifted.
+        ay (float): The lateral acceleration, if a wheel has lifted.
+    """
+
+    forces: FourCorner[float]
+    status: TractionStatus = TractionStatus.OK
+    required: float = 0
+    available: float = 0
+    loads: Optional[FourCorner[float]] = None
+    ax: float = 0
+    ay: float = 0
+
+    @classmethod
+    def insufficient_traction(
+        cls, required: float, available: float
+    ) -> "TractionResult":
+        return cls(
+            forces=FourCorner(0, 0, 0, 0),
+            status=TractionStatus.INSUFFICIENT_TRACTION,
+            required=required,
+            available=available,
+        )
+
+    @classmethod
+    def wheel_lift(
+        cls, loads: FourCorner[float], ax: float, ay: float
+    ) -> "TractionResult":
+        return cls(
+            forces=FourCorner(0, 0, 0, 0),
+            status=TractionStatus.WHEEL_LIFT,
+            loads=loads,
+            ax=ax,
+            ay=ay,
+        )
+
+    @classmethod
+    def from_error(
+        cls, error: InsufficientTractionError | WheelLiftError
+    ) -> "TractionResult":
+        if isinstance(error, InsufficientTractionError):
+            return cls.insufficient_traction(error.required, error.available)
+        return cls.wheel_lift(error.loads, error.ax, error.ay)
+
+    @property
+    def ok(self) -> bool:
+        return self.status is TractionStatus.OK
+
+    @property
+    def ratio(self) -> float:
+        """The ratio of required to available traction."""
+        return self.required / self.available
+
+    @property
+    def error(self) -> InsufficientTractionError | WheelLiftError:
+        """The exception equivalent to the status."""
+        if self.status is TractionStatus.INSUFFICIENT_TRACTION:
+            return InsufficientTractionError(self.required, self.available)
+        if self.status is TractionStatus.WHEEL_LIFT:
+            assert self.loads is not None
+            return WheelLiftError(self.loads, self.ax, self.ay)
+        raise ValueError("Traction result has no error.")
+
+    def unwrap(self) -> FourCorner[float]:
+        """
+        Get the forces, raising the equivalent exception
+        if the status is not OK.
+
+        Returns:
+            forces (FourCorner[float]): The available force at each tyre.
+
+        Raises:
+            InsufficientTractionError: If the traction is insufficient.
+            WheelLiftError: If a wheel has lifted.
+        """
+        if not self.ok:
+            raise self.error
+        return self.forces
+
+
+@dataclass
+class TractionArrays(object):
+    """
+    The result of a traction calculation at many nodes simultaneously.
+
+    This is the vectorised equivalent of `TractionResult`,
+    where the status of each node is given by a mask.
+
+    Attributes:
+        forces (FourCorner[Array]): The available force at each tyre,
+            which is only meaningful at nodes where the status is OK.
+        loads (FourCorner[Array]): The normal loads at each node.
+        wheel_lift (BoolArray): Mask of nodes where a wheel has lifted.
+        required (Array):
+            The traction required, at nodes with insufficient traction.
+        available (Array):
+            The traction available, at nodes with insufficient traction.
+    """
+
+    forces: FourCorner[Array]
+    loads: FourCorner[Array]
+    wheel_lift: BoolArray
+    required: Array
+    available: Array
+
+    @classmethod
+    def from_loads(
+        cls, loads: FourCorner[Any], wheel_lift: Any = False
+    ) -> "TractionArrays":
+        """
+        Create a result with no insufficient traction
+        and no available force, to be filled in by a traction model.
+
+        Args:
+            loads (FourCorner[Array]): The normal loads at each node.
+            wheel_lift (BoolArray): Mask of nodes where a wheel has lifted.
+        """
+        *corners, wheel_lift = np.broadcast_arrays(
+            *loads, np.asarray(wheel_lift, dtype=bool)
+        )
+        zeros = np.zeros(np.shape(wheel_lift))
+        return cls(
+            forces=FourCorner(zeros, zeros, zeros, zeros),
+            loads=FourCorner(*corners),
+            wheel_lift=wheel_lift,
+            required=zeros.copy(),
+            available=zeros.copy(),
+        )
+
+    @property
+    def insufficient_traction(self) -> BoolArray:
+        """Mask of nodes with insufficient traction."""
+        return ~self.wheel_lift & (self.required > self.available)
+
+    @property
+    def ok(self) -> BoolArray:
+        """Mask of nodes where the status is OK."""
+        return ~self.wheel_lift & ~self.insufficient_traction
+
+    @property
+    def lateral_load_transfer(self) -> Array:
+        left_load = self.loads.front_left + self.loads.rear_left
+        right_load = self.loads.front_right + self.loads.rear_right
+        return np.abs(left_load - right_load)
+
+    @property
+    def max_wheel_lift(self) -> Array:
+        return np.abs(np.minimum.reduce(list(self.loads)))
+
+    def set_insufficient_traction(
+        self, mask: BoolArray, required: Any, available: Any
+    ) -> None:
+        """
+        Mark nodes as having insufficient traction.
+        Nodes which are already marked keep their first recorded values,
+        matching the early return of the scalar calculations.
+        """
+        mask = mask & ~(self.required > self.available)
+        self.required = np.where(mask, required, self.required)
+        self.available = np.where(mask, available, self.available)
+
+    def get_error(self) -> InsufficientTractionError:
+        """
+        Get the error of the first node with insufficient traction.
+
+        Raises:
+            ValueError: If no node has insufficient traction.
+        """
+        insufficient = np.flatnonzero(self.insufficient_traction)
+        if len(insufficient) == 0:
+            raise ValueError("Traction arrays have no error.")
+        i = insufficient[0]
+        return InsufficientTractionError(
+            float(self.required[i]), float(self.available[i])
+        )
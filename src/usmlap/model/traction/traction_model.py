@@ -4,6 +4,9 @@ This module defines a common interface for vehicle models.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
 
 from usmlap.model.tyre import TyreAttitude, TyreModel
 from usmlap.model.vehicle_state import Trajectory
@@ -12,14 +15,26 @@ from usmlap.vehicle import Tyre, Vehicle
 from usmlap.vehicle.aero import AeroAttitude
 
 from ..context import NodeContext
+from ..errors import InsufficientTractionError, WheelLiftError
 from ..powertrain import PowertrainModelInterface
-from ..vehicle_state import CalculatedVehicleState
+from ..vehicle_state import (
+    CalculatedVehicleState,
+    PowertrainState,
+    VehicleStateTable,
+)
+from .status import Array, TractionArrays, TractionResult
 
 
 @dataclass
 class TractionModel(ABC):
     """
     Abstract base class for vehicle models.
+
+    The traction methods raise `InsufficientTractionError`
+    or `WheelLiftError` if the vehicle is beyond its limits.
+    Each has an equivalent `_status` method,
+    which returns a `TractionResult` instead of raising,
+    for use in the solvers' inner loops.
     """
 
     powertrain: PowertrainModelInterface
@@ -35,6 +50,12 @@ class TractionModel(ABC):
 
     @staticmethod
     def aero_attitude(ctx: NodeContext, velocity: float) -> AeroAttitude:
+        if isinstance(velocity, np.ndarray):
+            # Arrays of velocities are used by the vectorised solvers,
+            # and cannot be validated as a float.
+            return AeroAttitude.model_construct(
+                velocity=velocity, air_density=ctx.environment.air_density
+            )
         return AeroAttitude(
             velocity=velocity, air_density=ctx.environment.air_density
         )
@@ -118,6 +139,182 @@ class TractionModel(ABC):
         self, ctx: NodeContext, trajectory: Trajectory
     ) -> FourCorner[float]: ...
 
+    def lateral_traction_status(
+        self, ctx: NodeContext, trajectory: Trajectory
+    ) -> TractionResult:
+        """
+        Get the available lateral traction, without raising an exception.
+
+        By default, this wraps `lateral_traction`.
+        Models should override this to avoid raising exceptions internally.
+
+        Args:
+            ctx (NodeContext): The simulation context.
+            trajectory (Trajectory): The vehicle's trajectory.
+
+        Returns:
+            result (TractionResult):
+                The available lateral force at each tyre, and the status.
+        """
+        try:
+            return TractionResult(self.lateral_traction(ctx, trajectory))
+        except (InsufficientTractionError, WheelLiftError) as e:
+            return TractionResult.from_error(e)
+
+    def longitudinal_traction_status(
+        self, ctx: NodeContext, trajectory: Trajectory
+    ) -> TractionResult:
+        """
+        Get the available longitudinal traction,
+        without raising an exception.
+
+        By default, this wraps `longitudinal_traction`.
+        Models should override this to avoid raising exceptions internally.
+
+        Args:
+            ctx (NodeContext): The simulation context.
+            trajectory (Trajectory): The vehicle's trajectory.
+
+        Returns:
+            result (TractionResult):
+                The available longitudinal force at each tyre, and the status.
+        """
+        try:
+            return TractionResult(self.longitudinal_traction(ctx, trajectory))
+        except (InsufficientTractionError, WheelLiftError) as e:
+            return TractionResult.from_error(e)
+
+    def braking_traction_status(
+        self, ctx: NodeContext, trajectory: Trajectory
+    ) -> TractionResult:
+        """
+        Get the available braking traction, without raising an exception.
+
+        By default, this wraps `braking_traction`.
+        Models should override this to avoid raising exceptions internally.
+
+        Args:
+            ctx (NodeContext): The simulation context.
+            trajectory (Trajectory): The vehicle's trajectory.
+
+        Returns:
+            result (TractionResult):
+                The available braking force at each tyre, and the status.
+        """
+        try:
+            return TractionResult(self.braking_traction(ctx, trajectory))
+        except (InsufficientTractionError, WheelLiftError) as e:
+            return TractionResult.from_error(e)
+
+    def lateral_traction_array(
+        self, ctx: NodeContext, trajectory: Trajectory
+    ) -> TractionArrays:
+        """
+        Get the available lateral traction at many nodes simultaneously.
+
+        This is the vectorised equivalent of `lateral_traction_status`,
+        used by the vectorised solvers.
+        The track node of the context is a `NodeArrays`
+        (see `GlobalContext.get_array_context`),
+        and the trajectory holds one value per node.
+
+        Args:
+            ctx (NodeContext): The simulation context.
+            trajectory (Trajectory): The vehicle's trajectory at each node.
+
+        Returns:
+            result (TractionArrays):
+                The available lateral force at each tyre, and the status.
+
+        Raises:
+            NotImplementedError:
+                If the model has no vectorised lateral traction.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} has no vectorised lateral traction."
+        )
+
+    def analytic_apex_velocity(self, ctx: NodeContext) -> Optional[float]:
+        """
+        Calculate the apex velocity at a node in closed form.
+
+        Traction models which can express their lateral limit analytically
+        may override this method.
+        By default, `None` is returned,
+        indicating that the apex velocity must be solved iteratively.
+
+        Args:
+            ctx (NodeContext): The simulation context.
+
+        Returns:
+            apex_velocity (Optional[float]): The apex velocity at the node,
+                which may exceed the maximum velocity of the vehicle,
+                or `None` if no analytic solution is available.
+        """
+        return None
+
+    def analytic_maximum_ax(
+        self, ctx: NodeContext, velocity: float
+    ) -> Optional[float]:
+        """
+        Calculate the maximum longitudinal acceleration in closed form.
+
+        Traction models which can express their traction limit analytically
+        may override this method.
+        By default, `None` is returned,
+        indicating that the acceleration must be solved iteratively.
+
+        Args:
+            ctx (NodeContext): The simulation context.
+            velocity (float): The vehicle's velocity.
+
+        Returns:
+            maximum_ax (Optional[float]): The maximum acceleration,
+                or `None` if no analytic solution is available.
+        """
+        return None
+
+    def analytic_minimum_ax(
+        self, ctx: NodeContext, velocity: float
+    ) -> Optional[float]:
+        """
+        Calculate the minimum (braking) longitudinal acceleration
+        in closed form.
+
+        Traction models which can express their braking limit analytically
+        may override this method.
+        By default, `None` is returned,
+        indicating that the braking must be solved iteratively.
+
+        Args:
+            ctx (NodeContext): The simulation context.
+            velocity (float): The vehicle's velocity.
+
+        Returns:
+            minimum_ax (Optional[float]): The minimum (negative) acceleration,
+                or `None` if no analytic solution is available.
+        """
+        return None
+
+    def evaluate_powertrain_state(
+        self, ctx: NodeContext, trajectory: Trajectory
+    ) -> PowertrainState:
+        """
+        Evaluate only the state of the powertrain,
+        which is cheaper than evaluating the full vehicle state.
+
+        Args:
+            ctx (NodeContext): The simulation context.
+            trajectory (Trajectory): The trajectory of the vehicle.
+
+        Returns:
+            powertrain_state (PowertrainState): The state of the powertrain.
+        """
+        body_fx, aero_fx = self.resistive_forces(ctx, trajectory.velocity)
+        return self._evaluate_powertrain_state(
+            ctx, trajectory, body_fx + aero_fx
+        )
+
     def evaluate_full_vehicle_state(
         self, ctx: NodeContext, trajectory: Trajectory
     ) -> CalculatedVehicleState:
@@ -125,27 +322,9 @@ class TractionModel(ABC):
         centripetal_force = self.centripetal_force(ctx, trajectory.velocity)
         body_fz, aero_fz = self.normal_forces(ctx, trajectory.velocity)
         body_fx, aero_fx = self.resistive_forces(ctx, trajectory.velocity)
-        drive_force = max(
-            body_fx + aero_fx + trajectory.ax * ctx.vehicle.equivalent_mass, 0
-        )
         normal_loads = self.normal_loads(ctx, trajectory)
-        motor_speed = ctx.vehicle.velocity_to_motor_speed(trajectory.velocity)
-        motor_torque = self.powertrain.required_torque(ctx, drive_force)
-        motor_power = motor_speed * motor_torque
-        accu_power = (
-            motor_power / ctx.vehicle.powertrain.get_powertrain_efficiency()
-        )
-        accu_current = (
-            accu_power
-            / ctx.vehicle.powertrain.accumulator.get_voltage(
-                ctx.state.cell_state.soc
-            )
-        )
-        heating_power = ctx.vehicle.powertrain.accumulator.heating_power(
-            ctx.state.cell_state, accu_current
-        )
-        cooling_power = ctx.vehicle.powertrain.cooling_rate(
-            ctx.state.cell_temperature, ctx.environment.ambient_temperature
+        powertrain_state = self._evaluate_powertrain_state(
+            ctx, trajectory, body_fx + aero_fx
         )
 
         return CalculatedVehicleState(
@@ -160,12 +339,118 @@ class TractionModel(ABC):
             required_fy=self.required_fy(ctx, trajectory.velocity),
             normal_force=body_fz,
             normal_loads=normal_loads,
+            motor_speed=powertrain_state.motor_speed,
+            motor_torque=powertrain_state.motor_torque,
+            motor_power=powertrain_state.motor_power,
+            accumulator_current=powertrain_state.accumulator_current,
+            heating_power=powertrain_state.heating_power,
+            cooling_power=powertrain_state.cooling_power,
+        )
+
+    def evaluate_vehicle_state_table(
+        self, ctx: NodeContext, trajectory: Trajectory
+    ) -> VehicleStateTable:
+        """
+        Evaluate the full vehicle state at many nodes simultaneously.
+
+        This is the vectorised equivalent of `evaluate_full_vehicle_state`.
+        The track node of the context is a `NodeArrays`
+        (see `GlobalContext.get_array_context`),
+        and the trajectory and transient variables hold one value per node.
+
+        Args:
+            ctx (NodeContext): The simulation context.
+            trajectory (Trajectory): The trajectory at each node.
+
+        Returns:
+            table (VehicleStateTable): The full vehicle state at each node.
+        """
+        velocity = np.asarray(trajectory.velocity, dtype=float)
+        weight = np.full_like(velocity, self.weight(ctx))
+        centripetal_force = self.centripetal_force(ctx, velocity)
+        body_fz, aero_fz = self.normal_forces(ctx, velocity)
+        body_fx, aero_fx = self.resistive_forces(ctx, velocity)
+        normal_loads = self.normal_loads(ctx, trajectory)
+        drive_force = np.maximum(
+            body_fx + aero_fx + trajectory.ax * ctx.vehicle.equivalent_mass, 0
+        )
+        (
+            motor_speed,
+            motor_torque,
+            motor_power,
+            accu_current,
+            heating_power,
+            cooling_power,
+        ) = self._powertrain_quantities(ctx, velocity, drive_force)
+
+        return VehicleStateTable(
+            velocity=velocity,
+            ax=np.asarray(trajectory.ax, dtype=float),
+            ay=trajectory.ay,
+            weight=weight,
+            centripetal_force=centripetal_force,
+            downforce=aero_fz,
+            drag=aero_fx,
+            resistive_fx=(body_fx + aero_fx),
+            required_fy=self.required_fy(ctx, velocity),
+            normal_force=body_fz,
+            normal_loads=FourCorner(
+                *(
+                    np.broadcast_to(load, velocity.shape)
+                    for load in normal_loads
+                )
+            ),
             motor_speed=motor_speed,
             motor_torque=motor_torque,
             motor_power=motor_power,
             accumulator_current=accu_current,
             heating_power=heating_power,
-            cooling_power=cooling_power,
+            cooling_power=np.broadcast_to(cooling_power, velocity.shape),
+        )
+
+    def _evaluate_powertrain_state(
+        self, ctx: NodeContext, trajectory: Trajectory, resistive_fx: float
+    ) -> PowertrainState:
+        drive_force = max(
+            resistive_fx + trajectory.ax * ctx.vehicle.equivalent_mass, 0
+        )
+        return PowertrainState(
+            *self._powertrain_quantities(ctx, trajectory.velocity, drive_force)
+        )
+
+    def _powertrain_quantities(
+        self, ctx: NodeContext, velocity: float, drive_force: float
+    ) -> tuple[float, float, float, float, float, float]:
+        """
+        Get the motor speed, torque and power, accumulator current,
+        and heating and cooling power.
+        Arrays of values are accepted for use by the vectorised evaluation.
+        """
+        motor_speed = ctx.vehicle.velocity_to_motor_speed(velocity)
+        motor_torque = self.powertrain.required_torque(ctx, drive_force)
+        motor_power = motor_speed * motor_torque
+        accu_power = (
+            motor_power / ctx.vehicle.powertrain.get_powertrain_efficiency()
+        )
+        accu_current = (
+            accu_power
+            / ctx.vehicle.powertrain.accumulator.get_voltage(
+                ctx.state.cell_state.soc
+            )
+        )
+        heating_power = ctx.vehicle.powertrain.accumulator.heating_power(
+            ctx.state.cell_state, accu_current
+        )
+        cooling_power = ctx.vehicle.powertrain.cooling_rate(
+            ctx.state.cell_temperature, ctx.environment.ambient_temperature
+        )
+        return (
+            motor_speed,
+            motor_torque,
+            motor_power,
+            accu_current,
+            heating_power,
+            cooling_power,
         )
 
     def get_tyre_attitudes(
@@ -231,3 +516,106 @@ class TractionModel(ABC):
                 for fy, fx_max, fy_max in zip(fy, fx_max, fy_max)
             )
         )
+
+    def fy_available_status(
+        self,
+        fx: FourCorner[float],
+        fx_max: FourCorner[float],
+        fy_max: FourCorner[float],
+    ) -> TractionResult:
+        """Equivalent to `fy_available`, without raising an exception."""
+        forces: list[float] = []
+        for corner_fx, corner_fx_max, corner_fy_max in zip(fx, fx_max, fy_max):
+            fy, ratio = self.tyre_model.fy_with_ratio(
+                fx=corner_fx, fx_max=corner_fx_max, fy_max=corner_fy_max
+            )
+            if ratio > 1:
+                return TractionResult.insufficient_traction(
+                    corner_fx, corner_fx_max
+                )
+            forces.append(fy)
+        return TractionResult(FourCorner(*forces))
+
+    def fx_available_status(
+        self,
+        fy: FourCorner[float],
+        fx_max: FourCorner[float],
+        fy_max: FourCorner[float],
+    ) -> TractionResult:
+        """Equivalent to `fx_available`, without raising an exception."""
+        forces: list[float] = []
+        for corner_fy, corner_fx_max, corner_fy_max in zip(fy, fx_max, fy_max):
+            fx, ratio = self.tyre_model.fx_with_ratio(
+                fy=corner_fy, fx_max=corner_fx_max, fy_max=corner_fy_max
+            )
+            if ratio > 1:
+                return TractionResult.insufficient_traction(
+                    corner_fy, corner_fy_max
+                )
+            forces.append(fx)
+        return TractionResult(FourCorner(*forces))
+
+    def fy_available_array(
+        self,
+        fx: FourCorner[Any],
+        fx_max: FourCorner[Array],
+        fy_max: FourCorner[Array],
+        result: TractionArrays,
+    ) -> TractionArrays:
+        """
+        Equivalent to `fy_available_status` at many nodes simultaneously.
+        The available forces and any insufficient traction
+        are recorded in the result.
+        """
+        forces: list[Array] = []
+        for corner_fx, corner_fx_max, corner_fy_max in zip(fx, fx_max, fy_max):
+            fy, ratio = self.tyre_model.fy_with_ratio_array(
+                corner_fx, corner_fx_max, corner_fy_max
+            )
+            result.set_insufficient_traction(
+                ratio > 1, corner_fx, corner_fx_max
+            )
+            forces.append(fy)
+        result.forces = FourCorner(*forces)
+        return result
+
+    @staticmethod
+    def split_traction_array(
+        maximum: FourCorner[Any], required: Array, result: TractionArrays
+    ) -> FourCorner[Array]:
+        """
+        Equivalent to `split_traction_status` at many nodes simultaneously.
+        Any insufficient traction is recorded in the result.
+        """
+        available = sum(maximum)
+        result.set_insufficient_traction(
+            required > available, required, available
+        )
+        saturation = np.divide(
+            required,
+            available,
+            out=np.zeros(np.shape(required)),
+            where=available != 0,
+        )
+        return maximum * saturation
+
+    @staticmethod
+    def split_traction_status(
+        maximum: FourCorner[float], required: float
+    ) -> TractionResult:
+        """
+        Split the required traction between the tyres
+        in proportion to their maximum traction.
+
+        Args:
+            maximum (FourCorner[float]): The maximum traction of each tyre.
+            required (float): The total traction required.
+
+        Returns:
+            result (TractionResult): The traction required of each tyre.
+        """
+        available = sum(maximum)
+        if required > available:
+            return TractionResult.insufficient_traction(required, available)
+        saturation = required / available  # Between 0 and 1
+        return TractionResult(maximum * saturation)
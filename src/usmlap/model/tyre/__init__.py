@@ -3,6 +3,7 @@ This subpackage contains definitions of tyre models.
 """
 
 from .combined import FrictionEllipse as FrictionEllipse
+from .pure import ConstantTyre as ConstantTyre
 from .pure import LinearTyre as LinearTyre
 from .tyre_model import CombinedTyreModel as CombinedTyreModel
 from .tyre_model import PureTyreModel as PureTyreModel
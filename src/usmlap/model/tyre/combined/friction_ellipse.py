@@ -3,9 +3,12 @@ This module implements the friction ellipse combined tyre model.
 """
 
 import math
+from typing import Any
+
+import numpy as np
 
 from usmlap.model.errors import InsufficientTractionError
-from usmlap.model.tyre.tyre_model import CombinedTyreModel
+from usmlap.model.tyre.tyre_model import Array, CombinedTyreModel
 
 
 class FrictionEllipse(CombinedTyreModel):
@@ -17,6 +20,24 @@ class FrictionEllipse(CombinedTyreModel):
     def fy(self, fx: float, fx_max: float, fy_max: float) -> float:
         return fy_max * _get_scale_factor(fx, fx_max)
 
+    def fx_with_ratio(
+        self, fy: float, fx_max: float, fy_max: float
+    ) -> tuple[float, float]:
+        scale_factor, ratio = _get_scale_factor_with_ratio(fy, fy_max)
+        return fx_max * scale_factor, ratio
+
+    def fy_with_ratio(
+        self, fx: float, fx_max: float, fy_max: float
+    ) -> tuple[float, float]:
+        scale_factor, ratio = _get_scale_factor_with_ratio(fx, fx_max)
+        return fy_max * scale_factor, ratio
+
+    def fy_with_ratio_array(
+        self, fx: Any, fx_max: Array, fy_max: Array
+    ) -> tuple[Array, Array]:
+        scale_factor, ratio = _get_scale_factor_arrays(fx, fx_max)
+        return fy_max * scale_factor, ratio
+
 
 def _get_scale_factor(required: float, maximum: float) -> float:
     """Calculate a scale factor for available grip."""
@@ -25,3 +46,37 @@ def _get_scale_factor(required: float, maximum: float) -> float:
     if maximum == 0:
         return 0
     return math.sqrt(1 - (required / maximum) ** 2)
+
+
+def _get_scale_factor_with_ratio(
+    required: float, maximum: float
+) -> tuple[float, float]:
+    """
+    Calculate a scale factor for available grip,
+    and the ratio of required to maximum grip.
+    The scale factor is zero if the required grip exceeds the maximum.
+    """
+    if required > maximum:
+        return 0, required / maximum if maximum > 0 else math.inf
+    if maximum == 0:
+        return 0, 0
+    ratio = required / maximum
+    return math.sqrt(1 - ratio**2), ratio
+
+
+def _get_scale_factor_arrays(
+    required: Any, maximum: Any
+) -> tuple[Array, Array]:
+    """
+    Calculate the scale factor for available grip at many nodes,
+    equivalent to `_get_scale_factor_with_ratio`.
+    """
+    required, maximum = np.broadcast_arrays(
+        np.asarray(required, dtype=float), np.asarray(maximum, dtype=float)
+    )
+    ratio = np.divide(
+        required, maximum, out=np.zeros(required.shape), where=maximum > 0
+    )
+    ratio = np.where((maximum <= 0) & (required > maximum), np.inf, ratio)
+    scale_factor = np.sqrt(np.clip(1 - ratio**2, 0, None))
+    return np.where(maximum > 0, scale_factor, 0), ratio
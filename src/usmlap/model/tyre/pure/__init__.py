@@ -2,4 +2,5 @@
 This subpackage defines pure tyre models.
 """
 
+from .constant import ConstantTyre as ConstantTyre
 from .linear import LinearTyre as LinearTyre
@@ -4,13 +4,15 @@ This module implements a constant tyre model, which assumes that the effective g
 This tyre model is unsuitable for real simulation, and strictly for testing purposes.
 """
 
-from usmlap.model.tyre import PureTyreModel, TyreAttitude
+from usmlap.model.tyre.tyre_model import PureTyreModel, TyreAttitude
 from usmlap.vehicle import Tyre
 
 
 class ConstantTyre(PureTyreModel):
     """Constant tyre model."""
 
+    quadratic_in_load = True
+
     def maximum_fx(self, tyre: Tyre, attitude: TyreAttitude) -> float:
         return tyre.mu_x_peak * attitude.normal_load
 
@@ -9,6 +9,8 @@ from usmlap.vehicle import Tyre
 class LinearTyre(PureTyreModel):
     """Linear, load sensitive tyre model."""
 
+    quadratic_in_load = True
+
     def maximum_fx(self, tyre: Tyre, attitude: TyreAttitude) -> float:
         mu_x = tyre.mu_x_peak - (tyre.mu_x_sens * attitude.normal_load)
         return mu_x * attitude.normal_load
@@ -2,12 +2,18 @@
 This module defines the interface for tyre models.
 """
 
+import math
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import NamedTuple
+from typing import Any, ClassVar, NamedTuple
 
+import numpy as np
+
+from usmlap.model.errors import InsufficientTractionError
 from usmlap.vehicle import Tyre
 
+type Array = np.ndarray[tuple[Any, ...], np.dtype[np.float64]]
+
 
 class TyreAttitude(NamedTuple):
     """Variables describing the state of a tyre."""
@@ -19,7 +25,16 @@ class TyreAttitude(NamedTuple):
 
 
 class PureTyreModel(ABC):
-    """Abstract base class for pure tyre models."""
+    """
+    Abstract base class for pure tyre models.
+
+    Attributes:
+        quadratic_in_load (bool): Whether the maximum tyre forces
+            are at most quadratic in normal load.
+            This allows vehicle models to solve some limits analytically.
+    """
+
+    quadratic_in_load: ClassVar[bool] = False
 
     @abstractmethod
     def maximum_fx(self, tyre: Tyre, attitude: TyreAttitude) -> float: ...
@@ -29,7 +44,15 @@ class PureTyreModel(ABC):
 
 
 class CombinedTyreModel(ABC):
-    """Abstract base class for combined tyre models."""
+    """
+    Abstract base class for combined tyre models.
+
+    The `fx` and `fy` methods raise `InsufficientTractionError`
+    if the required force exceeds the maximum.
+    The `fx_with_ratio` and `fy_with_ratio` methods instead return
+    the ratio of required to maximum force alongside the available force,
+    for use in performance-critical loops.
+    """
 
     @abstractmethod
     def fx(self, fy: float, fx_max: float, fy_max: float) -> float: ...
@@ -37,6 +60,61 @@ class CombinedTyreModel(ABC):
     @abstractmethod
     def fy(self, fx: float, fx_max: float, fy_max: float) -> float: ...
 
+    def fx_with_ratio(
+        self, fy: float, fx_max: float, fy_max: float
+    ) -> tuple[float, float]:
+        """
+        Get the available longitudinal force without raising an exception.
+
+        Models should override this to avoid raising exceptions internally.
+
+        Returns:
+            fx (float): The available longitudinal force,
+                or zero if the lateral force exceeds the maximum.
+            ratio (float): The ratio of required to maximum lateral force.
+        """
+        try:
+            return self.fx(fy, fx_max, fy_max), _ratio(fy, fy_max)
+        except InsufficientTractionError as e:
+            return 0, e.ratio
+
+    def fy_with_ratio(
+        self, fx: float, fx_max: float, fy_max: float
+    ) -> tuple[float, float]:
+        """
+        Get the available lateral force without raising an exception.
+
+        Models should override this to avoid raising exceptions internally.
+
+        Returns:
+            fy (float): The available lateral force,
+                or zero if the longitudinal force exceeds the maximum.
+            ratio (float):
+                The ratio of required to maximum longitudinal force.
+        """
+        try:
+            return self.fy(fx, fx_max, fy_max), _ratio(fx, fx_max)
+        except InsufficientTractionError as e:
+            return 0, e.ratio
+
+    def fy_with_ratio_array(
+        self, fx: Any, fx_max: Array, fy_max: Array
+    ) -> tuple[Array, Array]:
+        """
+        Get the available lateral force at many nodes simultaneously.
+
+        This is the vectorised equivalent of `fy_with_ratio`.
+        By default, each node is evaluated in turn.
+        Models should override this with an array calculation.
+
+        Returns:
+            fy (Array): The available lateral force at each node.
+            ratio (Array):
+                The ratio of required to maximum longitudinal force.
+        """
+        fy_with_ratio = np.vectorize(self.fy_with_ratio, otypes=[float, float])
+        return fy_with_ratio(fx, fx_max, fy_max)
+
 
 @dataclass
 class TyreModel(object):
@@ -57,3 +135,25 @@ class TyreModel(object):
 
     def fy(self, fx: float, fx_max: float, fy_max: float) -> float:
         return self.combined.fy(fx, fx_max, fy_max)
+
+    def fx_with_ratio(
+        self, fy: float, fx_max: float, fy_max: float
+    ) -> tuple[float, float]:
+        return self.combined.fx_with_ratio(fy, fx_max, fy_max)
+
+    def fy_with_ratio(
+        self, fx: float, fx_max: float, fy_max: float
+    ) -> tuple[float, float]:
+        return self.combined.fy_with_ratio(fx, fx_max, fy_max)
+
+    def fy_with_ratio_array(
+        self, fx: Any, fx_max: Array, fy_max: Array
+    ) -> tuple[Array, Array]:
+        return self.combined.fy_with_ratio_array(fx, fx_max, fy_max)
+
+
+def _ratio(required: float, maximum: float) -> float:
+    """The ratio of required to maximum force, which is zero if both are."""
+    if maximum == 0:
+        return 0 if required == 0 else math.inf
+    return required / maximum
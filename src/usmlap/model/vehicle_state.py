@@ -5,12 +5,17 @@ This module defines the variables associated with a vehicle's state.
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import Any
+
+import numpy as np
 
 from usmlap.model.environment import AMBIENT_TEMPERATURE
 from usmlap.utils.datatypes import FourCorner
 from usmlap.vehicle.powertrain import CellState, StateOfCharge
 
+type Array = np.ndarray[tuple[Any, ...], np.dtype[np.float64]]
+
 
 @dataclass(slots=True)
 class Trajectory(object):
@@ -69,6 +74,33 @@ class TransientVariables(object):
         return TransientVariables()
 
 
+@dataclass(slots=True)
+class PowertrainState(object):
+    """
+    The state of the powertrain at a point.
+    This is all that is needed to update the transient variables.
+
+    Attributes:
+        motor_speed (float): The speed of the motor.
+        motor_torque (float): The torque output of the motor.
+        motor_power (float): The power output of the motor.
+        accumulator_current (float): The current drawn from the accumulator.
+        heating_power (float): The heat generated in the accumulator.
+        cooling_power (float): The heat removed from the accumulator.
+    """
+
+    motor_speed: float
+    motor_torque: float
+    motor_power: float
+    accumulator_current: float
+    heating_power: float
+    cooling_power: float
+
+    @property
+    def net_heating_power(self) -> float:
+        return self.heating_power - self.cooling_power
+
+
 @dataclass
 class CalculatedVehicleState(object):
     """
@@ -97,6 +129,17 @@ class CalculatedVehicleState(object):
     def net_heating_power(self) -> float:
         return self.heating_power - self.cooling_power
 
+    @property
+    def powertrain_state(self) -> PowertrainState:
+        return PowertrainState(
+            motor_speed=self.motor_speed,
+            motor_torque=self.motor_torque,
+            motor_power=self.motor_power,
+            accumulator_current=self.accumulator_current,
+            heating_power=self.heating_power,
+            cooling_power=self.cooling_power,
+        )
+
     @property
     def long_lt(self) -> float:
         """Longitudinal load transfer."""
@@ -108,6 +151,82 @@ class CalculatedVehicleState(object):
         return sum(self.normal_loads.left) - sum(self.normal_loads.right)
 
 
+@dataclass
+class VehicleStateTable(object):
+    """
+    The full state of the vehicle at many points, stored as columns.
+
+    This is the vectorised equivalent of `CalculatedVehicleState`,
+    with one array per field and one array per corner of the normal loads.
+    A row can be materialised as a `CalculatedVehicleState` by indexing.
+    """
+
+    velocity: Array
+    ax: Array
+    ay: Array
+    weight: Array
+    centripetal_force: Array
+    downforce: Array
+    drag: Array
+    resistive_fx: Array
+    required_fy: Array
+    normal_force: Array
+    normal_loads: FourCorner[Array]
+    motor_speed: Array
+    motor_torque: Array
+    motor_power: Array
+    accumulator_current: Array
+    heating_power: Array
+    cooling_power: Array
+
+    def __len__(self) -> int:
+        return len(self.velocity)
+
+    def __getitem__(self, index: int) -> CalculatedVehicleState:
+        columns = {
+            name: value.item(index)
+            for name, value in self.get_columns().items()
+            if not name.startswith("normal_load_")
+        }
+        return CalculatedVehicleState(
+            **columns,
+            normal_loads=FourCorner(
+                *(corner.item(index) for corner in self.normal_loads)
+            ),
+        )
+
+    def get_columns(self) -> dict[str, Array]:
+        """
+        Get every column of the table,
+        with the normal load at each corner as a separate column.
+
+        Returns:
+            columns (dict[str, Array]): The columns, keyed by field name.
+        """
+        columns = {
+            item.name: getattr(self, item.name)
+            for item in fields(self)
+            if item.name != "normal_loads"
+        }
+        for corner, loads in zip(FourCorner._fields, self.normal_loads):
+            columns[f"normal_load_{corner}"] = loads
+        return columns
+
+    @property
+    def net_heating_power(self) -> Array:
+        return self.heating_power - self.cooling_power
+
+    @property
+    def long_lt(self) -> Array:
+        """Longitudinal load transfer."""
+        return sum(self.normal_loads.front) - sum(self.normal_loads.rear)
+
+    @property
+    def lat_lt(self) -> Array:
+        """Lateral load transfer."""
+        return sum(self.normal_loads.left) - sum(self.normal_loads.right)
+
+
 @dataclass
 class VehicleState(object):
     """
@@ -2,6 +2,7 @@
 Script for simulating a Formula Student competition.
 """
 
+from usmlap.cache import ResultCache
 from usmlap.competition import Competition
 from usmlap.simulation import SimulationSettings
 from usmlap.vehicle import Vehicle
@@ -13,4 +14,5 @@ competition = Competition()
 vehicle = Vehicle.from_json(VEHICLE_FILE)
 simulation_settings = SimulationSettings()
 
-points = competition.simulate(vehicle, simulation_settings)
+cache = ResultCache()
+results = cache.simulate_competition(competition, vehicle, simulation_settings)
@@ -6,3 +6,4 @@ TODO: deprecate this module (or move analysis stuff to here)
 
 from .settings import SimulationSettings as SimulationSettings
 from .simulation import simulate as simulate
+from .simulation import simulate_batch as simulate_batch
@@ -3,14 +3,21 @@ This module defines settings for a simulation.
 """
 
 from dataclasses import dataclass, field
+from typing import Any, Optional
 
-from usmlap.model import Environment, GlobalContext, LambdaCoefficients
+from usmlap.model import (
+    Environment,
+    GlobalContext,
+    LambdaCoefficients,
+    TractionModel,
+)
 from usmlap.model.traction import FourCornerModel, PointMass
 from usmlap.model.vehicle_model import VehicleModelSettings
 from usmlap.solver import QuasiSteadyStateSolver as QSS
 from usmlap.solver import QuasiTransientSolver as QT
-from usmlap.solver import SolverInterface
-from usmlap.track.mesh_generation import Resolution
+from usmlap.solver import SolverInterface, SteadyLapSolver, StorageSettings
+from usmlap.solver.qss import ApexVelocityCache
+from usmlap.track.mesh_generation import AdaptiveResolution, Resolution
 from usmlap.vehicle import Vehicle
 
 
@@ -23,7 +30,28 @@ class SimulationSettings(object):
         environment (Environment): Environmental variables for the simulation.
         vehicle_model (TractionModel): The vehicle model to use.
         solver (SolverInterface): The solver to use.
+        solver_options (dict[str, Any]):
+            Keyword arguments for the solver, such as the table resolution
+            of an `EnvelopeSolver`.
         lambdas (LambdaCoefficients): Coefficients for the vehicle model.
+        reuse_steady_laps (bool):
+            Whether to reuse the solution of steady laps of a multi-lap mesh,
+            rather than solving every lap.
+        incremental_iterations (bool):
+            Whether each iteration of a quasi-transient solver
+            only re-solves the apex segments whose transient variables
+            have changed since the previous iteration.
+            Steady lap reuse takes precedence if both are enabled.
+        cache_apex_velocities (bool):
+            Whether a quasi-steady-state or quasi-transient solver
+            memoises apex velocities between nodes with similar conditions.
+            This is faster, but quantises the apex velocities.
+        cache_meshes (bool):
+            Whether events load their track meshes from the on-disk
+            mesh cache, rather than generating them.
+        storage (StorageSettings, optional):
+            Settings for storing solutions compactly,
+            or `None` to keep every node of the solution.
     """
 
     mesh_resolution: Resolution = Resolution(0.1)
@@ -31,14 +59,48 @@ class SimulationSettings(object):
         default_factory=VehicleModelSettings
     )
     solver: type[SolverInterface] = QT
+    solver_options: dict[str, Any] = field(default_factory=dict)
     environment: Environment = field(default_factory=Environment)
     lambdas: LambdaCoefficients = field(default_factory=LambdaCoefficients)
+    reuse_steady_laps: bool = False
+    incremental_iterations: bool = False
+    cache_apex_velocities: bool = False
+    cache_meshes: bool = False
+    storage: Optional[StorageSettings] = None
 
     def get_global_context(self, vehicle: Vehicle) -> GlobalContext:
         return GlobalContext(
             environment=self.environment, lambdas=self.lambdas, vehicle=vehicle
         )
 
+    def get_solver(
+        self, vehicle_model: TractionModel, global_context: GlobalContext
+    ) -> SolverInterface:
+        """
+        Create the solver for a simulation.
+
+        If steady laps are reused, a quasi-transient solver reuses laps
+        between its iterations, and any other solver is wrapped
+        by a `SteadyLapSolver`.
+        Incremental iterations only apply to a quasi-transient solver.
+        If apex velocities are cached, each solver has its own cache,
+        since the cache is not keyed by the vehicle.
+        """
+        options = dict(self.solver_options)
+        if self.cache_apex_velocities and issubclass(self.solver, (QSS, QT)):
+            options.setdefault("apex_cache", ApexVelocityCache())
+        if self.incremental_iterations and issubclass(self.solver, QT):
+            options.setdefault("incremental", True)
+        solver = self.solver(vehicle_model, global_context, **options)
+        if not self.reuse_steady_laps:
+            return solver
+        if isinstance(solver, QT):
+            solver.reuse_steady_laps = True
+            return solver
+        return SteadyLapSolver(
+            vehicle_model, global_context, lap_solver=solver
+        )
+
 
 class QualityPresets(object):
     """
@@ -48,6 +110,8 @@ class QualityPresets(object):
         DRAFT: Solves very quickly, but accuracy is low.
         FAST: Solves quickly, with decent accuracy.
         HIGH_QUALITY: Solves slowly, with high accuracy.
+        ADAPTIVE: Solves quickly, using an adaptive mesh which is
+            more accurate than a uniform mesh with as many nodes.
     """
 
     DRAFT: SimulationSettings = SimulationSettings(
@@ -76,3 +140,8 @@ class QualityPresets(object):
         vehicle_model=VehicleModelSettings(traction_model=FourCornerModel),
         solver=QT,
     )
+    ADAPTIVE: SimulationSettings = SimulationSettings(
+        mesh_resolution=AdaptiveResolution(0.1),
+        vehicle_model=VehicleModelSettings(traction_model=FourCornerModel),
+        solver=QT,
+    )
@@ -7,9 +7,11 @@ from __future__ import annotations
 from pyparsing import Optional
 
 from usmlap.model import TransientVariables
-from usmlap.solver.solution import create_new_solution
+from usmlap.solver import BatchSolver, CompactSolution, VectorisedSolver
+from usmlap.solver.solution import Solution, create_new_solution
 from usmlap.telemetry import TelemetrySolution
 from usmlap.track import Mesh
+from usmlap.utils.memory import MemoryProfile
 from usmlap.vehicle import Vehicle
 
 from .settings import SimulationSettings
@@ -24,6 +26,9 @@ def simulate(
     """
     Simulate a vehicle driving around a track.
 
+    The peak memory use after each stage of the simulation
+    is recorded in the memory profile of the returned solution.
+
     Args:
         vehicle (Vehicle): The vehicle to simulate.
         settings (SimulationSettings): Settings for the simulation.
@@ -31,14 +36,100 @@ def simulate(
     if initial_state is None:
         initial_state = TransientVariables.get_default()
 
+    memory_profile = MemoryProfile()
+    memory_profile.record("start")
     vehicle_model = settings.vehicle_model.build_vehicle_model()
     global_context = settings.get_global_context(vehicle)
-    solver = settings.solver(vehicle_model.traction, global_context)
+    solver = settings.get_solver(vehicle_model.traction, global_context)
 
     solution = create_new_solution(
         track_mesh, vehicle_model.traction, initial_state
     )
+    memory_profile.record("initialise")
     solution = solver.solve(solution)
+    memory_profile.record("solve")
+    if settings.storage is None:
+        return TelemetrySolution(
+            vehicle=vehicle,
+            solution=solution,
+            solver=type(solver),
+            memory_profile=memory_profile,
+        )
+
+    compact = CompactSolution.from_solution(solution, settings.storage)
+    memory_profile.record("store")
     return TelemetrySolution(
-        vehicle=vehicle, solution=solution, solver=type(solver)
+        vehicle=vehicle,
+        solution=compact,
+        solver=type(solver),
+        memory_profile=memory_profile,
+    )
+
+
+def simulate_batch(
+    vehicles: list[Vehicle],
+    track_mesh: Mesh,
+    settings: SimulationSettings,
+    initial_state: Optional[TransientVariables] = None,
+) -> list[TelemetrySolution]:
+    """
+    Simulate many vehicles driving around the same track.
+
+    With a `VectorisedSolver`, the vehicles are solved together
+    by a `BatchSolver`, which shares the mesh-dependent work between them,
+    and every solution shares the memory profile of the batch.
+    Otherwise, or if steady laps are reused or solver options are given,
+    each vehicle is simulated in turn with the requested solver.
+
+    Args:
+        vehicles (list[Vehicle]): The vehicles to simulate.
+        track_mesh (Mesh): The track mesh.
+        settings (SimulationSettings): Settings for the simulation.
+
+    Returns:
+        solutions (list[TelemetrySolution]): The solution of each vehicle.
+    """
+    if (
+        settings.reuse_steady_laps
+        or settings.solver_options
+        or not issubclass(settings.solver, VectorisedSolver)
+    ):
+        return [
+            simulate(vehicle, track_mesh, settings, initial_state)
+            for vehicle in vehicles
+        ]
+
+    state = initial_state or TransientVariables.get_default()
+    memory_profile = MemoryProfile()
+    memory_profile.record("start")
+    vehicle_model = settings.vehicle_model.build_vehicle_model()
+    solver = BatchSolver(
+        vehicle_model.traction,
+        [settings.get_global_context(vehicle) for vehicle in vehicles],
     )
+    memory_profile.record("initialise")
+
+    def new_solution() -> Solution:
+        return create_new_solution(track_mesh, vehicle_model.traction, state)
+
+    def store(solution: Solution) -> Solution | CompactSolution:
+        if settings.storage is None:
+            return solution
+        return CompactSolution.from_solution(solution, settings.storage)
+
+    batch_solution = solver.solve(new_solution())
+    memory_profile.record("solve")
+    solutions = [
+        store(solver.apply(batch_solution, i, new_solution()))
+        for i in range(len(vehicles))
+    ]
+    memory_profile.record("apply")
+    return [
+        TelemetrySolution(
+            vehicle=vehicle,
+            solution=solution,
+            solver=settings.solver,
+            memory_profile=memory_profile,
+        )
+        for vehicle, solution in zip(vehicles, solutions)
+    ]
@@ -2,8 +2,17 @@
 This package implements algorithms for solving a vehicle's trajectory.
 """
 
+from .batch import BatchSolver as BatchSolver
+from .compact import CompactSolution as CompactSolution
+from .compact import StorageSettings as StorageSettings
+from .envelope import EnvelopeSolver as EnvelopeSolver
+from .multigrid import MultigridSolver as MultigridSolver
 from .qss import QuasiSteadyStateSolver as QuasiSteadyStateSolver
 from .qt import QuasiTransientSolver as QuasiTransientSolver
 from .solution import Solution as Solution
+from .solution import SolutionArrays as SolutionArrays
 from .solution import SolutionNode as SolutionNode
 from .solver_interface import SolverInterface as SolverInterface
+from .steady_lap import SteadyLapSolver as SteadyLapSolver
+from .vectorised import VectorisedSolver as VectorisedSolver
+from .windowed import WindowedSolver as WindowedSolver
@@ -0,0 +1,6 @@
+"""
+This subpackage implements a solver for many vehicles on one mesh.
+"""
+
+from .batch import BatchSolution as BatchSolution
+from .batch import BatchSolver as BatchSolver
@@ -0,0 +1,177 @@
+"""
+This module implements a quasi-steady-state solver for many vehicles
+on one mesh, sharing the mesh-dependent work between them.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+from rich import progress
+
+from usmlap.model import GlobalContext, NodeContext, TractionModel
+from usmlap.solver.solution import Solution
+from usmlap.solver.vectorised import VectorisedSolver
+from usmlap.track import NodeArrays
+
+logger = logging.getLogger(__name__)
+
+type Array = np.ndarray[tuple[Any, ...], np.dtype[np.float64]]
+
+
+@dataclass
+class BatchSolution(object):
+    """
+    The velocity profiles of many vehicles on one mesh.
+
+    Velocities are arrays of shape (vehicles, nodes).
+
+    Attributes:
+        length (Array): The length of each node.
+        sector (list[str]): The sector of each node.
+        maximum_velocity (Array): The maximum velocity at each node.
+        initial_velocity (Array): The velocity at the start of each node.
+        final_velocity (Array): The velocity at the end of each node.
+        contexts (list[list[NodeContext]]): The context at each node
+            for each vehicle, which are reused to evaluate its vehicle states.
+    """
+
+    length: Array
+    sector: list[str]
+    maximum_velocity: Array
+    initial_velocity: Array
+    final_velocity: Array
+    contexts: list[list[NodeContext]] = field(repr=False)
+
+    @property
+    def number_of_vehicles(self) -> int:
+        return self.final_velocity.shape[0]
+
+    @property
+    def average_velocity(self) -> Array:
+        return (self.initial_velocity + self.final_velocity) / 2
+
+    @property
+    def times(self) -> Array:
+        """The time taken by each vehicle at each node."""
+        return self.length / self.average_velocity
+
+    @property
+    def total_times(self) -> Array:
+        """The total time of each vehicle."""
+        return self.times.sum(axis=1)
+
+    def get_sector_times(self, sector: str) -> Array:
+        """
+        Get the time of each vehicle for a given sector.
+
+        Args:
+            sector (str): The sector to get the time for.
+
+        Returns:
+            sector_times (Array): The time of each vehicle in the sector.
+        """
+        in_sector = np.array([label == sector for label in self.sector])
+        return self.times[:, in_sector].sum(axis=1)
+
+
+@dataclass
+class BatchSolver(object):
+    """
+    Quasi-steady-state solver for many vehicles on one mesh.
+
+    The node arrays, lengths, sectors and transient variables of the mesh
+    are built once and shared between vehicles,
+    and the contexts of each vehicle are built once
+    for both its profile and its vehicle states.
+    The apex velocities of every node are solved simultaneously
+    for each vehicle, and the velocity profiles of all vehicles
+    are collected into arrays of shape (vehicles, nodes).
+    Each profile is the same as that of a `VectorisedSolver`.
+
+    Attributes:
+        vehicle_model (TractionModel): The vehicle model to use.
+        global_contexts (list[GlobalContext]):
+            The simulation context of each vehicle.
+    """
+
+    vehicle_model: TractionModel
+    global_contexts: list[GlobalContext]
+
+    def solve(self, solution: Solution) -> BatchSolution:
+        """
+        Solve the velocity profile of every vehicle.
+
+        Args:
+            solution (Solution): A blank solution of the mesh,
+                whose transient variables are used for every vehicle.
+
+        Returns:
+            batch_solution (BatchSolution): The velocity profiles.
+        """
+        track_nodes = [node.track_node for node in solution.nodes]
+        states = [node.transient_variables for node in solution.nodes]
+        nodes = NodeArrays.from_nodes(track_nodes)
+        shape = (len(self.global_contexts), len(track_nodes))
+        maximum_velocity = np.empty(shape)
+        initial_velocity = np.empty(shape)
+        final_velocity = np.empty(shape)
+        contexts: list[list[NodeContext]] = []
+
+        for i, global_context in enumerate(
+            progress.track(
+                self.global_contexts,
+                description="Solving vehicles...",
+                transient=True,
+            )
+        ):
+            contexts.append(
+                [
+                    global_context.get_local_context(track_node, state)
+                    for track_node, state in zip(track_nodes, states)
+                ]
+            )
+            (maximum_velocity[i], initial_velocity[i], final_velocity[i]) = (
+                self._solver(i).solve_profile(nodes, contexts[i])
+            )
+
+        logger.info(f"Solved {len(self.global_contexts)} vehicles.")
+        return BatchSolution(
+            length=nodes.length,
+            sector=[node.sector for node in track_nodes],
+            maximum_velocity=maximum_velocity,
+            initial_velocity=initial_velocity,
+            final_velocity=final_velocity,
+            contexts=contexts,
+        )
+
+    def apply(
+        self, batch_solution: BatchSolution, index: int, solution: Solution
+    ) -> Solution:
+        """
+        Write the velocity profile of one vehicle to a blank solution,
+        and calculate the full vehicle state at every node.
+
+        Args:
+            batch_solution (BatchSolution): The solved velocity profiles.
+            index (int): The index of the vehicle.
+            solution (Solution): A blank solution of the mesh.
+
+        Returns:
+            solution (Solution): The solution of the vehicle.
+        """
+        solution.nodes[0].anchor_initial_velocity(0)
+        self._solver(index).apply_profile(
+            solution,
+            batch_solution.contexts[index],
+            batch_solution.maximum_velocity[index],
+            batch_solution.initial_velocity[index],
+            batch_solution.final_velocity[index],
+        )
+        return solution
+
+    def _solver(self, index: int) -> VectorisedSolver:
+        return VectorisedSolver(
+            self.vehicle_model, self.global_contexts[index]
+        )
@@ -0,0 +1,325 @@
+"""
+This module implements a compact storage format for solved solutions,
+which keeps only typed arrays of each channel rather than node objects.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Literal, Optional
+
+import numpy as np
+
+from usmlap.model import TractionModel
+
+from .errors import MemoryBudgetExceededError
+from .solution import Solution, SolutionNode
+
+logger = logging.getLogger(__name__)
+
+type Precision = Literal["float32", "float64"]
+type Array = np.ndarray[tuple[Any, ...], np.dtype[Any]]
+
+DEFAULT_PRECISION: dict[str, Precision] = {
+    "position": "float64",
+    "length": "float64",
+    "curvature": "float32",
+    "maximum_velocity": "float32",
+    "initial_velocity": "float64",
+    "final_velocity": "float64",
+    "soc": "float32",
+    "cell_temperature": "float32",
+    "motor_speed": "float32",
+    "motor_torque": "float32",
+    "motor_power": "float32",
+    "accumulator_current": "float32",
+    "heating_power": "float32",
+    "cooling_power": "float32",
+}
+INDEX_CHANNELS: dict[str, type[np.integer[Any]]] = {
+    "sector_id": np.int16,
+    "lap_number": np.int32,
+}
+POWERTRAIN_CHANNELS = (
+    "motor_speed",
+    "motor_torque",
+    "motor_power",
+    "accumulator_current",
+    "heating_power",
+    "cooling_power",
+)
+
+
+@dataclass
+class StorageSettings(object):
+    """
+    Settings for storing solutions compactly.
+
+    Attributes:
+        precision (dict[str, Precision]):
+            The precision of each channel. Channels which are not listed
+            are stored with the precision in `DEFAULT_PRECISION`.
+        memory_budget (int, optional):
+            The maximum size of a stored solution, in bytes.
+            If a solution exceeds the budget,
+            every channel is reduced to single precision,
+            and `MemoryBudgetExceededError` is raised
+            if it still exceeds the budget.
+    """
+
+    precision: dict[str, Precision] = field(default_factory=dict)
+    memory_budget: Optional[int] = None
+
+    def get_dtypes(self) -> dict[str, np.dtype[Any]]:
+        """
+        Get the type of each channel.
+
+        Returns:
+            dtypes (dict[str, np.dtype]): The type of each channel.
+        """
+        dtypes = {
+            channel: np.dtype(self.precision.get(channel, precision))
+            for channel, precision in DEFAULT_PRECISION.items()
+        }
+        for channel, dtype in INDEX_CHANNELS.items():
+            dtypes[channel] = np.dtype(dtype)
+        return dtypes
+
+    def get_budgeted_dtypes(self, node_count: int) -> dict[str, np.dtype[Any]]:
+        """
+        Get the type of each channel for a solution of a number of nodes,
+        reducing the precision to fit within the memory budget.
+
+        Args:
+            node_count (int): The number of nodes in the solution.
+
+        Returns:
+            dtypes (dict[str, np.dtype]): The type of each channel.
+
+        Raises:
+            MemoryBudgetExceededError:
+                If the solution exceeds the budget at single precision.
+        """
+        dtypes = self.get_dtypes()
+        if self.memory_budget is None:
+            return dtypes
+        if _get_size(dtypes, node_count) <= self.memory_budget:
+            return dtypes
+
+        logger.warning(
+            "Solution exceeds the memory budget, "
+            "storing every channel in single precision."
+        )
+        dtypes = {
+            channel: (
+                np.dtype(np.float32)
+                if np.issubdtype(dtype, np.floating)
+                else dtype
+            )
+            for channel, dtype in dtypes.items()
+        }
+        size = _get_size(dtypes, node_count)
+        if size > self.memory_budget:
+            raise MemoryBudgetExceededError(size, self.memory_budget)
+        return dtypes
+
+
+@dataclass
+class CompactSolution(object):
+    """
+    A solved solution, stored as preallocated typed arrays.
+
+    Only the channels needed for scoring and for most telemetry are kept,
+    without the track nodes, transient variables and vehicle states
+    of each node, so it uses a small fraction of the memory of a `Solution`.
+    The solution cannot be re-solved or plotted node by node.
+
+    Attributes:
+        channels (dict[str, Array]): The value of each channel at each node.
+        sectors (tuple[str, ...]): The names of the sectors,
+            indexed by the `sector_id` channel.
+        vehicle_model (TractionModel): The vehicle model used.
+    """
+
+    channels: dict[str, Array]
+    sectors: tuple[str, ...]
+    vehicle_model: TractionModel
+
+    @classmethod
+    def allocate(
+        cls,
+        node_count: int,
+        sectors: tuple[str, ...],
+        vehicle_model: TractionModel,
+        storage: StorageSettings,
+    ) -> CompactSolution:
+        """
+        Allocate an empty compact solution within the memory budget.
+
+        Args:
+            node_count (int): The number of nodes in the solution.
+            sectors (tuple[str, ...]): The names of the sectors.
+            vehicle_model (TractionModel): The vehicle model used.
+            storage (StorageSettings): Settings for storing the solution.
+
+        Returns:
+            solution (CompactSolution): A solution with uninitialised arrays.
+        """
+        dtypes = storage.get_budgeted_dtypes(node_count)
+        return cls(
+            channels={
+                channel: np.empty(node_count, dtype=dtype)
+                for channel, dtype in dtypes.items()
+            },
+            sectors=sectors,
+            vehicle_model=vehicle_model,
+        )
+
+    @classmethod
+    def from_solution(
+        cls, solution: Solution, storage: StorageSettings
+    ) -> CompactSolution:
+        """
+        Store a solved solution compactly.
+
+        Args:
+            solution (Solution): The solved solution.
+            storage (StorageSettings): Settings for storing the solution.
+
+        Returns:
+            solution (CompactSolution): The compact solution.
+        """
+        track_arrays = solution.track_arrays
+        compact = cls.allocate(
+            len(solution.nodes),
+            track_arrays.sectors,
+            solution.vehicle_model,
+            storage,
+        )
+        channels = compact.channels
+        for channel in ("position", "length", "curvature", *INDEX_CHANNELS):
+            channels[channel][:] = getattr(track_arrays, channel)
+        for channel in ("maximum_velocity", "initial_velocity"):
+            channels[channel][:] = solution.get_array(channel)
+        channels["final_velocity"][:] = solution.get_array("final_velocity")
+
+        nodes = solution.nodes
+        for i, node in enumerate(nodes):
+            channels["soc"][i] = node.transient_variables.soc
+            channels["cell_temperature"][i] = (
+                node.transient_variables.cell_temperature
+            )
+        for channel in POWERTRAIN_CHANNELS:
+            channels[channel][:] = [
+                _read_powertrain(node, channel) for node in nodes
+            ]
+        return compact
+
+    def __str__(self) -> str:
+        return f"Total time: {self.total_time:.3f}s"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    @property
+    def nodes(self) -> list[SolutionNode]:
+        raise AttributeError("Compact solutions do not store nodes.")
+
+    @property
+    def node_count(self) -> int:
+        return len(self.channels["length"])
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the arrays of the solution, in bytes."""
+        return sum(array.nbytes for array in self.channels.values())
+
+    def get_channel(self, channel: str) -> Array:
+        """
+        Get the value of a channel at each node.
+
+        Args:
+            channel (str): The name of the channel.
+
+        Returns:
+            values (Array): The value of the channel at each node.
+        """
+        return self.channels[channel]
+
+    @cached_property
+    def time(self) -> Array:
+        """The time taken to drive each node, in double precision."""
+        initial_velocity = self.channels["initial_velocity"].astype(float)
+        final_velocity = self.channels["final_velocity"].astype(float)
+        length = self.channels["length"].astype(float)
+        return length / ((initial_velocity + final_velocity) / 2)
+
+    @property
+    def total_time(self) -> float:
+        return float(self.time.sum())
+
+    @property
+    def total_length(self) -> float:
+        return float(self.channels["length"].sum(dtype=float))
+
+    @property
+    def total_energy_used(self) -> float:
+        motor_power = self.channels["motor_power"].astype(float)
+        return float(np.nansum(motor_power * self.time))
+
+    @property
+    def average_velocity(self) -> float:
+        return self.total_length / self.total_time
+
+    def get_sector_time(self, sector: str) -> float:
+        """
+        Get the time for a given sector.
+
+        Args:
+            sector (str): The sector to get the time for.
+
+        Returns:
+            sector_time (float): The sum of times for the nodes in the sector.
+        """
+        if sector not in self.sectors:
+            return 0
+        mask = self.channels["sector_id"] == self.sectors.index(sector)
+        return float(self.time[mask].sum())
+
+    def get_sector_boundary_positions(self) -> list[float]:
+        """
+        Get a list of positions where the sector changes.
+
+        Returns:
+            sector_boundary_positions (list[float]): List of positions.
+        """
+        sector_id = self.channels["sector_id"]
+        boundaries = np.flatnonzero(sector_id[1:] != sector_id[:-1]) + 1
+        return self.channels["position"][boundaries].tolist()
+
+    def get_lap_times(self) -> list[float]:
+        """
+        Get the time of each lap.
+
+        Returns:
+            lap_times (list[float]): The time of each lap, in lap order.
+        """
+        lap_number = self.channels["lap_number"]
+        return [
+            float(self.time[lap_number == lap].sum())
+            for lap in np.unique(lap_number)
+        ]
+
+
+def _get_size(dtypes: dict[str, np.dtype[Any]], node_count: int) -> int:
+    """Get the size of the arrays of a solution, in bytes."""
+    return node_count * sum(dtype.itemsize for dtype in dtypes.values())
+
+
+def _read_powertrain(node: SolutionNode, channel: str) -> float:
+    """Read a powertrain channel, which is NaN if it was not calculated."""
+    if node.powertrain_state is None:
+        return np.nan
+    return getattr(node.powertrain_state, channel)
@@ -0,0 +1,9 @@
+"""
+This subpackage implements a laptime solver
+which interpolates a precomputed performance envelope.
+"""
+
+from .envelope import EnvelopeError as EnvelopeError
+from .envelope import EnvelopeResolution as EnvelopeResolution
+from .envelope import PerformanceEnvelope as PerformanceEnvelope
+from .envelope_solver import EnvelopeSolver as EnvelopeSolver
@@ -0,0 +1,390 @@
+"""
+This module implements a precomputed performance envelope,
+which tabulates the limits of a vehicle model
+so that they can be interpolated rather than solved at every node.
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from usmlap.model import GlobalContext, NodeContext, TractionModel
+from usmlap.model.vehicle_state import TransientVariables
+from usmlap.solver.qss.acceleration import solve_maximum_ax
+from usmlap.solver.qss.apex_velocity import solve_apex_velocity
+from usmlap.solver.qss.braking import solve_minimum_ax
+from usmlap.solver.vectorised.apex_velocity import solve_apex_velocities
+from usmlap.track import NodeArrays, TrackNode
+from usmlap.vehicle.powertrain import StateOfCharge
+
+logger = logging.getLogger(__name__)
+
+type Array = np.ndarray[tuple[Any, ...], np.dtype[np.float64]]
+
+
+@dataclass(frozen=True)
+class EnvelopeResolution(object):
+    """
+    Resolution of a performance envelope table.
+
+    Attributes:
+        velocity_points (int): Number of points on the velocity axis.
+        curvature_points (int): Number of points on the curvature axis.
+        soc_points (int): Number of state of charge bins.
+        temperature_points (int): Number of cell temperature bins.
+    """
+
+    velocity_points: int = 40
+    curvature_points: int = 25
+    soc_points: int = 1
+    temperature_points: int = 1
+
+
+@dataclass(frozen=True)
+class EnvelopeError(object):
+    """
+    Maximum absolute error of a performance envelope,
+    relative to the iterative solvers, over a sample of nodes.
+
+    Attributes:
+        apex_velocity (float): Error in the apex velocity (m/s).
+        maximum_ax (float): Error in the maximum acceleration (m/s^2).
+        minimum_ax (float): Error in the maximum braking (m/s^2).
+        samples (int): The number of nodes sampled.
+    """
+
+    apex_velocity: float
+    maximum_ax: float
+    minimum_ax: float
+    samples: int
+
+
+@dataclass
+class PerformanceEnvelope(object):
+    """
+    Tabulated limits of a vehicle model.
+
+    The lateral limit is stored as the maximum lateral acceleration
+    at each curvature, which varies much more gradually with curvature
+    than the apex velocity does.
+    The longitudinal limits are stored on a velocity × curvature grid.
+    The acceleration limit is also binned by state of charge
+    and cell temperature, as these affect the available drive force.
+
+    Velocities are stored as a fraction of the apex velocity,
+    so that the lateral limit lies on the edge of the grid.
+    The longitudinal limits collapse rapidly as the lateral limit
+    is approached, so the velocity axis is concentrated towards it.
+    The curvature axis is quadratically spaced,
+    as the limits change most rapidly at small curvatures.
+
+    Attributes:
+        velocity (Array):
+            The velocity axis, as a fraction of the apex velocity.
+        curvature (Array): The absolute curvature axis (1/m).
+        soc (Array): The state of charge axis.
+        temperature (Array): The cell temperature axis (degC).
+        maximum_velocity (float): The maximum velocity of the vehicle (m/s).
+        lateral_acceleration (Array):
+            The maximum lateral acceleration at each curvature (m/s^2).
+        maximum_ax (Array):
+            The maximum longitudinal acceleration (m/s^2),
+            indexed by temperature, SOC, velocity and curvature.
+        minimum_ax (Array):
+            The maximum braking acceleration (m/s^2),
+            indexed by velocity and curvature.
+    """
+
+    velocity: Array
+    curvature: Array
+    soc: Array
+    temperature: Array
+    maximum_velocity: float
+    lateral_acceleration: Array
+    maximum_ax: Array
+    minimum_ax: Array
+
+    @classmethod
+    def build(
+        cls,
+        vehicle_model: TractionModel,
+        global_context: GlobalContext,
+        maximum_curvature: float,
+        soc_range: Optional[tuple[float, float]] = None,
+        temperature_range: Optional[tuple[float, float]] = None,
+        resolution: Optional[EnvelopeResolution] = None,
+    ) -> "PerformanceEnvelope":
+        """
+        Build the envelope of a vehicle model on a flat track.
+
+        Args:
+            vehicle_model (TractionModel): The vehicle model to use.
+            global_context (GlobalContext): The simulation context.
+            maximum_curvature (float): The largest curvature to tabulate.
+            soc_range (tuple[float, float], optional):
+                The range of states of charge to tabulate.
+                Defaults to the default state of charge only.
+            temperature_range (tuple[float, float], optional):
+                The range of cell temperatures to tabulate.
+                Defaults to the default cell temperature only.
+            resolution (EnvelopeResolution, optional):
+                The resolution of the table.
+                Defaults to the default `EnvelopeResolution`.
+
+        Returns:
+            envelope (PerformanceEnvelope): The performance envelope.
+        """
+        if resolution is None:
+            resolution = EnvelopeResolution()
+        default_state = TransientVariables.get_default()
+        if soc_range is None:
+            soc_range = (default_state.soc, default_state.soc)
+        if temperature_range is None:
+            temperature = default_state.cell_temperature
+            temperature_range = (temperature, temperature)
+
+        maximum_velocity = global_context.vehicle.maximum_velocity
+        velocity = 1 - (1 - np.linspace(0, 1, resolution.velocity_points)) ** 2
+        curvature = (
+            maximum_curvature
+            * np.linspace(0, 1, resolution.curvature_points) ** 2
+        )
+        soc = _axis(soc_range, resolution.soc_points)
+        temperature = _axis(temperature_range, resolution.temperature_points)
+
+        nodes = [_flat_node(k) for k in curvature]
+        apex_velocity = solve_apex_velocities(
+            vehicle_model, global_context, NodeArrays.from_nodes(nodes)
+        )
+        lateral_acceleration = apex_velocity**2 * curvature
+        if len(curvature) > 1:
+            lateral_acceleration[0] = lateral_acceleration[1]
+
+        maximum_ax = np.empty(
+            (len(temperature), len(soc), len(velocity), len(curvature))
+        )
+        minimum_ax = np.empty((len(velocity), len(curvature)))
+
+        for k, node in enumerate(nodes):
+            speeds = velocity * apex_velocity[k]
+            ctx = global_context.get_local_context(node, default_state)
+            for v, speed in enumerate(speeds):
+                minimum_ax[v, k] = solve_minimum_ax(
+                    vehicle_model, ctx, float(speed)
+                )
+            for t, cell_temperature in enumerate(temperature):
+                for s, state_of_charge in enumerate(soc):
+                    state = TransientVariables(
+                        soc=StateOfCharge(state_of_charge),
+                        cell_temperature=float(cell_temperature),
+                    )
+                    ctx = global_context.get_local_context(node, state)
+                    for v, speed in enumerate(speeds):
+                        maximum_ax[t, s, v, k] = solve_maximum_ax(
+                            vehicle_model, ctx, float(speed)
+                        )
+
+        return cls(
+            velocity=velocity,
+            curvature=curvature,
+            soc=soc,
+            temperature=temperature,
+            maximum_velocity=maximum_velocity,
+            lateral_acceleration=lateral_acceleration,
+            maximum_ax=maximum_ax,
+            minimum_ax=minimum_ax,
+        )
+
+    def apex_velocities(self, curvature: Array) -> Array:
+        """
+        Interpolate the apex velocity at each of a set of curvatures.
+
+        Args:
+            curvature (Array): The curvature of each node.
+
+        Returns:
+            apex_velocity (Array): The apex velocity at each node.
+        """
+        curvature = np.abs(curvature)
+        ay = np.interp(curvature, self.curvature, self.lateral_acceleration)
+        velocity = np.full(len(curvature), self.maximum_velocity)
+        cornering = curvature > 0
+        velocity[cornering] = np.sqrt(ay[cornering] / curvature[cornering])
+        return np.minimum(velocity, self.maximum_velocity)
+
+    def maximum_ax_rows(
+        self, curvature: Array, soc: Array, temperature: Array
+    ) -> Array:
+        """
+        Interpolate the maximum acceleration against velocity at each node.
+
+        Args:
+            curvature (Array): The curvature of each node.
+            soc (Array): The state of charge at each node.
+            temperature (Array): The cell temperature at each node.
+
+        Returns:
+            rows (Array):
+                The maximum acceleration at each point on the velocity axis,
+                with one row per node.
+        """
+        k, k_weight = _bracket(self.curvature, np.abs(curvature))
+        s, s_weight = _bracket(self.soc, soc)
+        t, t_weight = _bracket(self.temperature, temperature)
+
+        rows = np.zeros((len(curvature), len(self.velocity)))
+        for t_index, t_factor in _corners(t, t_weight, len(self.temperature)):
+            for s_index, s_factor in _corners(s, s_weight, len(self.soc)):
+                for k_index, k_factor in _corners(
+                    k, k_weight, len(self.curvature)
+                ):
+                    table = self.maximum_ax[t_index, s_index, :, k_index]
+                    rows += (t_factor * s_factor * k_factor)[:, None] * table
+        return rows
+
+    def minimum_ax_rows(self, curvature: Array) -> Array:
+        """
+        Interpolate the maximum braking against velocity at each node.
+
+        Args:
+            curvature (Array): The curvature of each node.
+
+        Returns:
+            rows (Array):
+                The minimum acceleration at each point on the velocity axis,
+                with one row per node.
+        """
+        k, k_weight = _bracket(self.curvature, np.abs(curvature))
+        rows = np.zeros((len(curvature), len(self.velocity)))
+        for k_index, k_factor in _corners(k, k_weight, len(self.curvature)):
+            rows += k_factor[:, None] * self.minimum_ax[:, k_index].T
+        return rows
+
+    def interpolate_velocity(
+        self, row: Sequence[float], velocity: float, apex_velocity: float
+    ) -> float:
+        """
+        Interpolate a row of the envelope at a velocity.
+
+        Args:
+            row (Sequence[float]): Values at each point on the velocity axis.
+            velocity (float): The velocity to interpolate at.
+            apex_velocity (float): The apex velocity of the row.
+
+        Returns:
+            value (float): The interpolated value.
+        """
+        last = len(self.velocity) - 1
+        fraction = min(velocity / apex_velocity, 1) if apex_velocity > 0 else 1
+        position = (1 - math.sqrt(1 - fraction)) * last
+        index = min(max(int(position), 0), last - 1)
+        weight = min(max(position - index, 0), 1)
+        return row[index] * (1 - weight) + row[index + 1] * weight
+
+    def error_bound(
+        self,
+        vehicle_model: TractionModel,
+        contexts: list[NodeContext],
+        velocity: Array,
+        samples: int,
+    ) -> EnvelopeError:
+        """
+        Estimate the error of the envelope against the iterative solvers.
+
+        The limits are compared at evenly spaced nodes,
+        at the velocity the vehicle travels through each node,
+        limited to the apex velocity.
+
+        Args:
+            vehicle_model (TractionModel): The vehicle model to use.
+            contexts (list[NodeContext]): The context at each node.
+            velocity (Array): The velocity at each node.
+            samples (int): The maximum number of nodes to compare.
+
+        Returns:
+            error (EnvelopeError): The maximum error over the sampled nodes.
+        """
+        indices = np.unique(
+            np.linspace(0, len(contexts) - 1, samples).astype(int)
+        )
+        curvature = np.array([contexts[i].node.curvature for i in indices])
+        soc = np.array([contexts[i].state.soc for i in indices])
+        temperature = np.array(
+            [contexts[i].state.cell_temperature for i in indices]
+        )
+
+        apex_velocity = self.apex_velocities(curvature)
+        maximum_rows = self.maximum_ax_rows(curvature, soc, temperature)
+        minimum_rows = self.minimum_ax_rows(curvature)
+
+        apex_error = maximum_error = minimum_error = 0.0
+        for j, i in enumerate(indices):
+            ctx = contexts[i]
+            iterative_apex = solve_apex_velocity(vehicle_model, ctx)
+            apex_error = max(
+                apex_error, abs(iterative_apex - apex_velocity[j])
+            )
+            speed = min(float(velocity[i]), iterative_apex, apex_velocity[j])
+            maximum_error = max(
+                maximum_error,
+                abs(
+                    solve_maximum_ax(vehicle_model, ctx, speed)
+                    - self.interpolate_velocity(
+                        maximum_rows[j], speed, apex_velocity[j]
+                    )
+                ),
+            )
+            minimum_error = max(
+                minimum_error,
+                abs(
+                    solve_minimum_ax(vehicle_model, ctx, speed)
+                    - self.interpolate_velocity(
+                        minimum_rows[j], speed, apex_velocity[j]
+                    )
+                ),
+            )
+
+        return EnvelopeError(
+            apex_velocity=float(apex_error),
+            maximum_ax=float(maximum_error),
+            minimum_ax=float(minimum_error),
+            samples=len(indices),
+        )
+
+
+def _axis(bounds: tuple[float, float], points: int) -> Array:
+    """Create an axis, collapsing it to a single point if it has no range."""
+    lower, upper = bounds
+    if points <= 1 or math.isclose(lower, upper):
+        return np.array([(lower + upper) / 2])
+    return np.linspace(lower, upper, points)
+
+
+def _flat_node(curvature: float) -> TrackNode:
+    """Create a flat track node with the given curvature."""
+    return TrackNode(position=0, length=1, curvature=curvature, elevation=0)
+
+
+def _bracket(axis: Array, values: Array) -> tuple[Array, Array]:
+    """
+    Find the lower grid index and interpolation weight for each value.
+
+    Values outside the axis are clamped to its ends.
+    """
+    if len(axis) == 1:
+        return np.zeros(len(values), dtype=int), np.zeros(len(values))
+    index = np.clip(np.searchsorted(axis, values) - 1, 0, len(axis) - 2)
+    weight = (values - axis[index]) / (axis[index + 1] - axis[index])
+    return index, np.clip(weight, 0, 1)
+
+
+def _corners(
+    index: Array, weight: Array, length: int
+) -> list[tuple[Array, Array]]:
+    """Get the indices and weights of the two grid points either side."""
+    if length == 1:
+        return [(index, np.ones(len(index)))]
+    return [(index, 1 - weight), (index + 1, weight)]
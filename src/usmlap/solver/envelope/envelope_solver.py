@@ -0,0 +1,168 @@
+"""
+This module implements a quasi-steady-state solver
+which interpolates a precomputed performance envelope.
+"""
+
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import numpy as np
+
+from usmlap.model import NodeContext
+from usmlap.solver.solution import Solution
+from usmlap.solver.vectorised import VectorisedSolver
+from usmlap.track import NodeArrays
+
+from .envelope import EnvelopeError, EnvelopeResolution, PerformanceEnvelope
+
+logger = logging.getLogger(__name__)
+
+type Array = np.ndarray[tuple[Any, ...], np.dtype[np.float64]]
+
+MINIMUM_CURVATURE_RANGE = 1e-3
+
+
+@dataclass
+class EnvelopeSolver(VectorisedSolver):
+    """
+    Performance envelope solver.
+
+    Builds a table of the vehicle's limits once per simulation,
+    then solves the velocity profile by interpolating the table
+    rather than iterating the traction model at every node.
+
+    The envelope is built for a flat track,
+    so banking and inclination are neglected by the kernels.
+    The error introduced by this, and by the table resolution,
+    is estimated against the iterative solvers after each solve.
+
+    Attributes:
+        resolution (EnvelopeResolution): The resolution of the table.
+        error_samples (int):
+            The number of nodes to sample when estimating the error bound.
+            Set to zero to skip the estimate.
+        envelope (PerformanceEnvelope): The most recently built envelope.
+        error (EnvelopeError): The most recently estimated error bound.
+    """
+
+    resolution: EnvelopeResolution = field(default_factory=EnvelopeResolution)
+    error_samples: int = 100
+
+    envelope: Optional[PerformanceEnvelope] = field(default=None, init=False)
+    error: Optional[EnvelopeError] = field(default=None, init=False)
+
+    def solve(self, previous_solution: Solution) -> Solution:
+        self._maximum_ax_rows: Optional[Array] = None
+        self._minimum_ax_rows: Optional[Array] = None
+        self._apex_velocity: Array = np.empty(0)
+
+        solution = super().solve(previous_solution)
+
+        if self.error_samples > 0 and self.envelope is not None:
+            contexts = [
+                self.local_context(node.track_node, node.transient_variables)
+                for node in solution.nodes
+            ]
+            velocity = np.array(
+                [node.initial_velocity for node in solution.nodes]
+            )
+            self.error = self.envelope.error_bound(
+                self.vehicle_model, contexts, velocity, self.error_samples
+            )
+            logger.info(f"Envelope error bound: {self.error}")
+
+        return solution
+
+    def _solve_maximum_velocities(
+        self, nodes: NodeArrays, contexts: list[NodeContext]
+    ) -> Array:
+        soc = np.array([ctx.state.soc for ctx in contexts])
+        temperature = np.array(
+            [ctx.state.cell_temperature for ctx in contexts]
+        )
+
+        envelope = self._get_envelope(nodes, soc, temperature)
+
+        self._maximum_ax_rows = envelope.maximum_ax_rows(
+            nodes.curvature, soc, temperature
+        )
+        self._minimum_ax_rows = envelope.minimum_ax_rows(nodes.curvature)
+        self._apex_velocity = envelope.apex_velocities(nodes.curvature)
+        return self._apex_velocity
+
+    def _get_envelope(
+        self, nodes: NodeArrays, soc: Array, temperature: Array
+    ) -> PerformanceEnvelope:
+        """
+        Get an envelope which covers the given nodes and states,
+        building a new one if the current envelope does not.
+        """
+        maximum_curvature = max(
+            float(np.max(np.abs(nodes.curvature))), MINIMUM_CURVATURE_RANGE
+        )
+        soc_range = (float(np.min(soc)), float(np.max(soc)))
+        temperature_range = (
+            float(np.min(temperature)),
+            float(np.max(temperature)),
+        )
+
+        envelope = self.envelope
+        if envelope is None or not _covers(
+            envelope, maximum_curvature, soc_range, temperature_range
+        ):
+            logger.info("Building performance envelope...")
+            envelope = PerformanceEnvelope.build(
+                self.vehicle_model,
+                self.global_context,
+                maximum_curvature,
+                soc_range=soc_range,
+                temperature_range=temperature_range,
+                resolution=self.resolution,
+            )
+            self.envelope = envelope
+        return envelope
+
+    def _accelerate(
+        self, index: int, ctx: NodeContext, initial_velocity: float
+    ) -> float:
+        assert self.envelope is not None and self._maximum_ax_rows is not None
+        ax = self.envelope.interpolate_velocity(
+            self._maximum_ax_rows[index],
+            initial_velocity,
+            self._apex_velocity[index],
+        )
+        return _next_velocity(initial_velocity, ax, ctx.node.length)
+
+    def _brake(
+        self, index: int, ctx: NodeContext, final_velocity: float
+    ) -> float:
+        assert self.envelope is not None and self._minimum_ax_rows is not None
+        ax = self.envelope.interpolate_velocity(
+            self._minimum_ax_rows[index],
+            final_velocity,
+            self._apex_velocity[index],
+        )
+        return _next_velocity(final_velocity, ax, -ctx.node.length)
+
+
+def _next_velocity(velocity: float, ax: float, distance: float) -> float:
+    """Get the velocity after travelling `distance` metres, or zero."""
+    return math.sqrt(max(velocity**2 + 2 * ax * distance, 0))
+
+
+def _covers(
+    envelope: PerformanceEnvelope,
+    maximum_curvature: float,
+    soc_range: tuple[float, float],
+    temperature_range: tuple[float, float],
+) -> bool:
+    """Check whether an envelope covers a range of conditions."""
+    return (
+        envelope.curvature[-1] >= maximum_curvature
+        and envelope.soc[0] <= soc_range[0]
+        and envelope.soc[-1] >= soc_range[1]
+        and envelope.temperature[0] <= temperature_range[0]
+        and envelope.temperature[-1] >= temperature_range[1]
+    )
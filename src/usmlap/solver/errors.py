@@ -62,3 +62,36 @@ class BelowTargetSOCError(SolverError):
 
     def overshoot(self, initial_soc: float) -> float:
         return (initial_soc - self.final_soc) / (initial_soc - self.target_soc)
+
+
+@dataclass
+class DischargeLimitNotFoundError(SolverError):
+    """
+    Error raised when no discharge current limit
+    meets the target state of charge.
+    """
+
+    trials: int
+    initial_soc: float
+    target_soc: float
+
+    def __str__(self) -> str:
+        return (
+            f"No discharge current limit meets the target SOC of "
+            f"{self.target_soc:.3f} from an initial SOC of "
+            f"{self.initial_soc:.3f} after {self.trials} solves."
+        )
+
+
+@dataclass
+class MemoryBudgetExceededError(SolverError):
+    """Error raised when a stored solution exceeds the memory budget."""
+
+    required: int
+    budget: int
+
+    def __str__(self) -> str:
+        return (
+            f"Storing the solution requires {self.required} bytes, "
+            f"which exceeds the memory budget of {self.budget} bytes."
+        )
@@ -0,0 +1,5 @@
+"""
+This subpackage implements a coarse-to-fine quasi-steady-state solver.
+"""
+
+from .multigrid import MultigridSolver as MultigridSolver
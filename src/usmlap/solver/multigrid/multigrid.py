@@ -0,0 +1,155 @@
+"""
+This module implements a coarse-to-fine quasi-steady-state solver,
+which solves a coarse mesh to decide where the fine mesh must be solved.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from usmlap.solver.qss import QuasiSteadyStateSolver
+from usmlap.solver.solution import Solution, SolutionNode
+from usmlap.track import TrackNode
+
+logger = logging.getLogger(__name__)
+
+type Array = np.ndarray[tuple[Any, ...], np.dtype[np.float64]]
+
+MINIMUM_COARSE_NODES = 3
+
+
+@dataclass
+class MultigridSolver(QuasiSteadyStateSolver):
+    """
+    Coarse-to-fine quasi-steady-state solver.
+
+    Groups of consecutive nodes are merged into a coarse mesh,
+    which is solved first to find the approximate velocity profile.
+    Apex velocities on the fine mesh are then only solved
+    near the lateral limit of the coarse solution,
+    which covers the apexes and the transitions into and out of them.
+    Each is seeded with the coarse apex velocity.
+    Elsewhere, the lateral limit does not constrain the velocity,
+    so the apex velocity is interpolated from the coarse solution.
+    The fine mesh is then propagated as normal,
+    so braking points and accelerations are resolved at full resolution.
+
+    Attributes:
+        coarsening (int): The number of fine nodes in each coarse node.
+        margin (float):
+            The fraction of the coarse apex velocity within which
+            a coarse node is considered to be at the lateral limit.
+        refined_fraction (float):
+            The fraction of fine nodes whose apex velocity
+            was solved in the last solve.
+    """
+
+    coarsening: int = 10
+    margin: float = 0.05
+    refined_fraction: float = field(default=0, init=False)
+
+    def _solve_maximum_velocities(self, solution: Solution) -> Solution:
+        """
+        Calculate the maximum velocity at each node,
+        only solving the nodes which are near the lateral limit.
+
+        Args:
+            solution (Solution): The solution with no maximum velocities.
+
+        Returns:
+            solution (Solution): The solution with maximum velocities solved.
+        """
+        number_of_nodes = len(solution.nodes)
+        if number_of_nodes < MINIMUM_COARSE_NODES * self.coarsening:
+            self.refined_fraction = 1
+            return super()._solve_maximum_velocities(solution)
+
+        logger.info("Solving coarse mesh...")
+        coarse = self._solve_coarse(solution)
+
+        velocity_estimate = np.interp(
+            _centres([node.track_node for node in solution.nodes]),
+            _centres([node.track_node for node in coarse.nodes]),
+            [node.maximum_velocity for node in coarse.nodes],
+        )
+        refined = self._refined_nodes(coarse)[:number_of_nodes]
+
+        for node, estimate, refine in zip(
+            solution.nodes, velocity_estimate, refined
+        ):
+            if not refine:
+                node.maximum_velocity = float(estimate)
+                continue
+            ctx = self.local_context(node.track_node, node.transient_variables)
+            node.maximum_velocity = self._solve_apex_velocity(
+                ctx, float(estimate)
+            )
+
+        self.refined_fraction = float(np.mean(refined))
+        logger.debug(
+            f"Solved apex velocities at {self.refined_fraction:.1%} of nodes."
+        )
+        return solution
+
+    def _solve_coarse(self, solution: Solution) -> Solution:
+        """Merge groups of nodes into a coarse mesh, and solve it."""
+        nodes = solution.nodes
+        groups = [
+            nodes[i : i + self.coarsening]
+            for i in range(0, len(nodes), self.coarsening)
+        ]
+        coarse_nodes = [
+            SolutionNode(
+                track_node=_merge([node.track_node for node in group]),
+                transient_variables=group[0].transient_variables,
+            )
+            for group in groups
+        ]
+        coarse_solver = QuasiSteadyStateSolver(
+            self.vehicle_model, self.global_context, apex_cache=self.apex_cache
+        )
+        return coarse_solver.solve(
+            Solution(nodes=coarse_nodes, vehicle_model=solution.vehicle_model)
+        )
+
+    def _refined_nodes(self, coarse: Solution) -> Array:
+        """
+        Find the fine nodes whose apex velocity must be solved.
+
+        These are the nodes of each coarse node which is an apex,
+        or whose velocity is within the margin of its apex velocity,
+        and of the coarse nodes either side of it.
+        """
+        at_limit = np.array(
+            [
+                node.is_apex()
+                or max(node.initial_velocity, node.final_velocity)
+                >= (1 - self.margin) * node.maximum_velocity
+                for node in coarse.nodes
+            ]
+        )
+        refined = at_limit.copy()
+        refined[1:] |= at_limit[:-1]
+        refined[:-1] |= at_limit[1:]
+        return np.repeat(refined, self.coarsening)
+
+
+def _merge(track_nodes: list[TrackNode]) -> TrackNode:
+    """
+    Merge consecutive track nodes into a single node.
+    The curvature is averaged so that the swept angle is preserved.
+    """
+    first = track_nodes[0]
+    length = sum(node.length for node in track_nodes)
+    return first.replace(
+        length=length,
+        curvature=sum(node.swept_angle for node in track_nodes) / length,
+        end_coordinate=track_nodes[-1].end_coordinate,
+    )
+
+
+def _centres(track_nodes: list[TrackNode]) -> Array:
+    """Get the position of the centre of each node."""
+    return np.array([node.position + node.length / 2 for node in track_nodes])
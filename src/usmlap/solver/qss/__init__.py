@@ -2,4 +2,9 @@
 This subpackage implements a Quasi Steady State laptime solver.
 """
 
-from .quasi_steady_state import QuasiSteadyStateSolver as QuasiSteadyStateSolver
+from .apex_cache import ApexVelocityCache as ApexVelocityCache
+from .quasi_steady_state import (
+    QuasiSteadyStateSolver as QuasiSteadyStateSolver,
+)
+from .warm_start import KernelStatistics as KernelStatistics
+from .warm_start import WarmStart as WarmStart
@@ -3,16 +3,24 @@ This module implements the acceleration solver,
 which calculates the maximum possible acceleration at a node.
 """
 
+from typing import Optional
+
 from usmlap.model import NodeContext, TractionModel
-from usmlap.model.errors import InsufficientTractionError, WheelLiftError
+from usmlap.model.errors import WheelLiftError
+from usmlap.model.traction import TractionStatus
 from usmlap.model.vehicle_state import Trajectory
 
+from .warm_start import WarmStart
+
 MAXIMUM_ITERATIONS = 100
 PRECISION = 1e-3
 
 
 def solve_acceleration(
-    model: TractionModel, ctx: NodeContext, initial_velocity: float
+    model: TractionModel,
+    ctx: NodeContext,
+    initial_velocity: float,
+    warm_start: Optional[WarmStart] = None,
 ) -> float:
     """
     Calculate the velocity at the end of a node,
@@ -23,36 +31,78 @@ def solve_acceleration(
         state (TransientVariables): The vehicle's state variables.
         node (TrackNode): The track node to solve.
         initial_velocity (float): The velocity at the start of the node.
+        warm_start (Optional[WarmStart]):
+            Previously converged accelerations, used to seed the solve.
 
     Returns:
         final_velocity (float): The velocity at the end of the node.
     """
+    trajectory = Trajectory(
+        velocity=initial_velocity,
+        ax=solve_maximum_ax(model, ctx, initial_velocity, warm_start),
+        curvature=ctx.node.curvature,
+    )
+    final_velocity = trajectory.next_velocity(ctx.node.length)
+    return final_velocity
+
+
+def solve_maximum_ax(
+    model: TractionModel,
+    ctx: NodeContext,
+    velocity: float,
+    warm_start: Optional[WarmStart] = None,
+) -> float:
+    """
+    Calculate the maximum longitudinal acceleration at a node.
+
+    If the vehicle model provides an analytic maximum acceleration,
+    it is used directly. Otherwise, it is solved by fixed-point iteration,
+    starting from the previously converged acceleration if one is available.
+
+    Args:
+        model (TractionModel): The vehicle model to use.
+        ctx (NodeContext): The context of the node to solve.
+        velocity (float): The velocity of the vehicle.
+        warm_start (Optional[WarmStart]):
+            Previously converged accelerations, used to seed the solve.
+
+    Returns:
+        ax (float): The maximum longitudinal acceleration.
+    """
     initial_ax = 0
+    if warm_start is not None:
+        initial_ax = warm_start.estimate("acceleration", ctx.node) or 0
     trajectory = Trajectory(
-        velocity=initial_velocity, ax=initial_ax, curvature=ctx.node.curvature
+        velocity=velocity, ax=initial_ax, curvature=ctx.node.curvature
     )
 
-    resistive_fx = sum(model.resistive_forces(ctx, initial_velocity))
-    drive_force = model.powertrain.drive_force(ctx, initial_velocity)
+    analytic_ax = model.analytic_maximum_ax(ctx, velocity)
+    if analytic_ax is not None:
+        return analytic_ax
+
+    resistive_fx = sum(model.resistive_forces(ctx, velocity))
+    drive_force = model.powertrain.drive_force(ctx, velocity)
 
     axs: list[float] = []
 
     for _ in range(1, MAXIMUM_ITERATIONS + 1):
         axs.append(trajectory.ax)
-        try:
-            traction_force = model.longitudinal_traction(ctx, trajectory)
-
-        except InsufficientTractionError as e:
-            trajectory.ax /= e.ratio
+        result = model.longitudinal_traction_status(ctx, trajectory)
+        if result.status is TractionStatus.INSUFFICIENT_TRACTION:
+            trajectory.ax /= result.ratio
             continue
 
-        except WheelLiftError as e:
+        if result.status is TractionStatus.WHEEL_LIFT:
+            e = result.error
+            assert isinstance(e, WheelLiftError)
             scale_factor = (
                 1 - (2 * e.max_wheel_lift) / e.longitudinal_load_transfer
             )
             trajectory.ax *= scale_factor
             continue
 
+        traction_force = result.forces
+
         limiting_force = min(sum(traction_force), drive_force)
         net_force = limiting_force - resistive_fx
         trajectory.ax = net_force / ctx.vehicle.equivalent_mass
@@ -60,5 +110,6 @@ def solve_acceleration(
         if abs(trajectory.ax - axs[-1]) < PRECISION:
             break
 
-    final_velocity = trajectory.next_velocity(ctx.node.length)
-    return final_velocity
+    if warm_start is not None:
+        warm_start.store("acceleration", ctx.node, trajectory.ax, len(axs))
+    return trajectory.ax
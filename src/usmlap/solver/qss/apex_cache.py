@@ -0,0 +1,143 @@
+"""
+This module implements a memo of apex velocity solutions,
+so that repeated track geometry is only solved once.
+"""
+
+import math
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+from usmlap.model import NodeContext, TractionModel
+
+from .apex_velocity import solve_apex_velocity
+from .warm_start import WarmStart
+
+type ApexKey = tuple[int, int, int, int, int, int, int]
+
+
+@dataclass
+class ApexVelocityCache(object):
+    """
+    Memo of apex velocities, keyed by quantised node conditions.
+
+    Nodes whose curvature, grip factor, banking, inclination
+    and transient state fall into the same bins share a single solve.
+    Curvature is binned relative to its magnitude,
+    so that tight and gentle corners are resolved to the same accuracy.
+    The least recently used entries are evicted once the cache is full.
+
+    Attributes:
+        curvature_quantum (float): Relative bin width of curvature.
+        angle_quantum (float): Bin width of banking and inclination (rad).
+        grip_quantum (float): Bin width of the grip factor.
+        soc_quantum (float): Bin width of the state of charge.
+        temperature_quantum (float): Bin width of the cell temperature (degC).
+        maximum_size (int, optional):
+            The maximum number of entries, or `None` for no limit.
+        hits (int): The number of solves served from the cache.
+        misses (int): The number of solves which were not cached.
+    """
+
+    curvature_quantum: float = 1e-4
+    angle_quantum: float = 1e-4
+    grip_quantum: float = 1e-4
+    soc_quantum: float = 0.05
+    temperature_quantum: float = 1
+    maximum_size: Optional[int] = 10000
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _entries: OrderedDict[ApexKey, float] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+
+    def solve_apex_velocity(
+        self,
+        vehicle_model: TractionModel,
+        ctx: NodeContext,
+        velocity_estimate: Optional[float] = None,
+        warm_start: Optional[WarmStart] = None,
+    ) -> float:
+        """
+        Get the apex velocity at a node,
+        solving it only if no similar node has been solved.
+
+        Args:
+            vehicle_model (TractionModel): The vehicle model to use.
+            ctx (NodeContext): The simulation context.
+            velocity_estimate (Optional[float]):
+                The initial velocity estimate, used on a cache miss.
+            warm_start (Optional[WarmStart]):
+                Previously converged apex velocities, used on a cache miss.
+
+        Returns:
+            apex_velocity (float): The apex velocity at the node.
+        """
+        key = self.get_key(ctx)
+        velocity = self._entries.get(key)
+        if velocity is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return velocity
+
+        self.misses += 1
+        velocity = solve_apex_velocity(
+            vehicle_model=vehicle_model,
+            ctx=ctx,
+            velocity_estimate=velocity_estimate,
+            warm_start=warm_start,
+        )
+        self._entries[key] = velocity
+        if self.maximum_size is not None:
+            while len(self._entries) > self.maximum_size:
+                self._entries.popitem(last=False)
+        return velocity
+
+    def get_key(self, ctx: NodeContext) -> ApexKey:
+        """
+        Get the cache key of a node.
+
+        Args:
+            ctx (NodeContext): The simulation context.
+
+        Returns:
+            key (ApexKey): The quantised conditions at the node.
+        """
+        node = ctx.node
+        state = ctx.state
+        return (
+            int(math.copysign(1, node.curvature)) if node.curvature else 0,
+            _quantise_relative(node.curvature, self.curvature_quantum),
+            round(node.grip_factor / self.grip_quantum),
+            round(node.banking / self.angle_quantum),
+            round(node.inclination / self.angle_quantum),
+            round(state.soc / self.soc_quantum),
+            round(state.cell_temperature / self.temperature_quantum),
+        )
+
+    @property
+    def size(self) -> int:
+        """The number of cached entries."""
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of solves served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0
+
+    def clear(self) -> None:
+        """Remove all entries and reset the hit and miss counts."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def _quantise_relative(value: float, quantum: float) -> int:
+    """
+    Quantise the magnitude of a value on a logarithmic scale,
+    so that the bin width is proportional to the magnitude.
+    """
+    if value == 0:
+        return 0
+    return round(math.log(abs(value)) / math.log1p(quantum))
@@ -9,9 +9,12 @@ from typing import Optional
 
 from usmlap.model import NodeContext, TractionModel
 from usmlap.model.errors import WheelLiftError
+from usmlap.model.traction import TractionStatus
 from usmlap.model.vehicle_state import Trajectory
 from usmlap.solver.errors import MaximumIterationsExceededError
 
+from .warm_start import WarmStart
+
 PRECISION = 1e-2
 MAXIMUM_ITERATIONS = 100
 
@@ -25,6 +28,7 @@ def solve_apex_velocity(
     velocity_estimate: Optional[float] = None,
     precision: float = PRECISION,
     maximum_iterations: int = MAXIMUM_ITERATIONS,
+    warm_start: Optional[WarmStart] = None,
 ) -> float:
     """
     Calculate the apex velocity at a node.
@@ -32,6 +36,12 @@ def solve_apex_velocity(
     while maintaining lateral traction,
     with zero longitudinal acceleration.
 
+    If the vehicle model provides an analytic apex velocity,
+    it is used directly.
+    Otherwise, the apex velocity is solved by fixed-point iteration.
+    If a warm start is given, the previously converged apex velocity
+    at the node takes precedence over the velocity estimate.
+
     Args:
         vehicle_model (TractionModel):
             The vehicle model to use.
@@ -44,6 +54,8 @@ def solve_apex_velocity(
         maximum_iterations (int):
             The maximum number of iterations to perform before raising an error.
             If high precision is required, this value may need to be increased.
+        warm_start (Optional[WarmStart]):
+            Previously converged apex velocities, used to seed the solve.
 
     Returns:
         apex_velocity (float): The apex velocity at the node.
@@ -57,6 +69,15 @@ def solve_apex_velocity(
     if ctx.node.curvature == 0:
         return maximum_velocity
 
+    analytic_velocity = vehicle_model.analytic_apex_velocity(ctx)
+    if analytic_velocity is not None:
+        return min(analytic_velocity, maximum_velocity)
+
+    if warm_start is not None:
+        previous_velocity = warm_start.estimate("apex", ctx.node)
+        if previous_velocity is not None:
+            velocity_estimate = previous_velocity
+
     if velocity_estimate is None:
         velocity_estimate = maximum_velocity
 
@@ -68,12 +89,14 @@ def solve_apex_velocity(
 
     for _ in range(1, maximum_iterations + 1):
         velocities.append(trajectory.velocity)
-        try:
-            available_fy = vehicle_model.lateral_traction(ctx, trajectory)
-            ay = sum(available_fy) / ctx.vehicle.total_mass
+        result = vehicle_model.lateral_traction_status(ctx, trajectory)
+        if result.status is TractionStatus.OK:
+            ay = sum(result.forces) / ctx.vehicle.total_mass
             trajectory.ay = math.copysign(ay, trajectory.curvature)
 
-        except WheelLiftError as e:
+        elif result.status is TractionStatus.WHEEL_LIFT:
+            e = result.error
+            assert isinstance(e, WheelLiftError)
             # TODO: Make this more robust
             scale_factor = 1 - (2 * e.max_wheel_lift) / e.lateral_load_transfer
             clamped_scale_factor = min(
@@ -82,12 +105,27 @@ def solve_apex_velocity(
             trajectory.ay *= clamped_scale_factor * scale_factor
             continue
 
+        else:
+            raise result.error
+
         if abs(trajectory.velocity - velocities[-1]) < precision:
-            return trajectory.velocity
+            return _converged(warm_start, ctx, trajectory.velocity, velocities)
 
         if trajectory.velocity >= maximum_velocity:
-            return maximum_velocity
+            return _converged(warm_start, ctx, maximum_velocity, velocities)
 
     raise MaximumIterationsExceededError(
         maximum_iterations, precision, velocities
     )
+
+
+def _converged(
+    warm_start: Optional[WarmStart],
+    ctx: NodeContext,
+    velocity: float,
+    velocities: list[float],
+) -> float:
+    """Store a converged apex velocity in the warm start, if there is one."""
+    if warm_start is not None:
+        warm_start.store("apex", ctx.node, velocity, len(velocities))
+    return velocity
@@ -3,16 +3,24 @@ This module implements the braking solver,
 which calculates the maximum possible braking at a node.
 """
 
+from typing import Optional
+
 from usmlap.model import NodeContext, TractionModel
-from usmlap.model.errors import InsufficientTractionError, WheelLiftError
+from usmlap.model.errors import WheelLiftError
+from usmlap.model.traction import TractionStatus
 from usmlap.model.vehicle_state import Trajectory
 
+from .warm_start import WarmStart
+
 MAXIMUM_ITERATIONS = 100
 PRECISION = 1e-3
 
 
 def solve_braking(
-    vehicle_model: TractionModel, ctx: NodeContext, final_velocity: float
+    vehicle_model: TractionModel,
+    ctx: NodeContext,
+    final_velocity: float,
+    warm_start: Optional[WarmStart] = None,
 ) -> float:
     """
     Calculate the velocity at the start of a node,
@@ -23,40 +31,85 @@ def solve_braking(
         state (TransientVariables): The vehicle's state variables.
         node (TrackNode): The track node to solve.
         final_velocity (float): The velocity at the end of the node.
+        warm_start (Optional[WarmStart]):
+            Previously converged decelerations, used to seed the solve.
 
     Returns:
         initial_velocity (float): The velocity at the start of the node.
     """
+    trajectory = Trajectory(
+        velocity=final_velocity,
+        ax=solve_minimum_ax(vehicle_model, ctx, final_velocity, warm_start),
+        curvature=ctx.node.curvature,
+    )
+    initial_velocity = trajectory.next_velocity(-ctx.node.length)
+    return initial_velocity
+
+
+def solve_minimum_ax(
+    vehicle_model: TractionModel,
+    ctx: NodeContext,
+    velocity: float,
+    warm_start: Optional[WarmStart] = None,
+) -> float:
+    """
+    Calculate the minimum (maximum braking) longitudinal acceleration
+    at a node.
+
+    If the vehicle model provides an analytic minimum acceleration,
+    it is used directly. Otherwise, it is solved by fixed-point iteration,
+    starting from the previously converged deceleration if one is available.
+
+    Args:
+        vehicle_model (TractionModel): The vehicle model to use.
+        ctx (NodeContext): The context of the node to solve.
+        velocity (float): The velocity of the vehicle.
+        warm_start (Optional[WarmStart]):
+            Previously converged decelerations, used to seed the solve.
+
+    Returns:
+        ax (float): The minimum longitudinal acceleration.
+    """
     initial_ax = 0
+    if warm_start is not None:
+        initial_ax = warm_start.estimate("braking", ctx.node) or 0
 
     trajectory = Trajectory(
-        velocity=final_velocity, ax=initial_ax, curvature=ctx.node.curvature
+        velocity=velocity, ax=initial_ax, curvature=ctx.node.curvature
     )
+
+    analytic_ax = vehicle_model.analytic_minimum_ax(ctx, velocity)
+    if analytic_ax is not None:
+        return analytic_ax
+
     axs: list[float] = []
 
-    resistive_fx = sum(vehicle_model.resistive_forces(ctx, final_velocity))
+    resistive_fx = sum(vehicle_model.resistive_forces(ctx, velocity))
 
     for _ in range(1, MAXIMUM_ITERATIONS + 1):
         axs.append(trajectory.ax)
-        try:
-            traction = vehicle_model.braking_traction(ctx, trajectory)
-
-        except InsufficientTractionError as e:
-            trajectory.ax /= e.ratio
+        result = vehicle_model.braking_traction_status(ctx, trajectory)
+        if result.status is TractionStatus.INSUFFICIENT_TRACTION:
+            trajectory.ax /= result.ratio
             continue
 
-        except WheelLiftError as e:
+        if result.status is TractionStatus.WHEEL_LIFT:
+            e = result.error
+            assert isinstance(e, WheelLiftError)
             scale_factor = (
                 1 - (2 * e.max_wheel_lift) / e.longitudinal_load_transfer
             )
             trajectory.ax *= scale_factor
             continue
 
+        traction = result.forces
+
         net_force = -(sum(traction) + resistive_fx)
         trajectory.ax = net_force / ctx.vehicle.equivalent_mass
 
         if abs(trajectory.ax - axs[-1]) < PRECISION:
             break
 
-    initial_velocity = trajectory.next_velocity(-ctx.node.length)
-    return initial_velocity
+    if warm_start is not None:
+        warm_start.store("braking", ctx.node, trajectory.ax, len(axs))
+    return trajectory.ax
@@ -0,0 +1,382 @@
+"""
+This module implements parallel forward and backward propagation
+of the quasi-steady-state solution between apexes.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass
+from typing import Literal
+
+from usmlap.model import GlobalContext, TractionModel, TransientVariables
+from usmlap.solver.solution import Solution
+from usmlap.track import TrackNode
+
+from .acceleration import solve_acceleration
+from .braking import solve_braking
+
+type Backend = Literal["thread", "process"]
+type Span = tuple[int, int]
+
+TASKS_PER_WORKER = 4
+
+
+@dataclass
+class PropagationState(object):
+    """
+    The velocities of a range of solution nodes, as plain lists,
+    so that they can be propagated independently of the linked nodes.
+
+    Attributes:
+        track_nodes (list[TrackNode]): The track node of each node.
+        states (list[TransientVariables]):
+            The transient variables of each node.
+        maximum_velocity (list[float]): The maximum velocity of each node.
+        initial_velocity (list[float]): The initial velocity of each node.
+        final_velocity (list[float]): The final velocity of each node.
+        initial_anchored (list[bool]):
+            Whether the initial velocity of each node is anchored.
+        final_anchored (list[bool]):
+            Whether the final velocity of each node is anchored.
+    """
+
+    track_nodes: list[TrackNode]
+    states: list[TransientVariables]
+    maximum_velocity: list[float]
+    initial_velocity: list[float]
+    final_velocity: list[float]
+    initial_anchored: list[bool]
+    final_anchored: list[bool]
+
+    @classmethod
+    def from_solution(cls, solution: Solution) -> PropagationState:
+        nodes = solution.nodes
+        return cls(
+            track_nodes=[node.track_node for node in nodes],
+            states=[node.transient_variables for node in nodes],
+            maximum_velocity=[node.maximum_velocity for node in nodes],
+            initial_velocity=[node.initial_velocity for node in nodes],
+            final_velocity=[node.final_velocity for node in nodes],
+            initial_anchored=[
+                node.initial_velocity_anchored for node in nodes
+            ],
+            final_anchored=[node.final_velocity_anchored for node in nodes],
+        )
+
+    def get_span(self, start: int, end: int) -> PropagationState:
+        """Get a copy of the state of the nodes from `start` to `end`."""
+        return PropagationState(
+            track_nodes=self.track_nodes[start:end],
+            states=self.states[start:end],
+            maximum_velocity=self.maximum_velocity[start:end],
+            initial_velocity=self.initial_velocity[start:end],
+            final_velocity=self.final_velocity[start:end],
+            initial_anchored=self.initial_anchored[start:end],
+            final_anchored=self.final_anchored[start:end],
+        )
+
+    def set_span(self, start: int, span: PropagationState) -> None:
+        """Overwrite the velocities of the nodes from `start` with a span."""
+        end = start + len(span.initial_velocity)
+        self.initial_velocity[start:end] = span.initial_velocity
+        self.final_velocity[start:end] = span.final_velocity
+
+    def apply(self, solution: Solution) -> None:
+        """Write the velocities back to the nodes of a solution."""
+        for node, initial_velocity, final_velocity in zip(
+            solution.nodes, self.initial_velocity, self.final_velocity
+        ):
+            node.set_initial_velocity(initial_velocity)
+            node.set_final_velocity(final_velocity)
+
+
+@dataclass
+class ParallelPropagator(object):
+    """
+    Parallel propagation of a solution between apexes.
+
+    The solution is partitioned at its apexes,
+    and each apex-to-apex span is propagated concurrently,
+    assuming that the velocity at each apex is its maximum velocity.
+    The spans are then merged in order.
+    Where a span reaches an apex below its maximum velocity,
+    the apex is removed and the next span is propagated again
+    from the new boundary velocity,
+    exactly as the serial solver would continue past that apex.
+    The merged velocities are therefore identical to serial propagation.
+
+    Attributes:
+        vehicle_model (TractionModel): The vehicle model to use.
+        global_context (GlobalContext): The simulation context.
+        workers (int): The number of workers.
+        backend (Backend):
+            Whether to use a pool of processes or threads.
+            Propagation holds the global interpreter lock,
+            so only processes propagate concurrently,
+            but the model and context must be picklable to use them.
+    """
+
+    vehicle_model: TractionModel
+    global_context: GlobalContext
+    workers: int = 2
+    backend: Backend = "process"
+
+    def propagate(self, solution: Solution) -> Solution:
+        """
+        Propagate a solution forward and backward from its apexes.
+
+        Args:
+            solution (Solution): The solution with apexes identified.
+
+        Returns:
+            solution (Solution): The propagated solution.
+        """
+        state = PropagationState.from_solution(solution)
+        with self._create_executor() as executor:
+            self._propagate_forward(executor, solution, state)
+            self._propagate_backward(executor, solution, state)
+        state.apply(solution)
+        return solution
+
+    def _create_executor(self) -> Executor:
+        if self.backend == "process":
+            return ProcessPoolExecutor(max_workers=self.workers)
+        return ThreadPoolExecutor(max_workers=self.workers)
+
+    def _map(
+        self,
+        executor: Executor,
+        direction: Literal["forward", "backward"],
+        tasks: list[tuple[PropagationState, float]],
+    ) -> list[tuple[PropagationState, float, bool]]:
+        """Propagate a list of spans in the executor, preserving order."""
+        if not tasks:
+            return []
+        batch_size = -(-len(tasks) // (self.workers * TASKS_PER_WORKER))
+        batches = [
+            tasks[i : i + batch_size] for i in range(0, len(tasks), batch_size)
+        ]
+        function = (
+            _propagate_forward_batch
+            if direction == "forward"
+            else _propagate_backward_batch
+        )
+        results = executor.map(
+            function,
+            [self.vehicle_model] * len(batches),
+            [self.global_context] * len(batches),
+            batches,
+        )
+        return [result for batch in results for result in batch]
+
+    def _propagate_forward(
+        self, executor: Executor, solution: Solution, state: PropagationState
+    ) -> None:
+        """
+        Propagate forward from every apex.
+
+        Each span runs from an apex up to the next apex.
+        Where an apex is retained, its initial velocity is set by
+        whichever propagation the serial solver would run last,
+        which is determined by the order of the apex velocities.
+        """
+        order = {
+            apex: rank
+            for rank, apex in enumerate(solution.get_sorted_apex_indices())
+        }
+        apexes = sorted(order)
+        spans = _spans(apexes, len(solution.nodes))
+        results = self._map(
+            executor,
+            "forward",
+            [
+                (state.get_span(start, end), state.maximum_velocity[start])
+                for start, end in spans
+            ],
+        )
+
+        origin, arrival = None, 0.0
+        for (start, end), (span, span_arrival, _) in zip(spans, results):
+            node = solution.nodes[start]
+            if origin is not None and arrival < node.maximum_velocity:
+                node.remove_apex()
+                span, span_arrival, _ = _propagate_forward_span(
+                    self.vehicle_model,
+                    self.global_context,
+                    state.get_span(start, end),
+                    arrival,
+                )
+            else:
+                if (
+                    origin is not None
+                    and order[origin] > order[start]
+                    and not span.initial_anchored[0]
+                ):
+                    span.initial_velocity[0] = arrival
+                origin = start
+            state.set_span(start, span)
+            arrival = span_arrival
+
+    def _propagate_backward(
+        self, executor: Executor, solution: Solution, state: PropagationState
+    ) -> None:
+        """
+        Propagate backward from every apex.
+
+        Each span runs back from an apex to the previous apex.
+        """
+        apexes = sorted(solution.get_apex_indices())
+        spans = [(apexes[i - 1], apexes[i] + 1) for i in range(1, len(apexes))]
+        results = self._map(
+            executor,
+            "backward",
+            [(state.get_span(start, end), 0) for start, end in spans],
+        )
+
+        boundary_changed = False
+        for (start, end), (span, _, crossed) in reversed(
+            list(zip(spans, results))
+        ):
+            if boundary_changed:
+                span, _, crossed = _propagate_backward_span(
+                    self.vehicle_model,
+                    self.global_context,
+                    state.get_span(start, end),
+                    0,
+                )
+            previous_final_velocity = state.final_velocity[start]
+            state.set_span(start, span)
+            if crossed:
+                solution.nodes[start].remove_apex()
+            boundary_changed = (
+                state.final_velocity[start] != previous_final_velocity
+            )
+
+
+def _spans(apexes: list[int], number_of_nodes: int) -> list[Span]:
+    """Partition the nodes into spans starting at each apex."""
+    boundaries = [*apexes, number_of_nodes]
+    return [
+        (boundaries[i], boundaries[i + 1])
+        for i in range(len(apexes))
+        if boundaries[i] < boundaries[i + 1]
+    ]
+
+
+def _propagate_forward_span(
+    vehicle_model: TractionModel,
+    global_context: GlobalContext,
+    span: PropagationState,
+    entry_velocity: float,
+) -> tuple[PropagationState, float, bool]:
+    """
+    Propagate a span forward from its first node.
+
+    This mirrors `QuasiSteadyStateSolver._propagate_forward`,
+    stopping at the end of the span rather than at the next apex.
+
+    Args:
+        vehicle_model (TractionModel): The vehicle model to use.
+        global_context (GlobalContext): The simulation context.
+        span (PropagationState): The nodes to propagate.
+        entry_velocity (float): The initial velocity of the first node.
+
+    Returns:
+        span (PropagationState): The propagated span.
+        arrival (float): The final velocity of the last node.
+        crossed (bool): Unused, for symmetry with backward propagation.
+    """
+    if not span.initial_anchored[0]:
+        span.initial_velocity[0] = entry_velocity
+
+    final_velocity = entry_velocity
+    number_of_nodes = len(span.track_nodes)
+    for i in range(number_of_nodes):
+        ctx = global_context.get_local_context(
+            span.track_nodes[i], span.states[i]
+        )
+        potential_velocity = solve_acceleration(
+            model=vehicle_model,
+            ctx=ctx,
+            initial_velocity=span.initial_velocity[i],
+        )
+        final_velocity = min(potential_velocity, span.maximum_velocity[i])
+        if not span.final_anchored[i]:
+            span.final_velocity[i] = final_velocity
+        if i + 1 < number_of_nodes and not span.initial_anchored[i + 1]:
+            span.initial_velocity[i + 1] = final_velocity
+
+    return span, final_velocity, False
+
+
+def _propagate_backward_span(
+    vehicle_model: TractionModel,
+    global_context: GlobalContext,
+    span: PropagationState,
+    _: float,
+) -> tuple[PropagationState, float, bool]:
+    """
+    Propagate a span backward from its last node.
+
+    This mirrors `QuasiSteadyStateSolver._propagate_backward`,
+    stopping at the start of the span rather than at the previous apex.
+
+    Args:
+        vehicle_model (TractionModel): The vehicle model to use.
+        global_context (GlobalContext): The simulation context.
+        span (PropagationState):
+            The nodes to propagate, from the previous apex to this apex.
+
+    Returns:
+        span (PropagationState): The propagated span.
+        entry (float): The final velocity of the first node.
+        crossed (bool):
+            `True` if the propagation reached the previous apex,
+            which must be removed, otherwise `False`.
+    """
+    for i in range(len(span.track_nodes) - 1, 0, -1):
+        if span.final_velocity[i - 1] < span.final_velocity[i]:
+            return span, span.final_velocity[0], False
+
+        ctx = global_context.get_local_context(
+            span.track_nodes[i], span.states[i]
+        )
+        potential_velocity = solve_braking(
+            vehicle_model=vehicle_model,
+            ctx=ctx,
+            final_velocity=span.final_velocity[i],
+        )
+        initial_velocity = min(potential_velocity, span.final_velocity[i - 1])
+        if not span.initial_anchored[i]:
+            span.initial_velocity[i] = initial_velocity
+        if not span.final_anchored[i - 1]:
+            span.final_velocity[i - 1] = initial_velocity
+
+    return span, span.final_velocity[0], True
+
+
+def _propagate_forward_batch(
+    vehicle_model: TractionModel,
+    global_context: GlobalContext,
+    tasks: list[tuple[PropagationState, float]],
+) -> list[tuple[PropagationState, float, bool]]:
+    return [
+        _propagate_forward_span(vehicle_model, global_context, span, entry)
+        for span, entry in tasks
+    ]
+
+
+def _propagate_backward_batch(
+    vehicle_model: TractionModel,
+    global_context: GlobalContext,
+    tasks: list[tuple[PropagationState, float]],
+) -> list[tuple[PropagationState, float, bool]]:
+    return [
+        _propagate_backward_span(vehicle_model, global_context, span, entry)
+        for span, entry in tasks
+    ]
@@ -3,26 +3,51 @@ This module implements a quasi-steady-state solver.
 """
 
 import logging
+import math
+from dataclasses import dataclass
+from typing import Optional
 
 from rich import progress
 from scipy.signal import find_peaks
 
-from usmlap.model.vehicle_state import Trajectory
-from usmlap.solver.solution import Solution
+from usmlap.model import NodeContext
+from usmlap.solver.solution import DeferredVehicleState, Solution
 from usmlap.solver.solver_interface import SolverInterface
 
 from .acceleration import solve_acceleration
+from .apex_cache import ApexVelocityCache
 from .apex_velocity import solve_apex_velocity
 from .braking import solve_braking
+from .parallel import Backend, ParallelPropagator
+from .warm_start import WarmStart
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
 class QuasiSteadyStateSolver(SolverInterface):
     """
     Quasi-steady-state solver.
+
+    Attributes:
+        apex_cache (ApexVelocityCache, optional):
+            Memo of apex velocities, shared between nodes
+            with similar conditions. By default, every node is solved.
+        warm_start (WarmStart, optional):
+            Converged values from a previous solve of the same mesh,
+            used to seed the fixed-point solvers at each node.
+        workers (int): The number of workers used to propagate
+            the spans between apexes concurrently.
+            Set to 1 to propagate serially.
+            The warm start is not used for concurrent propagation.
+        backend (Backend): Whether to propagate with processes or threads.
     """
 
+    apex_cache: Optional[ApexVelocityCache] = None
+    warm_start: Optional[WarmStart] = None
+    workers: int = 1
+    backend: Backend = "process"
+
     def solve(self, previous_solution: Solution) -> Solution:
 
         solution = previous_solution
@@ -35,6 +60,37 @@ class QuasiSteadyStateSolver(SolverInterface):
         logger.info("Finding apexes...")
         solution.set_apexes(_find_apexes(solution))
 
+        if self.workers > 1:
+            logger.info("Solving propagation in parallel...")
+            solution = ParallelPropagator(
+                vehicle_model=solution.vehicle_model,
+                global_context=self.global_context,
+                workers=self.workers,
+                backend=self.backend,
+            ).propagate(solution)
+        else:
+            solution = self._propagate(solution)
+
+        logger.info("Resolving powertrain state...")
+        for node in solution.nodes:
+            ctx = self.local_context(node.track_node, node.transient_variables)
+            node.deferred_state = DeferredVehicleState.evaluate(
+                self.vehicle_model, ctx, node.trajectory
+            )
+
+        return solution
+
+    def _propagate(self, solution: Solution) -> Solution:
+        """
+        Propagate the solution forward and backward from each apex,
+        in order of increasing apex velocity.
+
+        Args:
+            solution (Solution): The solution with apexes identified.
+
+        Returns:
+            solution (Solution): The propagated solution.
+        """
         logger.info("Solving forward propagation...")
         for apex in progress.track(
             solution.get_sorted_apex_indices(),
@@ -53,18 +109,6 @@ class QuasiSteadyStateSolver(SolverInterface):
             if solution.nodes[apex].is_apex():
                 solution = self._propagate_backward(solution, start_index=apex)
 
-        logger.info("Resolving full vehicle state...")
-        for node in solution.nodes:
-            ctx = self.local_context(node.track_node, node.transient_variables)
-            trajectory = Trajectory(
-                velocity=node.average_velocity,
-                ax=node.longitudinal_acceleration,
-                curvature=node.track_node.curvature,
-            )
-            node.calculated_vehicle_state = (
-                self.vehicle_model.evaluate_full_vehicle_state(ctx, trajectory)
-            )
-
         return solution
 
     def _solve_maximum_velocities(self, solution: Solution) -> Solution:
@@ -88,15 +132,46 @@ class QuasiSteadyStateSolver(SolverInterface):
             transient=True,
         ):
             ctx = self.local_context(node.track_node, node.transient_variables)
-            velocity = solve_apex_velocity(
-                vehicle_model=self.vehicle_model,
-                ctx=ctx,
-                velocity_estimate=previous_velocity,
-            )
+            velocity = self._solve_apex_velocity(ctx, previous_velocity)
             node.maximum_velocity = velocity
             previous_velocity = velocity
+
+        if self.apex_cache is not None:
+            logger.debug(
+                f"Apex cache: {self.apex_cache.hits} hits, "
+                f"{self.apex_cache.misses} misses."
+            )
         return solution
 
+    def _solve_apex_velocity(
+        self, ctx: NodeContext, velocity_estimate: Optional[float]
+    ) -> float:
+        """
+        Calculate the apex velocity at a node,
+        using the apex cache if there is one.
+
+        Args:
+            ctx (NodeContext): The context of the node to solve.
+            velocity_estimate (float, optional):
+                An initial estimate of the apex velocity.
+
+        Returns:
+            velocity (float): The apex velocity.
+        """
+        if self.apex_cache is None:
+            return solve_apex_velocity(
+                vehicle_model=self.vehicle_model,
+                ctx=ctx,
+                velocity_estimate=velocity_estimate,
+                warm_start=self.warm_start,
+            )
+        return self.apex_cache.solve_apex_velocity(
+            vehicle_model=self.vehicle_model,
+            ctx=ctx,
+            velocity_estimate=velocity_estimate,
+            warm_start=self.warm_start,
+        )
+
     def _propagate_forward(
         self, solution: Solution, start_index: int
     ) -> Solution:
@@ -121,6 +196,7 @@ class QuasiSteadyStateSolver(SolverInterface):
                 model=solution.vehicle_model,
                 ctx=ctx,
                 initial_velocity=node.initial_velocity,
+                warm_start=self.warm_start,
             )
 
             final_velocity = min(potential_velocity, node.maximum_velocity)
@@ -171,6 +247,7 @@ class QuasiSteadyStateSolver(SolverInterface):
                 vehicle_model=solution.vehicle_model,
                 ctx=ctx,
                 final_velocity=node.final_velocity,
+                warm_start=self.warm_start,
             )
 
             initial_velocity = min(
@@ -189,6 +266,9 @@ def _find_apexes(solution: Solution) -> list[int]:
     Identify the apexes of a solution.
 
     Apexes are the indices at which the maximum velocity is a local minimum.
+    Where the minimum is a plateau, such as a constant-radius corner,
+    the apex is placed at the start of the plateau,
+    as this is where braking into the corner must finish.
 
     Args:
         solution (Solution): The solution to analyse.
@@ -196,8 +276,13 @@ def _find_apexes(solution: Solution) -> list[int]:
     Returns:
         apexes (list[int]): The indices of the apexes.
     """
-    maximum_velocities = [-node.apex_velocity for node in solution]
-    apex_indices, _ = find_peaks(maximum_velocities)
-    apex_indices = set(apex_indices.tolist())
+    # Pad the ends so that minima at the boundaries are also found
+    maximum_velocities = [
+        -math.inf,
+        *(-node.apex_velocity for node in solution),
+        -math.inf,
+    ]
+    _, properties = find_peaks(maximum_velocities, plateau_size=1)
+    apex_indices = set((properties["left_edges"] - 1).tolist())
     apex_indices.update([0, len(solution.nodes) - 1])
     return list(apex_indices)
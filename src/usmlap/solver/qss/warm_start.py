@@ -0,0 +1,132 @@
+"""
+This module implements warm starting of the fixed-point solvers,
+so that repeated solves of a mesh are seeded with previously converged values.
+"""
+
+from dataclasses import dataclass, field
+from typing import Literal, Optional
+
+from usmlap.track import NodeArrays, TrackNode
+
+type Kernel = Literal["apex", "acceleration", "braking"]
+
+KERNELS: tuple[Kernel, ...] = ("apex", "acceleration", "braking")
+
+
+@dataclass
+class KernelStatistics(object):
+    """
+    Iteration counts of a fixed-point solver.
+
+    Attributes:
+        solves (int): The number of iterative solves.
+        iterations (int): The total number of iterations over all solves.
+    """
+
+    solves: int = 0
+    iterations: int = 0
+
+    @property
+    def mean_iterations(self) -> float:
+        """The mean number of iterations per solve."""
+        return self.iterations / self.solves if self.solves > 0 else 0
+
+    def record(self, iterations: int) -> None:
+        """Record a single solve."""
+        self.solves += 1
+        self.iterations += iterations
+
+    def reset(self) -> None:
+        """Reset the counts to zero."""
+        self.solves = 0
+        self.iterations = 0
+
+
+@dataclass
+class WarmStart(object):
+    """
+    Converged values of the fixed-point solvers at each track node.
+
+    The apex velocity, maximum acceleration and maximum braking
+    at each node are stored when solved,
+    and used as the initial estimate the next time the node is solved.
+    Nodes are identified by their row and lap in the arrays of their mesh,
+    so values are shared between solutions of the same mesh.
+    Values are only kept for one mesh at a time,
+    and are discarded when a node of another mesh is stored.
+
+    Attributes:
+        statistics (dict[Kernel, KernelStatistics]):
+            The iteration counts of each solver.
+    """
+
+    statistics: dict[Kernel, KernelStatistics] = field(
+        default_factory=lambda: {
+            kernel: KernelStatistics() for kernel in KERNELS
+        }
+    )
+    _estimates: dict[Kernel, dict[tuple[int, int], float]] = field(
+        default_factory=lambda: {kernel: {} for kernel in KERNELS},
+        init=False,
+        repr=False,
+    )
+    _arrays: Optional[NodeArrays] = field(default=None, init=False, repr=False)
+
+    def estimate(self, kernel: Kernel, node: TrackNode) -> Optional[float]:
+        """
+        Get the previously converged value at a node.
+
+        Args:
+            kernel (Kernel): The solver to get the value for.
+            node (TrackNode): The track node.
+
+        Returns:
+            estimate (float, optional):
+                The converged value, or `None` if the node has not been solved.
+        """
+        arrays, index, lap = node.row
+        if arrays is not self._arrays:
+            return None
+        return self._estimates[kernel].get((index, lap))
+
+    def store(
+        self, kernel: Kernel, node: TrackNode, value: float, iterations: int
+    ) -> None:
+        """
+        Store the converged value at a node.
+
+        Args:
+            kernel (Kernel): The solver which converged.
+            node (TrackNode): The track node.
+            value (float): The converged value.
+            iterations (int): The number of iterations taken to converge.
+        """
+        arrays, index, lap = node.row
+        if arrays is not self._arrays:
+            self._clear_estimates()
+            self._arrays = arrays
+        self._estimates[kernel][(index, lap)] = value
+        self.statistics[kernel].record(iterations)
+
+    def reset_statistics(self) -> None:
+        """Reset the iteration counts of every solver."""
+        for statistics in self.statistics.values():
+            statistics.reset()
+
+    def clear(self) -> None:
+        """Discard all stored values and reset the iteration counts."""
+        self._clear_estimates()
+        self._arrays = None
+        self.reset_statistics()
+
+    def _clear_estimates(self) -> None:
+        for estimates in self._estimates.values():
+            estimates.clear()
+
+    def summary(self) -> str:
+        """Summarise the mean iterations of each solver."""
+        return ", ".join(
+            f"{kernel}: {statistics.mean_iterations:.2f} "
+            f"({statistics.solves} solves)"
+            for kernel, statistics in self.statistics.items()
+        )
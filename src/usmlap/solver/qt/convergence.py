@@ -0,0 +1,207 @@
+"""
+This module implements convergence monitoring and acceleration
+for the outer loop of the quasi-transient solver.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from usmlap.model import TransientVariables
+from usmlap.solver.solution import Solution
+from usmlap.vehicle.powertrain import StateOfCharge
+
+
+@dataclass
+class ConvergenceHistory(object):
+    """
+    The convergence history of a quasi-transient solve.
+
+    Attributes:
+        times (list[float]): The total time after each iteration.
+        soc_residuals (list[float]):
+            The largest change in state of charge at any node
+            in each iteration.
+        temperature_residuals (list[float]):
+            The largest change in cell temperature (degC) at any node
+            in each iteration.
+        relaxation_factors (list[float]):
+            The relaxation factor applied in each iteration.
+        oscillations (list[bool]):
+            Whether the solution was oscillating in each iteration.
+    """
+
+    times: list[float] = field(default_factory=list)
+    soc_residuals: list[float] = field(default_factory=list)
+    temperature_residuals: list[float] = field(default_factory=list)
+    relaxation_factors: list[float] = field(default_factory=list)
+    oscillations: list[bool] = field(default_factory=list)
+
+    @property
+    def iterations(self) -> int:
+        """The number of iterations performed."""
+        return len(self.times)
+
+    def is_oscillating(self) -> bool:
+        """
+        Check if the total time is oscillating,
+        i.e. the last three changes in total time alternate in sign.
+        """
+        if len(self.times) < 4:
+            return False
+        changes = np.diff(self.times[-4:])
+        return bool(np.all(changes[1:] * changes[:-1] < 0))
+
+
+@dataclass
+class AitkenRelaxation(object):
+    """
+    Aitken dynamic relaxation of the transient variable field.
+
+    Each iteration of the quasi-transient solver is a fixed-point update
+    `x -> G(x)` of the transient variables at every node.
+    Rather than taking `G(x)` directly, the next field is extrapolated
+    along the residual `G(x) - x`, with a relaxation factor
+    estimated from the change in residual between iterations.
+    If the solution is oscillating, the relaxation factor is damped.
+
+    Both variables are scaled by their tolerance,
+    so that they contribute equally to the relaxation factor.
+
+    Attributes:
+        soc_tolerance (float):
+            The maximum change in state of charge at convergence.
+        temperature_tolerance (float):
+            The maximum change in cell temperature (degC) at convergence.
+        minimum_relaxation (float): The smallest relaxation factor allowed.
+        maximum_relaxation (float): The largest relaxation factor allowed.
+        damping (float):
+            The factor applied to the relaxation factor when oscillating.
+        history (ConvergenceHistory): The convergence history.
+    """
+
+    soc_tolerance: float = 1e-4
+    temperature_tolerance: float = 0.01
+    minimum_relaxation: float = 0.1
+    maximum_relaxation: float = 2
+    damping: float = 0.5
+    history: ConvergenceHistory = field(default_factory=ConvergenceHistory)
+    _relaxation: float = field(default=1, init=False, repr=False)
+    _previous_residual: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False
+    )
+
+    def relax(
+        self, solution: Solution, previous_field: np.ndarray
+    ) -> np.ndarray:
+        """
+        Relax the transient variables of a solution,
+        and record the iteration in the convergence history.
+
+        The solution is not modified, so that its transient variables
+        remain consistent with its velocities.
+        The relaxed field is only the input to the next iteration.
+
+        Args:
+            solution (Solution):
+                The solution, with transient variables
+                recalculated from the previous field.
+            previous_field (np.ndarray):
+                The transient variable field the solution was solved with,
+                as returned by `get_field`.
+
+        Returns:
+            relaxed_field (np.ndarray):
+                The transient variable field to solve the next iteration with.
+        """
+        updated_field = get_field(solution)
+        residual = self._scale(updated_field - previous_field)
+        self.history.times.append(solution.total_time)
+
+        oscillating = self.history.is_oscillating()
+        if self._previous_residual is not None:
+            change = residual - self._previous_residual
+            denominator = float(np.sum(change * change))
+            if denominator > 0:
+                numerator = float(np.sum(self._previous_residual * change))
+                self._relaxation *= -numerator / denominator
+        if oscillating:
+            self._relaxation *= self.damping
+        self._relaxation = min(
+            max(self._relaxation, self.minimum_relaxation),
+            self.maximum_relaxation,
+        )
+        self._previous_residual = residual
+
+        scaled_residual = np.abs(residual)
+        self.history.soc_residuals.append(
+            float(scaled_residual[0].max()) * self.soc_tolerance
+        )
+        self.history.temperature_residuals.append(
+            float(scaled_residual[1].max()) * self.temperature_tolerance
+        )
+        self.history.relaxation_factors.append(self._relaxation)
+        self.history.oscillations.append(oscillating)
+
+        return previous_field + self._relaxation * (
+            updated_field - previous_field
+        )
+
+    def residuals_converged(self) -> bool:
+        """
+        Check if the change in transient variables at every node
+        in the last iteration is within tolerance.
+        """
+        if not self.history.soc_residuals:
+            return False
+        return (
+            self.history.soc_residuals[-1] <= self.soc_tolerance
+            and self.history.temperature_residuals[-1]
+            <= self.temperature_tolerance
+        )
+
+    def reset(self) -> None:
+        """
+        Restart the relaxation, keeping the convergence history.
+        This must be called if the vehicle is modified between iterations.
+        """
+        self._relaxation = 1
+        self._previous_residual = None
+
+    def _scale(self, field: np.ndarray) -> np.ndarray:
+        """Scale each variable of a field by its tolerance."""
+        tolerances = np.array(
+            [[self.soc_tolerance], [self.temperature_tolerance]]
+        )
+        return field / tolerances
+
+
+def get_field(solution: Solution) -> np.ndarray:
+    """
+    Get the transient variable field of a solution.
+
+    Returns:
+        field (np.ndarray):
+            The state of charge and cell temperature at each node,
+            with shape (2, number of nodes).
+    """
+    return np.array(
+        [
+            [node.transient_variables.soc for node in solution],
+            [node.transient_variables.cell_temperature for node in solution],
+        ]
+    )
+
+
+def set_field(solution: Solution, field: np.ndarray) -> None:
+    """
+    Set the transient variables of a solution from a field,
+    clipping the state of charge to its valid range.
+    """
+    soc = np.clip(field[0], 0, 1)
+    for node, node_soc, cell_temperature in zip(solution, soc, field[1]):
+        node.transient_variables = TransientVariables(
+            soc=StateOfCharge(node_soc),
+            cell_temperature=float(cell_temperature),
+        )
@@ -0,0 +1,211 @@
+"""
+This module implements a root-finding search for the discharge current limit,
+such that the vehicle finishes with the target state of charge.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from usmlap.solver.errors import DischargeLimitNotFoundError
+
+OUT_OF_CHARGE_FACTOR = 0.7
+BRACKET_TOLERANCE = 1e-3
+
+
+@dataclass
+class DischargeLimitTrial(object):
+    """
+    A single solve of the discharge limit search.
+
+    Attributes:
+        limit (float): The discharge current limit.
+        final_soc (float, optional):
+            The state of charge at the finish,
+            or `None` if the vehicle ran out of charge.
+    """
+
+    limit: float
+    final_soc: Optional[float]
+
+    @property
+    def out_of_charge(self) -> bool:
+        return self.final_soc is None
+
+    def __str__(self) -> str:
+        if self.final_soc is None:
+            return f"{self.limit:.4f} -> out of charge"
+        return f"{self.limit:.4f} -> {self.final_soc:.4f}"
+
+
+@dataclass
+class DischargeLimitSearch(object):
+    """
+    Search for the highest discharge current limit
+    at which the final state of charge meets the target.
+
+    The limit is bracketed between a feasible limit,
+    which meets the target, and an infeasible limit, which does not.
+    Until a feasible limit is found, the limit is reduced
+    in proportion to the overshoot of the energy used.
+    The bracket is then narrowed by the Illinois variant of the secant method,
+    falling back to bisection if the vehicle ran out of charge.
+
+    Attributes:
+        target_soc (float): The minimum state of charge at the finish.
+        initial_soc (float): The state of charge at the start.
+        soc_tolerance (float):
+            The maximum amount by which the final state of charge
+            may exceed the target.
+        maximum_solves (int):
+            The maximum number of solves once a feasible limit is found.
+        maximum_trials (int):
+            The maximum number of solves in total.
+            If no feasible limit has been found by then,
+            `DischargeLimitNotFoundError` is raised.
+        trials (list[DischargeLimitTrial]): The trajectory of the search.
+    """
+
+    target_soc: float
+    initial_soc: float = 1
+    soc_tolerance: float = 1e-3
+    maximum_solves: int = 8
+    maximum_trials: int = 20
+    trials: list[DischargeLimitTrial] = field(default_factory=list)
+    _feasible: Optional[DischargeLimitTrial] = field(
+        default=None, init=False, repr=False
+    )
+    _infeasible: Optional[DischargeLimitTrial] = field(
+        default=None, init=False, repr=False
+    )
+    _last_feasible: Optional[bool] = field(
+        default=None, init=False, repr=False
+    )
+    _repeats: int = field(default=0, init=False, repr=False)
+
+    @property
+    def best_limit(self) -> Optional[float]:
+        """The highest feasible limit found, or `None` if there is none."""
+        return self._feasible.limit if self._feasible is not None else None
+
+    def record(self, limit: float, final_soc: Optional[float]) -> None:
+        """
+        Record the result of a solve.
+
+        Args:
+            limit (float): The discharge current limit.
+            final_soc (float, optional):
+                The state of charge at the finish,
+                or `None` if the vehicle ran out of charge.
+        """
+        trial = DischargeLimitTrial(limit=limit, final_soc=final_soc)
+        self.trials.append(trial)
+
+        feasible = self._is_feasible(trial)
+        if feasible == self._last_feasible:
+            self._repeats += 1
+        else:
+            self._repeats = 0
+        self._last_feasible = feasible
+
+        if feasible:
+            if self._feasible is None or limit > self._feasible.limit:
+                self._feasible = trial
+        elif self._infeasible is None or limit < self._infeasible.limit:
+            self._infeasible = trial
+
+    def is_complete(self) -> bool:
+        """
+        Check if the search is complete.
+        This requires a feasible limit, and either the final state of charge
+        to be within tolerance of the target, the bracket to be narrow,
+        or the maximum number of solves to have been reached.
+        """
+        if self._feasible is None or self._feasible.final_soc is None:
+            return False
+        if self._feasible.final_soc - self.target_soc <= self.soc_tolerance:
+            return True
+        if self._infeasible is None:
+            return True
+        width = self._infeasible.limit - self._feasible.limit
+        if width <= BRACKET_TOLERANCE * self._infeasible.limit:
+            return True
+        return (
+            self._solves_since_feasible() >= self.maximum_solves
+            or len(self.trials) >= self.maximum_trials
+        )
+
+    def next_limit(self) -> float:
+        """
+        Get the next discharge current limit to try.
+
+        Returns:
+            limit (float): The next discharge current limit.
+
+        Raises:
+            DischargeLimitNotFoundError:
+                If the maximum number of solves has been reached,
+                or the initial state of charge does not exceed the target,
+                without finding a feasible limit.
+        """
+        if self._feasible is None and (
+            len(self.trials) >= self.maximum_trials
+            or self.initial_soc <= self.target_soc
+        ):
+            raise DischargeLimitNotFoundError(
+                len(self.trials), self.initial_soc, self.target_soc
+            )
+        if self._infeasible is None:
+            raise ValueError("Search requires an infeasible limit to start.")
+        if self._feasible is None:
+            return self._reduce(self._infeasible)
+
+        low = self._feasible
+        high = self._infeasible
+        midpoint = (low.limit + high.limit) / 2
+        if low.final_soc is None or high.final_soc is None:
+            return midpoint
+
+        low_error = low.final_soc - self.target_soc
+        high_error = high.final_soc - self.target_soc
+        # Illinois modification: halve the error of a retained endpoint
+        if self._repeats > 0:
+            if self._last_feasible:
+                high_error /= 2
+            else:
+                low_error /= 2
+        limit = low.limit + low_error * (high.limit - low.limit) / (
+            low_error - high_error
+        )
+        if not low.limit < limit < high.limit:
+            return midpoint
+        return limit
+
+    def summary(self) -> str:
+        """Summarise the trajectory of the search."""
+        return ", ".join(str(trial) for trial in self.trials)
+
+    def _reduce(self, trial: DischargeLimitTrial) -> float:
+        """
+        Reduce an infeasible limit in proportion to the overshoot
+        of the energy used, with a small margin.
+        This requires the initial state of charge to exceed the target.
+        """
+        if trial.final_soc is None:
+            return trial.limit * OUT_OF_CHARGE_FACTOR
+        overshoot = (self.initial_soc - trial.final_soc) / (
+            self.initial_soc - self.target_soc
+        )
+        return trial.limit / (overshoot * 1.01)
+
+    def _solves_since_feasible(self) -> int:
+        """The number of solves since the first feasible limit was found."""
+        for i, trial in enumerate(self.trials):
+            if self._is_feasible(trial):
+                return len(self.trials) - i
+        return 0
+
+    def _is_feasible(self, trial: DischargeLimitTrial) -> bool:
+        """Check whether a trial meets the target state of charge."""
+        if trial.final_soc is None:
+            return False
+        return trial.final_soc >= self.target_soc
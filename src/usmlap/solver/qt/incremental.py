@@ -0,0 +1,243 @@
+"""
+This module implements an incremental solver for quasi-transient iterations,
+which only re-solves the regions of a solution whose transient variables
+have changed since they were last solved.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from usmlap.solver.qss import QuasiSteadyStateSolver
+from usmlap.solver.qss.acceleration import solve_acceleration
+from usmlap.solver.qss.braking import solve_braking
+from usmlap.solver.solution import Solution, SolutionNode
+from usmlap.solver.solver_interface import SolverInterface
+
+logger = logging.getLogger(__name__)
+
+type Region = tuple[int, int]
+
+BOUNDARY_TOLERANCE = 1e-6
+
+
+@dataclass
+class IncrementalSolver(SolverInterface):
+    """
+    Incremental solver, which re-solves only the changed apex segments.
+
+    An apex segment runs from one apex of the previous solution
+    up to the next apex.
+    The velocity at an apex is its maximum velocity,
+    so a segment can be re-solved independently of the rest of the solution,
+    with its entry and exit velocities anchored.
+    A segment is re-solved if the transient variables of any of its nodes
+    have changed beyond a tolerance since they were last solved.
+    If a segment contains a changed apex,
+    the preceding segment, which brakes into that apex, is also re-solved.
+
+    If the re-solved segment cannot meet its anchored velocities,
+    the whole solution is re-solved instead.
+
+    Attributes:
+        region_solver (SolverInterface, optional):
+            The solver used to solve each region.
+            Defaults to a `QuasiSteadyStateSolver`.
+        soc_tolerance (float):
+            The maximum change in state of charge for a node to be kept.
+        temperature_tolerance (float):
+            The maximum change in cell temperature (degC)
+            for a node to be kept.
+        resolved_fraction (float):
+            The fraction of nodes re-solved in the last call.
+    """
+
+    region_solver: Optional[SolverInterface] = None
+    soc_tolerance: float = 1e-4
+    temperature_tolerance: float = 0.01
+    resolved_fraction: float = field(default=0, init=False)
+    _soc: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    _cell_temperature: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.region_solver is None:
+            self.region_solver = QuasiSteadyStateSolver(
+                self.vehicle_model, self.global_context
+            )
+
+    def solve(self, previous_solution: Solution) -> Solution:
+        solution = previous_solution
+        soc, cell_temperature = _state_arrays(solution.nodes)
+
+        changed = self._changed_nodes(soc, cell_temperature)
+        if changed is None:
+            return self._solve_all(solution, soc, cell_temperature)
+
+        regions = _changed_regions(solution.get_apex_indices(), changed)
+        resolved_nodes = 0
+        for start, end in regions:
+            if not self._solve_region(solution, start, end):
+                logger.info(
+                    f"Region {start}-{end} could not meet its boundaries, "
+                    "solving all nodes."
+                )
+                return self._solve_all(solution, soc, cell_temperature)
+            resolved_nodes += end - start
+
+        assert self._soc is not None and self._cell_temperature is not None
+        for start, end in regions:
+            self._soc[start:end] = soc[start:end]
+            self._cell_temperature[start:end] = cell_temperature[start:end]
+
+        self.resolved_fraction = resolved_nodes / len(solution.nodes)
+        return solution
+
+    def clear(self) -> None:
+        """
+        Discard the previous solution, so that the next solve is complete.
+        This must be called if the vehicle is modified between solves.
+        """
+        self._soc = None
+        self._cell_temperature = None
+
+    def _changed_nodes(
+        self, soc: np.ndarray, cell_temperature: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """
+        Find the nodes whose transient variables have changed
+        beyond the tolerance since they were last solved.
+
+        Returns:
+            changed (np.ndarray, optional):
+                Whether each node has changed,
+                or `None` if there is no previous solution to compare against.
+        """
+        if self._soc is None or self._cell_temperature is None:
+            return None
+        if self._soc.shape != soc.shape:
+            return None
+        return (np.abs(soc - self._soc) > self.soc_tolerance) | (
+            np.abs(cell_temperature - self._cell_temperature)
+            > self.temperature_tolerance
+        )
+
+    def _solve_all(
+        self, solution: Solution, soc: np.ndarray, cell_temperature: np.ndarray
+    ) -> Solution:
+        """Solve every node, and store the states they were solved with."""
+        assert self.region_solver is not None
+        solution = self.region_solver.solve(solution)
+        self._soc = soc
+        self._cell_temperature = cell_temperature
+        self.resolved_fraction = 1
+        return solution
+
+    def _solve_region(self, solution: Solution, start: int, end: int) -> bool:
+        """
+        Re-solve the nodes of a region, with the velocities at its
+        boundaries anchored to those of the previous solution.
+
+        Args:
+            solution (Solution): The solution to update.
+            start (int): The index of the apex at the start of the region.
+            end (int): The index after the last node of the region.
+
+        Returns:
+            solved (bool):
+                `True` if the region was solved within its boundaries,
+                otherwise `False`, in which case the solution is unchanged.
+        """
+        assert self.region_solver is not None
+        nodes = solution.nodes[start:end]
+        region_nodes = [
+            SolutionNode(
+                track_node=node.track_node,
+                transient_variables=node.transient_variables,
+            )
+            for node in nodes
+        ]
+        region_nodes[0].anchor_initial_velocity(nodes[0].initial_velocity)
+        if end < len(solution.nodes):
+            region_nodes[-1].anchor_final_velocity(nodes[-1].final_velocity)
+
+        region = Solution(nodes=region_nodes, vehicle_model=self.vehicle_model)
+        self.region_solver.solve(region)
+
+        if not self._boundaries_feasible(region):
+            return False
+
+        for node, region_node in zip(nodes, region_nodes):
+            node.maximum_velocity = region_node.maximum_velocity
+            node.set_initial_velocity(region_node.initial_velocity)
+            node.set_final_velocity(region_node.final_velocity)
+            if region_node.is_apex():
+                node.add_apex()
+            elif node.is_apex():
+                node.remove_apex()
+            node.deferred_state = region_node.deferred_state
+        return True
+
+    def _boundaries_feasible(self, region: Solution) -> bool:
+        """
+        Check that the anchored velocities of a region can be achieved,
+        so that it joins the rest of the solution.
+        """
+        first = region.nodes[0]
+        ctx = self.local_context(first.track_node, first.transient_variables)
+        entry_velocity = solve_braking(
+            self.vehicle_model, ctx, final_velocity=first.final_velocity
+        )
+        if entry_velocity < first.initial_velocity - BOUNDARY_TOLERANCE:
+            return False
+
+        last = region.nodes[-1]
+        ctx = self.local_context(last.track_node, last.transient_variables)
+        exit_velocity = solve_acceleration(
+            self.vehicle_model, ctx, initial_velocity=last.initial_velocity
+        )
+        return exit_velocity >= last.final_velocity - BOUNDARY_TOLERANCE
+
+
+def _changed_regions(apexes: list[int], changed: np.ndarray) -> list[Region]:
+    """
+    Find the regions of consecutive apex segments which must be re-solved.
+
+    Args:
+        apexes (list[int]): The indices of the apexes of the previous solution.
+        changed (np.ndarray): Whether each node has changed.
+
+    Returns:
+        regions (list[Region]):
+            The start and end indices of each region to re-solve.
+    """
+    number_of_nodes = len(changed)
+    boundaries = sorted({0, *apexes, number_of_nodes})
+    segments = list(zip(boundaries[:-1], boundaries[1:]))
+
+    dirty = [bool(changed[start:end].any()) for start, end in segments]
+    for i in range(1, len(segments)):
+        if changed[segments[i][0]]:
+            dirty[i - 1] = True
+
+    regions: list[Region] = []
+    for (start, end), is_dirty in zip(segments, dirty):
+        if not is_dirty:
+            continue
+        if regions and regions[-1][1] == start:
+            regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+    return regions
+
+
+def _state_arrays(nodes: list[SolutionNode]) -> tuple[np.ndarray, np.ndarray]:
+    """Get the state of charge and cell temperature at each node."""
+    soc = np.array([node.transient_variables.soc for node in nodes])
+    cell_temperature = np.array(
+        [node.transient_variables.cell_temperature for node in nodes]
+    )
+    return soc, cell_temperature
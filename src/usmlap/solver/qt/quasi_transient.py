@@ -3,7 +3,10 @@ This module implements a quasi-transient solver.
 """
 
 import logging
+from dataclasses import dataclass, field, replace
+from typing import Optional
 
+import numpy as np
 from rich.progress import Progress
 
 from usmlap.model.errors import OutOfChargeError
@@ -12,26 +15,104 @@ from usmlap.solver.errors import (
     BelowTargetSOCError,
     MaximumIterationsExceededError,
 )
-from usmlap.solver.qss import QuasiSteadyStateSolver
+from usmlap.solver.qss import (
+    ApexVelocityCache,
+    KernelStatistics,
+    QuasiSteadyStateSolver,
+    WarmStart,
+)
+from usmlap.solver.qss.warm_start import Kernel
+from usmlap.solver.qt.convergence import AitkenRelaxation, get_field, set_field
+from usmlap.solver.qt.discharge_limit import DischargeLimitSearch
+from usmlap.solver.qt.incremental import IncrementalSolver
 from usmlap.solver.qt.transient_variable import update_transient_variables
 from usmlap.solver.solution import Solution
 from usmlap.solver.solver_interface import SolverInterface
+from usmlap.solver.steady_lap import SteadyLapSolver
 
 MAXIMUM_TRANSIENT_ITERATIONS = 100
 CONVERGENCE_TOLERANCE = 1e-4
 TASK_DESCRIPTION = "Solving transient simulation..."
 
 
+@dataclass
 class QuasiTransientSolver(SolverInterface):
     """
     Quasi-transient solver.
+
+    Attributes:
+        target_soc (float): The minimum state of charge at the finish.
+        apex_cache (ApexVelocityCache, optional):
+            Memo of apex velocities, shared between iterations.
+            By default, every node is solved.
+        warm_start (WarmStart):
+            Converged values of the fixed-point solvers at each node,
+            used to seed the next iteration.
+        kernel_iterations (list[dict[Kernel, KernelStatistics]]):
+            The iteration counts of each fixed-point solver
+            in each iteration.
+        reuse_steady_laps (bool):
+            Whether to reuse the solution of laps of a multi-lap mesh,
+            only re-solving laps whose transient variables have drifted.
+        incremental (bool):
+            Whether to re-solve only the apex segments whose
+            transient variables have changed between iterations.
+            By default, every node is re-solved.
+        resolved_fractions (list[float]):
+            The fraction of nodes re-solved in each iteration.
+        accelerate_convergence (bool):
+            Whether to extrapolate the transient variables between iterations
+            using Aitken relaxation, damped if the solution oscillates,
+            and to also stop once their residuals are within tolerance.
+            By default, each iteration is solved with the transient variables
+            of the previous iteration, until the total time converges.
+        search_discharge_limit (bool):
+            Whether to search for the discharge current limit
+            which meets the target state of charge by root finding.
+            By default, it is repeatedly scaled down until the target is met.
+        maximum_discharge_solves (int):
+            The maximum number of solves to refine the discharge limit,
+            once a feasible limit has been found.
+        maximum_discharge_trials (int):
+            The maximum number of solves to search for the discharge limit
+            in total, after which `DischargeLimitNotFoundError` is raised
+            if no feasible limit has been found.
+        discharge_limit_searches (list[DischargeLimitSearch]):
+            The trajectory of each discharge limit search.
     """
 
     target_soc: float = 0.2
+    apex_cache: Optional[ApexVelocityCache] = None
+    warm_start: WarmStart = field(default_factory=WarmStart)
+    kernel_iterations: list[dict[Kernel, KernelStatistics]] = field(
+        default_factory=list, init=False
+    )
+    reuse_steady_laps: bool = False
+    incremental: bool = False
+    resolved_fractions: list[float] = field(default_factory=list, init=False)
+    accelerate_convergence: bool = False
+    search_discharge_limit: bool = False
+    maximum_discharge_solves: int = 8
+    maximum_discharge_trials: int = 20
+    discharge_limit_searches: list[DischargeLimitSearch] = field(
+        default_factory=list, init=False
+    )
+    _relaxation: AitkenRelaxation = field(
+        default_factory=AitkenRelaxation, init=False, repr=False
+    )
+    _steady_lap_solver: Optional[SteadyLapSolver] = field(
+        default=None, init=False, repr=False
+    )
+    _incremental_solver: Optional[IncrementalSolver] = field(
+        default=None, init=False, repr=False
+    )
 
     def solve(self, previous_solution: Solution) -> Solution:
-        times: list[float] = []
         solution = previous_solution
+        self._relaxation = self._create_relaxation()
+        history = self._relaxation.history
+        solution.convergence = history
+        next_field: Optional[np.ndarray] = None
 
         with Progress(transient=True) as progress:
             task = progress.add_task(TASK_DESCRIPTION, total=None)
@@ -41,45 +122,192 @@ class QuasiTransientSolver(SolverInterface):
                     advance=1,
                     description=f"{TASK_DESCRIPTION} ({i + 1}/?)",
                 )
+                if next_field is not None:
+                    set_field(solution, next_field)
 
                 while True:
+                    previous_field = get_field(solution)
                     try:
                         solution = self._solve_next_iteration(solution)
                         solution = self._recalculate_state_variables(solution)
                         break
                     except OutOfChargeError:
+                        if self.search_discharge_limit:
+                            solution = self._search_discharge_limit(
+                                solution, previous_field, final_soc=None
+                            )
+                            break
                         self._decrease_discharge_limit(0.9)
 
                     except BelowTargetSOCError as e:
+                        if self.search_discharge_limit:
+                            solution = self._search_discharge_limit(
+                                solution, previous_field, e.final_soc
+                            )
+                            break
                         initial_soc = 1  # TODO
                         scaling_factor = e.overshoot(initial_soc) * 1.01
                         self._decrease_discharge_limit(1 / scaling_factor)
 
-                times.append(solution.total_time)
-                logging.info(f"Iteration {i}, time: {solution.total_time:.3f}s")
+                next_field = self._relaxation.relax(solution, previous_field)
+                logging.info(
+                    f"Iteration {i}, time: {solution.total_time:.3f}s, "
+                    f"SOC residual: {history.soc_residuals[-1]:.2e}, "
+                    f"temperature residual: "
+                    f"{history.temperature_residuals[-1]:.2e}, "
+                    f"relaxation: {history.relaxation_factors[-1]:.3f}"
+                )
 
-                if _convergence_achieved(times, CONVERGENCE_TOLERANCE):
+                if self._converged():
                     logging.info(f"Converged after {i} iterations.")
+                    solution.convergence = history
                     return solution
 
         raise MaximumIterationsExceededError(
-            MAXIMUM_TRANSIENT_ITERATIONS, CONVERGENCE_TOLERANCE, times
+            MAXIMUM_TRANSIENT_ITERATIONS, CONVERGENCE_TOLERANCE, history.times
         )
 
+    def _converged(self) -> bool:
+        """
+        Check whether the solution has converged.
+
+        The total time must have converged in an iteration which solved laps.
+        If convergence is accelerated, the total time must also not oscillate,
+        and the solution has also converged once the residuals
+        of the transient variables are within tolerance.
+        """
+        history = self._relaxation.history
+        time_converged = (
+            _convergence_achieved(history.times, CONVERGENCE_TOLERANCE)
+            and self._laps_solved()
+        )
+        if not self.accelerate_convergence:
+            return time_converged
+        if self._relaxation.residuals_converged():
+            return True
+        return time_converged and not history.oscillations[-1]
+
+    def _laps_solved(self) -> bool:
+        """
+        Check whether the last iteration solved any laps.
+        If every lap was reused, its time is unchanged,
+        so it cannot be used to judge convergence.
+        """
+        if self._steady_lap_solver is None:
+            return True
+        return self._steady_lap_solver.solved_laps > 0
+
+    def _create_relaxation(self) -> AitkenRelaxation:
+        """
+        Create the relaxation of the transient variables for a solve.
+        If convergence is not accelerated, the relaxation factor is fixed at 1.
+        """
+        if self.accelerate_convergence:
+            return AitkenRelaxation()
+        return AitkenRelaxation(minimum_relaxation=1, maximum_relaxation=1)
+
     def _decrease_discharge_limit(self, scaling_factor: float) -> None:
         powertrain = self.global_context.vehicle.powertrain
         old_limit = powertrain.discharge_current_limit
         new_limit = old_limit * scaling_factor
-        powertrain.discharge_current_limit = new_limit
+        self._set_discharge_limit(new_limit)
         logging.warning(
             f"Discharge current limit decreased from {old_limit} to {new_limit}"
         )
 
+    def _set_discharge_limit(self, limit: float) -> None:
+        """
+        Set the discharge current limit,
+        discarding any stored solutions which depend on it.
+        """
+        self.global_context.vehicle.powertrain.discharge_current_limit = limit
+        if self._steady_lap_solver is not None:
+            self._steady_lap_solver.clear()
+        if self._incremental_solver is not None:
+            self._incremental_solver.clear()
+        self._relaxation.reset()
+
+    def _search_discharge_limit(
+        self,
+        solution: Solution,
+        initial_field: np.ndarray,
+        final_soc: Optional[float],
+    ) -> Solution:
+        """
+        Search for the discharge current limit
+        which meets the target state of charge.
+
+        Each trial solves the next iteration from the same transient variables,
+        so that trials differ only in their discharge limit.
+        The fixed-point solvers are warm-started from the previous trial.
+
+        Args:
+            solution (Solution): The solution which failed to meet the target.
+            initial_field (np.ndarray):
+                The transient variables which the solution was solved with.
+            final_soc (float, optional):
+                The final state of charge of the failed solution,
+                or `None` if the vehicle ran out of charge.
+
+        Returns:
+            solution (Solution):
+                The next iteration of the solution, at the highest feasible
+                discharge limit found.
+
+        Raises:
+            DischargeLimitNotFoundError:
+                If no feasible limit is found within the maximum number
+                of solves.
+        """
+        powertrain = self.global_context.vehicle.powertrain
+        search = DischargeLimitSearch(
+            target_soc=self.target_soc,
+            initial_soc=float(initial_field[0, 0]),
+            maximum_solves=self.maximum_discharge_solves,
+            maximum_trials=self.maximum_discharge_trials,
+        )
+        self.discharge_limit_searches.append(search)
+        search.record(powertrain.discharge_current_limit, final_soc)
+
+        while not search.is_complete():
+            limit = search.next_limit()
+            self._set_discharge_limit(limit)
+            set_field(solution, initial_field)
+            try:
+                solution = self._solve_next_iteration(solution)
+                solution = self._recalculate_state_variables(solution)
+                search.record(
+                    limit, solution.nodes[-1].transient_variables.soc
+                )
+            except OutOfChargeError:
+                search.record(limit, None)
+            except BelowTargetSOCError as e:
+                search.record(limit, e.final_soc)
+
+        best_limit = search.best_limit
+        assert best_limit is not None
+        if search.trials[-1].limit != best_limit:
+            self._set_discharge_limit(best_limit)
+            set_field(solution, initial_field)
+            solution = self._solve_next_iteration(solution)
+            solution = self._recalculate_state_variables(solution)
+
+        logging.warning(
+            f"Discharge current limit set to {best_limit:.4f} "
+            f"after {len(search.trials)} solves: {search.summary()}"
+        )
+        return solution
+
     def _solve_next_iteration(self, previous_solution: Solution) -> Solution:
         """
         Calculate the next iteration of the solution.
 
         This is done by calling the `QuasiSteadyStateSolver`.
+        If steady laps are reused, it is wrapped by a `SteadyLapSolver`,
+        which persists between iterations.
+        Otherwise, if the solution is incremental,
+        it is wrapped by an `IncrementalSolver`,
+        which re-solves only the regions that have changed.
 
         Args:
             previous_solution (Solution): The previous iteration of the solution.
@@ -87,9 +315,42 @@ class QuasiTransientSolver(SolverInterface):
         Returns:
             solution (Solution): The next iteration of the solution.
         """
-        solver = QuasiSteadyStateSolver(self.vehicle_model, self.global_context)
+        solver: SolverInterface = QuasiSteadyStateSolver(
+            self.vehicle_model,
+            self.global_context,
+            apex_cache=self.apex_cache,
+            warm_start=self.warm_start,
+        )
+        if self.reuse_steady_laps:
+            if self._steady_lap_solver is None:
+                self._steady_lap_solver = SteadyLapSolver(
+                    self.vehicle_model, self.global_context, lap_solver=solver
+                )
+            solver = self._steady_lap_solver
+        elif self.incremental:
+            if self._incremental_solver is None:
+                self._incremental_solver = IncrementalSolver(
+                    self.vehicle_model,
+                    self.global_context,
+                    region_solver=solver,
+                )
+            solver = self._incremental_solver
         solution = solver.solve(previous_solution)
 
+        if self._incremental_solver is not None:
+            fraction = self._incremental_solver.resolved_fraction
+            self.resolved_fractions.append(fraction)
+            logging.info(f"Re-solved {fraction:.1%} of nodes.")
+
+        logging.info(f"Mean kernel iterations: {self.warm_start.summary()}")
+        self.kernel_iterations.append(
+            {
+                kernel: replace(statistics)
+                for kernel, statistics in self.warm_start.statistics.items()
+            }
+        )
+        self.warm_start.reset_statistics()
+
         return solution
 
     def _recalculate_state_variables(self, solution: Solution) -> Solution:
@@ -107,13 +368,13 @@ class QuasiTransientSolver(SolverInterface):
             ctx = self.local_context(
                 previous_node.track_node, previous_node.transient_variables
             )
-            if previous_node.calculated_vehicle_state is None:
+            if previous_node.powertrain_state is None:
                 raise AlgorithmError("Previous vehicle state not calculated.")
             solution.nodes[i].transient_variables = update_transient_variables(
                 ctx=ctx,
                 initial_state=previous_node.transient_variables,
                 dt=previous_node.time,
-                vehicle_state=previous_node.calculated_vehicle_state,  # noqa
+                vehicle_state=previous_node.powertrain_state,
             )
 
         final_soc = solution.nodes[-1].transient_variables.soc
@@ -2,7 +2,7 @@
 This module contains code for updating the vehicle state.
 """
 
-from usmlap.model import CalculatedVehicleState, NodeContext, TransientVariables
+from usmlap.model import NodeContext, PowertrainState, TransientVariables
 from usmlap.model.errors import OutOfChargeError
 from usmlap.vehicle.powertrain import StateOfCharge
 
@@ -11,7 +11,7 @@ def update_transient_variables(
     ctx: NodeContext,
     initial_state: TransientVariables,
     dt: float,
-    vehicle_state: CalculatedVehicleState,
+    vehicle_state: PowertrainState,
 ) -> TransientVariables:
     """Update the values of the transient variables."""
 
@@ -29,9 +29,7 @@ def update_transient_variables(
     return TransientVariables(soc=soc, cell_temperature=cell_temperature)
 
 
-def _discharge_rate(
-    ctx: NodeContext, vehicle_state: CalculatedVehicleState
-) -> float:
+def _discharge_rate(ctx: NodeContext, vehicle_state: PowertrainState) -> float:
     """Rate of change of state of charge"""
     return (
         -vehicle_state.accumulator_current
@@ -40,7 +38,7 @@ def _discharge_rate(
 
 
 def _temperature_rate(
-    ctx: NodeContext, vehicle_state: CalculatedVehicleState
+    ctx: NodeContext, vehicle_state: PowertrainState
 ) -> float:
     """Rate of change of cell temperature."""
     thermal_mass = ctx.vehicle.powertrain.accumulator.thermal_mass
@@ -7,29 +7,234 @@ from __future__ import annotations
 import logging
 from copy import copy
 from dataclasses import dataclass, field
-from typing import Generator, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, Generator, Optional, Sequence
+
+import numpy as np
 
 from usmlap.model import (
     CalculatedVehicleState,
+    GlobalContext,
+    NodeContext,
+    PowertrainState,
     TractionModel,
     TransientVariables,
+    VehicleStateTable,
 )
 from usmlap.model.vehicle_state import Trajectory
-from usmlap.track import Mesh, TrackNode
+from usmlap.track import Mesh, NodeArrays, TrackNode
+
+if TYPE_CHECKING:
+    from usmlap.solver.qt.convergence import ConvergenceHistory
+
+
+type Array = np.ndarray[tuple[Any, ...], np.dtype[np.float64]]
+type BoolArray = np.ndarray[tuple[Any, ...], np.dtype[np.bool_]]
+type IntArray = np.ndarray[tuple[Any, ...], np.dtype[np.intp]]
+
+FLOAT_COLUMNS = (
+    "length",
+    "maximum_velocity",
+    "initial_velocity",
+    "final_velocity",
+    "motor_power",
+)
+BOOL_COLUMNS = ("initial_velocity_anchored", "final_velocity_anchored", "apex")
+
+
+@dataclass(slots=True)
+class DeferredVehicleState(object):
+    """
+    The state of the vehicle at a node,
+    with the full vehicle state evaluated only when it is first requested.
+
+    The powertrain state is evaluated eagerly,
+    since it is needed to update the transient variables.
+    The context and trajectory of the node are kept,
+    so that the full state matches the solution that produced it.
+
+    Attributes:
+        powertrain (PowertrainState): The state of the powertrain.
+        vehicle_model (TractionModel, optional):
+            The vehicle model used to evaluate the full state.
+        ctx (NodeContext, optional): The context at the node.
+        trajectory (Trajectory, optional): The trajectory at the node.
+        full (CalculatedVehicleState, optional):
+            The full vehicle state, if it has been evaluated.
+    """
+
+    powertrain: PowertrainState
+    vehicle_model: Optional[TractionModel] = None
+    ctx: Optional[NodeContext] = None
+    trajectory: Optional[Trajectory] = None
+    full: Optional[CalculatedVehicleState] = None
+
+    @classmethod
+    def evaluate(
+        cls,
+        vehicle_model: TractionModel,
+        ctx: NodeContext,
+        trajectory: Trajectory,
+    ) -> DeferredVehicleState:
+        """
+        Evaluate the powertrain state at a node,
+        deferring the evaluation of the full vehicle state.
+
+        Args:
+            vehicle_model (TractionModel): The vehicle model.
+            ctx (NodeContext): The context at the node.
+            trajectory (Trajectory): The trajectory at the node.
+
+        Returns:
+            state (DeferredVehicleState): The state of the vehicle.
+        """
+        return cls(
+            powertrain=vehicle_model.evaluate_powertrain_state(
+                ctx, trajectory
+            ),
+            vehicle_model=vehicle_model,
+            ctx=ctx,
+            trajectory=trajectory,
+        )
+
+    @classmethod
+    def from_full(cls, full: CalculatedVehicleState) -> DeferredVehicleState:
+        """
+        Wrap a full vehicle state which has already been evaluated.
+
+        Args:
+            full (CalculatedVehicleState): The full vehicle state.
+
+        Returns:
+            state (DeferredVehicleState): The state of the vehicle.
+        """
+        return cls(powertrain=full.powertrain_state, full=full)
+
+    def resolve(self) -> CalculatedVehicleState:
+        """
+        Get the full vehicle state, evaluating it if necessary.
+
+        Returns:
+            full (CalculatedVehicleState): The full vehicle state.
+        """
+        if self.full is None:
+            assert self.vehicle_model is not None
+            assert self.ctx is not None and self.trajectory is not None
+            self.full = self.vehicle_model.evaluate_full_vehicle_state(
+                self.ctx, self.trajectory
+            )
+        return self.full
 
 
 @dataclass
+class SolutionArrays(object):
+    """
+    The solution at each node, stored as contiguous arrays.
+
+    Attributes:
+        length (Array): The length of each node.
+        maximum_velocity (Array): The maximum possible velocity at each node.
+        initial_velocity (Array): The velocity at the start of each node.
+        final_velocity (Array): The velocity at the end of each node.
+        motor_power (Array): The motor power at each node,
+            or zero if the vehicle state has not been calculated.
+        initial_velocity_anchored (BoolArray):
+            Whether the initial velocity of each node is anchored.
+        final_velocity_anchored (BoolArray):
+            Whether the final velocity of each node is anchored.
+        apex (BoolArray): Whether each node is an apex.
+        version (int): Incremented whenever the arrays are modified,
+            so that aggregates of the solution can be cached.
+    """
+
+    length: Array
+    maximum_velocity: Array
+    initial_velocity: Array
+    final_velocity: Array
+    motor_power: Array
+    initial_velocity_anchored: BoolArray
+    final_velocity_anchored: BoolArray
+    apex: BoolArray
+    version: int = 0
+
+    @classmethod
+    def empty(cls, length: Array) -> SolutionArrays:
+        """
+        Create blank arrays for nodes of given lengths.
+
+        Args:
+            length (Array): The length of each node.
+
+        Returns:
+            arrays (SolutionArrays): Arrays with every velocity set to zero.
+        """
+        count = len(length)
+        columns: dict[str, Any] = {
+            name: np.zeros(count) for name in FLOAT_COLUMNS
+        }
+        columns["length"] = np.array(length, dtype=float)
+        for name in BOOL_COLUMNS:
+            columns[name] = np.zeros(count, dtype=bool)
+        return cls(**columns)
+
+    @classmethod
+    def from_nodes(cls, nodes: Sequence[SolutionNode]) -> SolutionArrays:
+        """
+        Gather the solution at a sequence of nodes into new arrays.
+
+        Args:
+            nodes (Sequence[SolutionNode]): The solution nodes.
+
+        Returns:
+            arrays (SolutionArrays): The solution at each node.
+        """
+        columns: dict[str, Any] = {}
+        for name in FLOAT_COLUMNS + BOOL_COLUMNS:
+            dtype = bool if name in BOOL_COLUMNS else float
+            columns[name] = np.fromiter(
+                (
+                    getattr(node._arrays, name).item(node._index)
+                    for node in nodes
+                ),
+                dtype=dtype,
+                count=len(nodes),
+            )
+        return cls(**columns)
+
+    def __len__(self) -> int:
+        return len(self.length)
+
+    @property
+    def time(self) -> Array:
+        average_velocity = (self.initial_velocity + self.final_velocity) / 2
+        with np.errstate(divide="ignore"):
+            return self.length / average_velocity
+
+    @property
+    def energy_used(self) -> Array:
+        return self.motor_power * self.time
+
+
 class SolutionNode(object):
     """
     The solution at a single node.
 
+    The velocities and flags of a node are a view of a row of the
+    `SolutionArrays` of its solution. A standalone node stores them
+    as arrays of one row, which are gathered into the arrays of
+    a solution when the node is added to it.
+
     Attributes:
         track_node (TrackNode): The corresponding track node.
         maximum_velocity (float): The maximum possible velocity at the node,
             obtained from the lateral vehicle model.
-        acceleration (float): The longitudinal acceleration at the node.
         transient_variables (TransientVariables): The transient variables at the node.
         calculated_vehicle_state (CalculatedVehicleState): The state of the vehicle at the node.
+            It is evaluated when first requested.
+        deferred_state (DeferredVehicleState, optional):
+            The state of the vehicle at the node, before it is evaluated.
+        powertrain_state (PowertrainState, optional):
+            The state of the powertrain at the node.
         next (Optional[SolutionNode]): The next node in the solution
             (`None` if this is the final node).
         previous (Optional[SolutionNode]): The previous node in the solution
@@ -45,36 +250,155 @@ class SolutionNode(object):
         energy_used (float): The energy used to drive this node.
     """
 
-    track_node: TrackNode
-    maximum_velocity: float = 0
-    _apex: bool = False
-    _initial_velocity: float = 0
-    _final_velocity: float = 0
-    _initial_velocity_anchored: bool = False
-    _final_velocity_anchored: bool = False
-    transient_variables: TransientVariables = field(
-        default_factory=TransientVariables.get_default
+    __slots__ = (
+        "_arrays",
+        "_index",
+        "track_node",
+        "transient_variables",
+        "_deferred_state",
+        "next",
+        "previous",
     )
-    calculated_vehicle_state: Optional[CalculatedVehicleState] = None
-    next: Optional[SolutionNode] = None
-    previous: Optional[SolutionNode] = None
+
+    _arrays: SolutionArrays
+    _index: int
+    track_node: TrackNode
+    transient_variables: TransientVariables
+    _deferred_state: Optional[DeferredVehicleState]
+    next: Optional[SolutionNode]
+    previous: Optional[SolutionNode]
+
+    def __init__(
+        self,
+        track_node: TrackNode,
+        maximum_velocity: float = 0,
+        transient_variables: Optional[TransientVariables] = None,
+        calculated_vehicle_state: Optional[CalculatedVehicleState] = None,
+        next: Optional[SolutionNode] = None,
+        previous: Optional[SolutionNode] = None,
+    ) -> None:
+        if transient_variables is None:
+            transient_variables = TransientVariables.get_default()
+        self._arrays = SolutionArrays.empty(np.array([track_node.length]))
+        self._index = 0
+        self.track_node = track_node
+        self.transient_variables = transient_variables
+        self.next = next
+        self.previous = previous
+        self.maximum_velocity = maximum_velocity
+        self.calculated_vehicle_state = calculated_vehicle_state
+
+    def __repr__(self) -> str:
+        return (
+            f"SolutionNode(track_node={self.track_node!r}, "
+            f"initial_velocity={self.initial_velocity}, "
+            f"final_velocity={self.final_velocity})"
+        )
+
+    @classmethod
+    def view(
+        cls,
+        arrays: SolutionArrays,
+        index: int,
+        track_node: TrackNode,
+        transient_variables: TransientVariables,
+        deferred_state: Optional[DeferredVehicleState] = None,
+    ) -> SolutionNode:
+        """
+        Create a node which is a view of a row of solution arrays.
+
+        Args:
+            arrays (SolutionArrays): The solution arrays.
+            index (int): The index of the row.
+            track_node (TrackNode): The corresponding track node.
+            transient_variables (TransientVariables):
+                The transient variables at the node.
+            deferred_state (DeferredVehicleState, optional):
+                The state of the vehicle at the node.
+
+        Returns:
+            node (SolutionNode): A view of the row.
+        """
+        node = cls.__new__(cls)
+        node._bind(arrays, index)
+        node.track_node = track_node
+        node.transient_variables = transient_variables
+        node._deferred_state = deferred_state
+        node.next = None
+        node.previous = None
+        return node
+
+    def _bind(self, arrays: SolutionArrays, index: int) -> None:
+        """Make the node a view of a row of solution arrays."""
+        self._arrays = arrays
+        self._index = index
+
+    def _set(self, column: Array, value: Any) -> None:
+        column[self._index] = value
+        self._arrays.version += 1
+
+    @property
+    def maximum_velocity(self) -> float:
+        return self._arrays.maximum_velocity.item(self._index)
+
+    @maximum_velocity.setter
+    def maximum_velocity(self, velocity: float) -> None:
+        self._set(self._arrays.maximum_velocity, velocity)
+
+    @property
+    def calculated_vehicle_state(self) -> Optional[CalculatedVehicleState]:
+        if self._deferred_state is None:
+            return None
+        return self._deferred_state.resolve()
+
+    @calculated_vehicle_state.setter
+    def calculated_vehicle_state(
+        self, state: Optional[CalculatedVehicleState]
+    ) -> None:
+        self.deferred_state = (
+            None if state is None else DeferredVehicleState.from_full(state)
+        )
+
+    @property
+    def deferred_state(self) -> Optional[DeferredVehicleState]:
+        return self._deferred_state
+
+    @deferred_state.setter
+    def deferred_state(self, state: Optional[DeferredVehicleState]) -> None:
+        self._deferred_state = state
+        motor_power = 0 if state is None else state.powertrain.motor_power
+        self._set(self._arrays.motor_power, motor_power)
+
+    @property
+    def powertrain_state(self) -> Optional[PowertrainState]:
+        if self._deferred_state is None:
+            return None
+        return self._deferred_state.powertrain
 
     @property
     def apex_velocity(self) -> float:
         velocities: list[float] = [self.maximum_velocity]
-        if self._initial_velocity_anchored:
+        if self.initial_velocity_anchored:
             velocities.append(self.initial_velocity)
-        if self._final_velocity_anchored:
+        if self.final_velocity_anchored:
             velocities.append(self.final_velocity)
         return min(velocities)
 
     @property
     def initial_velocity(self) -> float:
-        return self._initial_velocity
+        return self._arrays.initial_velocity.item(self._index)
 
     @property
     def final_velocity(self) -> float:
-        return self._final_velocity
+        return self._arrays.final_velocity.item(self._index)
+
+    @property
+    def initial_velocity_anchored(self) -> bool:
+        return self._arrays.initial_velocity_anchored.item(self._index)
+
+    @property
+    def final_velocity_anchored(self) -> bool:
+        return self._arrays.final_velocity_anchored.item(self._index)
 
     @property
     def average_velocity(self) -> float:
@@ -116,9 +440,9 @@ class SolutionNode(object):
 
     @property
     def energy_used(self) -> float:
-        if self.calculated_vehicle_state is None:
+        if self.powertrain_state is None:
             return 0
-        return self.calculated_vehicle_state.motor_power * self.time  # TODO
+        return self.powertrain_state.motor_power * self.time  # TODO
 
     def is_apex(self) -> bool:
         """
@@ -127,20 +451,20 @@ class SolutionNode(object):
         Returns:
             is_apex (bool): `True` is the node is an apex, otherwise `False`.
         """
-        return self._apex
+        return self._arrays.apex.item(self._index)
 
     def add_apex(self) -> None:
         """
         Add the node as an apex.
         """
-        self._apex = True
+        self._set(self._arrays.apex, True)
 
     def remove_apex(self) -> None:
         """
         Remove the node as an apex.
         """
         logging.debug("Removing apex")
-        self._apex = False
+        self._set(self._arrays.apex, False)
 
     def set_initial_velocity(self, velocity: float) -> None:
         """
@@ -150,8 +474,8 @@ class SolutionNode(object):
         Args:
             velocity (float): The initial velocity to be set.
         """
-        if not self._initial_velocity_anchored:
-            self._initial_velocity = velocity
+        if not self.initial_velocity_anchored:
+            self._set(self._arrays.initial_velocity, velocity)
 
     def set_final_velocity(self, velocity: float) -> None:
         """
@@ -161,8 +485,8 @@ class SolutionNode(object):
         Args:
             velocity (float): The final velocity to be set.
         """
-        if not self._final_velocity_anchored:
-            self._final_velocity = velocity
+        if not self.final_velocity_anchored:
+            self._set(self._arrays.final_velocity, velocity)
 
     def anchor_initial_velocity(self, velocity: float) -> None:
         """
@@ -173,7 +497,7 @@ class SolutionNode(object):
             velocity (float): The initial velocity to be set.
         """
         self.set_initial_velocity(velocity)
-        self._initial_velocity_anchored = True
+        self._set(self._arrays.initial_velocity_anchored, True)
 
     def anchor_final_velocity(self, velocity: float) -> None:
         """
@@ -184,44 +508,189 @@ class SolutionNode(object):
             velocity (float): The final velocity to be set.
         """
         self.set_final_velocity(velocity)
-        self._final_velocity_anchored = True
+        self._set(self._arrays.final_velocity_anchored, True)
 
 
 @dataclass
 class Solution(object):
     """
     The solution to a simulation.
+
+    The velocities of every node are stored in `arrays`,
+    and each node is a view of a row of the arrays.
+    Nodes which are not already views of a single set of arrays
+    are gathered into new arrays when the solution is created.
+    Aggregates such as the total time are computed from the arrays,
+    and cached until the solution is modified.
+
+    Attributes:
+        nodes (list[SolutionNode]): The solution at each node.
+        vehicle_model (TractionModel): The vehicle model used.
+        convergence (ConvergenceHistory, optional):
+            The convergence history of an iterative solver,
+            or `None` if the solver is not iterative.
+        arrays (SolutionArrays): The solution at each node, as arrays.
     """
 
     nodes: list[SolutionNode]
     vehicle_model: TractionModel
+    convergence: Optional[ConvergenceHistory] = None
+    arrays: SolutionArrays = field(init=False, repr=False, compare=False)
+    _indices: Optional[IntArray] = field(init=False, repr=False, compare=False)
+    _aggregates: dict[str, Any] = field(init=False, repr=False, compare=False)
+    _version: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         for i in range(len(self.nodes) - 1):
             self.nodes[i].next = self.nodes[i + 1]
             self.nodes[i + 1].previous = self.nodes[i]
+        self._bind_nodes()
+
+    def _bind_nodes(self) -> None:
+        """
+        Make every node a view of the arrays of this solution.
+        If the nodes already share arrays, they are reused.
+        """
+        nodes = self.nodes
+        self._aggregates = {}
+        self._version = -1
+        arrays = nodes[0]._arrays if nodes else None
+        if arrays is not None and all(
+            node._arrays is arrays for node in nodes
+        ):
+            self.arrays = arrays
+            indices = np.fromiter(
+                (node._index for node in nodes),
+                dtype=np.intp,
+                count=len(nodes),
+            )
+            is_identity = len(arrays) == len(nodes) and bool(
+                np.all(indices == np.arange(len(nodes)))
+            )
+            self._indices = None if is_identity else indices
+            return
+
+        self.arrays = SolutionArrays.from_nodes(nodes)
+        self._indices = None
+        for i, node in enumerate(nodes):
+            node._bind(self.arrays, i)
 
     def __iter__(self) -> Generator[SolutionNode]:
         for node in self.nodes:
             yield node
 
+    def __copy__(self) -> Solution:
+        new_solution = Solution.__new__(Solution)
+        new_solution.__dict__.update(self.__dict__)
+        new_solution._aggregates = {}
+        return new_solution
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Get the state of the solution for pickling.
+        The links between nodes are removed, so that pickling long solutions
+        does not exceed the recursion limit, and restored on unpickling.
+        """
+        state = self.__dict__.copy()
+        state["nodes"] = [
+            (node.track_node, node.transient_variables, node.deferred_state)
+            for node in self.nodes
+        ]
+        state["_aggregates"] = {}
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        nodes: list[SolutionNode] = []
+        for (track_node, transient_variables, deferred_state), index in zip(
+            state["nodes"], self._get_indices()
+        ):
+            nodes.append(
+                SolutionNode.view(
+                    self.arrays,
+                    int(index),
+                    track_node,
+                    transient_variables,
+                    deferred_state,
+                )
+            )
+        self.nodes = nodes
+        self.__post_init__()
+
     def __str__(self) -> str:
         return f"Total time: {self.total_time:.3f}s"
 
     def __repr__(self) -> str:
         return self.__str__()
 
+    def _get_indices(self) -> IntArray:
+        """Get the index of the row of the arrays of each node."""
+        if self._indices is None:
+            return np.arange(len(self.nodes))
+        return self._indices
+
+    def _get_column(self, column: Array) -> Array:
+        """Get the values of a column of the arrays for each node."""
+        if self._indices is None:
+            return column
+        return column[self._indices]
+
+    def get_array(self, name: str) -> Array:
+        """
+        Get the values of a column of the solution arrays for each node.
+
+        Args:
+            name (str): The name of the column, such as `"final_velocity"`.
+
+        Returns:
+            values (Array): The value of the column at each node.
+        """
+        return self._get_column(getattr(self.arrays, name))
+
+    def _get_aggregate(self, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Get an aggregate of the solution,
+        which is cached until the arrays are modified.
+        """
+        if self._version != self.arrays.version:
+            self._aggregates.clear()
+            self._version = self.arrays.version
+        if name not in self._aggregates:
+            self._aggregates[name] = compute()
+        return self._aggregates[name]
+
+    @cached_property
+    def track_arrays(self) -> NodeArrays:
+        """The track nodes of the solution, as arrays."""
+        return NodeArrays.from_nodes([node.track_node for node in self.nodes])
+
+    @property
+    def time(self) -> Array:
+        """The time taken to drive each node."""
+        return self._get_aggregate(
+            "time", lambda: self._get_column(self.arrays.time)
+        )
+
     @property
     def total_time(self) -> float:
-        return sum(node.time for node in self)
+        return self._get_aggregate(
+            "total_time", lambda: float(self.time.sum())
+        )
 
     @property
     def total_length(self) -> float:
-        return sum(node.length for node in self)
+        return self._get_aggregate(
+            "total_length",
+            lambda: float(self._get_column(self.arrays.length).sum()),
+        )
 
     @property
     def total_energy_used(self) -> float:
-        return sum(node.energy_used for node in self)
+        def compute() -> float:
+            motor_power = self._get_column(self.arrays.motor_power)
+            return float(np.sum(motor_power * self.time))
+
+        return self._get_aggregate("total_energy_used", compute)
 
     @property
     def average_velocity(self) -> float:
@@ -237,7 +706,81 @@ class Solution(object):
         Returns:
             sector_time (float): The sum of times for the nodes in the sector.
         """
-        return sum([node.time for node in self if node.sector == sector])
+
+        def compute() -> float:
+            track_arrays = self.track_arrays
+            if sector not in track_arrays.sectors:
+                return 0
+            sector_id = track_arrays.sectors.index(sector)
+            return float(self.time[track_arrays.sector_id == sector_id].sum())
+
+        return self._get_aggregate(f"sector_time:{sector}", compute)
+
+    def get_vehicle_state_table(self) -> VehicleStateTable:
+        """
+        Evaluate the full vehicle state at every node simultaneously.
+
+        The state is evaluated from the context and trajectory
+        kept by the deferred vehicle state of each node,
+        so every node must have been solved.
+
+        Returns:
+            table (VehicleStateTable): The full vehicle state at each node.
+
+        Raises:
+            ValueError: If a node does not have a deferred vehicle state.
+        """
+
+        def compute() -> VehicleStateTable:
+            states = [node.deferred_state for node in self.nodes]
+            contexts: list[NodeContext] = []
+            trajectories: list[Trajectory] = []
+            for state in states:
+                if state is None or state.ctx is None:
+                    raise ValueError("Vehicle state not calculated.")
+                assert state.trajectory is not None
+                contexts.append(state.ctx)
+                trajectories.append(state.trajectory)
+            vehicle_model = states[0].vehicle_model  # type: ignore[union-attr]
+            assert vehicle_model is not None
+
+            first = contexts[0]
+            global_context = GlobalContext(
+                environment=first.environment,
+                vehicle=first.vehicle,
+                lambdas=first.lambdas,
+            )
+            count = len(contexts)
+            transient_variables = TransientVariables(
+                soc=np.fromiter(  # type: ignore[arg-type]
+                    (ctx.state.soc for ctx in contexts), float, count
+                ),
+                cell_temperature=np.fromiter(  # type: ignore[arg-type]
+                    (ctx.state.cell_temperature for ctx in contexts),
+                    float,
+                    count,
+                ),
+            )
+            ctx = global_context.get_array_context(
+                NodeArrays.from_nodes([ctx.node for ctx in contexts]),
+                transient_variables,
+            )
+            trajectory = Trajectory(
+                curvature=ctx.node.curvature,
+                velocity=np.fromiter(  # type: ignore[arg-type]
+                    (trajectory.velocity for trajectory in trajectories),
+                    float,
+                    count,
+                ),
+                ax=np.fromiter(  # type: ignore[arg-type]
+                    (trajectory.ax for trajectory in trajectories),
+                    float,
+                    count,
+                ),
+            )
+            return vehicle_model.evaluate_vehicle_state_table(ctx, trajectory)
+
+        return self._get_aggregate("vehicle_state_table", compute)
 
     def get_sector_boundary_positions(self) -> list[float]:
         """
@@ -262,7 +805,8 @@ class Solution(object):
         Returns:
             apex_indices (list[int]): Indices of apexes.
         """
-        return [i for i, node in enumerate(self.nodes) if node.is_apex()]
+        apex = self._get_column(self.arrays.apex)
+        return np.flatnonzero(apex).tolist()
 
     def get_sorted_apex_indices(self) -> list[int]:
         """
@@ -302,20 +846,19 @@ class Solution(object):
         """
         new_solution = copy(self)
         new_solution.nodes = [self.nodes[i] for i in indices]
+        new_solution._indices = self._get_indices()[indices]
+        new_solution.__dict__.pop("track_arrays", None)
         return new_solution
 
     def get_lap_solutions(self) -> list[Solution]:
         """
         Get a list of solutions separated by lap.
         """
-        laps = {node.lap_number for node in self.nodes}
-        solutions: list[Solution] = []
-        for lap in laps:
-            indices = [
-                i for i, node in enumerate(self.nodes) if node.lap_number == lap
-            ]
-            solutions.append(self.get_subset(indices))
-        return solutions
+        lap_number = self.track_arrays.lap_number
+        return [
+            self.get_subset(np.flatnonzero(lap_number == lap).tolist())
+            for lap in np.unique(lap_number)
+        ]
 
 
 # TODO: deprecate this
@@ -337,10 +880,17 @@ def create_new_solution(
     transient_variables = initialise_transient_variables(
         track_mesh, initial_state
     )
+    arrays = SolutionArrays.empty(
+        np.fromiter(
+            (track_node.length for track_node in track_mesh.nodes),
+            dtype=float,
+            count=track_mesh.node_count,
+        )
+    )
     solution_nodes = [
-        SolutionNode(track_node=track_node, transient_variables=estimated_state)
-        for track_node, estimated_state in zip(
-            track_mesh.nodes, transient_variables
+        SolutionNode.view(arrays, i, track_node, estimated_state)
+        for i, (track_node, estimated_state) in enumerate(
+            zip(track_mesh.nodes, transient_variables)
         )
     ]
     solution = Solution(nodes=solution_nodes, vehicle_model=vehicle_model)
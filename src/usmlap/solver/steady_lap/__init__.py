@@ -0,0 +1,6 @@
+"""
+This subpackage implements a solver for multi-lap meshes,
+which reuses the solution of steady laps rather than re-solving them.
+"""
+
+from .steady_lap import SteadyLapSolver as SteadyLapSolver
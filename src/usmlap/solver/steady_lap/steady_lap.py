@@ -0,0 +1,388 @@
+"""
+This module implements a solver for multi-lap meshes,
+which reuses the solution of steady laps rather than re-solving them.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from usmlap.model import TransientVariables
+from usmlap.solver.qss import QuasiSteadyStateSolver
+from usmlap.solver.qss.acceleration import solve_acceleration
+from usmlap.solver.qss.braking import solve_braking
+from usmlap.solver.solution import DeferredVehicleState, Solution, SolutionNode
+from usmlap.solver.solver_interface import SolverInterface
+
+logger = logging.getLogger(__name__)
+
+type LapRole = tuple[bool, bool]
+
+BOUNDARY_TOLERANCE = 1e-6
+
+
+@dataclass
+class LapTemplate(object):
+    """
+    The solution of a single lap, which can be reused for similar laps.
+
+    Attributes:
+        role (LapRole): Whether the lap is the first and/or the last lap.
+        soc (np.ndarray): The state of charge at each node when solved.
+        cell_temperature (np.ndarray):
+            The cell temperature at each node when solved.
+        maximum_velocity (list[float]): The maximum velocity at each node.
+        initial_velocity (list[float]): The initial velocity at each node.
+        final_velocity (list[float]): The final velocity at each node.
+        apex (list[bool]): Whether each node is an apex.
+        vehicle_state (list[Optional[DeferredVehicleState]]):
+            The vehicle state at each node.
+    """
+
+    role: LapRole
+    soc: np.ndarray
+    cell_temperature: np.ndarray
+    maximum_velocity: list[float]
+    initial_velocity: list[float]
+    final_velocity: list[float]
+    apex: list[bool]
+    vehicle_state: list[Optional[DeferredVehicleState]]
+
+    @classmethod
+    def from_nodes(
+        cls, role: LapRole, nodes: list[SolutionNode]
+    ) -> "LapTemplate":
+        soc, cell_temperature = _state_arrays(nodes)
+        return cls(
+            role=role,
+            soc=soc,
+            cell_temperature=cell_temperature,
+            maximum_velocity=[node.maximum_velocity for node in nodes],
+            initial_velocity=[node.initial_velocity for node in nodes],
+            final_velocity=[node.final_velocity for node in nodes],
+            apex=[node.is_apex() for node in nodes],
+            vehicle_state=[node.deferred_state for node in nodes],
+        )
+
+    def apply(self, nodes: list[SolutionNode]) -> None:
+        """
+        Copy the solution onto the nodes of a lap.
+        Vehicle states are shared by reference.
+        """
+        for i, node in enumerate(nodes):
+            node.maximum_velocity = self.maximum_velocity[i]
+            node.set_initial_velocity(self.initial_velocity[i])
+            node.set_final_velocity(self.final_velocity[i])
+            if self.apex[i]:
+                node.add_apex()
+            elif node.is_apex():
+                node.remove_apex()
+            node.deferred_state = self.vehicle_state[i]
+
+
+@dataclass
+class SteadyLapSolver(SolverInterface):
+    """
+    Multi-lap solver, which reuses the solution of steady laps.
+
+    The laps of a multi-lap mesh are nearly identical,
+    so each lap is only solved if no similar lap has already been solved.
+    Laps are similar if they have the same role
+    (first lap, intermediate lap or last lap),
+    and their transient variables at every node are within a tolerance.
+
+    Until a flying lap has been solved, laps are solved in a window
+    of three consecutive laps, so that each lap sees the correct
+    exit conditions.
+    For a quasi-steady-state simulation, this means only three laps
+    are solved: the standing-start lap, one flying lap and the final lap.
+
+    Templates persist between calls to `solve`,
+    so when used within a quasi-transient solver,
+    only laps whose transient variables have drifted are re-solved.
+    A drifted lap is solved on its own, with its entry velocity anchored
+    to the exit velocity of the previous lap,
+    and its exit velocity anchored to the entry velocity
+    of a stored lap with the role of the next lap.
+    If the lap cannot meet its anchored velocities,
+    it is solved in a window instead.
+
+    Attributes:
+        lap_solver (SolverInterface, optional):
+            The solver used to solve each window of laps.
+            Defaults to a `QuasiSteadyStateSolver`.
+        soc_tolerance (float):
+            The maximum difference in state of charge for a lap to be reused.
+        temperature_tolerance (float):
+            The maximum difference in cell temperature (degC)
+            for a lap to be reused.
+        solved_laps (int):
+            The number of laps solved in the last call,
+            including laps solved only to be stored for the final lap.
+        reused_laps (int): The number of laps reused in the last call.
+    """
+
+    lap_solver: Optional[SolverInterface] = None
+    soc_tolerance: float = 0.01
+    temperature_tolerance: float = 0.5
+    solved_laps: int = field(default=0, init=False)
+    reused_laps: int = field(default=0, init=False)
+    _templates: list[LapTemplate] = field(
+        default_factory=list, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.lap_solver is None:
+            self.lap_solver = QuasiSteadyStateSolver(
+                self.vehicle_model, self.global_context
+            )
+
+    def solve(self, previous_solution: Solution) -> Solution:
+        solution = previous_solution
+        laps = _split_laps(solution)
+        self.solved_laps = 0
+        self.reused_laps = 0
+
+        if laps is None:
+            logger.info("Laps are not identical, solving all laps.")
+            self.solved_laps = len({node.lap_number for node in solution})
+            return self._solve_window(solution.nodes)
+
+        number_of_laps = len(laps)
+        solution.nodes[0].anchor_initial_velocity(0)
+
+        k = 0
+        while k < number_of_laps:
+            role = (k == 0, k == number_of_laps - 1)
+            template = self._find_template(role, laps[k])
+            if template is not None:
+                template.apply(laps[k])
+                self.reused_laps += 1
+                k += 1
+            elif self._solve_lap(laps, k):
+                k += 1
+            else:
+                last = min(k + 2, number_of_laps - 1)
+                k += self._solve_laps(laps, k, last)
+
+        logger.info(
+            f"Solved {self.solved_laps} laps, reused {self.reused_laps} laps."
+        )
+        return solution
+
+    def clear(self) -> None:
+        """
+        Discard all stored laps.
+        This must be called if the vehicle is modified between solves.
+        """
+        self._templates.clear()
+
+    def _solve_lap(self, laps: list[list[SolutionNode]], k: int) -> bool:
+        """
+        Solve a single lap with its entry and exit velocities anchored,
+        and store it as a template.
+
+        The entry velocity is the exit velocity of the previous lap,
+        which has already been solved or reused.
+        The exit velocity is the entry velocity of the most recently stored
+        lap with the role of the next lap.
+
+        Args:
+            laps (list[list[SolutionNode]]): The nodes of each lap.
+            k (int): The index of the lap to solve.
+
+        Returns:
+            solved (bool):
+                `True` if the lap was solved within its anchored velocities,
+                otherwise `False`, in which case the lap is unchanged.
+        """
+        number_of_laps = len(laps)
+        if k == 0:
+            return False
+        exit_velocity = None
+        if k < number_of_laps - 1:
+            exit_velocity = self._get_entry_velocity(
+                (False, k + 1 == number_of_laps - 1)
+            )
+            if exit_velocity is None:
+                return False
+
+        window_lap = _copy_nodes(laps[k])
+        window_lap[0].anchor_initial_velocity(laps[k - 1][-1].final_velocity)
+        if exit_velocity is not None:
+            window_lap[-1].anchor_final_velocity(exit_velocity)
+        self._solve_window(window_lap)
+        self.solved_laps += 1
+        if not self._boundaries_feasible(window_lap):
+            logger.info(f"Lap {k} could not meet its boundaries.")
+            return False
+
+        template = LapTemplate.from_nodes(
+            (False, k == number_of_laps - 1), window_lap
+        )
+        self._store(template)
+        template.apply(laps[k])
+        return True
+
+    def _solve_laps(
+        self, laps: list[list[SolutionNode]], first: int, last: int
+    ) -> int:
+        """
+        Solve a window of consecutive laps, and store them as templates.
+
+        The window starts from rest if it starts at the first lap,
+        otherwise its entry velocity is anchored
+        to the exit velocity of the previous lap.
+        The exit of the window is free, so its last lap is only applied
+        if it is the last lap of the mesh,
+        otherwise it is stored as a template for the last lap.
+
+        Args:
+            laps (list[list[SolutionNode]]): The nodes of each lap.
+            first (int): The index of the first lap in the window.
+            last (int): The index of the last lap in the window.
+
+        Returns:
+            applied (int): The number of laps of the mesh which were solved.
+        """
+        number_of_laps = len(laps)
+        window_laps = [_copy_nodes(laps[k]) for k in range(first, last + 1)]
+        if first > 0:
+            window_laps[0][0].anchor_initial_velocity(
+                laps[first - 1][-1].final_velocity
+            )
+        self._solve_window([node for lap in window_laps for node in lap])
+        self.solved_laps += last - first + 1
+
+        applied = 0
+        for k, window_lap in zip(range(first, last + 1), window_laps):
+            template = LapTemplate.from_nodes((k == 0, k == last), window_lap)
+            self._store(template)
+            if template.role == (k == 0, k == number_of_laps - 1):
+                template.apply(laps[k])
+                applied += 1
+        return applied
+
+    def _solve_window(self, nodes: list[SolutionNode]) -> Solution:
+        """Solve a set of nodes with the lap solver."""
+        assert self.lap_solver is not None
+        window = Solution(nodes=nodes, vehicle_model=self.vehicle_model)
+        return self.lap_solver.solve(window)
+
+    def _boundaries_feasible(self, nodes: list[SolutionNode]) -> bool:
+        """
+        Check that the anchored velocities of a lap can be achieved,
+        so that it joins the neighbouring laps.
+        """
+        first = nodes[0]
+        ctx = self.local_context(first.track_node, first.transient_variables)
+        entry_velocity = solve_braking(
+            self.vehicle_model, ctx, final_velocity=first.final_velocity
+        )
+        if entry_velocity < first.initial_velocity - BOUNDARY_TOLERANCE:
+            return False
+
+        last = nodes[-1]
+        ctx = self.local_context(last.track_node, last.transient_variables)
+        exit_velocity = solve_acceleration(
+            self.vehicle_model, ctx, initial_velocity=last.initial_velocity
+        )
+        return exit_velocity >= last.final_velocity - BOUNDARY_TOLERANCE
+
+    def _get_entry_velocity(self, role: LapRole) -> Optional[float]:
+        """Get the entry velocity of the most recent template with a role."""
+        for template in reversed(self._templates):
+            if template.role == role:
+                return template.initial_velocity[0]
+        return None
+
+    def _store(self, template: LapTemplate) -> None:
+        """Store a template, replacing any which it supersedes."""
+        self._templates = [
+            existing
+            for existing in self._templates
+            if not self._is_similar(existing, template)
+        ]
+        self._templates.append(template)
+
+    def _find_template(
+        self, role: LapRole, nodes: list[SolutionNode]
+    ) -> Optional[LapTemplate]:
+        """
+        Find a stored lap with the same role and similar transient variables.
+        """
+        soc, cell_temperature = _state_arrays(nodes)
+        for template in reversed(self._templates):
+            if template.role == role and self._within_tolerance(
+                template, soc, cell_temperature
+            ):
+                return template
+        return None
+
+    def _is_similar(self, template: LapTemplate, other: LapTemplate) -> bool:
+        """Check whether two templates share a role and similar states."""
+        return template.role == other.role and self._within_tolerance(
+            template, other.soc, other.cell_temperature
+        )
+
+    def _within_tolerance(
+        self,
+        template: LapTemplate,
+        soc: np.ndarray,
+        cell_temperature: np.ndarray,
+    ) -> bool:
+        """Check whether a set of states are within tolerance of a template."""
+        soc_error = np.max(np.abs(template.soc - soc))
+        temperature_error = np.max(
+            np.abs(template.cell_temperature - cell_temperature)
+        )
+        return bool(
+            soc_error <= self.soc_tolerance
+            and temperature_error <= self.temperature_tolerance
+        )
+
+
+def _split_laps(solution: Solution) -> Optional[list[list[SolutionNode]]]:
+    """
+    Split the nodes of a solution into laps.
+
+    Returns:
+        laps (list[list[SolutionNode]], optional):
+            The nodes of each lap, or `None` if the laps are not identical.
+    """
+    laps: list[list[SolutionNode]] = []
+    lap_number = None
+    for node in solution.nodes:
+        if node.lap_number != lap_number:
+            laps.append([])
+            lap_number = node.lap_number
+        laps[-1].append(node)
+
+    reference = [node.track_node.curvature for node in laps[0]]
+    for lap in laps[1:]:
+        if [node.track_node.curvature for node in lap] != reference:
+            return None
+    return laps
+
+
+def _copy_nodes(nodes: list[SolutionNode]) -> list[SolutionNode]:
+    """Create unsolved copies of a set of nodes."""
+    return [
+        SolutionNode(
+            track_node=node.track_node,
+            transient_variables=node.transient_variables,
+        )
+        for node in nodes
+    ]
+
+
+def _state_arrays(nodes: list[SolutionNode]) -> tuple[np.ndarray, np.ndarray]:
+    """Get the state of charge and cell temperature at each node."""
+    states: list[TransientVariables] = [
+        node.transient_variables for node in nodes
+    ]
+    soc = np.array([state.soc for state in states])
+    cell_temperature = np.array([state.cell_temperature for state in states])
+    return soc, cell_temperature
@@ -0,0 +1,5 @@
+"""
+This subpackage implements a vectorised Quasi Steady State laptime solver.
+"""
+
+from .vectorised import VectorisedSolver as VectorisedSolver
@@ -0,0 +1,149 @@
+"""
+This module implements a vectorised apex solver,
+which calculates the theoretical maximum velocity at every node of a mesh
+simultaneously, assuming zero longitudinal acceleration.
+"""
+
+from typing import Any
+
+import numpy as np
+
+from usmlap.model import GlobalContext, NodeContext, TractionModel
+from usmlap.model.vehicle_state import Trajectory, TransientVariables
+from usmlap.solver.errors import MaximumIterationsExceededError
+from usmlap.solver.qss.apex_velocity import (
+    MAX_ERROR_SF,
+    MAXIMUM_ITERATIONS,
+    MIN_ERROR_SF,
+    PRECISION,
+)
+from usmlap.track import NodeArrays
+
+type Array = np.ndarray[tuple[Any, ...], np.dtype[np.float64]]
+
+
+def solve_apex_velocities(
+    vehicle_model: TractionModel,
+    global_context: GlobalContext,
+    nodes: NodeArrays,
+    precision: float = PRECISION,
+    maximum_iterations: int = MAXIMUM_ITERATIONS,
+) -> Array:
+    """
+    Calculate the apex velocity at every node of a mesh.
+
+    This is the vectorised equivalent of `solve_apex_velocity`.
+    Every node is iterated simultaneously,
+    and nodes are removed from the iteration once they have converged.
+
+    Args:
+        vehicle_model (TractionModel): The vehicle model to use.
+        global_context (GlobalContext): The simulation context.
+        nodes (NodeArrays): The track nodes to solve.
+        precision (float): The maximum error allowed in the calculation.
+        maximum_iterations (int):
+            The maximum number of iterations to perform
+            before raising an error.
+
+    Returns:
+        apex_velocity (Array): The apex velocity at each node.
+
+    Raises:
+        MaximumIterationsExceededError:
+            If the maximum number of iterations is exceeded
+            without every node converging on a solution.
+    """
+    maximum_velocity = global_context.vehicle.maximum_velocity
+    velocity = np.full(len(nodes), maximum_velocity)
+    active = np.flatnonzero(nodes.curvature != 0)
+
+    residuals: list[float] = []
+
+    for _ in range(maximum_iterations):
+        if len(active) == 0:
+            return velocity
+
+        ctx = _array_context(global_context, nodes[active])
+        previous_velocity = velocity[active]
+        new_velocity, wheel_lift = _lateral_limit_velocity(
+            vehicle_model, ctx, previous_velocity
+        )
+        velocity[active] = new_velocity
+
+        error = np.abs(new_velocity - previous_velocity)
+        converged = ~wheel_lift & (error < precision)
+        saturated = ~wheel_lift & (new_velocity >= maximum_velocity)
+        velocity[active[saturated]] = maximum_velocity
+
+        residuals.append(float(np.max(error)))
+        active = active[~(converged | saturated)]
+
+    if len(active) == 0:
+        return velocity
+
+    raise MaximumIterationsExceededError(
+        maximum_iterations, precision, residuals
+    )
+
+
+def _array_context(
+    global_context: GlobalContext, nodes: NodeArrays
+) -> NodeContext:
+    """
+    Create a context which evaluates a set of nodes simultaneously.
+
+    The lateral limit is independent of the transient variables,
+    so the default state is used.
+    """
+    return global_context.get_array_context(
+        nodes, TransientVariables.get_default()
+    )
+
+
+def _lateral_limit_velocity(
+    vehicle_model: TractionModel, ctx: NodeContext, velocity: Array
+) -> tuple[Array, Array]:
+    """
+    Perform one fixed-point iteration of the apex velocity calculation,
+    using the vectorised lateral traction of the vehicle model.
+
+    Returns:
+        velocity (Array): The updated velocity estimate.
+        wheel_lift (Array): Mask of nodes where a wheel has lifted.
+
+    Raises:
+        InsufficientTractionError:
+            If any node has insufficient traction,
+            as in `solve_apex_velocity`.
+    """
+    curvature = ctx.node.curvature
+    trajectory = Trajectory(curvature=curvature, velocity=velocity, ax=0)
+    result = vehicle_model.lateral_traction_array(ctx, trajectory)
+    if np.any(result.insufficient_traction):
+        raise result.get_error()
+
+    ay = sum(result.forces) / ctx.vehicle.total_mass
+    new_velocity = np.sqrt(np.abs(ay) / np.abs(curvature))
+
+    # Mirror the handling of wheel lift in `solve_apex_velocity`
+    wheel_lift = result.wheel_lift
+    if np.any(wheel_lift):
+        scale_factor = 1 - _safe_divide(
+            2 * result.max_wheel_lift, result.lateral_load_transfer
+        )
+        clamped = np.clip(scale_factor, MIN_ERROR_SF, MAX_ERROR_SF)
+        lifted_velocity = velocity * np.sqrt(np.abs(clamped * scale_factor))
+        new_velocity = np.where(wheel_lift, lifted_velocity, new_velocity)
+
+    return new_velocity, wheel_lift
+
+
+def _safe_divide(numerator: Any, denominator: Any) -> Array:
+    """Divide two arrays, returning zero where the denominator is zero."""
+    numerator, denominator = np.broadcast_arrays(numerator, denominator)
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros(np.shape(numerator)),
+        where=denominator != 0,
+    )
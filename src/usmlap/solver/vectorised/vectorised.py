@@ -0,0 +1,270 @@
+"""
+This module implements a vectorised quasi-steady-state solver.
+"""
+
+import logging
+from typing import Any
+
+import numpy as np
+from rich import progress
+
+from usmlap.model import NodeContext
+from usmlap.solver.qss.acceleration import solve_acceleration
+from usmlap.solver.qss.braking import solve_braking
+from usmlap.solver.solution import DeferredVehicleState, Solution
+from usmlap.solver.solver_interface import SolverInterface
+from usmlap.track import NodeArrays
+
+from .apex_velocity import solve_apex_velocities
+
+logger = logging.getLogger(__name__)
+
+type Array = np.ndarray[tuple[Any, ...], np.dtype[np.float64]]
+
+
+class VectorisedSolver(SolverInterface):
+    """
+    Vectorised quasi-steady-state solver.
+
+    Produces the same velocity profile as `QuasiSteadyStateSolver`,
+    but operates on arrays for the whole mesh rather than on solution nodes.
+    Apex velocities for every node are solved simultaneously.
+    The velocity profile is then found with a single forward pass
+    and a single backward pass, taking the minimum envelope
+    of the acceleration and braking limits.
+    """
+
+    def solve(self, previous_solution: Solution) -> Solution:
+
+        solution = previous_solution
+        solution.nodes[0].anchor_initial_velocity(0)
+
+        nodes = NodeArrays.from_nodes(
+            [node.track_node for node in solution.nodes]
+        )
+        contexts = [
+            self.local_context(node.track_node, node.transient_variables)
+            for node in solution.nodes
+        ]
+
+        profile = self.solve_profile(nodes, contexts)
+        self.apply_profile(solution, contexts, *profile)
+        return solution
+
+    def solve_profile(
+        self, nodes: NodeArrays, contexts: list[NodeContext]
+    ) -> tuple[Array, Array, Array]:
+        """
+        Solve the velocity profile of a mesh.
+
+        Args:
+            nodes (NodeArrays): The track nodes to solve.
+            contexts (list[NodeContext]): The context at each node.
+
+        Returns:
+            maximum_velocity (Array): The maximum velocity at each node.
+            initial_velocity (Array): The velocity at the start of each node.
+            final_velocity (Array): The velocity at the end of each node.
+        """
+        logger.info("Solving maximum velocities...")
+        maximum_velocity = self._solve_maximum_velocities(nodes, contexts)
+
+        logger.info("Solving forward propagation...")
+        initial_velocity, final_velocity = self._propagate_forward(
+            contexts, maximum_velocity
+        )
+
+        logger.info("Solving backward propagation...")
+        initial_velocity, final_velocity = self._propagate_backward(
+            contexts, initial_velocity, final_velocity
+        )
+        return maximum_velocity, initial_velocity, final_velocity
+
+    def apply_profile(
+        self,
+        solution: Solution,
+        contexts: list[NodeContext],
+        maximum_velocity: Array,
+        initial_velocity: Array,
+        final_velocity: Array,
+    ) -> None:
+        """
+        Write a velocity profile to the nodes of a solution,
+        and calculate the full vehicle state at every node.
+
+        Args:
+            solution (Solution): The solution to update.
+            contexts (list[NodeContext]): The context at each node.
+            maximum_velocity (Array): The maximum velocity at each node.
+            initial_velocity (Array): The velocity at the start of each node.
+            final_velocity (Array): The velocity at the end of each node.
+        """
+        for i, node in enumerate(solution.nodes):
+            node.maximum_velocity = float(maximum_velocity[i])
+            node.set_initial_velocity(float(initial_velocity[i]))
+            node.set_final_velocity(float(final_velocity[i]))
+
+        _update_apexes(solution, maximum_velocity, final_velocity)
+
+        logger.info("Resolving full vehicle state...")
+        self._evaluate_vehicle_states(solution, contexts)
+
+    def _solve_maximum_velocities(
+        self, nodes: NodeArrays, contexts: list[NodeContext]
+    ) -> Array:
+        """
+        Calculate the apex velocity at every node.
+
+        Args:
+            nodes (NodeArrays): The track nodes to solve.
+            contexts (list[NodeContext]): The context at each node.
+
+        Returns:
+            maximum_velocity (Array): The maximum velocity at each node.
+        """
+        return solve_apex_velocities(
+            self.vehicle_model, self.global_context, nodes
+        )
+
+    def _accelerate(
+        self, index: int, ctx: NodeContext, initial_velocity: float
+    ) -> float:
+        """
+        Calculate the velocity at the end of a node under full acceleration.
+        """
+        return solve_acceleration(
+            model=self.vehicle_model,
+            ctx=ctx,
+            initial_velocity=initial_velocity,
+        )
+
+    def _brake(
+        self, index: int, ctx: NodeContext, final_velocity: float
+    ) -> float:
+        """
+        Calculate the velocity at the start of a node under full braking.
+        """
+        return solve_braking(
+            vehicle_model=self.vehicle_model,
+            ctx=ctx,
+            final_velocity=final_velocity,
+        )
+
+    def _propagate_forward(
+        self, contexts: list[NodeContext], maximum_velocity: Array
+    ) -> tuple[Array, Array]:
+        """
+        Propagate the solution forward from a standing start.
+
+        Args:
+            contexts (list[NodeContext]): The context at each node.
+            maximum_velocity (Array): The maximum velocity at each node.
+
+        Returns:
+            initial_velocity (Array): The velocity at the start of each node.
+            final_velocity (Array): The velocity at the end of each node.
+        """
+        initial_velocity = np.empty(len(contexts))
+        final_velocity = np.empty(len(contexts))
+
+        velocity = 0.0
+        for i, ctx in enumerate(
+            progress.track(
+                contexts,
+                description="Solving forward propagation...",
+                transient=True,
+            )
+        ):
+            initial_velocity[i] = velocity
+            potential_velocity = self._accelerate(i, ctx, velocity)
+            velocity = min(potential_velocity, maximum_velocity[i])
+            final_velocity[i] = velocity
+
+        return initial_velocity, final_velocity
+
+    def _propagate_backward(
+        self,
+        contexts: list[NodeContext],
+        initial_velocity: Array,
+        final_velocity: Array,
+    ) -> tuple[Array, Array]:
+        """
+        Propagate the solution backwards from the final node.
+
+        Braking is only solved at nodes where the vehicle decelerates.
+
+        Args:
+            contexts (list[NodeContext]): The context at each node.
+            initial_velocity (Array):
+                The forward-propagated initial velocities.
+            final_velocity (Array): The forward-propagated final velocities.
+
+        Returns:
+            initial_velocity (Array): The velocity at the start of each node.
+            final_velocity (Array): The velocity at the end of each node.
+        """
+        initial_velocity = initial_velocity.copy()
+        final_velocity = final_velocity.copy()
+
+        velocity = final_velocity[-1]
+        for i in progress.track(
+            range(len(contexts) - 1, -1, -1),
+            description="Solving backward propagation...",
+            transient=True,
+        ):
+            final_velocity[i] = min(velocity, final_velocity[i])
+            if final_velocity[i] < initial_velocity[i]:
+                potential_velocity = self._brake(
+                    i, contexts[i], final_velocity[i]
+                )
+                initial_velocity[i] = min(
+                    potential_velocity, initial_velocity[i]
+                )
+            velocity = initial_velocity[i]
+
+        return initial_velocity, final_velocity
+
+    def _evaluate_vehicle_states(
+        self, solution: Solution, contexts: list[NodeContext]
+    ) -> None:
+        """
+        Calculate the powertrain state at every node of the solution.
+        The full vehicle state is only evaluated when it is requested.
+
+        Args:
+            solution (Solution): The solution with velocities solved.
+            contexts (list[NodeContext]): The context at each node.
+        """
+        for node, ctx in zip(solution.nodes, contexts):
+            node.deferred_state = DeferredVehicleState.evaluate(
+                self.vehicle_model, ctx, node.trajectory
+            )
+
+
+def _update_apexes(
+    solution: Solution, maximum_velocity: Array, final_velocity: Array
+) -> None:
+    """
+    Mark the apexes of a solved velocity profile.
+
+    Apexes are local minima of the maximum velocity
+    which are reached by the final velocity profile.
+
+    Args:
+        solution (Solution): The solution to update.
+        maximum_velocity (Array): The maximum velocity at each node.
+        final_velocity (Array): The solved final velocity at each node.
+    """
+    previous = np.append(np.inf, maximum_velocity[:-1])
+    following = np.append(maximum_velocity[1:], np.inf)
+    local_minimum = (maximum_velocity < previous) & (
+        maximum_velocity <= following
+    )
+    reached = final_velocity >= maximum_velocity
+    apexes = local_minimum & reached
+
+    for node, is_apex in zip(solution.nodes, apexes):
+        if is_apex:
+            node.add_apex()
+        elif node.is_apex():
+            node.remove_apex()
@@ -0,0 +1,8 @@
+"""
+This subpackage implements a solver for very long meshes,
+which solves the mesh in overlapping windows to bound memory use.
+"""
+
+from .windowed import SolutionSummary as SolutionSummary
+from .windowed import WindowedSolver as WindowedSolver
+from .windowed import stream_nodes as stream_nodes
@@ -0,0 +1,301 @@
+"""
+This module implements a solver for very long meshes,
+which solves the mesh in overlapping windows to bound memory use.
+"""
+
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Generator, Optional
+
+from usmlap.model import TransientVariables
+from usmlap.solver.qss import QuasiSteadyStateSolver
+from usmlap.solver.qss.braking import solve_braking
+from usmlap.solver.solution import Solution, SolutionNode
+from usmlap.solver.solver_interface import SolverInterface
+from usmlap.track import TrackNode
+
+logger = logging.getLogger(__name__)
+
+type ChunkSink = Callable[[Solution], None]
+
+BOUNDARY_TOLERANCE = 1e-6
+
+
+@dataclass
+class SolutionSummary(object):
+    """
+    The totals of a solution, accumulated one chunk at a time.
+
+    This can be used as the sink of a `WindowedSolver`
+    when the solution at each node is not needed.
+
+    Attributes:
+        node_count (int): The number of nodes.
+        total_time (float): The total time.
+        total_length (float): The total length.
+        total_energy_used (float): The total energy used.
+        sector_times (dict[str, float]): The total time in each sector.
+    """
+
+    node_count: int = 0
+    total_time: float = 0
+    total_length: float = 0
+    total_energy_used: float = 0
+    sector_times: dict[str, float] = field(default_factory=dict)
+
+    def __call__(self, chunk: Solution) -> None:
+        for node in chunk:
+            self.node_count += 1
+            self.total_time += node.time
+            self.total_length += node.length
+            self.total_energy_used += node.energy_used
+            self.sector_times[node.sector] = (
+                self.sector_times.get(node.sector, 0) + node.time
+            )
+
+    def __str__(self) -> str:
+        return f"Total time: {self.total_time:.3f}s"
+
+    @property
+    def average_velocity(self) -> float:
+        return self.total_length / self.total_time
+
+
+@dataclass
+class WindowedSolver(SolverInterface):
+    """
+    Solver which solves a mesh in overlapping windows.
+
+    Each window is solved in full, and the nodes before its
+    slowest remaining apex are committed and passed to a sink.
+    The next window starts at that apex, anchored to its velocity,
+    and the nodes after it are solved again.
+    Nothing after an apex can change the solution before it
+    unless a braking zone spans the overlap,
+    so a committed chunk is only released to the sink
+    once the next window confirms that its entry velocity can be reached.
+    Otherwise, the chunk is solved again as part of the next window.
+
+    Only the current window and one committed chunk are held in memory,
+    so the memory used is independent of the length of the mesh.
+
+    Attributes:
+        window_solver (SolverInterface, optional):
+            The solver used to solve each window.
+            Defaults to a `QuasiSteadyStateSolver`.
+        window_length (float):
+            The length (m) of each window which may be committed.
+        overlap_length (float):
+            The length (m) solved beyond each window,
+            which must be longer than any braking zone.
+        windows (int): The number of windows solved in the last solve.
+        extended_windows (int):
+            The number of windows which were extended in the last solve,
+            because no boundary was found or a boundary was infeasible.
+        peak_window_nodes (int):
+            The largest number of nodes in a window in the last solve.
+    """
+
+    window_solver: Optional[SolverInterface] = None
+    window_length: float = 1000
+    overlap_length: float = 250
+    windows: int = field(default=0, init=False)
+    extended_windows: int = field(default=0, init=False)
+    peak_window_nodes: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        if self.window_solver is None:
+            self.window_solver = QuasiSteadyStateSolver(
+                self.vehicle_model, self.global_context
+            )
+
+    def solve(self, previous_solution: Solution) -> Solution:
+        solution = previous_solution
+        solution.nodes[0].anchor_initial_velocity(0)
+        nodes = iter(solution.nodes)
+
+        def write_back(chunk: Solution) -> None:
+            for chunk_node in chunk:
+                _copy_node(chunk_node, next(nodes))
+
+        self.solve_stream(solution.nodes, write_back)
+        return solution
+
+    def solve_stream(
+        self, nodes: Iterable[SolutionNode], sink: ChunkSink
+    ) -> None:
+        """
+        Solve a stream of nodes, passing each finished chunk to a sink.
+
+        Only the track node and transient variables of each node are used,
+        so the nodes may be generated lazily with `stream_nodes`.
+        Chunks are passed to the sink in order, and are not linked
+        to each other, so they may be discarded once consumed.
+
+        Args:
+            nodes (Iterable[SolutionNode]): The nodes to solve.
+            sink (ChunkSink): The consumer of each finished chunk.
+        """
+        source = iter(nodes)
+        self.windows = 0
+        self.extended_windows = 0
+        self.peak_window_nodes = 0
+
+        window: list[SolutionNode] = []
+        window_length = self.window_length
+        entry_velocity = 0.0
+        held: Optional[Solution] = None
+        held_entry_velocity = 0.0
+
+        while True:
+            exhausted = _fill(
+                window, source, window_length + self.overlap_length
+            )
+            self.peak_window_nodes = max(self.peak_window_nodes, len(window))
+            solution = self._solve_window(window, entry_velocity)
+
+            if held is not None and not self._entry_feasible(solution):
+                logger.debug("Window entry infeasible, extending window.")
+                window = [*held.nodes, *window]
+                entry_velocity = held_entry_velocity
+                held = None
+                self.extended_windows += 1
+                continue
+
+            if held is not None:
+                sink(held)
+                held = None
+
+            if exhausted:
+                sink(solution)
+                break
+
+            boundary = _find_boundary(solution, window_length)
+            if boundary is None:
+                logger.debug("No boundary found, extending window.")
+                window_length += self.window_length
+                self.extended_windows += 1
+                continue
+
+            held = Solution(
+                nodes=solution.nodes[:boundary],
+                vehicle_model=self.vehicle_model,
+            )
+            held.nodes[-1].next = None
+            held_entry_velocity = entry_velocity
+            entry_velocity = solution.nodes[boundary].initial_velocity
+            window = window[boundary:]
+            window_length = self.window_length
+
+        logger.info(
+            f"Solved {self.windows} windows, "
+            f"extended {self.extended_windows} windows."
+        )
+
+    def _solve_window(
+        self, window: list[SolutionNode], entry_velocity: float
+    ) -> Solution:
+        """
+        Solve a window of nodes, starting from an entry velocity.
+        The nodes are copied, so that they are not linked to the rest
+        of the mesh.
+        """
+        assert self.window_solver is not None
+        nodes = [
+            SolutionNode(
+                track_node=node.track_node,
+                transient_variables=node.transient_variables,
+            )
+            for node in window
+        ]
+        nodes[0].anchor_initial_velocity(entry_velocity)
+        self.windows += 1
+        solution = Solution(nodes=nodes, vehicle_model=self.vehicle_model)
+        return self.window_solver.solve(solution)
+
+    def _entry_feasible(self, solution: Solution) -> bool:
+        """
+        Check that the vehicle can brake from the anchored entry velocity
+        of a window to the final velocity of its first node.
+        """
+        first = solution.nodes[0]
+        ctx = self.local_context(first.track_node, first.transient_variables)
+        entry_velocity = solve_braking(
+            self.vehicle_model, ctx, final_velocity=first.final_velocity
+        )
+        return entry_velocity >= first.initial_velocity - BOUNDARY_TOLERANCE
+
+
+def stream_nodes(
+    track_nodes: Iterable[TrackNode], initial_state: TransientVariables
+) -> Generator[SolutionNode]:
+    """
+    Generate blank solution nodes for a sequence of track nodes.
+
+    Args:
+        track_nodes (Iterable[TrackNode]): The track nodes.
+        initial_state (TransientVariables): The state at every node.
+
+    Yields:
+        node (SolutionNode): A blank solution node.
+    """
+    for track_node in track_nodes:
+        yield SolutionNode(
+            track_node=track_node, transient_variables=initial_state
+        )
+
+
+def _fill(
+    window: list[SolutionNode], source: Iterator[SolutionNode], length: float
+) -> bool:
+    """
+    Extend a window from a source until it reaches a length.
+
+    Returns:
+        exhausted (bool): `True` if the source has no more nodes.
+    """
+    window_length = sum(node.length for node in window)
+    while window_length < length:
+        node = next(source, None)
+        if node is None:
+            return True
+        window.append(node)
+        window_length += node.length
+    return False
+
+
+def _find_boundary(solution: Solution, length: float) -> Optional[int]:
+    """
+    Find the remaining apex with the lowest velocity
+    within a length of the start of a solution, excluding the first node.
+
+    Returns:
+        boundary (int, optional): The index of the apex, if there is one.
+    """
+    boundary = None
+    position = 0.0
+    for i, node in enumerate(solution.nodes):
+        if position > length:
+            break
+        position += node.length
+        if i == 0 or not node.is_apex():
+            continue
+        if (
+            boundary is None
+            or node.apex_velocity < solution.nodes[boundary].apex_velocity
+        ):
+            boundary = i
+    return boundary
+
+
+def _copy_node(source: SolutionNode, target: SolutionNode) -> None:
+    """Copy the solution at a node onto another node."""
+    target.maximum_velocity = source.maximum_velocity
+    target.set_initial_velocity(source.initial_velocity)
+    target.set_final_velocity(source.final_velocity)
+    if source.is_apex():
+        target.add_apex()
+    elif target.is_apex():
+        target.remove_apex()
+    target.deferred_state = source.deferred_state
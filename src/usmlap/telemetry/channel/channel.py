@@ -9,7 +9,7 @@ from typing import ClassVar, NamedTuple, Optional
 
 from pint.facets.plain import PlainUnit as Unit
 
-from usmlap.solver import SolutionNode
+from usmlap.solver import CompactSolution, SolutionNode
 from usmlap.telemetry.data import TelemetrySolution
 
 
@@ -67,6 +67,8 @@ class PrimitiveDataChannel(ABC):
 
     These channels extract a list of values from a telemetry solution.
     Each value corresponds to a node in the solution.
+    Compact solutions do not store nodes,
+    so channels which support them also implement `read_compact`.
     """
 
     unit: ClassVar[Unit]
@@ -82,10 +84,28 @@ class PrimitiveDataChannel(ABC):
     @abstractmethod
     def read_value(cls, node: SolutionNode) -> float: ...
 
+    @classmethod
+    def read_compact(cls, solution: CompactSolution) -> list[float]:
+        """
+        Read the value of the channel at each node of a compact solution.
+
+        Args:
+            solution (CompactSolution): The compact solution.
+
+        Returns:
+            values (list[float]): The value of the channel at each node.
+
+        Raises:
+            TypeError: If the channel is not stored in compact solutions.
+        """
+        raise TypeError(f"{cls.label} is not stored in compact solutions.")
+
     def __new__(
         cls, unit: Optional[Unit] = None, label: Optional[str] = None
     ) -> TelemetryChannel[list[float]]:
         def channel_fcn(solution: TelemetrySolution) -> list[float]:  # noqa: S1720
+            if isinstance(solution.solution, CompactSolution):
+                return cls.read_compact(solution.solution)
             return [cls.read_value(node) for node in solution.nodes]
 
         if not unit:
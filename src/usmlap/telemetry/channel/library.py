@@ -5,7 +5,7 @@ This module defines primitive telemetry channels which extract values from a tel
 from pint import UnitRegistry
 
 import usmlap.telemetry.channel.functions as fcn
-from usmlap.solver import SolutionNode
+from usmlap.solver import CompactSolution, SolutionNode
 from usmlap.telemetry import TelemetrySolution
 
 from .channel import DerivedDataChannel, PrimitiveDataChannel
@@ -22,6 +22,12 @@ class Velocity(
     def read_value(cls, node: SolutionNode) -> float:
         return node.average_velocity
 
+    @classmethod
+    def read_compact(cls, solution: CompactSolution) -> list[float]:
+        initial_velocity = solution.get_channel("initial_velocity")
+        final_velocity = solution.get_channel("final_velocity")
+        return ((initial_velocity + final_velocity) / 2).tolist()
+
 
 class MaximumVelocity(
     PrimitiveDataChannel,
@@ -34,6 +40,10 @@ class MaximumVelocity(
     def read_value(cls, node: SolutionNode) -> float:
         return node.maximum_velocity
 
+    @classmethod
+    def read_compact(cls, solution: CompactSolution) -> list[float]:
+        return solution.get_channel("maximum_velocity").tolist()
+
 
 class Position(PrimitiveDataChannel, unit=ureg.meter, label="Position"):
     """Position of the vehicle."""
@@ -42,6 +52,10 @@ class Position(PrimitiveDataChannel, unit=ureg.meter, label="Position"):
     def read_value(cls, node: SolutionNode) -> float:
         return node.track_node.position
 
+    @classmethod
+    def read_compact(cls, solution: CompactSolution) -> list[float]:
+        return solution.get_channel("position").tolist()
+
 
 class NodeTime(PrimitiveDataChannel, unit=ureg.millisecond, label="Node Time"):
     """Time taken to traverse the node."""
@@ -50,6 +64,10 @@ class NodeTime(PrimitiveDataChannel, unit=ureg.millisecond, label="Node Time"):
     def read_value(cls, node: SolutionNode) -> float:
         return node.time
 
+    @classmethod
+    def read_compact(cls, solution: CompactSolution) -> list[float]:
+        return solution.time.tolist()
+
 
 class Time(DerivedDataChannel, unit=ureg.second, label="Time"):
     """Cumulative time."""
@@ -66,6 +84,10 @@ class Curvature(PrimitiveDataChannel, unit=1 / ureg.meter, label="Curvature"):
     def read_value(cls, node: SolutionNode) -> float:
         return node.track_node.curvature
 
+    @classmethod
+    def read_compact(cls, solution: CompactSolution) -> list[float]:
+        return solution.get_channel("curvature").tolist()
+
 
 class LateralAcceleration(
     PrimitiveDataChannel,
@@ -78,6 +100,14 @@ class LateralAcceleration(
     def read_value(cls, node: SolutionNode) -> float:
         return node.lateral_acceleration
 
+    @classmethod
+    def read_compact(cls, solution: CompactSolution) -> list[float]:
+        initial_velocity = solution.get_channel("initial_velocity")
+        final_velocity = solution.get_channel("final_velocity")
+        average_velocity = (initial_velocity + final_velocity) / 2
+        curvature = solution.get_channel("curvature")
+        return (average_velocity**2 * curvature).tolist()
+
 
 class LongitudinalAcceleration(
     PrimitiveDataChannel,
@@ -90,13 +120,24 @@ class LongitudinalAcceleration(
     def read_value(cls, node: SolutionNode) -> float:
         return node.longitudinal_acceleration
 
+    @classmethod
+    def read_compact(cls, solution: CompactSolution) -> list[float]:
+        initial_velocity = solution.get_channel("initial_velocity")
+        final_velocity = solution.get_channel("final_velocity")
+        length = solution.get_channel("length")
+        return (
+            (final_velocity**2 - initial_velocity**2) / (2 * length)
+        ).tolist()
+
 
-class Drag(PrimitiveDataChannel, unit=ureg.newton, label="Drag"):
+class Drag(DerivedDataChannel, unit=ureg.newton, label="Drag"):
     """Aerodynamic drag force."""
 
     @classmethod
-    def read_value(cls, node: SolutionNode) -> float:
-        return node.calculated_vehicle_state.drag
+    def channel_fcn(cls, solution: TelemetrySolution) -> list[float]:
+        if isinstance(solution.solution, CompactSolution):
+            raise TypeError("Drag is not stored in compact solutions.")
+        return solution.solution.get_vehicle_state_table().drag.tolist()
 
 
 class AccumulatorCurrent(
@@ -106,22 +147,35 @@ class AccumulatorCurrent(
 
     @classmethod
     def read_value(cls, node: SolutionNode) -> float:
-        return node.calculated_vehicle_state.accumulator_current
+        return node.powertrain_state.accumulator_current
+
+    @classmethod
+    def read_compact(cls, solution: CompactSolution) -> list[float]:
+        return solution.get_channel("accumulator_current").tolist()
 
 
 class MotorTorque(
-    PrimitiveDataChannel, unit=ureg.newton * ureg.meter, label="Motor Torque"
+    DerivedDataChannel, unit=ureg.newton * ureg.meter, label="Motor Torque"
 ):
     """Torque output of the motor."""
 
     @classmethod
-    def read_value(cls, node: SolutionNode) -> float:
-        return node.calculated_vehicle_state.motor_torque
+    def channel_fcn(cls, solution: TelemetrySolution) -> list[float]:
+        if isinstance(solution.solution, CompactSolution):
+            return solution.solution.get_channel("motor_torque").tolist()
+        table = solution.solution.get_vehicle_state_table()
+        return table.motor_torque.tolist()
 
 
-class MotorPower(PrimitiveDataChannel, unit=ureg.kilowatt, label="Motor Power"):
+class MotorPower(
+    PrimitiveDataChannel, unit=ureg.kilowatt, label="Motor Power"
+):
     """Power output of the motor."""
 
     @classmethod
     def read_value(cls, node: SolutionNode) -> float:
-        return node.calculated_vehicle_state.motor_power
+        return node.powertrain_state.motor_power
+
+    @classmethod
+    def read_compact(cls, solution: CompactSolution) -> list[float]:
+        return solution.get_channel("motor_power").tolist()
@@ -5,8 +5,15 @@ This module defines a format for storing the solution of a simulation.
 from __future__ import annotations
 
 from dataclasses import dataclass
-
-from usmlap.solver import Solution, SolutionNode, SolverInterface
+from typing import Optional
+
+from usmlap.solver import (
+    CompactSolution,
+    Solution,
+    SolutionNode,
+    SolverInterface,
+)
+from usmlap.utils.memory import MemoryProfile
 from usmlap.vehicle import Vehicle
 
 
@@ -15,14 +22,17 @@ class TelemetrySolution(object):
     """A solution object."""
 
     vehicle: Vehicle
-    solution: Solution
+    solution: Solution | CompactSolution
     solver: type[SolverInterface]
+    memory_profile: Optional[MemoryProfile] = None
 
     @property
     def nodes(self) -> list[SolutionNode]:
         return self.solution.nodes
 
     def get_subset(self, indices: list[int]) -> TelemetrySolution:
+        if isinstance(self.solution, CompactSolution):
+            raise TypeError("Compact solutions cannot be subset.")
         return TelemetrySolution(
             vehicle=self.vehicle,
             solution=self.solution.get_subset(indices),
@@ -3,7 +3,11 @@ This package contains code for loading track data and generating track meshes.
 """
 
 from .mesh import Mesh as Mesh
+from .mesh import NodeArrays as NodeArrays
+from .mesh import RepeatingMesh as RepeatingMesh
 from .mesh import TrackNode as TrackNode
+from .mesh_cache import MeshCache as MeshCache
+from .mesh_cache import load_mesh as load_mesh
 from .mesh_generation import generate_mesh as generate_mesh
 from .track_data import Configuration as Configuration
 from .track_data import TrackData as TrackData
@@ -4,21 +4,35 @@ This module defines nodes and meshes for a track.
 
 from __future__ import annotations
 
-import copy
 import math
-from dataclasses import dataclass
-from typing import Generator
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, fields
+from functools import cached_property
+from typing import Any, Generator, Optional
 
 import matplotlib.pyplot as plt
-from pydantic import BaseModel, Field
+import numpy as np
 
 from .track_data import Configuration
 
+type Array = np.ndarray[tuple[Any, ...], np.dtype[np.float64]]
+type IntArray = np.ndarray[tuple[Any, ...], np.dtype[np.int64]]
 
-class TrackNode(BaseModel):
+DEFAULT_SECTOR = "Sector 1"
+
+
+class TrackNode(object):
     """
     A node of a track.
 
+    Track nodes are lightweight views of a single row of `NodeArrays`,
+    so that the nodes of a mesh are stored as contiguous arrays.
+    A standalone node can also be created from its attributes,
+    which are validated and stored as an array of one row.
+    A node of a repeating mesh is a view of a row of the base lap,
+    offset by its lap and by the length of the preceding laps.
+    Nodes are read-only.
+
     Attributes:
         Position (float): The position of the node from the start of the track.
         Length (float): The length of the track section.
@@ -30,18 +44,182 @@ class TrackNode(BaseModel):
         Sector (int): The sector of the track section.
     """
 
-    position: float = Field(ge=0)
-    length: float = Field(gt=0)
-    curvature: float
-    elevation: float
-    inclination: float = Field(gt=-math.pi / 2, lt=math.pi / 2, default=0)
-    banking: float = Field(ge=-math.pi / 2, le=math.pi / 2, default=0)
-    grip_factor: float = Field(gt=0, default=1)
-    sector: str = Field(default="Sector 1")
-    lap_number: int = Field(default=1)
-    start_coordinate: tuple[float, float] = Field(default=(0, 0))
-    end_coordinate: tuple[float, float] = Field(default=(0, 0))
-    heading_angle: float = Field(default=0)
+    __slots__ = ("_arrays", "_index", "_lap", "_offset")
+
+    _arrays: NodeArrays
+    _index: int
+    _lap: int
+    _offset: float
+
+    def __init__(
+        self,
+        position: float,
+        length: float,
+        curvature: float,
+        elevation: float,
+        inclination: float = 0,
+        banking: float = 0,
+        grip_factor: float = 1,
+        sector: str = DEFAULT_SECTOR,
+        lap_number: int = 1,
+        start_coordinate: tuple[float, float] = (0, 0),
+        end_coordinate: tuple[float, float] = (0, 0),
+        heading_angle: float = 0,
+    ) -> None:
+        if position < 0:
+            raise ValueError("Position must not be negative")
+        if length <= 0:
+            raise ValueError("Length must be greater than 0")
+        if not -math.pi / 2 < inclination < math.pi / 2:
+            raise ValueError("Inclination must be between -pi/2 and pi/2")
+        if not -math.pi / 2 <= banking <= math.pi / 2:
+            raise ValueError("Banking must be between -pi/2 and pi/2")
+        if grip_factor <= 0:
+            raise ValueError("Grip factor must be greater than 0")
+
+        self._arrays = NodeArrays(
+            position=np.array([position], dtype=np.float64),
+            length=np.array([length], dtype=np.float64),
+            curvature=np.array([curvature], dtype=np.float64),
+            elevation=np.array([elevation], dtype=np.float64),
+            inclination=np.array([inclination], dtype=np.float64),
+            banking=np.array([banking], dtype=np.float64),
+            grip_factor=np.array([grip_factor], dtype=np.float64),
+            sector_id=np.zeros(1, dtype=np.int64),
+            lap_number=np.array([lap_number], dtype=np.int64),
+            heading_angle=np.array([heading_angle], dtype=np.float64),
+            start_x=np.array([start_coordinate[0]], dtype=np.float64),
+            start_y=np.array([start_coordinate[1]], dtype=np.float64),
+            end_x=np.array([end_coordinate[0]], dtype=np.float64),
+            end_y=np.array([end_coordinate[1]], dtype=np.float64),
+            sectors=(sector,),
+        )
+        self._index = 0
+        self._lap = 0
+        self._offset = 0.0
+
+    @classmethod
+    def view(
+        cls, arrays: NodeArrays, index: int, lap: int = 0, offset: float = 0
+    ) -> TrackNode:
+        """
+        Create a view of a row of node arrays.
+
+        Args:
+            arrays (NodeArrays): The node arrays.
+            index (int): The index of the row.
+            lap (int): The number of laps to add to the lap number of the row.
+            offset (float): The distance to add to the position of the row.
+
+        Returns:
+            node (TrackNode): A view of the row.
+        """
+        node = cls.__new__(cls)
+        node._arrays = arrays
+        node._index = index
+        node._lap = lap
+        node._offset = offset
+        return node
+
+    @property
+    def row(self) -> tuple[NodeArrays, int, int]:
+        """
+        The node arrays which the node is a view of,
+        the index of its row and the lap of a repeating mesh it belongs to,
+        which together identify the node within its mesh.
+        """
+        return self._arrays, self._index, self._lap
+
+    def __repr__(self) -> str:
+        attributes = ", ".join(
+            f"{name}={value!r}" for name, value in self.to_dict().items()
+        )
+        return f"TrackNode({attributes})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Get the attributes of the node.
+
+        Returns:
+            attributes (dict[str, Any]):
+                The keyword arguments to create an equal standalone node.
+        """
+        return {
+            "position": self.position,
+            "length": self.length,
+            "curvature": self.curvature,
+            "elevation": self.elevation,
+            "inclination": self.inclination,
+            "banking": self.banking,
+            "grip_factor": self.grip_factor,
+            "sector": self.sector,
+            "lap_number": self.lap_number,
+            "start_coordinate": self.start_coordinate,
+            "end_coordinate": self.end_coordinate,
+            "heading_angle": self.heading_angle,
+        }
+
+    def replace(self, **changes: Any) -> TrackNode:
+        """
+        Create a standalone copy of the node with some attributes changed.
+
+        Args:
+            **changes (Any): The attributes to change.
+
+        Returns:
+            node (TrackNode): The new node.
+        """
+        return TrackNode(**(self.to_dict() | changes))
+
+    @property
+    def position(self) -> float:
+        return self._arrays.position.item(self._index) + self._offset
+
+    @property
+    def length(self) -> float:
+        return self._arrays.length.item(self._index)
+
+    @property
+    def curvature(self) -> float:
+        return self._arrays.curvature.item(self._index)
+
+    @property
+    def elevation(self) -> float:
+        return self._arrays.elevation.item(self._index)
+
+    @property
+    def inclination(self) -> float:
+        return self._arrays.inclination.item(self._index)
+
+    @property
+    def banking(self) -> float:
+        return self._arrays.banking.item(self._index)
+
+    @property
+    def grip_factor(self) -> float:
+        return self._arrays.grip_factor.item(self._index)
+
+    @property
+    def sector(self) -> str:
+        return self._arrays.sectors[self._arrays.sector_id.item(self._index)]
+
+    @property
+    def lap_number(self) -> int:
+        return self._arrays.lap_number.item(self._index) + self._lap
+
+    @property
+    def start_coordinate(self) -> tuple[float, float]:
+        arrays, index = self._arrays, self._index
+        return arrays.start_x.item(index), arrays.start_y.item(index)
+
+    @property
+    def end_coordinate(self) -> tuple[float, float]:
+        arrays, index = self._arrays, self._index
+        return arrays.end_x.item(index), arrays.end_y.item(index)
+
+    @property
+    def heading_angle(self) -> float:
+        return self._arrays.heading_angle.item(self._index)
 
     @property
     def radius(self) -> float:
@@ -74,19 +252,184 @@ class TrackNode(BaseModel):
         return value * math.cos(self.banking) * math.cos(self.inclination)
 
 
+@dataclass
+class NodeArrays(object):
+    """
+    Columnar representation of a sequence of track nodes.
+
+    Provides the same properties and projection methods as `TrackNode`,
+    evaluated element-wise, so that vehicle models can be evaluated
+    for many nodes at once.
+
+    Attributes:
+        position (Array): The position of each node.
+        length (Array): The length of each node.
+        curvature (Array): The curvature of each node (left +ve).
+        elevation (Array): The elevation of each node.
+        inclination (Array): The inclination angle of each node.
+        banking (Array): The banking angle of each node.
+        grip_factor (Array): The grip factor of each node.
+        sector_id (IntArray):
+            The index in `sectors` of the sector of each node.
+        lap_number (IntArray): The lap number of each node.
+        heading_angle (Array): The heading angle of each node.
+        start_x (Array): The x coordinate of the start of each node.
+        start_y (Array): The y coordinate of the start of each node.
+        end_x (Array): The x coordinate of the end of each node.
+        end_y (Array): The y coordinate of the end of each node.
+        sectors (tuple[str, ...]): The names of the sectors.
+    """
+
+    position: Array
+    length: Array
+    curvature: Array
+    elevation: Array
+    inclination: Array
+    banking: Array
+    grip_factor: Array
+    sector_id: IntArray
+    lap_number: IntArray
+    heading_angle: Array
+    start_x: Array
+    start_y: Array
+    end_x: Array
+    end_y: Array
+    sectors: tuple[str, ...] = (DEFAULT_SECTOR,)
+
+    @classmethod
+    def from_nodes(cls, nodes: Sequence[TrackNode]) -> NodeArrays:
+        """
+        Create a columnar representation of a sequence of track nodes.
+
+        If every node is a view of the same arrays,
+        including the nodes of a repeating mesh,
+        the rows are gathered from those arrays directly.
+
+        Args:
+            nodes (Sequence[TrackNode]): The track nodes.
+
+        Returns:
+            node_arrays (NodeArrays): Arrays of the node attributes.
+        """
+        arrays = _get_shared_arrays(nodes)
+        if arrays is not None:
+            count = len(nodes)
+            indices = np.fromiter(
+                (node._index for node in nodes), dtype=np.intp, count=count
+            )
+            gathered = arrays[indices]
+            laps = np.fromiter(
+                (node._lap for node in nodes), dtype=np.int64, count=count
+            )
+            if laps.any():
+                offsets = np.fromiter(
+                    (node._offset for node in nodes), dtype=float, count=count
+                )
+                gathered.lap_number = gathered.lap_number + laps
+                gathered.position = gathered.position + offsets
+            return gathered
+
+        sectors = tuple(dict.fromkeys(node.sector for node in nodes))
+        return cls(
+            position=np.array([node.position for node in nodes]),
+            length=np.array([node.length for node in nodes]),
+            curvature=np.array([node.curvature for node in nodes]),
+            elevation=np.array([node.elevation for node in nodes]),
+            inclination=np.array([node.inclination for node in nodes]),
+            banking=np.array([node.banking for node in nodes]),
+            grip_factor=np.array([node.grip_factor for node in nodes]),
+            sector_id=np.array(
+                [sectors.index(node.sector) for node in nodes], dtype=np.int64
+            ),
+            lap_number=np.array(
+                [node.lap_number for node in nodes], dtype=np.int64
+            ),
+            heading_angle=np.array([node.heading_angle for node in nodes]),
+            start_x=np.array([node.start_coordinate[0] for node in nodes]),
+            start_y=np.array([node.start_coordinate[1] for node in nodes]),
+            end_x=np.array([node.end_coordinate[0] for node in nodes]),
+            end_y=np.array([node.end_coordinate[1] for node in nodes]),
+            sectors=sectors,
+        )
+
+    def __len__(self) -> int:
+        return len(self.length)
+
+    def __getitem__(self, index: Any) -> NodeArrays:
+        return self.map(lambda column: column[index])
+
+    def get_columns(self) -> dict[str, np.ndarray]:
+        """
+        Get the array of each attribute.
+
+        Returns:
+            columns (dict[str, np.ndarray]): The arrays, keyed by attribute.
+        """
+        return {
+            field.name: getattr(self, field.name)
+            for field in fields(self)
+            if field.name != "sectors"
+        }
+
+    def map(self, function: Callable[[np.ndarray], np.ndarray]) -> NodeArrays:
+        """
+        Create new node arrays by applying a function to every column.
+
+        Args:
+            function (Callable[[np.ndarray], np.ndarray]):
+                The function to apply to each column.
+
+        Returns:
+            node_arrays (NodeArrays): The new node arrays.
+        """
+        columns = {
+            name: function(column)
+            for name, column in self.get_columns().items()
+        }
+        return NodeArrays(**columns, sectors=self.sectors)
+
+    def y_to_y(self, value: Any) -> Array:
+        return value * np.cos(self.banking)
+
+    def y_to_z(self, value: Any) -> Array:
+        return value * np.sin(self.banking)
+
+    def z_to_x(self, value: Any) -> Array:
+        return value * np.sin(self.inclination)
+
+    def z_to_y(self, value: Any) -> Array:
+        return value * np.sin(self.banking)
+
+    def z_to_z(self, value: Any) -> Array:
+        return value * np.cos(self.banking) * np.cos(self.inclination)
+
+
+def _get_shared_arrays(nodes: Sequence[TrackNode]) -> Optional[NodeArrays]:
+    """Get the arrays viewed by every node, if they are all the same."""
+    if not nodes:
+        return None
+    arrays = nodes[0]._arrays
+    if all(node._arrays is arrays for node in nodes):
+        return arrays
+    return None
+
+
 @dataclass
 class Mesh(object):
     """
     A mesh of a track.
 
+    The nodes are stored as columns of `NodeArrays`,
+    and `nodes` provides a lightweight `TrackNode` view of each row.
+
     Attributes:
-        nodes (list[Node]): A list of nodes making up the track.
+        arrays (NodeArrays): The attributes of each node of the track.
         configuration (Configuration): The configuration of the track
             (OPEN or CLOSED).
         track_name (str): The name of the track.
     """
 
-    nodes: list[TrackNode]
+    arrays: NodeArrays
     configuration: Configuration
     track_name: str
     location: str
@@ -96,72 +439,87 @@ class Mesh(object):
     def __post_init__(self) -> None:
         self.calculate_positions()
 
+    @classmethod
+    def from_nodes(
+        cls,
+        nodes: Sequence[TrackNode],
+        configuration: Configuration,
+        track_name: str,
+        location: str,
+        initial_heading: float,
+        initial_coordinates: tuple[float, float],
+    ) -> Mesh:
+        """
+        Create a mesh from a sequence of track nodes.
+
+        Args:
+            nodes (Sequence[TrackNode]): The nodes making up the track.
+            configuration (Configuration): The configuration of the track.
+            track_name (str): The name of the track.
+            location (str): The location of the track.
+            initial_heading (float): The heading at the start of the track.
+            initial_coordinates (tuple[float, float]):
+                The coordinates of the start of the track.
+
+        Returns:
+            mesh (Mesh): A mesh of the nodes.
+        """
+        return cls(
+            arrays=NodeArrays.from_nodes(nodes),
+            configuration=configuration,
+            track_name=track_name,
+            location=location,
+            initial_heading=initial_heading,
+            initial_coordinates=initial_coordinates,
+        )
+
     def __iter__(self) -> Generator[TrackNode]:
         for node in self.nodes:
             yield node
 
+    @cached_property
+    def nodes(self) -> list[TrackNode]:
+        return [TrackNode.view(self.arrays, i) for i in range(self.node_count)]
+
     @property
     def node_count(self) -> int:
-        return len(self.nodes)
+        return len(self.arrays)
 
     @property
     def track_length(self) -> float:
-        return sum(node.length for node in self)
+        return self._track_length
 
     @property
     def resolution(self) -> float:
         return self.track_length / self.node_count
 
     def calculate_positions(self) -> None:
-        position = 0
-        for node in self:
-            node.position = position
-            position += node.length
+        length = self.arrays.length
+        end_position = np.cumsum(length)
+        self.arrays.position = end_position - length
+        self._track_length = float(end_position[-1])
 
-    def get_repeating_mesh(self, number_of_laps: int) -> Mesh:
+    def get_repeating_mesh(self, number_of_laps: int) -> RepeatingMesh:
         """
         Generate a new mesh that repeats the track a number of times.
+        The new mesh is a view of this mesh, so no node data is copied.
 
         Args:
             number_of_laps (int): The number of times to repeat the track.
 
         Returns:
-            mesh (Mesh): A new mesh that repeats the track a number of times.
-        """
-
-        repeating_nodes: list[TrackNode] = []
-        for lap in range(1, number_of_laps + 1):
-            new_nodes = copy.deepcopy(self.nodes)
-            for node in new_nodes:
-                node.lap_number = lap
-                repeating_nodes.append(node)
-
-        position = 0
-        for node in repeating_nodes:
-            node.position = position
-            position += node.length
-
-        return Mesh(
-            nodes=repeating_nodes,
-            configuration=self.configuration,
-            track_name=self.track_name,
-            location=self.location,
-            initial_heading=self.initial_heading,
-            initial_coordinates=self.initial_coordinates,
-        )
+            mesh (RepeatingMesh):
+                A new mesh that repeats the track a number of times.
+        """
+        return RepeatingMesh(self, number_of_laps)
 
     def plot_traces(self) -> None:
-        position = [node.position for node in self]
-        curvature = [node.curvature for node in self]
-        elevation = [node.elevation for node in self]
-        inclination = [node.inclination for node in self]
-        banking = [node.banking for node in self]
-
-        data: dict[str, list[float]] = {
-            "Curvature": curvature,
-            "Elevation": elevation,
-            "Inclination": inclination,
-            "Banking": banking,
+        arrays = self.arrays
+        data: dict[str, Array] = {
+            "Curvature": arrays.curvature,
+            "Elevation": arrays.elevation,
+            "Inclination": arrays.inclination,
+            "Banking": arrays.banking,
         }
 
         fig, axs = plt.subplots(len(data), sharex=True)
@@ -170,9 +528,75 @@ class Mesh(object):
 
         i = 0
         for label, ydata in data.items():
-            axs[i].plot(position, ydata)
+            axs[i].plot(arrays.position, ydata)
             axs[i].set_title(label)
             axs[i].set_ylabel(label)
             axs[i].grid()
             i += 1
         plt.show()
+
+
+class RepeatingMesh(Mesh):
+    """
+    A mesh which repeats a base mesh a number of times.
+
+    The nodes are views of the arrays of the base mesh,
+    offset by their lap, so the node data of the base mesh
+    is shared by every lap rather than copied.
+    The full `arrays` of the repeated track are only built if requested.
+
+    Attributes:
+        base (Mesh): The mesh of a single lap.
+        number_of_laps (int): The number of times the base mesh is repeated.
+        lap_offsets (list[float]): The start position of each lap.
+    """
+
+    base: Mesh
+    number_of_laps: int
+    lap_offsets: list[float]
+
+    def __init__(self, base: Mesh, number_of_laps: int) -> None:
+        self.base = base
+        self.number_of_laps = number_of_laps
+        self.configuration = base.configuration
+        self.track_name = base.track_name
+        self.location = base.location
+        self.initial_heading = base.initial_heading
+        self.initial_coordinates = base.initial_coordinates
+        self._set_lap_offsets()
+
+    def __repr__(self) -> str:
+        return (
+            f"RepeatingMesh(base={self.base!r}, "
+            f"number_of_laps={self.number_of_laps})"
+        )
+
+    @cached_property
+    def arrays(self) -> NodeArrays:  # type: ignore[override]
+        return NodeArrays.from_nodes(self.nodes)
+
+    @cached_property
+    def nodes(self) -> list[TrackNode]:
+        base_arrays = self.base.arrays
+        return [
+            TrackNode.view(base_arrays, i, lap, offset)
+            for lap, offset in enumerate(self.lap_offsets)
+            for i in range(self.base.node_count)
+        ]
+
+    @property
+    def node_count(self) -> int:
+        return self.number_of_laps * self.base.node_count
+
+    def calculate_positions(self) -> None:
+        self.base.calculate_positions()
+        self._set_lap_offsets()
+        self.__dict__.pop("nodes", None)
+        self.__dict__.pop("arrays", None)
+
+    def _set_lap_offsets(self) -> None:
+        base_length = self.base.track_length
+        self.lap_offsets = [
+            lap * base_length for lap in range(self.number_of_laps)
+        ]
+        self._track_length = self.number_of_laps * base_length
@@ -0,0 +1,169 @@
+"""
+This module contains an on-disk cache of generated track meshes.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from usmlap.filepath import CACHE_ROOT
+
+from .mesh import Mesh, NodeArrays
+from .mesh_generation import Resolution, generate_mesh
+from .track_data import Configuration, TrackData
+
+DEFAULT_MESH_DIRECTORY = CACHE_ROOT / "meshes"
+METADATA_FILE = "metadata.json"
+MESH_GENERATION_SOURCES = ("mesh.py", "mesh_generation.py")
+
+
+@dataclass
+class MeshCache(object):
+    """
+    On-disk cache of generated track meshes.
+
+    Each mesh is stored as a directory of NumPy arrays, one per column
+    of its `NodeArrays`, which are memory-mapped when the mesh is loaded.
+    Meshes are keyed by a hash of the track data, the resolution,
+    the options passed to `generate_mesh` and the source code
+    of the mesh generation, so that a changed track is regenerated.
+
+    Attributes:
+        directory (Path): The directory to store meshes in.
+    """
+
+    directory: Path = DEFAULT_MESH_DIRECTORY
+
+    def get_mesh(
+        self,
+        track_data: TrackData,
+        resolution: float | Resolution,
+        **options: Any,
+    ) -> Mesh:
+        """
+        Load a mesh from the cache, generating and storing it if missing.
+
+        Args:
+            track_data (TrackData): The track data object.
+            resolution (Resolution): The resolution of the mesh, in metres.
+            **options (Any): Keyword arguments for `generate_mesh`.
+
+        Returns:
+            mesh (Mesh): A mesh of the track.
+        """
+        if not isinstance(resolution, Resolution):
+            resolution = Resolution(resolution)
+        path = self.directory / get_mesh_key(track_data, resolution, options)
+        if path.is_dir():
+            return _load_mesh(path)
+        mesh = generate_mesh(track_data, resolution, **options)
+        self._store(path, mesh)
+        return mesh
+
+    def clear(self) -> None:
+        """Remove all meshes from the cache."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _store(self, path: Path, mesh: Mesh) -> None:
+        """
+        Store a mesh in the cache.
+        The mesh is written to a temporary directory which is then renamed,
+        so that other processes never load a partially written mesh.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary_path = Path(tempfile.mkdtemp(dir=self.directory))
+        try:
+            _save_mesh(temporary_path, mesh)
+            os.replace(temporary_path, path)
+        except OSError:
+            if not path.is_dir():
+                raise
+        finally:
+            shutil.rmtree(temporary_path, ignore_errors=True)
+
+
+def get_mesh_key(
+    track_data: TrackData, resolution: Resolution, options: dict[str, Any]
+) -> str:
+    """
+    Get the key of a mesh in the cache.
+
+    Args:
+        track_data (TrackData): The track data object.
+        resolution (Resolution): The resolution of the mesh.
+        options (dict[str, Any]): Keyword arguments for `generate_mesh`.
+
+    Returns:
+        key (str): A hexadecimal SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    digest.update(track_data.model_dump_json().encode())
+    digest.update(f"{type(resolution).__qualname__}{resolution!r}".encode())
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode())
+    for source in MESH_GENERATION_SOURCES:
+        digest.update((Path(__file__).parent / source).read_bytes())
+    return digest.hexdigest()
+
+
+def load_mesh(
+    track_data: TrackData,
+    resolution: float | Resolution,
+    cache: bool = False,
+    **options: Any,
+) -> Mesh:
+    """
+    Get a track mesh, loading it from the default mesh cache if enabled.
+
+    Args:
+        track_data (TrackData): The track data object.
+        resolution (Resolution): The resolution of the mesh, in metres.
+        cache (bool): Whether to load the mesh from the default mesh cache,
+            generating and storing it if it has not been generated before.
+            Otherwise, the mesh is generated.
+        **options (Any): Keyword arguments for `generate_mesh`.
+
+    Returns:
+        mesh (Mesh): A mesh of the track.
+    """
+    if not cache:
+        return generate_mesh(track_data, resolution, **options)
+    mesh_cache = MeshCache(directory=DEFAULT_MESH_DIRECTORY)
+    return mesh_cache.get_mesh(track_data, resolution, **options)
+
+
+def _save_mesh(path: Path, mesh: Mesh) -> None:
+    for column, array in mesh.arrays.get_columns().items():
+        np.save(path / f"{column}.npy", array)
+
+    metadata = {
+        "configuration": mesh.configuration.value,
+        "track_name": mesh.track_name,
+        "location": mesh.location,
+        "initial_heading": mesh.initial_heading,
+        "initial_coordinates": list(mesh.initial_coordinates),
+        "sectors": list(mesh.arrays.sectors),
+    }
+    (path / METADATA_FILE).write_text(json.dumps(metadata))
+
+
+def _load_mesh(path: Path) -> Mesh:
+    metadata = json.loads((path / METADATA_FILE).read_text())
+    columns = {
+        column.stem: np.load(column, mmap_mode="r")
+        for column in path.glob("*.npy")
+    }
+    return Mesh(
+        arrays=NodeArrays(**columns, sectors=tuple(metadata["sectors"])),
+        configuration=Configuration(metadata["configuration"]),
+        track_name=metadata["track_name"],
+        location=metadata["location"],
+        initial_heading=metadata["initial_heading"],
+        initial_coordinates=tuple(metadata["initial_coordinates"]),
+    )
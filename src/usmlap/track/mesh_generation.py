@@ -9,7 +9,7 @@ import numpy as np
 
 from usmlap.utils.array import interp_previous
 
-from .mesh import Mesh, TrackNode
+from .mesh import Mesh, NodeArrays
 from .track_data import (
     BankingData,
     Configuration,
@@ -28,6 +28,8 @@ MAX_TANGENCY_CORRECTION_ITERATIONS = 100
 ACCEPTABLE_TANGENCY_ERROR = 1e-4
 MAX_DISPLACEMENT_CORRECTION_ITERATIONS = 200
 ACCEPTABLE_DISPLACEMENT_ERROR = 1e-3
+DEFAULT_MAXIMUM_SPACING = 2
+DEFAULT_TARGET_ERROR = 5e-3
 
 
 class Resolution(float):
@@ -43,6 +45,66 @@ class Resolution(float):
         return super().__new__(cls, value)
 
 
+class AdaptiveResolution(Resolution):
+    """
+    Resolution of an adaptive track mesh, in metres.
+
+    Nodes are no shorter than the resolution,
+    and no longer than the maximum spacing.
+    Between these limits, each node is extended
+    until the variation in curvature or inclination across it,
+    multiplied by its length, would exceed the target error.
+    Nodes are therefore short in corners and on crests,
+    and long on straights.
+
+    Attributes:
+        maximum_spacing (float): The maximum length of a node, in metres.
+        target_error (float):
+            The maximum variation in curvature (1/m) or inclination (rad)
+            across a node, multiplied by its length (m).
+    """
+
+    maximum_spacing: float
+    target_error: float
+
+    def __new__(
+        cls,
+        value: Any,
+        maximum_spacing: float = DEFAULT_MAXIMUM_SPACING,
+        target_error: float = DEFAULT_TARGET_ERROR,
+    ) -> Self:
+        resolution = super().__new__(cls, value)
+        if maximum_spacing < resolution:
+            raise ValueError("Maximum spacing must not be below resolution")
+        if target_error <= 0:
+            raise ValueError("Target error must be greater than 0")
+        resolution.maximum_spacing = float(maximum_spacing)
+        resolution.target_error = float(target_error)
+        return resolution
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AdaptiveResolution):
+            return False
+        return self._key == other._key
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __repr__(self) -> str:
+        return (
+            f"AdaptiveResolution({float(self)}, "
+            f"maximum_spacing={self.maximum_spacing}, "
+            f"target_error={self.target_error})"
+        )
+
+    @property
+    def _key(self) -> tuple[float, float, float]:
+        return (float(self), self.maximum_spacing, self.target_error)
+
+
 def generate_mesh(
     track_data: TrackData,
     resolution: float | Resolution,
@@ -58,7 +120,9 @@ def generate_mesh(
 
     Args:
         track_data (TrackData): The track data object.
-        resolution (Resolution): The resolut     ion of the mesh, in metres.
+        resolution (Resolution): The resolution of the mesh, in metres.
+            If an `AdaptiveResolution` is given, the spacing of the nodes
+            adapts to the curvature and elevation of the track.
         smooth (bool): Whether to smooth the curvature data (default = `True`).
         correct_tangency (bool): Whether to apply tangency correction
             to the track (default = `True`).
@@ -69,52 +133,66 @@ def generate_mesh(
     Returns:
         mesh (Mesh): A mesh of the track.
     """
-    resolution = Resolution(resolution)
+    if not isinstance(resolution, Resolution):
+        resolution = Resolution(resolution)
 
     track_length = track_data.total_length
-    node_count = round(track_length / resolution)
-    spacing = track_length / (node_count - 1)
-    position = np.arange(0, track_length, spacing)
-
-    length = np.diff(np.append(position, track_length))
+    position = _uniform_positions(track_length, resolution)
     curvature = _interpolate_curvature(
         track_data.shape, position, smooth=smooth
     )
-
-    elevation = _interpolate_elevation(track_data.elevation, position)
-    banking = _interpolate_banking(track_data.banking, position)
-    grip_factor = _interpolate_grip_factor(track_data.grip_factor, position)
-    sector = _interpolate_sector(track_data.sectors, position)
-    inclination = _calculate_inclination(position, elevation)
-
-    nodes = [
-        TrackNode(
-            position=position[i],
-            length=length[i],
-            curvature=curvature[i],
-            elevation=elevation[i],
-            inclination=inclination[i],
-            banking=banking[i],
-            grip_factor=grip_factor[i],
-            sector=sector[i],
-        )
-        for i in range(len(position))
-    ]
+    length = np.diff(np.append(position, track_length))
 
     if correct_tangency and track_data.configuration == Configuration.CLOSED:
-        nodes = _correct_tangency(nodes)
+        curvature = _correct_tangency(length, curvature)
 
     if (
         correct_displacement
         and track_data.configuration == Configuration.CLOSED
     ):
-        nodes = _correct_displacement(nodes)
+        length, curvature = _correct_displacement(length, curvature)
+
+    if isinstance(resolution, AdaptiveResolution):
+        position, length, curvature = _adapt_positions(
+            track_data, resolution, position, length, curvature
+        )
+
+    elevation = _interpolate_elevation(track_data.elevation, position)
+    banking = _interpolate_banking(track_data.banking, position)
+    grip_factor = _interpolate_grip_factor(track_data.grip_factor, position)
+    sector = _interpolate_sector(track_data.sectors, position)
+    inclination = _calculate_inclination(position, elevation)
 
-    nodes = _set_heading_angle(nodes, initial_heading)
-    nodes = _set_coordinates(nodes, initial_coordinates)
+    heading_angle = _calculate_heading_angle(
+        length, curvature, initial_heading
+    )
+    x, y = _calculate_coordinates(
+        length.copy(), curvature, initial_coordinates
+    )
+    sectors = tuple(dict.fromkeys(sector))
+
+    arrays = NodeArrays(
+        position=position,
+        length=length,
+        curvature=curvature,
+        elevation=elevation,
+        inclination=inclination,
+        banking=banking,
+        grip_factor=grip_factor,
+        sector_id=np.array(
+            [sectors.index(label) for label in sector], dtype=np.int64
+        ),
+        lap_number=np.ones(len(position), dtype=np.int64),
+        heading_angle=heading_angle,
+        start_x=x[:-1],
+        start_y=y[:-1],
+        end_x=x[1:],
+        end_y=y[1:],
+        sectors=sectors,
+    )
 
     return Mesh(
-        nodes=nodes,
+        arrays=arrays,
         configuration=track_data.configuration,
         track_name=track_data.print_name,
         location=track_data.location,
@@ -123,6 +201,93 @@ def generate_mesh(
     )
 
 
+def _uniform_positions(track_length: float, resolution: float) -> NDArray:
+    """
+    Get evenly spaced node positions along a track.
+
+    Args:
+        track_length (float): The length of the track.
+        resolution (float): The approximate spacing of the nodes.
+
+    Returns:
+        position (NDArray): The start position of each node.
+    """
+    node_count = round(track_length / resolution)
+    spacing = track_length / (node_count - 1)
+    return np.arange(0, track_length, spacing)
+
+
+def _adapt_positions(
+    track_data: TrackData,
+    resolution: AdaptiveResolution,
+    position: NDArray,
+    length: NDArray,
+    curvature: NDArray,
+) -> tuple[NDArray, NDArray, NDArray]:
+    """
+    Merge evenly spaced nodes into nodes whose length adapts to the track.
+
+    Consecutive nodes are merged greedily, until the merged node
+    would exceed the maximum spacing or the target error,
+    or would span a sector boundary.
+    The curvature of each merged node is the mean of the nodes it contains,
+    so that the heading of the track is preserved.
+    The even nodes are merged after tangency and displacement correction,
+    so the merged nodes keep the corrected geometry
+    without exceeding the maximum spacing.
+
+    Args:
+        track_data (TrackData): The track data object.
+        resolution (AdaptiveResolution): The resolution of the mesh.
+        position (NDArray): The start position of each even node.
+        length (NDArray): The corrected length of each even node.
+        curvature (NDArray): The corrected curvature of each even node.
+
+    Returns:
+        position (NDArray): The start position of each merged node.
+        length (NDArray): The length of each merged node.
+        curvature (NDArray): The curvature of each merged node.
+    """
+    end = np.cumsum(length)
+    start = end - length
+    elevation = _interpolate_elevation(track_data.elevation, position)
+    inclination = _calculate_inclination(position, elevation)
+    sector = _interpolate_sector(track_data.sectors, position.tolist())
+
+    starts = [0]
+    curvature_range = [curvature[0], curvature[0]]
+    inclination_range = [inclination[0], inclination[0]]
+    for i in range(1, len(position)):
+        curvature_range = [
+            min(curvature_range[0], curvature[i]),
+            max(curvature_range[1], curvature[i]),
+        ]
+        inclination_range = [
+            min(inclination_range[0], inclination[i]),
+            max(inclination_range[1], inclination[i]),
+        ]
+        node_length = end[i] - start[starts[-1]]
+        curvature_error = (
+            curvature_range[1] - curvature_range[0]
+        ) * node_length
+        inclination_error = (
+            inclination_range[1] - inclination_range[0]
+        ) * node_length
+        if (
+            node_length > resolution.maximum_spacing
+            or curvature_error > resolution.target_error
+            or inclination_error > resolution.target_error
+            or sector[i] != sector[starts[-1]]
+        ):
+            starts.append(i)
+            curvature_range = [curvature[i], curvature[i]]
+            inclination_range = [inclination[i], inclination[i]]
+
+    swept_angle = np.add.reduceat(curvature * length, starts)
+    merged_length = np.add.reduceat(length, starts)
+    return position[starts], merged_length, swept_angle / merged_length
+
+
 def _interpolate_curvature(
     data: list[ShapeData], sample_position: NDArray, smooth: bool = True
 ) -> NDArray:
@@ -274,30 +439,6 @@ def _calculate_heading_angle(
     return heading
 
 
-def _set_heading_angle(
-    nodes: list[TrackNode], initial_heading: float = 0
-) -> list[TrackNode]:
-    """
-    Set the heading angle of each node in a list.
-
-    Args:
-        nodes (list[TrackNode]): The nodes to update.
-        initial_heading (float): The initial heading angle (default = 0).
-
-    Returns:
-        nodes (list[TrackNode]): The updated nodes.
-    """
-
-    curvature = np.array([node.curvature for node in nodes])
-    length = np.array([node.length for node in nodes])
-    heading = _calculate_heading_angle(length, curvature, initial_heading)
-
-    for i, node in enumerate(nodes):
-        node.heading_angle = heading[i]
-
-    return nodes
-
-
 def _calculate_coordinates(
     length: NDArray,
     curvature: NDArray,
@@ -338,51 +479,26 @@ def _calculate_coordinates(
     return x, y
 
 
-def _set_coordinates(
-    nodes: list[TrackNode], initial_coordinates: tuple[float, float] = (0, 0)
-) -> list[TrackNode]:
-    """
-    Set the heading angle and coordinates of each node in a list.
-
-    Args:
-        nodes (list[TrackNode]): The nodes to update.
-        initial_coordinates (tuple[float, float]): The start coordinate
-            of the first node (default = (0, 0)).
-
-    Returns:
-        nodes (list[TrackNode]): The updated nodes.
-    """
-
-    length = np.array([node.length for node in nodes])
-    curvature = np.array([node.curvature for node in nodes])
-    x, y = _calculate_coordinates(length, curvature, initial_coordinates)
-
-    for i, node in enumerate(nodes):
-        node.start_coordinate = (x[i], y[i])
-        node.end_coordinate = (x[i + 1], y[i + 1])
-
-    return nodes
-
-
 def _correct_tangency(
-    nodes: list[TrackNode], iterations: int = MAX_TANGENCY_CORRECTION_ITERATIONS
-) -> list[TrackNode]:
+    length: NDArray,
+    curvature: NDArray,
+    iterations: int = MAX_TANGENCY_CORRECTION_ITERATIONS,
+) -> NDArray:
     """
     Adjust track curvature to correct the tangency of closed tracks.
 
     The tangency error is calculated by summing the sweep angle of each node.
 
     Args:
-        curvature (list[float]): The curvature of each node.
-        length (list[float]): The length of each node.
-        fractional_position (list[float]): The fractional position of each node.
+        length (NDArray): The length of each node.
+        curvature (NDArray): The curvature of each node.
+        iterations (int): The maximum number of iterations to run.
 
     Returns:
-        corrected_curvature (list[float]): Corrected curvature of each node.
+        corrected_curvature (NDArray): Corrected curvature of each node.
     """
 
-    curvature = np.array([node.curvature for node in nodes])
-    length = np.array([node.length for node in nodes])
+    curvature = curvature.copy()
 
     for i in range(iterations):
         heading_angle = _calculate_heading_angle(length, curvature, 0)
@@ -403,31 +519,30 @@ def _correct_tangency(
         correction_factor = abs_curvature / sum(abs_curvature)
         curvature += tangency_correction * correction_factor
 
-    for i, node in enumerate(nodes):
-        node.curvature = curvature[i]
-
-    nodes = _set_heading_angle(nodes)
-    return nodes
+    return curvature
 
 
 def _correct_displacement(
-    nodes: list[TrackNode],
+    length: NDArray,
+    curvature: NDArray,
     iterations: int = MAX_DISPLACEMENT_CORRECTION_ITERATIONS,
-) -> list[TrackNode]:
+) -> tuple[NDArray, NDArray]:
     """
     Adjust the length and curvature of each node
     to correct a displacement error.
 
     Args:
-        nodes (list[TrackNode]): The nodes of the track.
+        length (NDArray): The length of each node.
+        curvature (NDArray): The curvature of each node.
         iterations (int): The number of iterations to run.
 
     Returns:
-        corrected_nodes (list[TrackNode]): The corrected nodes.
+        corrected_length (NDArray): Corrected length of each node.
+        corrected_curvature (NDArray): Corrected curvature of each node.
     """
-    original_length = sum([node.length for node in nodes])
-    length = np.array([node.length for node in nodes])
-    curvature = np.array([node.curvature for node in nodes])
+    original_length = sum(length)
+    length = length.copy()
+    curvature = curvature.copy()
 
     for i in range(iterations):
         x, y = _calculate_coordinates(length, curvature, (0, 0))
@@ -451,8 +566,4 @@ def _correct_displacement(
         length *= stretch_factor
         curvature /= stretch_factor
 
-    for i in range(len(nodes)):
-        nodes[i].length = length[i]
-        nodes[i].curvature = curvature[i]
-
-    return nodes
+    return length, curvature
@@ -3,3 +3,4 @@ This package contains utility code used throughout the project.
 """
 
 from .maths import clamp as clamp
+from .maths import smallest_positive_root as smallest_positive_root
@@ -32,7 +32,7 @@ class FrontRear[T](NamedTuple):
     def __add__(self, other: Any) -> FrontRear[T]:
         if isinstance(other, FrontRear):
             return FrontRear(*(a + b for a, b in zip(self, other)))
-        elif isinstance(other, float | int):
+        elif isinstance(other, float | int | np.ndarray):
             return FrontRear(*(a + other for a in self))
         else:
             return NotImplemented
@@ -40,7 +40,7 @@ class FrontRear[T](NamedTuple):
     def __mul__(self, other: Any) -> FrontRear[T]:
         if isinstance(other, FrontRear):
             return FrontRear(*(a * b for a, b in zip(self, other)))
-        elif isinstance(other, float | int):
+        elif isinstance(other, float | int | np.ndarray):
             return FrontRear(*(a * other for a in self))
         else:
             return NotImplemented
@@ -72,7 +72,7 @@ class LeftRight[T](NamedTuple):
     def __add__(self, other: Any) -> LeftRight[T]:
         if isinstance(other, LeftRight):
             return LeftRight(*(a + b for a, b in zip(self, other)))
-        elif isinstance(other, float | int):
+        elif isinstance(other, float | int | np.ndarray):
             return LeftRight(*(a + other for a in self))
         else:
             return NotImplemented
@@ -80,7 +80,7 @@ class LeftRight[T](NamedTuple):
     def __mul__(self, other: Any) -> LeftRight[T]:
         if isinstance(other, LeftRight):
             return LeftRight(*(a * b for a, b in zip(self, other)))
-        elif isinstance(other, float | int):
+        elif isinstance(other, float | int | np.ndarray):
             return LeftRight(*(a * other for a in self))
         else:
             return NotImplemented
@@ -151,7 +151,7 @@ class FourCorner[T](NamedTuple):
     def __add__(self, other: Any) -> FourCorner[T]:
         if isinstance(other, FourCorner):
             return FourCorner(*(a + b for a, b in zip(self, other)))
-        elif isinstance(other, float | int):
+        elif isinstance(other, float | int | np.ndarray):
             return FourCorner(*(a + other for a in self))
         else:
             return NotImplemented
@@ -159,7 +159,7 @@ class FourCorner[T](NamedTuple):
     def __mul__(self, other: Any) -> FourCorner[T]:
         if isinstance(other, FourCorner):
             return FourCorner(*(a * b for a, b in zip(self, other)))
-        elif isinstance(other, float | int):
+        elif isinstance(other, float | int | np.ndarray):
             return FourCorner(*(a * other for a in self))
         else:
             return NotImplemented
@@ -2,6 +2,7 @@
 This module contains functions for mathematical operations.
 """
 
+import math
 from typing import Optional
 
 
@@ -22,3 +23,31 @@ def clamp(
     if maximum is not None:
         value = min(value, maximum)
     return value
+
+
+def smallest_positive_root(a: float, b: float, c: float) -> float:
+    """
+    Find the smallest positive root of the polynomial `a * x**2 + b * x + c`.
+    If the polynomial has no positive real roots, `math.inf` is returned.
+
+    Example:
+        >>> smallest_positive_root(1, -3, 2)
+        1.0
+    """
+    if a == 0:
+        if b == 0:
+            return math.inf
+        root = -c / b
+        return root if root > 0 else math.inf
+
+    discriminant = b**2 - 4 * a * c
+    if discriminant < 0:
+        return math.inf
+
+    # Numerically stable form of the quadratic formula
+    q = -0.5 * (b + math.copysign(math.sqrt(discriminant), b))
+    roots = [q / a]
+    if q != 0:
+        roots.append(c / q)
+    positive_roots = [root for root in roots if root > 0]
+    return min(positive_roots, default=math.inf)
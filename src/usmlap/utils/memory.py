@@ -0,0 +1,87 @@
+"""
+This module contains functions for measuring the memory use of the process.
+"""
+
+import logging
+import sys
+from dataclasses import dataclass, field
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+def get_peak_rss() -> Optional[int]:
+    """
+    Get the peak resident set size of the current process.
+
+    Returns:
+        peak_rss (int, optional): The peak resident set size in bytes,
+            or `None` if it cannot be measured on this platform.
+    """
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak_rss
+    return peak_rss * 1024
+
+
+@dataclass
+class MemoryProfile(object):
+    """
+    The peak resident set size of the process after each stage of a task.
+
+    The peak resident set size never decreases,
+    so the growth during a stage is the difference from the previous stage.
+
+    Attributes:
+        stages (dict[str, int]): The peak resident set size in bytes
+            after each stage, in the order the stages were recorded.
+    """
+
+    stages: dict[str, int] = field(default_factory=dict)
+
+    def record(self, stage: str) -> None:
+        """
+        Record the peak resident set size at the end of a stage.
+
+        Args:
+            stage (str): The name of the stage.
+        """
+        peak_rss = get_peak_rss()
+        if peak_rss is None:
+            return
+        self.stages[stage] = peak_rss
+        logger.info(f"Peak RSS after {stage}: {peak_rss / 2**20:.1f} MiB")
+
+    @property
+    def peak(self) -> int:
+        """The largest peak resident set size of any stage, in bytes."""
+        return max(self.stages.values(), default=0)
+
+    def get_growth(self) -> dict[str, int]:
+        """
+        Get the growth in peak resident set size during each stage.
+
+        Returns:
+            growth (dict[str, int]): The growth in bytes of each stage.
+        """
+        growth: dict[str, int] = {}
+        previous: Optional[int] = None
+        for stage, peak_rss in self.stages.items():
+            growth[stage] = 0 if previous is None else peak_rss - previous
+            previous = peak_rss
+        return growth
+
+    def __str__(self) -> str:
+        growth = self.get_growth()
+        return "\n".join(
+            f"{stage}: {peak_rss / 2**20:.1f} MiB "
+            f"(+{growth[stage] / 2**20:.1f} MiB)"
+            for stage, peak_rss in self.stages.items()
+        )
@@ -92,7 +92,12 @@ class Accumulator(
         return self.get_voltage(state_of_charge=StateOfCharge(0))
 
     def resistance(self, cell_state: CellState) -> float:
-        cell_resistance = self.cell.resistance(cell_state)
+        if isinstance(cell_state.soc, np.ndarray):
+            cell_resistance = self.cell.resistances(
+                cell_state.soc, np.asarray(cell_state.temperature)
+            )
+        else:
+            cell_resistance = self.cell.resistance(cell_state)
         return cell_resistance * self.cells_in_series / self.cells_in_parallel
 
     def soc_derate(self, state_of_charge: StateOfCharge) -> float:
@@ -7,6 +7,7 @@ from functools import cached_property, lru_cache
 from typing import Any, Self
 
 import numpy as np
+from pydantic import field_validator
 from scipy.interpolate import (
     LinearNDInterpolator,
     NearestNDInterpolator,
@@ -117,14 +118,28 @@ class Cell(HasLibrary, path=LIBRARY_ROOT / "components" / "cells"):
             return NotImplemented
         return self.__key() == other.__key()
 
+    @field_validator("voltage_lookup")
+    @classmethod
+    def sort_voltage_lookup(
+        cls, lookup: list[_CellVoltageLookup]
+    ) -> list[_CellVoltageLookup]:
+        """Sort the voltage lookup table by state of charge."""
+        return sorted(lookup, key=lambda node: node.state_of_charge)
+
+    @field_validator("resistance_lookup")
+    @classmethod
+    def sort_resistance_lookup(
+        cls, lookup: list[_TemperatureResistanceLookup]
+    ) -> list[_TemperatureResistanceLookup]:
+        """Sort the resistance lookup table by temperature."""
+        return sorted(lookup, key=lambda node: node.temperature)
+
     @cached_property
     def _soc_lookup_values(self) -> list[float]:
-        self.voltage_lookup.sort(key=lambda node: node.state_of_charge)
         return [node.state_of_charge for node in self.voltage_lookup]
 
     @cached_property
     def _voltage_lookup_values(self) -> list[float]:
-        self.voltage_lookup.sort(key=lambda node: node.state_of_charge)
         return [node.voltage for node in self.voltage_lookup]
 
     def get_voltage(self, state_of_charge: StateOfCharge) -> float:
@@ -134,13 +149,20 @@ class Cell(HasLibrary, path=LIBRARY_ROOT / "components" / "cells"):
         This function interpolates linearly
         between the charge and discharge voltage.
 
+        Arrays of states of charge are accepted,
+        for use by the vectorised vehicle state evaluation.
+
         Args:
             state_of_charge (float): State of charge, between 0 and 1.
 
         Returns:
             voltage (float): Voltage of the cell.
         """
-        if state_of_charge < 0 or state_of_charge > 1:
+        if isinstance(state_of_charge, np.ndarray):
+            invalid = np.any((state_of_charge < 0) | (state_of_charge > 1))
+        else:
+            invalid = state_of_charge < 0 or state_of_charge > 1
+        if invalid:
             raise ValueError("State of charge must be between 0 and 1.")
 
         voltage = np.interp(
@@ -152,7 +174,6 @@ class Cell(HasLibrary, path=LIBRARY_ROOT / "components" / "cells"):
 
     @cached_property
     def _resistance_interpolator(self) -> LinearNDInterpolator:
-        self.resistance_lookup.sort(key=lambda node: node.temperature)
         values: list[tuple[float, float, float]] = []
         for temperature in self.resistance_lookup:
             for node in temperature.lookup:
@@ -187,6 +208,15 @@ class Cell(HasLibrary, path=LIBRARY_ROOT / "components" / "cells"):
         resistance = self._resistance_interpolator((soc, temperature))
         return resistance + self.resistance_offset
 
+    def resistances(self, soc: np.ndarray, temperature: np.ndarray) -> Any:
+        """
+        Get the resistance of the cell for arrays of cell states.
+        This is the vectorised equivalent of `resistance`, and is not cached.
+        """
+        temperature = np.clip(temperature, self._min_temp, self._max_temp)
+        resistance = self._resistance_interpolator((soc, temperature))
+        return resistance + self.resistance_offset
+
     def discharge_current(self, cell_state: CellState) -> float:
         """Get the available  discharge current for a given cell state.."""
         return self.max_discharge_current
@@ -7,6 +7,7 @@ from __future__ import annotations
 from abc import ABC
 from typing import Optional
 
+import numpy as np
 from pydantic import BaseModel
 
 from .accumulator import Accumulator, CellState
@@ -79,7 +80,9 @@ class RWDPowertrain(PowertrainInterface):
         )
         return current * resistance
 
-    def get_motor_voltage(self, cell_state: CellState, current: float) -> float:
+    def get_motor_voltage(
+        self, cell_state: CellState, current: float
+    ) -> float:
         """
         Calculate the voltage applied to the motor.
 
@@ -140,7 +143,9 @@ class RWDPowertrain(PowertrainInterface):
         elif motor_speed >= maximum_speed:
             ratio = 0
         else:
-            ratio = (maximum_speed - motor_speed) / (maximum_speed - knee_speed)
+            ratio = (maximum_speed - motor_speed) / (
+                maximum_speed - knee_speed
+            )
 
         return maximum_torque * ratio
 
@@ -160,6 +165,15 @@ class RWDPowertrain(PowertrainInterface):
     def cooling_rate(
         self, cell_temperature: float, ambient_temperature: float
     ) -> float:
+        if isinstance(cell_temperature, np.ndarray):
+            temperature_delta = np.maximum(
+                cell_temperature - ambient_temperature, 0
+            )
+            return np.where(
+                cell_temperature < COOLING_TEMPERATURE_THRESHOLD,
+                0,
+                self.cooling_coefficient * temperature_delta,
+            )
         if cell_temperature < COOLING_TEMPERATURE_THRESHOLD:
             return 0
         temperature_delta = cell_temperature - ambient_temperature
@@ -0,0 +1,62 @@
+"""Fixtures shared by the unit tests."""
+
+import pytest
+
+from usmlap.model import GlobalContext, TractionModel
+from usmlap.model.traction import PointMass
+from usmlap.model.vehicle_model import VehicleModelSettings
+from usmlap.simulation import SimulationSettings
+from usmlap.track import Mesh, TrackData, generate_mesh
+from usmlap.vehicle import Vehicle
+
+VEHICLE = "USM26"
+TRACK = "FS AutoX Germany 2012"
+
+
+@pytest.fixture
+def vehicle() -> Vehicle:
+    return Vehicle.from_json(VEHICLE)
+
+
+@pytest.fixture
+def global_context(vehicle: Vehicle) -> GlobalContext:
+    return SimulationSettings().get_global_context(vehicle)
+
+
+@pytest.fixture
+def traction_model_type() -> type[TractionModel]:
+    """The traction model to test, which modules may override."""
+    return PointMass
+
+
+@pytest.fixture
+def traction_model(traction_model_type: type[TractionModel]) -> TractionModel:
+    settings = VehicleModelSettings(traction_model=traction_model_type)
+    return settings.build_vehicle_model().traction
+
+
+@pytest.fixture
+def track_data() -> TrackData:
+    return TrackData.from_json(TRACK)
+
+
+@pytest.fixture
+def mesh_resolution() -> float:
+    """The resolution of the test mesh, which modules may override."""
+    return 1
+
+
+@pytest.fixture
+def number_of_laps() -> int:
+    """The number of laps of the test mesh, which modules may override."""
+    return 1
+
+
+@pytest.fixture
+def mesh(
+    track_data: TrackData, mesh_resolution: float, number_of_laps: int
+) -> Mesh:
+    mesh = generate_mesh(track_data, resolution=mesh_resolution)
+    if number_of_laps == 1:
+        return mesh
+    return mesh.get_repeating_mesh(number_of_laps)
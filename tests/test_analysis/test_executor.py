@@ -0,0 +1,72 @@
+"""Unit tests for the analysis executor."""
+
+import pytest
+
+from usmlap.analysis import AnalysisExecutor
+from usmlap.analysis.executor import MAXIMUM_BATCH_SIZE, ExecutorBackend
+from usmlap.competition import Competition
+from usmlap.model.traction import PointMass
+from usmlap.model.vehicle_model import VehicleModelSettings
+from usmlap.simulation import SimulationSettings
+from usmlap.vehicle import Vehicle, get_new_vehicle
+from usmlap.vehicle.parameters import CurbMass
+
+MASSES = [220, 180, 200, 190, 210]
+
+
+@pytest.fixture
+def vehicles() -> list[Vehicle]:
+    baseline = Vehicle.from_json("USM26")
+    return [get_new_vehicle(baseline, CurbMass, mass) for mass in MASSES]
+
+
+@pytest.fixture
+def competition() -> Competition:
+    return Competition(
+        simulate_skidpad=False,
+        simulate_autocross=False,
+        simulate_endurance=False,
+    )
+
+
+@pytest.fixture
+def settings() -> SimulationSettings:
+    return SimulationSettings(
+        vehicle_model=VehicleModelSettings(traction_model=PointMass)
+    )
+
+
+@pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+def test_results_in_order(
+    backend: ExecutorBackend,
+    vehicles: list[Vehicle],
+    competition: Competition,
+    settings: SimulationSettings,
+) -> None:
+    expected = [
+        competition.simulate(vehicle, settings).points for vehicle in vehicles
+    ]
+    executor = AnalysisExecutor(
+        backend=backend, workers=2, batch_size=2, max_in_flight=2
+    )
+    results = executor.simulate(competition, iter(vehicles), settings)
+
+    assert len(results) == len(vehicles)
+    for result, points in zip(results, expected):
+        assert result.points == pytest.approx(points)
+
+
+def test_default_batch_size(
+    vehicles: list[Vehicle],
+    competition: Competition,
+    settings: SimulationSettings,
+) -> None:
+    executor = AnalysisExecutor(backend="serial")
+    assert executor._get_batch_size(len(vehicles), 1) == len(vehicles)
+    assert executor._get_batch_size(None, 1) == MAXIMUM_BATCH_SIZE
+
+    expected = competition.simulate_batch(vehicles, settings)
+    results = executor.simulate(competition, iter(vehicles), settings)
+    assert [result.points for result in results] == pytest.approx(
+        [result.points for result in expected]
+    )
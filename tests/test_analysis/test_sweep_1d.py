@@ -0,0 +1,54 @@
+"""Unit tests for 1D parameter sweeps."""
+
+import logging
+
+import pytest
+
+from usmlap.analysis import AnalysisExecutor, SweepSettings, sweep_1d
+from usmlap.competition import Competition
+from usmlap.model.traction import PointMass
+from usmlap.model.vehicle_model import VehicleModelSettings
+from usmlap.simulation import SimulationSettings
+from usmlap.vehicle import Vehicle
+from usmlap.vehicle.parameters import CurbMass
+
+
+@pytest.fixture
+def competition() -> Competition:
+    return Competition(
+        simulate_skidpad=False,
+        simulate_autocross=False,
+        simulate_endurance=False,
+    )
+
+
+@pytest.fixture
+def settings() -> SimulationSettings:
+    return SimulationSettings(
+        vehicle_model=VehicleModelSettings(traction_model=PointMass)
+    )
+
+
+def test_empty_sweep(
+    vehicle: Vehicle, competition: Competition, settings: SimulationSettings
+) -> None:
+    sweep_settings = SweepSettings(parameter=CurbMass, values=[])
+    assert sweep_1d(vehicle, settings, competition, sweep_settings) == {}
+
+
+def test_sweep_logs_each_value(
+    vehicle: Vehicle,
+    competition: Competition,
+    settings: SimulationSettings,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    sweep_settings = SweepSettings(parameter=CurbMass, values=[180, 220])
+    executor = AnalysisExecutor(backend="serial")
+    with caplog.at_level(logging.INFO):
+        results = sweep_1d(
+            vehicle, settings, competition, sweep_settings, executor
+        )
+
+    assert list(results) == [180, 220]
+    for value in sweep_settings.values:
+        assert f"{CurbMass.name} = {value}" in caplog.text
@@ -0,0 +1,100 @@
+"""Unit tests for the result cache."""
+
+from pathlib import Path
+
+import pytest
+
+from usmlap.cache import ResultCache, fingerprint
+from usmlap.model.traction import PointMass
+from usmlap.model.vehicle_model import VehicleModelSettings
+from usmlap.simulation import SimulationSettings
+from usmlap.track import Mesh, TrackData, generate_mesh
+from usmlap.track.mesh_generation import AdaptiveResolution, Resolution
+from usmlap.vehicle import Vehicle, get_new_vehicle
+from usmlap.vehicle.parameters import CurbMass
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ResultCache:
+    return ResultCache(directory=tmp_path)
+
+
+def test_fingerprint_is_canonical(vehicle: Vehicle) -> None:
+    settings = SimulationSettings()
+
+    assert fingerprint(vehicle, settings) == fingerprint(
+        Vehicle.from_json("USM26"), SimulationSettings()
+    )
+    assert fingerprint(vehicle) != fingerprint(
+        get_new_vehicle(vehicle, CurbMass, 210)
+    )
+    assert fingerprint(settings) != fingerprint(
+        SimulationSettings(
+            vehicle_model=VehicleModelSettings(traction_model=PointMass)
+        )
+    )
+    assert fingerprint(Resolution(0.5)) != fingerprint(AdaptiveResolution(0.5))
+
+
+def test_fingerprint_rejects_callables() -> None:
+    with pytest.raises(TypeError):
+        fingerprint(lambda: 1)
+    with pytest.raises(TypeError):
+        fingerprint(SimulationSettings(solver_options={"callback": lambda: 1}))
+
+
+def test_hits_and_misses(cache: ResultCache) -> None:
+    calls: list[int] = []
+
+    def compute() -> float:
+        calls.append(1)
+        return 42.0
+
+    assert cache.get_or_compute("key", compute) == 42.0
+    assert cache.get_or_compute("key", compute) == 42.0
+    assert len(calls) == 1
+    assert cache.statistics.hits == 1
+    assert cache.statistics.misses == 1
+    assert ResultCache(directory=cache.directory).get("key") == 42.0
+
+
+def test_evicts_least_recently_used(cache: ResultCache) -> None:
+    result = bytes(1000)
+    cache.put("first", result)
+    cache.put("second", result)
+    entry_size = cache.size / 2
+    cache.maximum_size = int(2.5 * entry_size)
+    cache.get("first")
+    cache.put("third", result)
+
+    assert cache.statistics.evictions == 1
+    assert cache.get("second") is None
+    assert cache.get("first") == result
+    assert cache.get("third") == result
+
+
+def test_skips_results_larger_than_cache(cache: ResultCache) -> None:
+    cache.put("small", bytes(10))
+    cache.maximum_size = cache.size + 100
+    cache.put("large", bytes(1000))
+
+    assert cache.statistics.writes == 1
+    assert cache.statistics.evictions == 0
+    assert cache.get("large") is None
+    assert cache.get("small") == bytes(10)
+    assert len(list(cache.directory.iterdir())) == 1
+
+
+def test_cached_simulation(cache: ResultCache, vehicle: Vehicle) -> None:
+    track_data = TrackData.from_json("FS AutoX Germany 2012")
+    mesh: Mesh = generate_mesh(track_data, resolution=1)
+    settings = SimulationSettings(
+        vehicle_model=VehicleModelSettings(traction_model=PointMass)
+    )
+    solution = cache.simulate(vehicle, mesh, settings)
+    cached = cache.simulate(vehicle, mesh, settings)
+
+    assert cache.statistics.hits == 1
+    assert cached.solution.total_time == pytest.approx(
+        solution.solution.total_time
+    )
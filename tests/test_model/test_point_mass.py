@@ -0,0 +1,48 @@
+"""Unit tests for the point mass traction model."""
+
+import pytest
+
+from usmlap.model import GlobalContext, TransientVariables
+from usmlap.model.traction import PointMass
+from usmlap.model.tyre import ConstantTyre, LinearTyre, PureTyreModel
+from usmlap.model.vehicle_model import VehicleModelSettings
+from usmlap.solver.qss.apex_velocity import solve_apex_velocity
+from usmlap.track import TrackNode
+
+PRECISION = 1e-6
+
+
+def _point_mass(tyre_model: type[PureTyreModel]) -> PointMass:
+    settings = VehicleModelSettings(
+        traction_model=PointMass,
+        longitudinal_tyre=tyre_model,
+        lateral_tyre=tyre_model,
+    )
+    traction = settings.build_vehicle_model().traction
+    assert isinstance(traction, PointMass)
+    return traction
+
+
+@pytest.mark.parametrize("tyre_model", [LinearTyre, ConstantTyre])
+@pytest.mark.parametrize("curvature", [0.2, -0.1, 0.05, 0.02])
+def test_analytic_apex_velocity(
+    global_context: GlobalContext,
+    tyre_model: type[PureTyreModel],
+    curvature: float,
+) -> None:
+    model = _point_mass(tyre_model)
+    node = TrackNode(
+        position=0, length=1, curvature=curvature, elevation=0, banking=0.05
+    )
+    ctx = global_context.get_local_context(node, TransientVariables())
+
+    analytic = model.analytic_apex_velocity(ctx)
+    assert analytic is not None
+
+    model.analytic_apex_velocity = lambda ctx: None  # type: ignore
+    iterative = solve_apex_velocity(model, ctx, precision=PRECISION)
+
+    maximum_velocity = ctx.vehicle.maximum_velocity
+    assert min(analytic, maximum_velocity) == pytest.approx(
+        iterative, abs=1e-4
+    )
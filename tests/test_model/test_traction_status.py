@@ -0,0 +1,107 @@
+"""Unit tests for the non-raising traction API."""
+
+import numpy as np
+import pytest
+
+from usmlap.model import GlobalContext, TransientVariables
+from usmlap.model.errors import InsufficientTractionError, WheelLiftError
+from usmlap.model.traction import (
+    Bicycle,
+    FourCornerModel,
+    PointMass,
+    TractionModel,
+    TractionStatus,
+)
+from usmlap.model.tyre import FrictionEllipse
+from usmlap.model.vehicle_model import VehicleModelSettings
+from usmlap.model.vehicle_state import Trajectory
+from usmlap.track import NodeArrays, TrackNode
+
+CURVATURE = 0.1
+VELOCITIES = [5.0, 10.0, 15.0, 30.0, 60.0]
+
+
+def _model(traction_model: type[TractionModel]) -> TractionModel:
+    settings = VehicleModelSettings(traction_model=traction_model)
+    return settings.build_vehicle_model().traction
+
+
+@pytest.mark.parametrize("traction_model", [FourCornerModel, Bicycle])
+@pytest.mark.parametrize("velocity", [5, 10, 15, 30])
+@pytest.mark.parametrize("ax", [-20, 0, 5])
+def test_status_matches_raising(
+    global_context: GlobalContext,
+    traction_model: type[TractionModel],
+    velocity: float,
+    ax: float,
+) -> None:
+    model = _model(traction_model)
+    node = TrackNode(position=0, length=1, curvature=CURVATURE, elevation=0)
+    ctx = global_context.get_local_context(node, TransientVariables())
+    trajectory = Trajectory(curvature=CURVATURE, velocity=velocity, ax=ax)
+
+    for raising, status in (
+        (model.lateral_traction, model.lateral_traction_status),
+        (model.longitudinal_traction, model.longitudinal_traction_status),
+        (model.braking_traction, model.braking_traction_status),
+    ):
+        result = status(ctx, trajectory)
+        try:
+            forces = raising(ctx, trajectory)
+        except InsufficientTractionError as e:
+            assert result.status is TractionStatus.INSUFFICIENT_TRACTION
+            assert result.ratio == pytest.approx(e.ratio)
+        except WheelLiftError:
+            assert result.status is TractionStatus.WHEEL_LIFT
+        else:
+            assert result.ok
+            assert tuple(result.forces) == pytest.approx(tuple(forces))
+
+
+def test_friction_ellipse_with_ratio() -> None:
+    ellipse = FrictionEllipse()
+    assert ellipse.fx_with_ratio(fy=60, fx_max=100, fy_max=100) == (
+        pytest.approx(80),
+        pytest.approx(0.6),
+    )
+
+    fx, ratio = ellipse.fx_with_ratio(fy=150, fx_max=100, fy_max=100)
+    assert (fx, ratio) == (0, pytest.approx(1.5))
+    with pytest.raises(InsufficientTractionError):
+        ellipse.fx(fy=150, fx_max=100, fy_max=100)
+
+
+@pytest.mark.parametrize(
+    "traction_model", [PointMass, Bicycle, FourCornerModel]
+)
+def test_lateral_traction_array_matches_status(
+    global_context: GlobalContext, traction_model: type[TractionModel]
+) -> None:
+    model = _model(traction_model)
+    node = TrackNode(position=0, length=1, curvature=CURVATURE, elevation=0)
+    ctx = global_context.get_array_context(
+        NodeArrays.from_nodes([node] * len(VELOCITIES)), TransientVariables()
+    )
+    result = model.lateral_traction_array(
+        ctx,
+        Trajectory(
+            curvature=ctx.node.curvature,
+            velocity=np.array(VELOCITIES),  # type: ignore[arg-type]
+            ax=0,
+        ),
+    )
+
+    local_ctx = global_context.get_local_context(node, TransientVariables())
+    for i, velocity in enumerate(VELOCITIES):
+        expected = model.lateral_traction_status(
+            local_ctx, Trajectory(curvature=CURVATURE, velocity=velocity, ax=0)
+        )
+        assert bool(result.wheel_lift[i]) == (
+            expected.status is TractionStatus.WHEEL_LIFT
+        )
+        assert bool(result.insufficient_traction[i]) == (
+            expected.status is TractionStatus.INSUFFICIENT_TRACTION
+        )
+        if expected.ok:
+            forces = [corner[i] for corner in result.forces]
+            assert forces == pytest.approx(list(expected.forces))
@@ -0,0 +1,62 @@
+"""Unit tests for the vectorised vehicle state evaluation."""
+
+import numpy as np
+import pytest
+
+from usmlap.model import GlobalContext, TransientVariables
+from usmlap.model.traction import (
+    Bicycle,
+    FourCornerModel,
+    PointMass,
+    TractionModel,
+)
+from usmlap.model.vehicle_model import VehicleModelSettings
+from usmlap.model.vehicle_state import Trajectory
+from usmlap.track import NodeArrays, TrackNode
+
+VELOCITY = [5.0, 12.0, 20.0, 30.0]
+AX = [-10.0, 0.0, 4.0, 2.0]
+CURVATURE = [0.1, -0.05, 0.0, 0.01]
+SOC = [1.0, 0.8, 0.5, 0.3]
+TEMPERATURE = [25.0, 40.0, 50.0, 55.0]
+
+
+@pytest.mark.parametrize(
+    "traction_model", [PointMass, Bicycle, FourCornerModel]
+)
+def test_table_matches_scalar(
+    global_context: GlobalContext, traction_model: type[TractionModel]
+) -> None:
+    settings = VehicleModelSettings(traction_model=traction_model)
+    model = settings.build_vehicle_model().traction
+    nodes = [
+        TrackNode(position=i, length=1, curvature=curvature, elevation=0)
+        for i, curvature in enumerate(CURVATURE)
+    ]
+    ctx = global_context.get_array_context(
+        NodeArrays.from_nodes(nodes),
+        TransientVariables(
+            soc=np.array(SOC),  # type: ignore[arg-type]
+            cell_temperature=np.array(TEMPERATURE),  # type: ignore[arg-type]
+        ),
+    )
+    trajectory = Trajectory(
+        curvature=ctx.node.curvature,
+        velocity=np.array(VELOCITY),  # type: ignore[arg-type]
+        ax=np.array(AX),  # type: ignore[arg-type]
+    )
+    table = model.evaluate_vehicle_state_table(ctx, trajectory)
+
+    assert len(table) == len(nodes)
+    for i, node in enumerate(nodes):
+        state = TransientVariables(soc=SOC[i], cell_temperature=TEMPERATURE[i])
+        expected = model.evaluate_full_vehicle_state(
+            global_context.get_local_context(node, state),
+            Trajectory(curvature=CURVATURE[i], velocity=VELOCITY[i], ax=AX[i]),
+        )
+        row = table[i]
+        for name, value in vars(expected).items():
+            if name == "normal_loads":
+                assert list(row.normal_loads) == pytest.approx(list(value))
+            else:
+                assert getattr(row, name) == pytest.approx(value)
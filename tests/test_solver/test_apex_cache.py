@@ -0,0 +1,96 @@
+"""Unit tests for the apex velocity cache."""
+
+import pytest
+
+from usmlap.model import GlobalContext, TractionModel, TransientVariables
+from usmlap.model.traction import FourCornerModel
+from usmlap.simulation import SimulationSettings
+from usmlap.solver import QuasiSteadyStateSolver
+from usmlap.solver import QuasiTransientSolver as QT
+from usmlap.solver.qss import ApexVelocityCache
+from usmlap.solver.solution import create_new_solution
+from usmlap.track import TrackData, TrackNode, generate_mesh
+
+
+@pytest.fixture
+def traction_model_type() -> type[TractionModel]:
+    return FourCornerModel
+
+
+def _solve(
+    cache: ApexVelocityCache,
+    model: TractionModel,
+    global_context: GlobalContext,
+    curvature: float,
+) -> float:
+    node = TrackNode(position=0, length=1, curvature=curvature, elevation=0)
+    ctx = global_context.get_local_context(
+        node, TransientVariables.get_default()
+    )
+    return cache.solve_apex_velocity(model, ctx)
+
+
+def test_repeated_geometry_hits(
+    global_context: GlobalContext, traction_model: TractionModel
+) -> None:
+    cache = ApexVelocityCache()
+    first = _solve(cache, traction_model, global_context, 0.1)
+    second = _solve(cache, traction_model, global_context, 0.1 * (1 + 1e-6))
+    assert second == first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    _solve(cache, traction_model, global_context, 0.2)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_opposite_curvature_misses(
+    global_context: GlobalContext, traction_model: TractionModel
+) -> None:
+    cache = ApexVelocityCache()
+    _solve(cache, traction_model, global_context, 0.1)
+    _solve(cache, traction_model, global_context, -0.1)
+    assert cache.misses == 2
+
+
+def test_least_recently_used_evicted(
+    global_context: GlobalContext, traction_model: TractionModel
+) -> None:
+    cache = ApexVelocityCache(maximum_size=2)
+    for curvature in (0.1, 0.2, 0.1, 0.3, 0.1, 0.2):
+        _solve(cache, traction_model, global_context, curvature)
+    assert cache.size == 2
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_cached_laptime_matches_uncached(
+    global_context: GlobalContext, traction_model: TractionModel
+) -> None:
+    mesh = generate_mesh(TrackData.from_json("FSAE Skidpad"), resolution=0.5)
+    laptimes: list[float] = []
+    for cache in (None, ApexVelocityCache()):
+        solver = QuasiSteadyStateSolver(
+            traction_model, global_context, apex_cache=cache
+        )
+        solution = create_new_solution(
+            mesh, traction_model, TransientVariables.get_default()
+        )
+        laptimes.append(solver.solve(solution).total_time)
+
+    assert laptimes[1] == pytest.approx(laptimes[0], rel=1e-4)
+
+
+@pytest.mark.parametrize("solver", [QuasiSteadyStateSolver, QT])
+def test_cache_opt_in(
+    global_context: GlobalContext,
+    traction_model: TractionModel,
+    solver: type[QuasiSteadyStateSolver | QT],
+) -> None:
+    settings = SimulationSettings(solver=solver)
+    default = settings.get_solver(traction_model, global_context)
+    assert isinstance(default, solver)
+    assert default.apex_cache is None
+
+    settings = SimulationSettings(solver=solver, cache_apex_velocities=True)
+    cached = settings.get_solver(traction_model, global_context)
+    assert isinstance(cached, solver)
+    assert isinstance(cached.apex_cache, ApexVelocityCache)
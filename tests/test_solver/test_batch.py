@@ -0,0 +1,59 @@
+"""Unit tests for the batch solver."""
+
+from dataclasses import replace
+
+import pytest
+
+from usmlap.model.traction import PointMass
+from usmlap.model.vehicle_model import VehicleModelSettings
+from usmlap.simulation import SimulationSettings, simulate, simulate_batch
+from usmlap.solver import QuasiSteadyStateSolver, VectorisedSolver
+from usmlap.track import Mesh
+from usmlap.vehicle import Vehicle, get_new_vehicle
+from usmlap.vehicle.parameters import CurbMass
+
+MASSES = [180, 200, 220]
+
+
+@pytest.fixture
+def vehicles() -> list[Vehicle]:
+    baseline = Vehicle.from_json("USM26")
+    return [get_new_vehicle(baseline, CurbMass, mass) for mass in MASSES]
+
+
+@pytest.fixture
+def settings() -> SimulationSettings:
+    return SimulationSettings(
+        vehicle_model=VehicleModelSettings(traction_model=PointMass),
+        solver=VectorisedSolver,
+    )
+
+
+def test_batch_matches_individual(
+    vehicles: list[Vehicle], mesh: Mesh, settings: SimulationSettings
+) -> None:
+    batch = simulate_batch(vehicles, mesh, settings)
+    assert len(batch) == len(vehicles)
+    for vehicle, solution in zip(vehicles, batch):
+        assert solution.solver is VectorisedSolver
+        individual = simulate(vehicle, mesh, settings).solution
+        assert solution.solution.total_time == pytest.approx(
+            individual.total_time
+        )
+        assert solution.solution.total_energy_used == pytest.approx(
+            individual.total_energy_used
+        )
+
+    laptimes = [solution.solution.total_time for solution in batch]
+    assert laptimes == sorted(laptimes)
+
+
+def test_batch_keeps_requested_solver(
+    vehicles: list[Vehicle], mesh: Mesh, settings: SimulationSettings
+) -> None:
+    settings = replace(settings, solver=QuasiSteadyStateSolver)
+    batch = simulate_batch(vehicles[:1], mesh, settings)
+    individual = simulate(vehicles[0], mesh, settings)
+
+    assert batch[0].solver is QuasiSteadyStateSolver
+    assert batch[0].solution.total_time == individual.solution.total_time
@@ -0,0 +1,111 @@
+"""Unit tests for compact solution storage."""
+
+import numpy as np
+import pytest
+
+from usmlap.model import GlobalContext, TractionModel, TransientVariables
+from usmlap.solver import (
+    CompactSolution,
+    QuasiSteadyStateSolver,
+    StorageSettings,
+)
+from usmlap.solver.errors import MemoryBudgetExceededError
+from usmlap.solver.solution import Solution, create_new_solution
+from usmlap.telemetry import TelemetrySolution
+from usmlap.telemetry.channel import library
+from usmlap.track import Mesh
+from usmlap.vehicle import Vehicle
+
+NUMBER_OF_LAPS = 3
+
+
+@pytest.fixture
+def mesh_resolution() -> float:
+    return 0.5
+
+
+@pytest.fixture
+def number_of_laps() -> int:
+    return NUMBER_OF_LAPS
+
+
+@pytest.fixture
+def solution(
+    global_context: GlobalContext, traction_model: TractionModel, mesh: Mesh
+) -> Solution:
+    state = TransientVariables.get_default()
+    return QuasiSteadyStateSolver(traction_model, global_context).solve(
+        create_new_solution(mesh, traction_model, state)
+    )
+
+
+def test_compact_aggregates(solution: Solution) -> None:
+    compact = CompactSolution.from_solution(solution, StorageSettings())
+
+    assert compact.node_count == len(solution.nodes)
+    assert compact.total_time == pytest.approx(solution.total_time)
+    assert compact.total_length == pytest.approx(solution.total_length)
+    assert compact.total_energy_used == pytest.approx(
+        solution.total_energy_used, rel=1e-5
+    )
+    assert compact.get_lap_times() == pytest.approx(
+        [lap.total_time for lap in solution.get_lap_solutions()]
+    )
+    assert compact.get_sector_boundary_positions() == pytest.approx(
+        solution.get_sector_boundary_positions()
+    )
+
+
+def test_compact_precision(solution: Solution) -> None:
+    storage = StorageSettings(precision={"final_velocity": "float32"})
+    compact = CompactSolution.from_solution(solution, storage)
+
+    assert compact.get_channel("final_velocity").dtype == np.float32
+    assert compact.get_channel("initial_velocity").dtype == np.float64
+    assert compact.get_channel("sector_id").dtype == np.int16
+
+
+def test_memory_budget(solution: Solution) -> None:
+    node_count = len(solution.nodes)
+    full_size = CompactSolution.from_solution(
+        solution, StorageSettings()
+    ).nbytes
+
+    storage = StorageSettings(memory_budget=full_size - 1)
+    compact = CompactSolution.from_solution(solution, storage)
+    assert compact.nbytes < full_size
+    assert compact.get_channel("length").dtype == np.float32
+
+    with pytest.raises(MemoryBudgetExceededError):
+        StorageSettings(memory_budget=node_count).get_budgeted_dtypes(
+            node_count
+        )
+
+
+def test_compact_telemetry(solution: Solution, vehicle: Vehicle) -> None:
+    def telemetry(solution: Solution | CompactSolution) -> TelemetrySolution:
+        return TelemetrySolution(
+            vehicle=vehicle, solution=solution, solver=QuasiSteadyStateSolver
+        )
+
+    full = telemetry(solution)
+    compact = telemetry(
+        CompactSolution.from_solution(solution, StorageSettings())
+    )
+    for channel in (
+        library.Velocity(),
+        library.Time(),
+        library.Position(),
+        library.Curvature(),
+        library.LateralAcceleration(),
+        library.LongitudinalAcceleration(),
+        library.MotorTorque(),
+    ):
+        assert channel(compact) == pytest.approx(
+            channel(full), rel=1e-5, nan_ok=True
+        )
+
+    with pytest.raises(TypeError):
+        library.Drag()(compact)
+    with pytest.raises(TypeError):
+        compact.get_subset([0])
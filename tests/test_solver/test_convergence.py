@@ -0,0 +1,101 @@
+"""Unit tests for convergence acceleration of the quasi-transient solver."""
+
+import pytest
+
+from usmlap.model import GlobalContext, TractionModel, TransientVariables
+from usmlap.solver import QuasiTransientSolver
+from usmlap.solver.qt.convergence import (
+    AitkenRelaxation,
+    ConvergenceHistory,
+    get_field,
+    set_field,
+)
+from usmlap.solver.qt.quasi_transient import CONVERGENCE_TOLERANCE
+from usmlap.solver.solution import Solution, SolutionNode, create_new_solution
+from usmlap.track import Mesh, TrackNode
+
+
+def _update(temperature: float) -> float:
+    """A slowly converging, oscillating fixed-point map with solution 50."""
+    return 50 - 0.8 * (temperature - 50)
+
+
+def _create_solution(traction_model: TractionModel) -> Solution:
+    nodes = [
+        SolutionNode(
+            track_node=TrackNode(
+                position=i, length=1, curvature=0, elevation=0
+            ),
+            transient_variables=TransientVariables(cell_temperature=0),
+        )
+        for i in range(3)
+    ]
+    for node in nodes:
+        node.set_initial_velocity(10)
+        node.set_final_velocity(10)
+    return Solution(nodes=nodes, vehicle_model=traction_model)
+
+
+def test_aitken_relaxation_converges(traction_model: TractionModel) -> None:
+    solution = _create_solution(traction_model)
+    relaxation = AitkenRelaxation()
+
+    field = get_field(solution)
+    for _ in range(5):
+        set_field(solution, field)
+        for node in solution:
+            temperature = node.transient_variables.cell_temperature
+            node.transient_variables = TransientVariables(
+                cell_temperature=_update(temperature)
+            )
+        updated_field = get_field(solution)
+        field = relaxation.relax(solution, field)
+        assert (get_field(solution) == updated_field).all()
+        if relaxation.residuals_converged():
+            break
+
+    assert relaxation.residuals_converged()
+    assert relaxation.history.iterations <= 4
+    for node in solution:
+        assert node.transient_variables.cell_temperature == pytest.approx(
+            50, abs=relaxation.temperature_tolerance
+        )
+
+
+def test_oscillation_detected() -> None:
+    history = ConvergenceHistory(times=[10, 12, 11, 12])
+    assert history.is_oscillating()
+
+    history.times = [10, 12, 13, 14]
+    assert not history.is_oscillating()
+
+
+@pytest.mark.parametrize("accelerate_convergence", [False, True])
+def test_residual_criterion_opt_in(
+    global_context: GlobalContext,
+    traction_model: TractionModel,
+    mesh: Mesh,
+    monkeypatch: pytest.MonkeyPatch,
+    accelerate_convergence: bool,
+) -> None:
+    monkeypatch.setattr(
+        AitkenRelaxation, "residuals_converged", lambda _: True
+    )
+    solver = QuasiTransientSolver(
+        traction_model,
+        global_context,
+        accelerate_convergence=accelerate_convergence,
+    )
+    solution = solver.solve(
+        create_new_solution(
+            mesh, traction_model, TransientVariables.get_default()
+        )
+    )
+
+    assert solution.convergence is not None
+    times = solution.convergence.times
+    if accelerate_convergence:
+        assert len(times) == 1
+    else:
+        assert len(times) > 1
+        assert abs(times[-1] - times[-2]) < CONVERGENCE_TOLERANCE
@@ -0,0 +1,109 @@
+"""Unit tests for the discharge current limit search."""
+
+from typing import Optional
+
+import pytest
+
+from usmlap.model import TractionModel, TransientVariables
+from usmlap.simulation import SimulationSettings
+from usmlap.solver import QuasiTransientSolver
+from usmlap.solver.errors import DischargeLimitNotFoundError
+from usmlap.solver.qt.discharge_limit import DischargeLimitSearch
+from usmlap.solver.solution import create_new_solution
+from usmlap.track import Mesh
+from usmlap.vehicle import Vehicle
+
+TARGET_SOC = 0.2
+LAP_TARGET_SOC = 0.97
+
+
+def _final_soc(limit: float) -> Optional[float]:
+    """A nonlinear model of the final state of charge."""
+    soc = 1 - 1.3 * limit**1.5
+    return soc if soc >= 0 else None
+
+
+def _run(search: DischargeLimitSearch, initial_limit: float) -> float:
+    search.record(initial_limit, _final_soc(initial_limit))
+    while not search.is_complete():
+        limit = search.next_limit()
+        search.record(limit, _final_soc(limit))
+    assert search.best_limit is not None
+    return search.best_limit
+
+
+@pytest.mark.parametrize("initial_limit", [1, 0.9, 0.75])
+def test_search_finds_target(initial_limit: float) -> None:
+    search = DischargeLimitSearch(target_soc=TARGET_SOC)
+    limit = _run(search, initial_limit)
+
+    final_soc = _final_soc(limit)
+    assert final_soc is not None
+    assert TARGET_SOC <= final_soc <= TARGET_SOC + search.soc_tolerance
+    assert len(search.trials) <= 8
+
+
+def test_search_capped() -> None:
+    search = DischargeLimitSearch(
+        target_soc=TARGET_SOC, soc_tolerance=0, maximum_solves=2
+    )
+    limit = _run(search, 1)
+
+    final_soc = _final_soc(limit)
+    assert final_soc is not None and final_soc >= TARGET_SOC
+    assert len(search.trials) <= 4
+
+
+def test_search_raises_without_feasible_limit() -> None:
+    search = DischargeLimitSearch(target_soc=TARGET_SOC, maximum_trials=5)
+    with pytest.raises(DischargeLimitNotFoundError):
+        for _ in range(search.maximum_trials + 1):
+            search.record(1, TARGET_SOC / 2)
+            search.next_limit()
+    assert len(search.trials) == search.maximum_trials
+
+    search = DischargeLimitSearch(
+        target_soc=TARGET_SOC, initial_soc=TARGET_SOC
+    )
+    search.record(1, TARGET_SOC / 2)
+    with pytest.raises(DischargeLimitNotFoundError):
+        search.next_limit()
+
+
+def _solve_to_target(
+    traction_model: TractionModel, mesh: Mesh, search_discharge_limit: bool
+) -> tuple[QuasiTransientSolver, float]:
+    """Solve a lap which cannot meet the target at the default limit."""
+    global_context = SimulationSettings().get_global_context(
+        Vehicle.from_json("USM26")
+    )
+    solver = QuasiTransientSolver(
+        traction_model,
+        global_context,
+        target_soc=LAP_TARGET_SOC,
+        search_discharge_limit=search_discharge_limit,
+    )
+    solution = solver.solve(
+        create_new_solution(
+            mesh, traction_model, TransientVariables.get_default()
+        )
+    )
+    return solver, solution.nodes[-1].transient_variables.soc
+
+
+def test_quasi_transient_search(
+    traction_model: TractionModel, mesh: Mesh
+) -> None:
+    solver, final_soc = _solve_to_target(traction_model, mesh, True)
+    limit = solver.global_context.vehicle.powertrain.discharge_current_limit
+
+    assert solver.discharge_limit_searches
+    search = solver.discharge_limit_searches[-1]
+    assert search.best_limit == limit
+    assert LAP_TARGET_SOC <= final_soc
+    assert final_soc <= LAP_TARGET_SOC + search.soc_tolerance
+
+    heuristic, _ = _solve_to_target(traction_model, mesh, False)
+    assert not heuristic.discharge_limit_searches
+    powertrain = heuristic.global_context.vehicle.powertrain
+    assert powertrain.discharge_current_limit <= limit < 1
@@ -0,0 +1,65 @@
+"""Unit tests for the performance envelope solver."""
+
+import pytest
+
+from usmlap.model.traction import FourCornerModel, PointMass
+from usmlap.model.vehicle_model import VehicleModelSettings
+from usmlap.model.vehicle_state import TransientVariables
+from usmlap.simulation import SimulationSettings, simulate
+from usmlap.solver import EnvelopeSolver, QuasiSteadyStateSolver
+from usmlap.solver.envelope import EnvelopeResolution
+from usmlap.solver.solution import create_new_solution
+from usmlap.track import Mesh
+from usmlap.vehicle import Vehicle
+
+LAPTIME_TOLERANCE = 0.01
+
+
+@pytest.mark.parametrize("traction_model", [PointMass, FourCornerModel])
+def test_laptime_matches_qss(
+    vehicle: Vehicle, mesh: Mesh, traction_model: type
+) -> None:
+    model_settings = VehicleModelSettings(traction_model=traction_model)
+    laptimes: list[float] = []
+    for solver in (QuasiSteadyStateSolver, EnvelopeSolver):
+        settings = SimulationSettings(
+            vehicle_model=model_settings, solver=solver
+        )
+        solution = simulate(vehicle, mesh, settings).solution
+        laptimes.append(solution.total_time)
+
+    assert laptimes[1] == pytest.approx(laptimes[0], rel=LAPTIME_TOLERANCE)
+
+
+def test_error_bound_reported(vehicle: Vehicle, mesh: Mesh) -> None:
+    settings = SimulationSettings(solver=EnvelopeSolver)
+    vehicle_model = settings.vehicle_model.build_vehicle_model()
+    solver = EnvelopeSolver(
+        vehicle_model.traction, settings.get_global_context(vehicle)
+    )
+    solution = create_new_solution(
+        mesh, vehicle_model.traction, TransientVariables.get_default()
+    )
+    solver.solve(solution)
+
+    assert solver.error is not None
+    assert solver.error.samples > 0
+    assert solver.error.maximum_ax < 1
+    assert solver.error.minimum_ax < 1
+
+
+def test_resolution_from_settings(vehicle: Vehicle) -> None:
+    resolution = EnvelopeResolution(velocity_points=10, curvature_points=5)
+    settings = SimulationSettings(
+        solver=EnvelopeSolver,
+        solver_options={"resolution": resolution, "error_samples": 0},
+    )
+    vehicle_model = settings.vehicle_model.build_vehicle_model().traction
+    global_context = settings.get_global_context(vehicle)
+    solver = settings.get_solver(vehicle_model, global_context)
+    default = EnvelopeSolver(vehicle_model, global_context)
+
+    assert isinstance(solver, EnvelopeSolver)
+    assert solver.resolution is resolution
+    assert solver.error_samples == 0
+    assert default.resolution == EnvelopeResolution()
@@ -0,0 +1,75 @@
+"""Unit tests for the incremental solver."""
+
+import numpy as np
+import pytest
+
+from usmlap.model import GlobalContext, TractionModel, TransientVariables
+from usmlap.simulation import SimulationSettings
+from usmlap.solver import QuasiSteadyStateSolver, QuasiTransientSolver
+from usmlap.solver.qt.incremental import IncrementalSolver, _changed_regions
+from usmlap.solver.solution import Solution, create_new_solution
+from usmlap.track import TrackData, generate_mesh
+
+
+def _new_solution(traction_model: TractionModel) -> Solution:
+    mesh = generate_mesh(
+        TrackData.from_json("FS AutoX Germany 2012"), resolution=1
+    )
+    return create_new_solution(
+        mesh, traction_model, TransientVariables.get_default()
+    )
+
+
+def test_changed_regions() -> None:
+    changed = np.zeros(10, dtype=bool)
+    changed[4] = True
+    assert _changed_regions([0, 3, 6], changed) == [(3, 6)]
+
+    changed[6] = True
+    assert _changed_regions([0, 3, 6], changed) == [(3, 10)]
+
+
+def test_unchanged_solution_not_resolved(
+    global_context: GlobalContext, traction_model: TractionModel
+) -> None:
+    solver = IncrementalSolver(traction_model, global_context)
+    solution = solver.solve(_new_solution(traction_model))
+    assert solver.resolved_fraction == 1
+
+    total_time = solution.total_time
+    solution = solver.solve(solution)
+    assert solver.resolved_fraction == 0
+    assert solution.total_time == total_time
+
+
+def test_changed_region_matches_full_solve(
+    global_context: GlobalContext, traction_model: TractionModel
+) -> None:
+    solver = IncrementalSolver(traction_model, global_context)
+    solution = solver.solve(_new_solution(traction_model))
+
+    hot_state = TransientVariables(cell_temperature=60)
+    full = _new_solution(traction_model)
+    changed = range(len(solution.nodes) // 2, len(solution.nodes))
+    for i in changed:
+        solution.nodes[i].transient_variables = hot_state
+        full.nodes[i].transient_variables = hot_state
+
+    solution = solver.solve(solution)
+    full = QuasiSteadyStateSolver(traction_model, global_context).solve(full)
+
+    assert 0 < solver.resolved_fraction < 1
+    assert solution.total_time == pytest.approx(full.total_time, rel=1e-6)
+
+
+def test_incremental_opt_in(
+    global_context: GlobalContext, traction_model: TractionModel
+) -> None:
+    default = SimulationSettings().get_solver(traction_model, global_context)
+    assert isinstance(default, QuasiTransientSolver)
+    assert not default.incremental
+
+    settings = SimulationSettings(incremental_iterations=True)
+    solver = settings.get_solver(traction_model, global_context)
+    assert isinstance(solver, QuasiTransientSolver)
+    assert solver.incremental
@@ -0,0 +1,27 @@
+"""Unit tests for the coarse-to-fine solver."""
+
+import pytest
+
+from usmlap.model import GlobalContext, TractionModel, TransientVariables
+from usmlap.solver import MultigridSolver, QuasiSteadyStateSolver
+from usmlap.solver.solution import create_new_solution
+from usmlap.track import Mesh
+
+
+@pytest.fixture
+def mesh_resolution() -> float:
+    return 0.2
+
+
+def test_matches_fine_solve(
+    global_context: GlobalContext, traction_model: TractionModel, mesh: Mesh
+) -> None:
+    state = TransientVariables.get_default()
+    fine = QuasiSteadyStateSolver(
+        traction_model, global_context, apex_cache=None
+    ).solve(create_new_solution(mesh, traction_model, state))
+    solver = MultigridSolver(traction_model, global_context, apex_cache=None)
+    multigrid = solver.solve(create_new_solution(mesh, traction_model, state))
+
+    assert 0 < solver.refined_fraction < 1
+    assert multigrid.total_time == pytest.approx(fine.total_time, rel=1e-4)
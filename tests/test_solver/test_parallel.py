@@ -0,0 +1,45 @@
+"""Unit tests for parallel propagation of the quasi-steady-state solver."""
+
+import pytest
+
+from usmlap.model import GlobalContext, TractionModel, TransientVariables
+from usmlap.model.traction import FourCornerModel
+from usmlap.solver import QuasiSteadyStateSolver
+from usmlap.solver.solution import Solution, create_new_solution
+from usmlap.track import Mesh
+
+
+@pytest.fixture
+def traction_model_type() -> type[TractionModel]:
+    return FourCornerModel
+
+
+def _solve(
+    mesh: Mesh,
+    traction_model: TractionModel,
+    global_context: GlobalContext,
+    workers: int,
+) -> Solution:
+    solver = QuasiSteadyStateSolver(
+        traction_model, global_context, apex_cache=None, workers=workers
+    )
+    solution = create_new_solution(
+        mesh, traction_model, TransientVariables.get_default()
+    )
+    return solver.solve(solution)
+
+
+@pytest.mark.parametrize("workers", [2, 4])
+def test_parallel_matches_serial(
+    mesh: Mesh,
+    traction_model: TractionModel,
+    global_context: GlobalContext,
+    workers: int,
+) -> None:
+    serial = _solve(mesh, traction_model, global_context, workers=1)
+    parallel = _solve(mesh, traction_model, global_context, workers)
+
+    assert parallel.get_apex_indices() == serial.get_apex_indices()
+    for parallel_node, serial_node in zip(parallel.nodes, serial.nodes):
+        assert parallel_node.initial_velocity == serial_node.initial_velocity
+        assert parallel_node.final_velocity == serial_node.final_velocity
@@ -0,0 +1,105 @@
+"""Unit tests for the solution representation."""
+
+import pickle
+from copy import copy
+
+import pytest
+
+from usmlap.model import GlobalContext, TractionModel, TransientVariables
+from usmlap.solver import QuasiSteadyStateSolver
+from usmlap.solver.solution import Solution, SolutionNode, create_new_solution
+from usmlap.track import Mesh, TrackNode
+
+NUMBER_OF_LAPS = 10
+
+
+@pytest.fixture
+def mesh_resolution() -> float:
+    return 0.5
+
+
+@pytest.fixture
+def number_of_laps() -> int:
+    return NUMBER_OF_LAPS
+
+
+@pytest.fixture
+def solution(
+    global_context: GlobalContext, traction_model: TractionModel, mesh: Mesh
+) -> Solution:
+    state = TransientVariables.get_default()
+    return QuasiSteadyStateSolver(traction_model, global_context).solve(
+        create_new_solution(mesh, traction_model, state)
+    )
+
+
+def test_pickle_round_trip(solution: Solution) -> None:
+    restored: Solution = pickle.loads(pickle.dumps(solution))
+
+    assert len(restored.nodes) == len(solution.nodes)
+    assert restored.total_time == pytest.approx(solution.total_time)
+    assert restored.nodes[0].previous is None
+    assert restored.nodes[-1].next is None
+    for node, next_node in zip(restored.nodes, restored.nodes[1:]):
+        assert node.next is next_node
+        assert next_node.previous is node
+
+
+def test_copy_shares_nodes(solution: Solution) -> None:
+    new_solution = copy(solution)
+
+    assert new_solution.nodes is solution.nodes
+    assert solution.nodes[0].next is solution.nodes[1]
+
+
+def test_aggregates_match_nodes(solution: Solution) -> None:
+    sector = solution.nodes[0].sector
+
+    assert solution.total_time == pytest.approx(
+        sum(node.time for node in solution)
+    )
+    assert solution.total_energy_used == pytest.approx(
+        sum(node.energy_used for node in solution)
+    )
+    assert solution.get_sector_time(sector) == pytest.approx(
+        sum(node.time for node in solution if node.sector == sector)
+    )
+    lap = solution.get_lap_solutions()[1]
+    assert lap.total_time == pytest.approx(sum(node.time for node in lap))
+
+
+def test_aggregates_invalidated(solution: Solution) -> None:
+    total_time = solution.total_time
+    lap = solution.get_lap_solutions()[0]
+    node = lap.nodes[1]
+    node.set_final_velocity(node.final_velocity / 2)
+
+    assert solution.total_time > total_time
+    assert lap.total_time == pytest.approx(sum(node.time for node in lap))
+
+
+def test_standalone_nodes_gathered(traction_model: TractionModel) -> None:
+    track_node = TrackNode(position=0, length=2, curvature=0, elevation=0)
+    nodes = [SolutionNode(track_node=track_node) for _ in range(3)]
+    for node in nodes:
+        node.set_initial_velocity(4)
+        node.set_final_velocity(4)
+    solution = Solution(nodes=nodes, vehicle_model=traction_model)
+
+    assert solution.total_time == pytest.approx(1.5)
+    assert all(node._arrays is solution.arrays for node in nodes)
+
+
+def test_full_vehicle_state_deferred(solution: Solution) -> None:
+    node = solution.nodes[100]
+    deferred_state = node.deferred_state
+
+    assert deferred_state is not None
+    assert deferred_state.full is None
+    assert node.powertrain_state is not None
+    full_state = node.calculated_vehicle_state
+    assert full_state is deferred_state.full
+    assert full_state.motor_power == pytest.approx(
+        node.powertrain_state.motor_power
+    )
+    assert solution.nodes[101].deferred_state.full is None
@@ -0,0 +1,61 @@
+"""Unit tests for the steady lap solver."""
+
+import pytest
+
+from usmlap.model import GlobalContext, TractionModel, TransientVariables
+from usmlap.solver import QuasiSteadyStateSolver
+from usmlap.solver.solution import create_new_solution
+from usmlap.solver.steady_lap import SteadyLapSolver
+from usmlap.track import Mesh
+
+NUMBER_OF_LAPS = 6
+
+
+@pytest.fixture
+def number_of_laps() -> int:
+    return NUMBER_OF_LAPS
+
+
+def test_matches_full_solve(
+    global_context: GlobalContext, traction_model: TractionModel, mesh: Mesh
+) -> None:
+    state = TransientVariables.get_default()
+    full = QuasiSteadyStateSolver(traction_model, global_context).solve(
+        create_new_solution(mesh, traction_model, state)
+    )
+    solver = SteadyLapSolver(traction_model, global_context)
+    reused = solver.solve(create_new_solution(mesh, traction_model, state))
+
+    assert solver.solved_laps == 3
+    assert solver.reused_laps == NUMBER_OF_LAPS - 2
+    assert reused.total_time == pytest.approx(full.total_time, rel=1e-6)
+    for full_node, reused_node in zip(full, reused):
+        assert reused_node.final_velocity == pytest.approx(
+            full_node.final_velocity, abs=1e-6
+        )
+
+
+def test_drifted_laps_resolved(
+    global_context: GlobalContext, traction_model: TractionModel, mesh: Mesh
+) -> None:
+    solver = SteadyLapSolver(traction_model, global_context)
+    solution = create_new_solution(
+        mesh, traction_model, TransientVariables.get_default()
+    )
+    solver.solve(solution)
+
+    for node in solution:
+        if node.lap_number == 4:
+            node.transient_variables = TransientVariables(cell_temperature=50)
+    solver.solve(solution)
+
+    assert solver.solved_laps == 1
+    assert solver.reused_laps == NUMBER_OF_LAPS - 1
+
+    full = create_new_solution(
+        mesh, traction_model, TransientVariables.get_default()
+    )
+    for full_node, node in zip(full, solution):
+        full_node.transient_variables = node.transient_variables
+    full = QuasiSteadyStateSolver(traction_model, global_context).solve(full)
+    assert solution.total_time == pytest.approx(full.total_time, rel=1e-6)
@@ -0,0 +1,36 @@
+"""Unit tests for the vectorised solver."""
+
+import pytest
+
+from usmlap.model.traction import FourCornerModel, PointMass
+from usmlap.model.vehicle_model import VehicleModelSettings
+from usmlap.simulation import SimulationSettings, simulate
+from usmlap.solver import QuasiSteadyStateSolver, VectorisedSolver
+from usmlap.track import Mesh
+from usmlap.vehicle import Vehicle
+
+LAPTIME_TOLERANCE = 0.01
+
+
+@pytest.mark.parametrize("traction_model", [PointMass, FourCornerModel])
+def test_laptime_matches_qss(
+    vehicle: Vehicle, mesh: Mesh, traction_model: type
+) -> None:
+    model_settings = VehicleModelSettings(traction_model=traction_model)
+    laptimes: list[float] = []
+    for solver in (QuasiSteadyStateSolver, VectorisedSolver):
+        settings = SimulationSettings(
+            vehicle_model=model_settings, solver=solver
+        )
+        solution = simulate(vehicle, mesh, settings).solution
+        laptimes.append(solution.total_time)
+
+    assert laptimes[1] == pytest.approx(laptimes[0], rel=LAPTIME_TOLERANCE)
+
+
+def test_velocities_within_maximum(vehicle: Vehicle, mesh: Mesh) -> None:
+    settings = SimulationSettings(solver=VectorisedSolver)
+    solution = simulate(vehicle, mesh, settings).solution
+    for node in solution:
+        assert node.final_velocity <= node.maximum_velocity + 1e-9
+        assert node.initial_velocity >= 0
@@ -0,0 +1,58 @@
+"""Unit tests for warm starting the fixed-point solvers."""
+
+import pytest
+
+from usmlap.model import GlobalContext, TractionModel, TransientVariables
+from usmlap.model.traction import FourCornerModel
+from usmlap.solver import QuasiSteadyStateSolver
+from usmlap.solver.qss import WarmStart
+from usmlap.solver.solution import create_new_solution
+from usmlap.track import TrackData, TrackNode, generate_mesh
+
+
+@pytest.fixture
+def traction_model_type() -> type[TractionModel]:
+    return FourCornerModel
+
+
+def test_warm_start_reduces_iterations(
+    global_context: GlobalContext, traction_model: TractionModel
+) -> None:
+    mesh = generate_mesh(TrackData.from_json("FSAE Skidpad"), resolution=0.5)
+    warm_start = WarmStart()
+    solver = QuasiSteadyStateSolver(
+        traction_model, global_context, apex_cache=None, warm_start=warm_start
+    )
+
+    laptimes: list[float] = []
+    mean_iterations: list[float] = []
+    for _ in range(2):
+        solution = create_new_solution(
+            mesh, traction_model, TransientVariables.get_default()
+        )
+        laptimes.append(solver.solve(solution).total_time)
+        mean_iterations.append(warm_start.statistics["apex"].mean_iterations)
+        warm_start.reset_statistics()
+
+    assert laptimes[1] == pytest.approx(laptimes[0], rel=1e-4)
+    assert mean_iterations[1] < mean_iterations[0]
+    assert mean_iterations[1] <= 2
+
+
+def test_estimates_keyed_by_mesh_row() -> None:
+    track_data = TrackData.from_json("FSAE Skidpad")
+    mesh = generate_mesh(track_data, resolution=1)
+    warm_start = WarmStart()
+    warm_start.store("apex", TrackNode.view(mesh.arrays, 3), 10, 1)
+
+    assert warm_start.estimate("apex", TrackNode.view(mesh.arrays, 3)) == 10
+    assert (
+        warm_start.estimate("apex", TrackNode.view(mesh.arrays, 3, 1)) is None
+    )
+    assert warm_start.estimate("braking", mesh.nodes[3]) is None
+
+    other = generate_mesh(track_data, resolution=1)
+    assert warm_start.estimate("apex", other.nodes[3]) is None
+    warm_start.store("apex", other.nodes[4], 12, 1)
+    assert warm_start.estimate("apex", TrackNode.view(mesh.arrays, 3)) is None
+    assert warm_start.estimate("apex", other.nodes[4]) == 12
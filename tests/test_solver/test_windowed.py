@@ -0,0 +1,60 @@
+"""Unit tests for the windowed solver."""
+
+import pytest
+
+from usmlap.model import GlobalContext, TractionModel, TransientVariables
+from usmlap.solver import QuasiSteadyStateSolver
+from usmlap.solver.solution import create_new_solution
+from usmlap.solver.windowed import (
+    SolutionSummary,
+    WindowedSolver,
+    stream_nodes,
+)
+from usmlap.track import Mesh
+
+NUMBER_OF_LAPS = 3
+
+
+@pytest.fixture
+def number_of_laps() -> int:
+    return NUMBER_OF_LAPS
+
+
+def test_matches_full_solve(
+    global_context: GlobalContext, traction_model: TractionModel, mesh: Mesh
+) -> None:
+    state = TransientVariables.get_default()
+    full = QuasiSteadyStateSolver(traction_model, global_context).solve(
+        create_new_solution(mesh, traction_model, state)
+    )
+    solver = WindowedSolver(
+        traction_model, global_context, window_length=300, overlap_length=150
+    )
+    windowed = solver.solve(create_new_solution(mesh, traction_model, state))
+
+    assert solver.windows > 1
+    assert solver.peak_window_nodes < mesh.node_count
+    assert windowed.total_time == pytest.approx(full.total_time, rel=1e-9)
+    for full_node, windowed_node in zip(full, windowed):
+        assert windowed_node.initial_velocity == pytest.approx(
+            full_node.initial_velocity
+        )
+        assert windowed_node.final_velocity == pytest.approx(
+            full_node.final_velocity
+        )
+
+
+def test_stream_to_summary(
+    global_context: GlobalContext, traction_model: TractionModel, mesh: Mesh
+) -> None:
+    state = TransientVariables.get_default()
+    full = QuasiSteadyStateSolver(traction_model, global_context).solve(
+        create_new_solution(mesh, traction_model, state)
+    )
+    solver = WindowedSolver(traction_model, global_context)
+    summary = SolutionSummary()
+    solver.solve_stream(stream_nodes(mesh.nodes, state), summary)
+
+    assert summary.node_count == mesh.node_count
+    assert summary.total_time == pytest.approx(full.total_time, rel=1e-9)
+    assert summary.total_length == pytest.approx(full.total_length)
@@ -0,0 +1,68 @@
+"""Unit tests for track meshes."""
+
+import pytest
+
+from usmlap.track import Mesh, NodeArrays, TrackNode
+
+NUMBER_OF_LAPS = 3
+
+
+def test_node_views(mesh: Mesh) -> None:
+    arrays = mesh.arrays
+    node = mesh.nodes[10]
+
+    assert mesh.nodes[10] is node
+    assert node.length == arrays.length[10]
+    assert node.position == pytest.approx(arrays.length[:10].sum())
+    assert node.end_coordinate == mesh.nodes[11].start_coordinate
+    assert mesh.track_length == pytest.approx(arrays.length.sum())
+    with pytest.raises(AttributeError):
+        node.curvature = 0  # type: ignore
+
+
+def test_standalone_node() -> None:
+    node = TrackNode(position=0, length=2, curvature=0.1, elevation=0)
+
+    assert node.swept_angle == pytest.approx(0.2)
+    assert node.replace(curvature=0.2).swept_angle == pytest.approx(0.4)
+    assert node.curvature == 0.1
+    with pytest.raises(ValueError):
+        TrackNode(position=0, length=0, curvature=0, elevation=0)
+
+
+def test_from_nodes(mesh: Mesh) -> None:
+    subset = mesh.nodes[5:15]
+    gathered = NodeArrays.from_nodes(subset)
+    standalone = NodeArrays.from_nodes([node.replace() for node in subset])
+
+    assert gathered.curvature.tolist() == standalone.curvature.tolist()
+    assert [gathered.sectors[i] for i in gathered.sector_id] == [
+        node.sector for node in subset
+    ]
+
+
+def test_repeating_mesh(mesh: Mesh) -> None:
+    repeating = mesh.get_repeating_mesh(NUMBER_OF_LAPS)
+
+    assert repeating.node_count == NUMBER_OF_LAPS * mesh.node_count
+    assert repeating.track_length == pytest.approx(
+        NUMBER_OF_LAPS * mesh.track_length
+    )
+    last = repeating.nodes[-1]
+    assert last.lap_number == NUMBER_OF_LAPS
+    assert last.curvature == mesh.nodes[-1].curvature
+    assert last.position == pytest.approx(repeating.track_length - last.length)
+    assert last._arrays is mesh.arrays
+
+
+def test_repeating_mesh_arrays(mesh: Mesh) -> None:
+    repeating = mesh.get_repeating_mesh(NUMBER_OF_LAPS)
+    arrays = repeating.arrays
+
+    assert len(arrays) == repeating.node_count
+    assert arrays.lap_number.tolist() == [
+        node.lap_number for node in repeating
+    ]
+    assert arrays.position.tolist() == pytest.approx(
+        [node.position for node in repeating]
+    )
@@ -0,0 +1,59 @@
+"""Unit tests for the mesh cache."""
+
+from pathlib import Path
+
+import pytest
+
+from usmlap.track import (
+    MeshCache,
+    TrackData,
+    generate_mesh,
+    load_mesh,
+    mesh_cache,
+)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> MeshCache:
+    return MeshCache(directory=tmp_path)
+
+
+def test_cached_mesh_matches_generated(
+    cache: MeshCache, track_data: TrackData
+) -> None:
+    generated = generate_mesh(track_data, 0.5, smooth=False)
+    cache.get_mesh(track_data, 0.5, smooth=False)
+    loaded = cache.get_mesh(track_data, 0.5, smooth=False)
+
+    assert len(list(cache.directory.iterdir())) == 1
+    assert loaded.node_count == generated.node_count
+    assert loaded.configuration == generated.configuration
+    for loaded_node, node in zip(loaded, generated):
+        assert loaded_node.position == pytest.approx(node.position)
+        assert loaded_node.curvature == pytest.approx(node.curvature)
+        assert loaded_node.end_coordinate == pytest.approx(node.end_coordinate)
+        assert loaded_node.sector == node.sector
+
+
+def test_invalidated_by_inputs(
+    cache: MeshCache, track_data: TrackData
+) -> None:
+    cache.get_mesh(track_data, 1)
+    cache.get_mesh(track_data, 1, smooth=False)
+    cache.get_mesh(track_data, 2)
+    modified = track_data.model_copy(deep=True)
+    modified.shape[0].curvature += 0.01
+    cache.get_mesh(modified, 1)
+
+    assert len(list(cache.directory.iterdir())) == 4
+
+
+def test_load_mesh_uncached_by_default(
+    tmp_path: Path, track_data: TrackData, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(mesh_cache, "DEFAULT_MESH_DIRECTORY", tmp_path)
+    load_mesh(track_data, 2)
+    assert not any(tmp_path.iterdir())
+
+    load_mesh(track_data, 2, cache=True)
+    assert len(list(tmp_path.iterdir())) == 1
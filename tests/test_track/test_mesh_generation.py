@@ -0,0 +1,56 @@
+"""Unit tests for track mesh generation."""
+
+import pytest
+
+from usmlap.model import TransientVariables
+from usmlap.model.traction import PointMass
+from usmlap.model.vehicle_model import VehicleModelSettings
+from usmlap.simulation import SimulationSettings
+from usmlap.solver import QuasiSteadyStateSolver
+from usmlap.solver.solution import create_new_solution
+from usmlap.track import Mesh, TrackData, generate_mesh
+from usmlap.track.mesh_generation import AdaptiveResolution, Resolution
+from usmlap.vehicle import Vehicle
+
+TRACK = "FS AutoX Germany 2012"
+
+
+def _laptime(mesh: Mesh) -> float:
+    vehicle = Vehicle.from_json("USM26")
+    global_context = SimulationSettings().get_global_context(vehicle)
+    settings = VehicleModelSettings(traction_model=PointMass)
+    traction_model = settings.build_vehicle_model().traction
+    solution = create_new_solution(
+        mesh, traction_model, TransientVariables.get_default()
+    )
+    solver = QuasiSteadyStateSolver(traction_model, global_context)
+    return solver.solve(solution).total_time
+
+
+def test_adaptive_resolution_key() -> None:
+    resolution = AdaptiveResolution(0.1)
+    assert resolution != Resolution(0.1)
+    assert resolution == AdaptiveResolution(0.1)
+    assert resolution != AdaptiveResolution(0.1, target_error=1e-2)
+    assert len({resolution, Resolution(0.1), AdaptiveResolution(0.1)}) == 2
+    with pytest.raises(ValueError):
+        AdaptiveResolution(1, maximum_spacing=0.5)
+
+
+def test_adaptive_mesh() -> None:
+    track_data = TrackData.from_json(TRACK)
+    resolution = AdaptiveResolution(0.1, maximum_spacing=2)
+    uniform = generate_mesh(track_data, Resolution(0.1))
+    adaptive = generate_mesh(track_data, resolution)
+
+    assert adaptive.node_count < uniform.node_count / 3
+    assert adaptive.track_length == pytest.approx(uniform.track_length)
+    lengths = [node.length for node in adaptive]
+    assert max(lengths) <= resolution.maximum_spacing
+
+    coarse = generate_mesh(
+        track_data, Resolution(uniform.track_length / adaptive.node_count)
+    )
+    reference = _laptime(uniform)
+    adaptive_error = abs(_laptime(adaptive) - reference)
+    assert adaptive_error < abs(_laptime(coarse) - reference) / 2